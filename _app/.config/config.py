@@ -10,12 +10,35 @@ TRANSCRIPTION_PROVIDER = "faster-whisper" # Dostawca: "faster-whisper" (4x szybs
 # Ustawienia Faster-Whisper (pip install faster-whisper)
 FASTER_WHISPER_DEVICE = "auto" # "cuda", "cpu", lub "auto"
 FASTER_WHISPER_COMPUTE_TYPE = "auto" # "float16", "int8", "int8_float16", lub "auto"
+# "auto" używa wyników kalibracji (python -m pogadane calibrate), jeśli są zapisane
 FASTER_WHISPER_BATCH_SIZE = 0 # 0 = bez batch, >0 dla przyspieszenia
 FASTER_WHISPER_VAD_FILTER = False # Voice Activity Detection
+LOOP_GUARD_ENABLED = True # Przerywaj pętle powtórzeń (halucynacje) i wznawiaj od kolejnej mowy
+LOOP_GUARD_MAX_REPEATS = 3 # Tyle identycznych segmentów z rzędu uznaje się za pętlę
+LOOP_GUARD_MIN_REPEAT_WORDS = 3 # Krótsze segmenty ("Tak.", "Dobrze.") są pętlą dopiero przy długiej serii bez przerw
 
 # Ustawienia Whisper (wspólne dla obu)
 WHISPER_LANGUAGE = "Polish" # Język transkrypcji (np. "Polish", "English")
 WHISPER_MODEL = "turbo" # Model: "tiny", "base", "small", "medium", "large", "turbo", "large-v3"
+TRANSCRIPTION_PROFILE = "balanced" # Profil dekodowania: "fast" (szybki), "balanced" (zbalansowany), "accurate" (dokładny)
+
+# Tryb kaskadowy (tylko faster-whisper): szkic małym modelem, niepewne fragmenty
+# są ponownie dekodowane modelem WHISPER_MODEL
+CASCADE_ENABLED = False # True = włącz tryb kaskadowy
+CASCADE_DRAFT_MODEL = "small" # Model szkicu: "tiny", "base" lub "small"
+CASCADE_LOGPROB_THRESHOLD = -0.8 # Ponowne dekodowanie, gdy avg_logprob jest niższy
+CASCADE_COMPRESSION_RATIO_THRESHOLD = 2.0 # ...gdy tekst jest zbyt powtarzalny
+CASCADE_NO_SPEECH_THRESHOLD = 0.5 # ...gdy model wykrył tekst mimo prawdopodobnej ciszy
+
+# Wspólne partie dla krótkich nagrań (tylko faster-whisper): wiele krótkich plików
+# z kolejki jest transkrybowanych razem, co przyspiesza duże kolejki notatek głosowych
+SHORT_CLIP_BATCHING = False # True = włącz
+SHORT_CLIP_MAX_SECONDS = 30 # Maksymalna długość pliku (s) pakowanego do wspólnej partii
+SHORT_CLIP_BATCH_SIZE = 8 # Liczba okien 30 s w jednej partii
+
+# Lokalny magazyn modeli (dep/models/faster-whisper, python -m pogadane models)
+WHISPER_MODEL_STORE = True # True = wczytuj zainstalowane modele prosto z dysku
+WHISPER_OFFLINE = False # True = nigdy nie łącz się z Hugging Face Hub
 
 # Ustawienia dla openai-whisper (jeśli TRANSCRIPTION_PROVIDER="whisper")
 WHISPER_DEVICE = "auto"     # Urządzenie: "auto", "cpu", "cuda"
@@ -23,6 +46,26 @@ WHISPER_DEVICE = "auto"     # Urządzenie: "auto", "cpu", "cuda"
 # YouTube Downloads (pip: yt-dlp)
 YT_DLP_PATH = "yt-dlp" # Komenda lub pełna ścieżka
 
+# Import folderów do kolejki
+IMPORT_DEDUPE_CONTENT = True # Pomijaj pliki o identycznej zawartości (szybki skrót fragmentów pliku)
+
+# Rozpoznawanie tych samych nagrań po dźwięku (np. MP4 i jego eksport do MP3)
+AUDIO_DEDUPE_ENABLED = True # Użyj istniejącej transkrypcji, jeśli nagranie o tym samym dźwięku było już transkrybowane
+AUDIO_DEDUPE_THRESHOLD = 0.85 # Wymagane podobieństwo odcisków dźwięku (0-1); wyżej = ostrożniej
+
+# Diagnostyka GUI
+UI_LAG_THRESHOLD_MS = 50 # Loguj operacje blokujące interfejs dłużej niż tyle ms (0 = wyłączone)
+
+# Dziennik przetwarzania (folder logs: pogadane.log i pogadane.jsonl)
+LOG_TO_DISK = True # Zapisuj dziennik przetwarzania na dysku
+LOG_MAX_MB = 10 # Rozmiar pliku dziennika, po którym zaczynany jest nowy plik
+LOG_BACKUPS = 5 # Liczba zachowanych starszych plików dziennika
+
+# Archiwum wyników (baza results/pogadane.db z wyszukiwaniem pełnotekstowym)
+RESULT_STORE_ENABLED = True # Zapisuj wyniki w bazie, aby wyszukiwać je także po ponownym uruchomieniu
+SEMANTIC_SEARCH_ENABLED = False # Wyszukiwanie po znaczeniu ("gdzie rozmawialiśmy o X"); wymaga: pip install sentence-transformers
+SEMANTIC_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2" # Mały wielojęzyczny model wektorów zdań (działa na CPU)
+
 # --- Ustawienia Podsumowania ---
 SUMMARY_PROVIDER = "gguf" # Dostawca: "transformers" (pip, offline), "ollama" (lokalnie, wymaga instalacji), "google" (cloud API), lub "gguf" (llama-cpp, quantized models)
 SUMMARY_LANGUAGE = "Polish" # Język podsumowania (uwaga: większość modeli Transformers działa tylko po angielsku)
@@ -74,6 +117,8 @@ TRANSFORMERS_DEVICE = "auto" # Urządzenie: "auto" (automatyczny wybór GPU/CPU)
 # Wymagają instalacji: pip install llama-cpp-python
 GGUF_MODEL_PATH = "_app/dep/models/gemma-3-4b-it-Q4_K_M.gguf" # Ścieżka do pliku GGUF
 GGUF_N_GPU_LAYERS = 0 # Liczba warstw na GPU (0 = tylko CPU, >0 = użyj GPU dla przyspieszenia)
+GGUF_CONTEXT_SIZE = 4096 # Rozmiar kontekstu w tokenach; dłuższe transkrypcje są przycinane w pytaniach o nagranie
+GGUF_QA_STATE_MB = 1024 # Pamięć (MB) na zapamiętane rozmowy o nagraniach; najdawniej używane są zwalniane
 
 # Ustawienia Ogólne Skryptu
 TRANSCRIPTION_FORMAT = "txt"  # Format pliku transkrypcji (używany wewnętrznie przez skrypt CLI)
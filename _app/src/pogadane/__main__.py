@@ -2,17 +2,27 @@
 Pogadane - Main entry point for running as a module
 
 This allows running Pogadane with: python -m pogadane
+
+Without arguments the GUI is launched. Maintenance commands:
+    python -m pogadane calibrate --model turbo
+    python -m pogadane models install turbo --quantization int8
+    python -m pogadane results search "budżet na 2025"
+    python -m pogadane results find "gdzie rozmawialiśmy o podwyżkach"
 """
 
 import sys
+import argparse
+from pathlib import Path
+
+from .constants import CALIBRATION_CLIP_SECONDS, DEFAULT_CONFIG, RESULTS_DB, SEMANTIC_INDEX_DIR
 
 
-def main():
-    """Main entry point - launches the GUI."""
+def launch_gui():
+    """Launch the Flet GUI."""
     try:
         from .gui_flet import main as gui_main
         import flet as ft
-        
+
         print("Launching Pogadane - Material 3 Expressive GUI...")
         ft.app(target=gui_main)
     except ImportError as e:
@@ -25,5 +35,396 @@ def main():
         sys.exit(1)
 
 
+def run_calibrate(args) -> int:
+    """
+    Time faster-whisper configurations and store the fastest one.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Process exit code
+    """
+    from .hardware import calibrate_faster_whisper, save_tuning, probe_hardware
+    from .config_loader import ConfigManager
+
+    if args.probe_only:
+        print(f"🔧 {probe_hardware().summary()}")
+        return 0
+
+    config_manager = ConfigManager()
+    model = args.model or config_manager.get("WHISPER_MODEL")
+
+    audio = None
+    if args.audio:
+        try:
+            from faster_whisper import decode_audio
+            audio = decode_audio(args.audio)[: int(args.seconds * 16000)]
+        except ImportError:
+            print("❌ Error: faster-whisper library not installed.", file=sys.stderr)
+            print("   Install with: pip install faster-whisper", file=sys.stderr)
+            return 1
+
+    try:
+        results = calibrate_faster_whisper(
+            model,
+            device=args.device or config_manager.get("FASTER_WHISPER_DEVICE"),
+            clip_seconds=args.seconds,
+            audio=audio,
+        )
+    except ImportError:
+        print("❌ Error: faster-whisper library not installed.", file=sys.stderr)
+        print("   Install with: pip install faster-whisper", file=sys.stderr)
+        return 1
+
+    if not results or not results[0].ok:
+        print("❌ Error: No configuration could be run successfully.", file=sys.stderr)
+        return 1
+
+    best = results[0]
+    print(f"\n🏆 Fastest: {best}")
+
+    if args.dry_run:
+        print("   (--dry-run: result not saved)")
+    else:
+        save_tuning(model, best, config_manager)
+        print(f"✅ Saved to settings.json - used automatically when "
+              f"FASTER_WHISPER_COMPUTE_TYPE = \"auto\"")
+    return 0
+
+
+def run_models(args) -> int:
+    """
+    Manage the local CTranslate2 model store.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Process exit code
+    """
+    from . import model_store
+
+    action = args.models_action or "list"
+
+    if action == "list":
+        models = model_store.list_models()
+        if not models:
+            print(f"No models in {model_store.store_dir()}")
+            print("   Install with: python -m pogadane models install turbo")
+            return 0
+        for model in models:
+            print(model)
+        return 0
+
+    if action == "install":
+        print(f"⬇️ Installing '{args.name}'"
+              + (f" (quantization: {args.quantization})" if args.quantization else "") + "...")
+        try:
+            model = model_store.install_model(args.name, args.quantization)
+        except ImportError as e:
+            print(f"❌ Error: Missing library: {e}", file=sys.stderr)
+            print("   Install with: pip install faster-whisper"
+                  + (" transformers" if args.quantization else ""), file=sys.stderr)
+            return 1
+        except Exception as e:
+            print(f"❌ Error: Installation failed: {e}", file=sys.stderr)
+            return 1
+        print(f"✅ Installed: {model}")
+        return 0
+
+    if action == "import":
+        try:
+            model = model_store.import_model(args.path, args.name, args.quantization)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: Import failed: {e}", file=sys.stderr)
+            return 1
+        print(f"✅ Imported: {model}")
+        return 0
+
+    # verify
+    models = [model for model in model_store.list_models()
+              if not args.name or model.name == args.name]
+    if not models:
+        print("❌ Error: No matching models in the store.", file=sys.stderr)
+        return 1
+    failed = 0
+    for model in models:
+        ok = model_store.verify_model(model.path, full=args.full)
+        failed += not ok
+        print(f"{'✅' if ok else '❌'} {model}")
+    return 1 if failed else 0
+
+
+def _parse_date(value: str) -> float:
+    """Parse a YYYY-MM-DD argument into a Unix timestamp (local midnight)."""
+    from datetime import datetime
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got '{value}'")
+
+
+def run_results(args) -> int:
+    """
+    Search and browse the persistent result store.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Process exit code
+    """
+    from datetime import datetime
+    from .result_store import ResultStore
+
+    db = args.db or RESULTS_DB
+    action = args.results_action or "list"
+    if not db.exists() and action != "restore":
+        print(f"No result store at {db}")
+        print("   Results are stored by the GUI when RESULT_STORE_ENABLED = True")
+        return 1
+    store = ResultStore(db)
+    try:
+        if action in ("archive", "restore"):
+            from . import archive
+            try:
+                if action == "archive":
+                    count = archive.archive_store(store, args.destination, full=args.full)
+                    print(f"✅ Archived {count} new result(s) to {args.destination}")
+                else:
+                    count = archive.import_archive(args.archive, store, replace=args.replace)
+                    print(f"✅ Restored {count} result(s) into {db}")
+            except ImportError as e:
+                print(f"❌ Error: Missing library: {e}", file=sys.stderr)
+                print("   Install with: pip install pyarrow", file=sys.stderr)
+                return 1
+            return 0
+
+        if action in ("find", "index"):
+            return _run_semantic(args, store)
+
+        if action == "show":
+            result = store.get(args.source)
+            if result is None:
+                print(f"❌ Error: No stored result for {args.source}", file=sys.stderr)
+                return 1
+            provenance = result["provenance"]
+            print(f"Source: {result['source']}")
+            print(f"Stored: {datetime.fromtimestamp(result['created_at']):%Y-%m-%d %H:%M}")
+            for key in ("transcription_model", "profile", "language", "summary_provider", "summary_model"):
+                if provenance.get(key):
+                    print(f"{key}: {provenance[key]}")
+            print("\n--- Transcription ---")
+            print(result["transcription"])
+            print("\n--- Summary ---")
+            print(result["summary"] or "(none)")
+            return 0
+
+        filters = dict(
+            source=args.source, profile=args.profile, transcription_model=args.model,
+            summary_model=args.summary_model, since=args.since, until=args.until,
+        )
+        if action == "export":
+            from .exporters import export_results
+            if args.query:
+                sources = [hit.source for hit in store.search(args.query, limit=args.limit or -1, **filters)]
+            else:
+                sources = [row["source"] for row in store.filter(limit=args.limit, **filters)]
+
+            def items():
+                for source in sources:
+                    result = store.get(source)
+                    if result:
+                        yield source, result["transcription"], result["summary"]
+
+            def progress(done, total):
+                print(f"\r   {done}/{total}", end="", flush=True)
+
+            stats = export_results(items(), args.format, args.destination, total=len(sources), progress=progress)
+            print(f"\n✅ Exported {stats.exported} result(s) to {args.destination}"
+                  + (f" ({stats.skipped} without timestamps skipped)" if stats.skipped else ""))
+            return 0
+
+        if action == "search":
+            try:
+                hits = store.search(args.query, limit=args.limit or 50, raw=args.raw, **filters)
+            except ValueError as e:
+                print(f"❌ Error: {e}", file=sys.stderr)
+                return 1
+            for hit in hits:
+                print(f"{datetime.fromtimestamp(hit.created_at):%Y-%m-%d %H:%M}  {hit.source}")
+                print(f"    {hit.snippet}")
+            print(f"\n{len(hits)} result(s)")
+            return 0
+
+        # list
+        rows = store.filter(limit=args.limit or 50, **filters)
+        for row in rows:
+            details = ", ".join(str(row[key]) for key in ("transcription_model", "profile") if row[key])
+            print(f"{datetime.fromtimestamp(row['created_at']):%Y-%m-%d %H:%M}  {row['source']}"
+                  + (f"  ({details})" if details else ""))
+        print(f"\n{len(rows)} of {len(store)} stored result(s)")
+        return 0
+    finally:
+        store.close()
+
+
+def _run_semantic(args, store) -> int:
+    """
+    Search the semantic index, or add stored results to it.
+
+    Args:
+        args: Parsed command-line arguments
+        store: Open result store
+
+    Returns:
+        Process exit code
+    """
+    from .config_loader import ConfigManager
+    from .text_utils import format_timestamp
+
+    try:
+        from .semantic_index import SemanticIndex
+        model = ConfigManager().get("SEMANTIC_MODEL", DEFAULT_CONFIG["SEMANTIC_MODEL"])
+        index = SemanticIndex(args.index or SEMANTIC_INDEX_DIR, model)
+        if args.results_action == "index":
+            if args.rebuild:
+                index.clear()
+            sources = [row["source"] for row in reversed(store.filter(limit=None)) if row["source"] not in index]
+            for number, source in enumerate(sources, 1):
+                result = store.get(source)
+                if result:
+                    chunks = index.add(source, result["transcription"])
+                    print(f"   [{number}/{len(sources)}] {source}: {chunks} fragment(s)")
+            print(f"✅ Indexed {len(sources)} result(s); {len(index)} fragment(s) in the index")
+            return 0
+
+        if not len(index):
+            print("Semantic index is empty")
+            print("   Build it with: python -m pogadane results index")
+            return 1
+        hits = index.search(args.query, limit=args.limit, per_source=args.per_source)
+    except ImportError as e:
+        print(f"❌ Error: Missing library: {e}", file=sys.stderr)
+        print("   Install with: pip install sentence-transformers", file=sys.stderr)
+        return 1
+    for hit in hits:
+        position = f" @ {format_timestamp(hit.start)}" if hit.start is not None else ""
+        print(f"{hit.score:.2f}  {hit.source}{position}")
+        print(f"    {hit.text}")
+    print(f"\n{len(hits)} fragment(s)")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+    parser = argparse.ArgumentParser(
+        prog="pogadane",
+        description="Pogadane - transcription and summaries of recordings. "
+                    "Run without arguments to start the GUI.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    calibrate = subparsers.add_parser(
+        "calibrate",
+        help="Find the fastest faster-whisper settings for this machine",
+    )
+    calibrate.add_argument("--model", help="Whisper model (default: WHISPER_MODEL from config)")
+    calibrate.add_argument("--device", choices=["auto", "cpu", "cuda"],
+                           help="Device (default: FASTER_WHISPER_DEVICE from config)")
+    calibrate.add_argument("--seconds", type=float, default=CALIBRATION_CLIP_SECONDS,
+                           help="Length of the test clip in seconds "
+                                f"(default: {CALIBRATION_CLIP_SECONDS})")
+    calibrate.add_argument("--audio", help="Use this audio file instead of a synthetic clip")
+    calibrate.add_argument("--dry-run", action="store_true",
+                           help="Print results without saving them")
+    calibrate.add_argument("--probe-only", action="store_true",
+                           help="Only print detected hardware")
+    calibrate.set_defaults(handler=run_calibrate)
+
+    models = subparsers.add_parser(
+        "models",
+        help="Manage locally stored faster-whisper models (offline loading)",
+    )
+    models.set_defaults(handler=run_models, models_action=None)
+    models_actions = models.add_subparsers(dest="models_action")
+    models_actions.add_parser("list", help="List stored models")
+    install = models_actions.add_parser("install", help="Download a model into the store")
+    install.add_argument("name", help="Model name, e.g. turbo, large-v3, small")
+    install.add_argument("--quantization",
+                         help="Convert with this quantization, e.g. int8 (requires transformers)")
+    import_ = models_actions.add_parser("import", help="Import a converted CTranslate2 model directory")
+    import_.add_argument("path", help="Directory with model.bin and config.json")
+    import_.add_argument("--name", required=True, help="Model name to register")
+    import_.add_argument("--quantization", help="Quantization of the weights")
+    verify = models_actions.add_parser("verify", help="Check stored models against their manifests")
+    verify.add_argument("name", nargs="?", help="Only verify this model")
+    verify.add_argument("--full", action="store_true", help="Recompute all checksums")
+
+    results = subparsers.add_parser(
+        "results",
+        help="Search and list results stored by the GUI (results/pogadane.db)",
+    )
+    results.set_defaults(handler=run_results, results_action=None, source=None, profile=None,
+                         model=None, summary_model=None, since=None, until=None, limit=None)
+    results.add_argument("--db", type=Path, help=f"Result database (default: {RESULTS_DB})")
+    results_actions = results.add_subparsers(dest="results_action")
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument("--source", help="Only sources whose name contains this text")
+    filters.add_argument("--profile", help="Only results of this transcription profile")
+    filters.add_argument("--model", help="Only results of this Whisper model")
+    filters.add_argument("--summary-model", help="Only results summarized by this model")
+    filters.add_argument("--since", type=_parse_date, help="Stored on or after this day (YYYY-MM-DD)")
+    filters.add_argument("--until", type=_parse_date, help="Stored before this day (YYYY-MM-DD)")
+    filters.add_argument("--limit", type=int,
+                         help="Maximum number of results (default: 50, export: all)")
+    search = results_actions.add_parser("search", parents=[filters],
+                                         help="Full-text search of transcripts and summaries")
+    search.add_argument("query", help="Words to find (all must occur)")
+    search.add_argument("--raw", action="store_true",
+                        help="Use FTS5 query syntax (OR, NOT, \"phrases\", prefix*)")
+    results_actions.add_parser("list", parents=[filters], help="List stored results, newest first")
+    export = results_actions.add_parser("export", parents=[filters],
+                                        help="Export stored results (subtitle formats: one file per result)")
+    export.add_argument("format", choices=["txt", "md", "jsonl", "srt", "vtt"], help="Export format")
+    export.add_argument("destination", type=Path, help="Output file (txt, md, jsonl) or folder (srt, vtt)")
+    export.add_argument("--query", help="Only results matching this full-text search")
+    archive = results_actions.add_parser(
+        "archive", help="Append results stored since the last run to a Parquet archive (analytics)")
+    archive.add_argument("destination", type=Path, help="Archive folder")
+    archive.add_argument("--full", action="store_true", help="Archive all results again")
+    restore = results_actions.add_parser(
+        "restore", help="Restore the result store from a Parquet archive without reprocessing")
+    restore.add_argument("archive", type=Path, help="Archive folder")
+    restore.add_argument("--replace", action="store_true",
+                         help="Overwrite results already in the store")
+    find = results_actions.add_parser(
+        "find", help="Find where something was discussed (semantic search, needs sentence-transformers)")
+    find.add_argument("query", help="Topic or question, e.g. \"where we discussed the budget\"")
+    find.add_argument("--limit", type=int, default=10, help="Maximum number of fragments (default: 10)")
+    find.add_argument("--per-source", type=int, help="Maximum fragments of one recording")
+    find.add_argument("--index", type=Path, help=f"Index folder (default: {SEMANTIC_INDEX_DIR})")
+    index = results_actions.add_parser("index", help="Add stored results to the semantic index")
+    index.add_argument("--rebuild", action="store_true", help="Discard the index and embed everything again")
+    index.add_argument("--index", type=Path, help=f"Index folder (default: {SEMANTIC_INDEX_DIR})")
+    show = results_actions.add_parser("show", help="Print a stored transcription and summary")
+    show.add_argument("source", help="Source (file path or URL) as listed")
+
+    return parser
+
+
+def main(argv=None):
+    """Main entry point - launches the GUI or runs a maintenance command."""
+    args = build_parser().parse_args(argv)
+
+    handler = getattr(args, "handler", None)
+    if handler is None:
+        launch_gui()
+        return
+
+    sys.exit(handler(args))
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,421 @@
+"""
+Columnar archive of results for analytics (Apache Parquet).
+
+An archive is a folder of Parquet files written in pairs, one pair per
+archiving run:
+
+- ``results-<time>.parquet``: one row per result with the source, summary,
+  status, models, profile, language, timings (audio and processing seconds,
+  the job's metrics as JSON) and provenance as JSON. The transcription text
+  is only stored here for results without timestamps.
+- ``segments-<time>.parquet``: one row per transcript segment with the
+  ``source_id`` of its result, segment number, start and end times, text
+  and average log-probability (null when the decoder did not report it).
+
+Files are zstd-compressed and written in row groups while results are read
+from the store, so archiving needs memory for one row group only. Each run
+adds only results stored after the newest archived one, so archiving the
+result store regularly appends small files instead of rewriting the archive.
+A source archived again (its result was replaced) appears in several files;
+the row with the newest ``created_at`` is the current one.
+
+The archive can be read with any Parquet tool (pandas, DuckDB, Polars) or
+with ``open_dataset``; ``import_archive`` restores the result store from it
+without reprocessing any recording. Word timestamps are not archived.
+
+Requires the optional ``pyarrow`` package (``pip install pyarrow``).
+
+Usage:
+    archived = archive_store(store, "archiwum")
+    segments = open_dataset("archiwum", "segments").to_table()
+    restored = import_archive("archiwum", ResultStore("kopia.db"))
+"""
+
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .constants import ARCHIVE_COMPRESSION, ARCHIVE_ROW_GROUP_ROWS
+from .metrics import JobMetrics
+from .result_store import ResultStore
+from .segments import SegmentStore
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_TABLES = ("results", "segments")
+
+
+def source_id(source: str) -> int:
+    """
+    Stable 64-bit identifier of a source, joining segments to their result.
+
+    Args:
+        source: Source identifier (file path or URL)
+
+    Returns:
+        Signed 64-bit integer derived from a hash of the source
+    """
+    digest = hashlib.blake2b(source.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def _schemas():
+    """Arrow schemas of the results and segments tables."""
+    import pyarrow as pa
+
+    results = pa.schema([
+        ("source_id", pa.int64()),
+        ("source", pa.string()),
+        ("created_at", pa.float64()),  # Unix time
+        ("job_id", pa.string()),
+        ("status", pa.string()),
+        ("summary", pa.string()),
+        ("transcription", pa.string()),  # null when the segments table holds it
+        ("segments", pa.int32()),
+        ("transcription_model", pa.string()),
+        ("summary_model", pa.string()),
+        ("profile", pa.string()),
+        ("language", pa.string()),
+        ("audio_seconds", pa.float64()),
+        ("processing_seconds", pa.float64()),
+        ("provenance", pa.string()),  # JSON
+        ("metrics", pa.string()),  # JSON (JobMetrics)
+    ])
+    segments = pa.schema([
+        ("source_id", pa.int64()),
+        ("segment", pa.int32()),
+        ("start", pa.float32()),
+        ("end", pa.float32()),
+        ("text", pa.string()),
+        ("logprob", pa.float32()),
+    ])
+    return results, segments
+
+
+def part_files(directory: Union[str, Path], table: str) -> List[Path]:
+    """
+    Files of one archive table, oldest first.
+
+    Args:
+        directory: Archive folder
+        table: "results" or "segments"
+
+    Returns:
+        Parquet files of the table (empty if the folder does not exist)
+    """
+    if table not in ARCHIVE_TABLES:
+        raise ValueError(f"Unknown archive table: {table}")
+    return sorted(Path(directory).glob(f"{table}-*.parquet"))
+
+
+def open_dataset(directory: Union[str, Path], table: str = "results"):
+    """
+    Open an archive table as a ``pyarrow.dataset.Dataset`` for analytics.
+
+    Args:
+        directory: Archive folder
+        table: "results" or "segments"
+
+    Returns:
+        Dataset over all files of the table
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow.dataset as ds
+
+    schema = _schemas()[ARCHIVE_TABLES.index(table)]
+    return ds.dataset([str(path) for path in part_files(directory, table)], schema=schema, format="parquet")
+
+
+def last_archived(directory: Union[str, Path]) -> Optional[float]:
+    """
+    Time the newest archived result was stored (read from file statistics).
+
+    Args:
+        directory: Archive folder
+
+    Returns:
+        Largest created_at in the archive, or None if it is empty
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow.parquet as pq
+
+    newest = None
+    for path in part_files(directory, "results"):
+        metadata = pq.ParquetFile(path).metadata
+        column = metadata.schema.names.index("created_at")
+        for group in range(metadata.num_row_groups):
+            statistics = metadata.row_group(group).column(column).statistics
+            if statistics is not None and statistics.has_min_max:
+                newest = statistics.max if newest is None else max(newest, statistics.max)
+    return newest
+
+
+class ArchiveWriter:
+    """
+    Writes results into a new pair of archive files, one row group at a time.
+
+    Files are written under a temporary name and renamed by close(), so an
+    interrupted run never leaves a truncated file in the archive.
+
+    Attributes:
+        results_path (Path): Results file of this part
+        segments_path (Path): Segments file of this part
+        count (int): Results written
+    """
+
+    def __init__(self, directory: Union[str, Path], row_group_rows: int = ARCHIVE_ROW_GROUP_ROWS,
+                 compression: str = ARCHIVE_COMPRESSION):
+        """
+        Create the files of a new archive part.
+
+        Args:
+            directory: Archive folder (created if missing)
+            row_group_rows: Buffered segment rows written as one row group
+            compression: Parquet compression codec
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        import pyarrow.parquet as pq
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        # Names sort in the order the parts were written
+        stamp, number = time.strftime("%Y%m%d-%H%M%S"), 1
+        while (directory / f"results-{stamp}-{number:03d}.parquet").exists():
+            number += 1
+        name = f"{stamp}-{number:03d}"
+        self.results_path = directory / f"results-{name}.parquet"
+        self.segments_path = directory / f"segments-{name}.parquet"
+        self.row_group_rows = row_group_rows
+        self.count = 0
+        self._schemas = _schemas()
+        self._writers = [
+            pq.ParquetWriter(str(self._partial(path)), schema, compression=compression)
+            for path, schema in zip((self.results_path, self.segments_path), self._schemas)
+        ]
+        self._buffers: Tuple[Dict[str, list], Dict[str, list]] = tuple(
+            {name: [] for name in schema.names} for schema in self._schemas
+        )
+
+    @staticmethod
+    def _partial(path: Path) -> Path:
+        return path.with_name(path.name + ".partial")
+
+    def add(self, result: Dict[str, Any]) -> None:
+        """
+        Append a result.
+
+        Args:
+            result: Result as returned by ResultStore.get()
+        """
+        key = source_id(result["source"])
+        transcription = result["transcription"]
+        segments = transcription if isinstance(transcription, SegmentStore) else None
+        metrics = result.get("metrics")
+        row = {
+            "source_id": key,
+            "source": result["source"],
+            "created_at": result["created_at"],
+            "job_id": result.get("job_id"),
+            "status": result.get("status"),
+            "summary": result.get("summary") or "",
+            "transcription": None if segments is not None else transcription,
+            "segments": len(segments) if segments is not None else None,
+            "transcription_model": result.get("transcription_model"),
+            "summary_model": result.get("summary_model"),
+            "profile": result.get("profile"),
+            "language": result.get("language"),
+            "audio_seconds": result.get("audio_seconds"),
+            "processing_seconds": result.get("processing_seconds"),
+            "provenance": json.dumps(result.get("provenance") or {}, ensure_ascii=False, default=str),
+            "metrics": json.dumps(metrics.to_dict()) if metrics else None,
+        }
+        results, rows = self._buffers
+        for name, value in row.items():
+            results[name].append(value)
+        if segments is not None:
+            for index in range(len(segments)):
+                rows["source_id"].append(key)
+                rows["segment"].append(index)
+                rows["start"].append(segments.start(index))
+                rows["end"].append(segments.end(index))
+                rows["text"].append(segments.text(index))
+                rows["logprob"].append(segments.logprob(index))
+        self.count += 1
+        if len(rows["source_id"]) >= self.row_group_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows as a row group of each file."""
+        import pyarrow as pa
+
+        for writer, schema, buffer in zip(self._writers, self._schemas, self._buffers):
+            if buffer[schema.names[0]]:
+                writer.write_table(pa.Table.from_pydict(buffer, schema=schema))
+                for column in buffer.values():
+                    column.clear()
+
+    def close(self) -> None:
+        """Write the remaining rows and move the files into the archive (removed if empty)."""
+        self.flush()
+        for writer, path in zip(self._writers, (self.results_path, self.segments_path)):
+            writer.close()
+            if self.count:
+                self._partial(path).replace(path)
+            else:
+                self._partial(path).unlink()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def archive_store(store: ResultStore, directory: Union[str, Path], full: bool = False,
+                  row_group_rows: int = ARCHIVE_ROW_GROUP_ROWS, **filters: Any) -> int:
+    """
+    Append results of the result store to an archive.
+
+    Args:
+        store: Result store to read
+        directory: Archive folder (created if missing)
+        full: Archive all results, not only those stored after the newest archived one
+        row_group_rows: Segment rows per row group
+        **filters: Restrict the results, see ResultStore.filter()
+
+    Returns:
+        Number of results archived (0 writes no files)
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    newest = None if full else last_archived(directory)
+    rows = store.filter(limit=None, **filters)
+    sources = [row["source"] for row in reversed(rows) if newest is None or row["created_at"] > newest]
+    with ArchiveWriter(directory, row_group_rows=row_group_rows) as writer:
+        for source in sources:
+            result = store.get(source)
+            if result is not None:
+                writer.add(result)
+    logger.info(f"Archived {writer.count} result(s) to {writer.results_path.parent}")
+    return writer.count
+
+
+def _current_rows(directory: Path) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+    """Newest archived row of every source with the index of its part file."""
+    import pyarrow.parquet as pq
+
+    current: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    for part, path in enumerate(part_files(directory, "results")):
+        for row in pq.read_table(str(path)).to_pylist():
+            known = current.get(row["source"])
+            if known is None or row["created_at"] >= known[1]["created_at"]:
+                current[row["source"]] = (part, row)
+    return current
+
+
+def _iter_segments(path: Path, wanted: set) -> Iterator[Tuple[int, SegmentStore]]:
+    """
+    Rebuild the segment stores of the wanted results from a segments file.
+
+    Segments of a result are contiguous and in order, as ArchiveWriter writes them.
+    """
+    import pyarrow.parquet as pq
+
+    names = ("start", "end", "text", "logprob")
+    current_id, current = None, None
+    for batch in pq.ParquetFile(str(path)).iter_batches(columns=["source_id", *names]):
+        columns = batch.to_pydict()
+        keys = columns["source_id"]
+        first = 0
+        # Collect the rows of each result as column slices, then build its store at once
+        for index in range(len(keys) + 1):
+            if index < len(keys) and keys[index] == current_id:
+                continue
+            if current is not None and index > first:
+                for name in names:
+                    current[name].extend(columns[name][first:index])
+            if index == len(keys):
+                break
+            if current is not None:
+                yield current_id, SegmentStore.from_columns(*(current[name] for name in names))
+            current_id, first = keys[index], index
+            current = {name: [] for name in names} if current_id in wanted else None
+    if current is not None:
+        yield current_id, SegmentStore.from_columns(*(current[name] for name in names))
+
+
+def _stored_result(row: Dict[str, Any], transcription: Union[str, SegmentStore]) -> Dict[str, Any]:
+    """ResultStore.add() arguments of an archived row."""
+    return dict(
+        source=row["source"],
+        transcription=transcription,
+        summary=row["summary"] or "",
+        job_id=row["job_id"],
+        status=row["status"] or "completed",
+        provenance=json.loads(row["provenance"]) if row["provenance"] else {},
+        metrics=JobMetrics.from_dict(json.loads(row["metrics"])) if row["metrics"] else None,
+        created_at=row["created_at"],
+    )
+
+
+def import_archive(directory: Union[str, Path], store: ResultStore, replace: bool = False,
+                   batch_size: int = 500) -> int:
+    """
+    Restore results from an archive into the result store.
+
+    Args:
+        directory: Archive folder
+        store: Result store to fill
+        replace: Overwrite results already in the store (default: keep them)
+        batch_size: Results stored per transaction
+
+    Returns:
+        Number of results restored
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    directory = Path(directory)
+    current = _current_rows(directory)
+    if not replace:
+        for source in store.sources():
+            current.pop(source, None)
+
+    restored = 0
+    batch: List[Dict[str, Any]] = []
+
+    def add(result: Dict[str, Any]) -> None:
+        nonlocal restored
+        batch.append(result)
+        if len(batch) >= batch_size:
+            restored += store.add_many(batch)
+            batch.clear()
+
+    segment_files = part_files(directory, "segments")
+    for part, results_path in enumerate(part_files(directory, "results")):
+        rows = {row["source_id"]: row for index, row in current.values() if index == part}
+        if not rows:
+            continue
+        for row in rows.values():
+            if not row["segments"]:
+                add(_stored_result(row, row["transcription"] or ""))
+        wanted = {key for key, row in rows.items() if row["segments"]}
+        segments_path = results_path.with_name(results_path.name.replace("results-", "segments-", 1))
+        if wanted and segments_path in segment_files:
+            for key, segments in _iter_segments(segments_path, wanted):
+                add(_stored_result(rows[key], segments))
+                wanted.discard(key)
+        for key in wanted:
+            logger.warning(f"Segments of {rows[key]['source']} missing in the archive")
+    restored += store.add_many(batch)
+    return restored
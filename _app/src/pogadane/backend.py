@@ -6,15 +6,17 @@ with proper logging and progress callbacks - no console parsing.
 """
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, Callable, Dict, Any
+from typing import Optional, Tuple, Callable, Dict, Any, List, Union
 from dataclasses import dataclass
 from enum import Enum
 import shutil
+import time
 import uuid
 
 # Import utility modules
-from .config_loader import ConfigManager
+from .config_loader import ConfigManager, parse_bool
 from .text_utils import is_valid_url
 from .file_utils import get_unique_filename, get_input_name_stem
 from .constants import (
@@ -22,8 +24,11 @@ from .constants import (
     TEMP_AUDIO_FOLDER_NAME,
     PROJECT_ROOT
 )
-from .llm_providers import LLMProviderFactory
-from .transcription_providers import TranscriptionProviderFactory
+from .llm_providers import LLMProviderFactory, LlamaCppProvider
+from .segments import SegmentStore
+from .log_store import LogStore
+from .metrics import JobMetrics, peak_rss_bytes
+from .transcription_providers import TranscriptionProviderFactory, get_transcription_profile
 
 
 # Configure logging
@@ -59,19 +64,30 @@ class ProgressCallback:
     Native Python progress callback handler.
     
     Provides structured progress updates without print statements.
+    Updates and log messages are also recorded in a LogStore when given,
+    and the time spent in each stage is measured (stage_seconds).
     """
     
-    def __init__(self, callback: Optional[Callable[[ProgressUpdate], None]] = None):
+    def __init__(self, callback: Optional[Callable[[ProgressUpdate], None]] = None,
+                 log_store: Optional[LogStore] = None, source: Optional[str] = None):
         """
         Initialize progress callback.
         
         Args:
             callback: Optional callback function that receives ProgressUpdate objects
+            log_store: Optional on-disk log receiving every update
+            source: Input source recorded with each log record
         """
         self.callback = callback
+        self.log_store = log_store
+        self.source = source
         self.current_stage = ProcessingStage.INITIALIZING
         self.current_progress = 0.0
         self.history = []
+        self.started_at = time.time()
+        # Seconds spent in each stage (stage value -> seconds), see update()
+        self.stage_seconds: Dict[str, float] = {}
+        self._stage_started = time.perf_counter()
     
     def update(
         self, 
@@ -89,6 +105,8 @@ class ProgressCallback:
             progress: Progress value (0.0 to 1.0)
             details: Optional additional details
         """
+        if stage != self.current_stage:
+            self._close_stage()
         self.current_stage = stage
         self.current_progress = progress
         
@@ -103,6 +121,7 @@ class ProgressCallback:
         
         # Log the update
         logger.info(str(update))
+        self._record(message, "info")
         
         # Call the callback if provided
         if self.callback:
@@ -121,6 +140,7 @@ class ProgressCallback:
         """
         log_func = getattr(logger, level, logger.info)
         log_func(message)
+        self._record(message, level)
         
         # Also send as progress update if callback exists
         if self.callback:
@@ -134,6 +154,25 @@ class ProgressCallback:
                 self.callback(update)
             except Exception as e:
                 logger.error(f"Error in progress callback: {e}")
+    
+    def _close_stage(self):
+        """Add the time since the current stage started to stage_seconds."""
+        now = time.perf_counter()
+        if self.current_stage not in (ProcessingStage.COMPLETED, ProcessingStage.ERROR):
+            stage = self.current_stage.value
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + now - self._stage_started
+        self._stage_started = now
+    
+    def _record(self, message: str, level: str):
+        """Append a message to the log store (if any) with the current stage."""
+        if self.log_store is not None:
+            self.log_store.write(
+                message,
+                level=level,
+                source=self.source,
+                stage=self.current_stage.value,
+                progress=round(self.current_progress, 3),
+            )
 
 
 class PogadaneBackend:
@@ -162,6 +201,38 @@ class PogadaneBackend:
         
         self.config = self.config_manager.config
         
+        # Statistics reported by the transcription provider for the last file
+        self.last_transcription_info = {}
+        
+        # Segments of the last transcription (None if it is not in segment format)
+        self.last_segments: Optional[SegmentStore] = None
+        
+        # Statistics reported by the LLM provider for the last summary (tokens, timings)
+        self.last_summary_info = {}
+        
+        # GGUF provider kept between questions: its Q&A sessions hold evaluated transcripts
+        self._qa_provider: Optional[LlamaCppProvider] = None
+        
+        # Statistics of the last answered question (evaluated and reused prompt tokens, timings)
+        self.last_qa_info = {}
+        
+        # Performance metrics of the last process_file() call
+        self.last_job_metrics: Optional[JobMetrics] = None
+        
+        # Optional on-disk log (LogStore) fed by every ProgressCallback
+        self.log_store: Optional[LogStore] = None
+        
+        # Optional FingerprintIndex: transcripts of recordings whose audio was
+        # transcribed before (e.g. an MP4 and its MP3 export) are reused
+        self.fingerprint_index = None
+        # Fingerprints of new recordings are computed here while they are transcribed
+        self._fingerprint_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Transcriptions produced ahead of time by prepare_batch(), keyed by input source
+        self._pretranscribed: Dict[str, str] = {}
+        # Transcription statistics of those files (clip length, model, profile)
+        self._pretranscribed_info: Dict[str, Dict[str, Any]] = {}
+        
         # Setup temp audio directory
         self.temp_audio_dir = PROJECT_ROOT / "src" / "pogadane" / TEMP_AUDIO_FOLDER_NAME
         self.temp_audio_dir.mkdir(parents=True, exist_ok=True)
@@ -171,7 +242,10 @@ class PogadaneBackend:
         input_source: str,
         progress_callback: Optional[Callable[[ProgressUpdate], None]] = None,
         start_time: Optional[str] = None,
-        end_time: Optional[str] = None
+        end_time: Optional[str] = None,
+        profile: Optional[str] = None,
+        segment_callback: Optional[Callable[[float, float, str], None]] = None,
+        reuse_duplicates: bool = True
     ) -> Tuple[Optional[str], Optional[str]]:
         """
         Process a single file or URL with native progress tracking.
@@ -181,12 +255,20 @@ class PogadaneBackend:
             progress_callback: Optional callback that receives ProgressUpdate objects
             start_time: Optional start time for YouTube download (format: mm:ss or hh:mm:ss)
             end_time: Optional end time for YouTube download (format: mm:ss or hh:mm:ss)
+            profile: Optional transcription profile for this job ("fast", "balanced",
+                "accurate"); defaults to TRANSCRIPTION_PROFILE from config
+            segment_callback: Optional callback receiving (start, end, text) of each
+                transcript segment while decoding runs (providers that decode
+                segment by segment; called from the processing thread)
+            reuse_duplicates: Reuse the transcript of an earlier recording with the
+                same audio (AUDIO_DEDUPE_ENABLED and fingerprint_index required);
+                False transcribes again
             
         Returns:
             Tuple of (transcription, summary) or (None, None) on error
         """
         # Create progress tracker
-        progress = ProgressCallback(progress_callback)
+        progress = ProgressCallback(progress_callback, self.log_store, input_source)
         
         try:
             progress.update(
@@ -196,11 +278,18 @@ class PogadaneBackend:
                 {"source": input_source}
             )
             
+            self.last_transcription_info = {}
+            self.last_summary_info = {}
+            self.last_segments = None
+            
             # Get source name
             source_name = get_input_name_stem(input_source)
             
             # Handle YouTube URLs
-            if is_valid_url(input_source):
+            if input_source in self._pretranscribed:
+                # Already transcribed in a shared short-clip batch (prepare_batch)
+                audio_file = None
+            elif is_valid_url(input_source):
                 time_range_msg = ""
                 if start_time or end_time:
                     time_range_msg = f" [{start_time or '0:00'} - {end_time or 'koniec'}]"
@@ -236,13 +325,43 @@ class PogadaneBackend:
                     return None, None
             
             # Transcribe
-            progress.update(
-                ProcessingStage.TRANSCRIBING,
-                "Transcribing audio...",
-                0.3,
-                {"audio_file": str(audio_file)}
-            )
-            transcription = self._transcribe_audio(audio_file, source_name, progress)
+            if audio_file is None:
+                transcription = self._pretranscribed.pop(input_source)
+                self.last_transcription_info = self._pretranscribed_info.pop(input_source, {})
+                self.last_segments = SegmentStore.from_text(transcription)
+                progress.update(
+                    ProcessingStage.TRANSCRIBING,
+                    "Using batched short-clip transcription",
+                    0.3,
+                    {"batched": True}
+                )
+            else:
+                fingerprint, pending_fingerprint, duplicate = None, None, None
+                if self._dedupe_enabled():
+                    if reuse_duplicates and self._may_have_duplicate(audio_file, input_source):
+                        fingerprint = self._fingerprint_audio(audio_file, progress)
+                        if fingerprint is not None:
+                            duplicate = self._find_duplicate(fingerprint, input_source, progress)
+                    else:
+                        # Nothing to compare with: fingerprint for the index during transcription
+                        pending_fingerprint = self._start_fingerprint(audio_file)
+                if duplicate is not None:
+                    transcription = self._reuse_transcript(duplicate, fingerprint, progress)
+                else:
+                    progress.update(
+                        ProcessingStage.TRANSCRIBING,
+                        "Transcribing audio...",
+                        0.3,
+                        {"audio_file": str(audio_file)}
+                    )
+                    transcription = self._transcribe_audio(
+                        audio_file, source_name, progress, profile, segment_callback
+                    )
+                    if pending_fingerprint is not None:
+                        # Waited for even if transcription failed: the file is deleted next
+                        fingerprint = self._fingerprint_audio(audio_file, progress, pending_fingerprint)
+                    if transcription and fingerprint is not None:
+                        self._index_fingerprint(input_source, fingerprint, transcription, progress)
             
             if not transcription:
                 progress.update(
@@ -276,7 +395,8 @@ class PogadaneBackend:
                 1.0,
                 {
                     "transcription_length": len(transcription) if transcription else 0,
-                    "summary_length": len(summary) if summary else 0
+                    "summary_length": len(summary) if summary else 0,
+                    "transcription_info": self.last_transcription_info
                 }
             )
             
@@ -291,6 +411,163 @@ class PogadaneBackend:
                 {"error": str(e)}
             )
             return None, None
+        finally:
+            self.last_job_metrics = self._job_metrics(input_source, progress)
+    
+    def _job_metrics(self, input_source: str, progress: ProgressCallback) -> JobMetrics:
+        """Collect the performance metrics of a finished process_file() call."""
+        transcription_info = self.last_transcription_info
+        summary_info = self.last_summary_info
+        return JobMetrics(
+            source=input_source,
+            started_at=progress.started_at,
+            status="completed" if progress.current_stage == ProcessingStage.COMPLETED else "error",
+            stage_seconds=dict(progress.stage_seconds),
+            audio_seconds=transcription_info.get("audio_duration"),
+            prompt_tokens=summary_info.get("prompt_tokens"),
+            completion_tokens=summary_info.get("completion_tokens"),
+            prompt_eval_seconds=summary_info.get("prompt_eval_seconds"),
+            generation_seconds=summary_info.get("generation_seconds"),
+            peak_rss_bytes=peak_rss_bytes(),
+            cache_hits=transcription_info.get("model_cache_hits", 0),
+            cache_misses=transcription_info.get("model_cache_misses", 0),
+        )
+
+    def job_provenance(self) -> Dict[str, Any]:
+        """
+        Describe how the result of the last process_file() call was produced.
+
+        Returns:
+            Dictionary with the providers, models, profile, languages and prompt
+            template, plus the provider statistics (JSON-serializable)
+        """
+        config = self.config
+        transcription_info = self.last_transcription_info
+        summary_provider = getattr(config, 'SUMMARY_PROVIDER', DEFAULT_CONFIG['SUMMARY_PROVIDER'])
+        summary_models = {
+            "ollama": getattr(config, 'OLLAMA_MODEL', DEFAULT_CONFIG['OLLAMA_MODEL']),
+            "google": getattr(config, 'GOOGLE_GEMINI_MODEL', DEFAULT_CONFIG['GOOGLE_GEMINI_MODEL']),
+            "transformers": getattr(config, 'TRANSFORMERS_MODEL', None),
+            "gguf": Path(getattr(config, 'GGUF_MODEL_PATH', DEFAULT_CONFIG['GGUF_MODEL_PATH']) or "").name or None,
+        }
+        return {
+            "transcription_provider": getattr(config, 'TRANSCRIPTION_PROVIDER', DEFAULT_CONFIG['TRANSCRIPTION_PROVIDER']),
+            "transcription_model": transcription_info.get("model")
+                or getattr(config, 'WHISPER_MODEL', DEFAULT_CONFIG['WHISPER_MODEL']),
+            "profile": transcription_info.get("profile")
+                or getattr(config, 'TRANSCRIPTION_PROFILE', DEFAULT_CONFIG['TRANSCRIPTION_PROFILE']),
+            "language": getattr(config, 'WHISPER_LANGUAGE', DEFAULT_CONFIG['WHISPER_LANGUAGE']),
+            "summary_provider": summary_provider,
+            "summary_model": summary_models.get(summary_provider),
+            "summary_language": getattr(config, 'SUMMARY_LANGUAGE', DEFAULT_CONFIG['SUMMARY_LANGUAGE']),
+            "prompt_template": getattr(config, 'LLM_PROMPT_TEMPLATE_NAME', DEFAULT_CONFIG['LLM_PROMPT_TEMPLATE_NAME']),
+            "transcription_info": dict(transcription_info),
+            "summary_info": dict(self.last_summary_info),
+        }
+
+    def prepare_batch(
+        self,
+        input_sources: List[Union[str, Dict[str, Any]]],
+        progress_callback: Optional[Callable[[ProgressUpdate], None]] = None
+    ) -> int:
+        """
+        Transcribe short local files of a queue together before processing.
+        
+        With SHORT_CLIP_BATCHING enabled, local files no longer than
+        SHORT_CLIP_MAX_SECONDS are packed into shared batched inference calls.
+        The results are used by the following process_file() calls, which then
+        skip transcription and only summarize. Files that cannot be handled
+        this way are transcribed normally by process_file().
+        
+        Args:
+            input_sources: Queue entries (paths/URLs, or dicts with "value",
+                "start_time", "end_time" and "profile")
+            progress_callback: Optional callback that receives ProgressUpdate objects
+            
+        Returns:
+            Number of files transcribed ahead of time
+        """
+        from .short_clips import probe_audio_duration
+        
+        self._pretranscribed = {}
+        self._pretranscribed_info = {}
+        if not parse_bool(getattr(self.config, 'SHORT_CLIP_BATCHING',
+                                  DEFAULT_CONFIG['SHORT_CLIP_BATCHING'])):
+            return 0
+        
+        progress = ProgressCallback(progress_callback, self.log_store)
+        try:
+            max_seconds = float(getattr(self.config, 'SHORT_CLIP_MAX_SECONDS',
+                                        DEFAULT_CONFIG['SHORT_CLIP_MAX_SECONDS']))
+            batch_size = int(getattr(self.config, 'FASTER_WHISPER_BATCH_SIZE', 0) or 0) or \
+                int(getattr(self.config, 'SHORT_CLIP_BATCH_SIZE', DEFAULT_CONFIG['SHORT_CLIP_BATCH_SIZE']))
+        except (ValueError, TypeError):
+            progress.log("Invalid short-clip batching settings", "warning")
+            return 0
+        
+        # Collect short local files, grouped by transcription profile
+        candidates: Dict[str, List[Tuple[str, float]]] = {}
+        for source in input_sources:
+            if isinstance(source, dict):
+                value, profile = source.get("value"), source.get("profile")
+                if source.get("start_time") or source.get("end_time"):
+                    continue
+            else:
+                value, profile = source, None
+            if not value or is_valid_url(value) or not Path(value).is_file():
+                continue
+            duration = probe_audio_duration(Path(value))
+            if duration and duration <= max_seconds:
+                profile_name = get_transcription_profile(profile or getattr(
+                    self.config, 'TRANSCRIPTION_PROFILE', DEFAULT_CONFIG['TRANSCRIPTION_PROFILE']
+                ))["name"]
+                candidates.setdefault(profile_name, []).append((value, duration))
+        
+        if sum(len(files) for files in candidates.values()) < 2:
+            # Nothing to share a batch with
+            return 0
+        
+        provider = TranscriptionProviderFactory.create_provider(self.config)
+        if provider is None or not hasattr(provider, "transcribe_short_clips"):
+            progress.log("Short-clip batching requires the faster-whisper provider", "warning")
+            return 0
+        
+        language = getattr(self.config, 'WHISPER_LANGUAGE', DEFAULT_CONFIG['WHISPER_LANGUAGE'])
+        for profile_name, files in candidates.items():
+            model = get_transcription_profile(profile_name)["model"] or getattr(
+                self.config, 'WHISPER_MODEL', DEFAULT_CONFIG['WHISPER_MODEL']
+            )
+            progress.update(
+                ProcessingStage.TRANSCRIBING,
+                f"Batched transcription of {len(files)} short files (profile: {profile_name})",
+                0.0,
+                {"files": len(files), "profile": profile_name}
+            )
+            results = provider.transcribe_short_clips(
+                [Path(value) for value, _ in files],
+                [duration for _, duration in files],
+                language=language,
+                model=model,
+                profile=profile_name,
+                batch_size=batch_size
+            )
+            failed = provider.last_run_info.get("short_clip_failed") or []
+            if failed:
+                progress.log(f"Short-clip batching failed for {len(failed)} file(s), "
+                             f"transcribing them separately: {', '.join(failed)}", "warning")
+            for value, duration in files:
+                text = results.get(Path(value))
+                if text:
+                    self._pretranscribed[value] = text
+                    self._pretranscribed_info[value] = {
+                        "model": model,
+                        "profile": profile_name,
+                        "audio_duration": duration,
+                        "short_clip_batched": True,
+                    }
+        
+        progress.log(f"Short-clip batching: {len(self._pretranscribed)} files transcribed ahead of time")
+        return len(self._pretranscribed)
     
     def _download_youtube_audio(
         self, 
@@ -426,11 +703,108 @@ class PogadaneBackend:
             progress.log(f"Copy error: {e}", "error")
             return None
     
+    def _dedupe_enabled(self) -> bool:
+        """True if duplicates are looked up and new recordings indexed."""
+        return self.fingerprint_index is not None and parse_bool(getattr(
+            self.config, 'AUDIO_DEDUPE_ENABLED', DEFAULT_CONFIG['AUDIO_DEDUPE_ENABLED']
+        ))
+    
+    def _may_have_duplicate(self, audio_path: Path, input_source: str) -> bool:
+        """
+        Cheap check before decoding: is a recording of about the same length indexed?
+        
+        The duration comes from the container header; if it is unknown the
+        audio has to be fingerprinted to be sure.
+        """
+        from .short_clips import probe_audio_duration
+        duration = probe_audio_duration(audio_path)
+        if duration is None:
+            return True
+        try:
+            return self.fingerprint_index.has_candidates(duration, exclude=input_source)
+        except Exception:
+            return True
+    
+    @staticmethod
+    def _timed_fingerprint(audio_path: Path):
+        """Fingerprint of a file and the seconds it took (raises ImportError without numpy/PyAV)."""
+        from .fingerprint import fingerprint_file
+        started = time.perf_counter()
+        return fingerprint_file(audio_path), time.perf_counter() - started
+    
+    def _start_fingerprint(self, audio_path: Path) -> Future:
+        """Fingerprint a file in the background (see _fingerprint_audio)."""
+        if self._fingerprint_executor is None:
+            self._fingerprint_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fingerprint")
+        return self._fingerprint_executor.submit(self._timed_fingerprint, audio_path)
+    
+    def _fingerprint_audio(self, audio_path: Path, progress: ProgressCallback, pending: Optional[Future] = None):
+        """
+        Fingerprint of the audio for duplicate detection (None if not computable).
+        
+        Args:
+            audio_path: Audio file
+            progress: Progress tracker for log messages
+            pending: Fingerprint started by _start_fingerprint (waited for
+                instead of decoding the file again)
+        """
+        try:
+            fingerprint, seconds = pending.result() if pending is not None else self._timed_fingerprint(audio_path)
+        except ImportError as e:
+            progress.log(f"Audio fingerprinting unavailable: {e}", "warning")
+            return None
+        except Exception as e:
+            progress.log(f"Audio fingerprint failed: {e}", "warning")
+            return None
+        progress.log(f"Audio fingerprint: {fingerprint.duration:.0f}s of audio in {seconds:.2f}s")
+        return fingerprint
+    
+    def _find_duplicate(self, fingerprint, input_source: str, progress: ProgressCallback):
+        """Earlier recording with the same audio (FingerprintMatch), or None."""
+        try:
+            threshold = float(getattr(self.config, 'AUDIO_DEDUPE_THRESHOLD', DEFAULT_CONFIG['AUDIO_DEDUPE_THRESHOLD']))
+        except (ValueError, TypeError):
+            progress.log("Invalid AUDIO_DEDUPE_THRESHOLD", "warning")
+            return None
+        try:
+            return self.fingerprint_index.find(fingerprint, threshold, exclude=input_source)
+        except Exception as e:
+            progress.log(f"Duplicate lookup failed: {e}", "warning")
+            return None
+    
+    def _reuse_transcript(self, duplicate, fingerprint, progress: ProgressCallback) -> str:
+        """Take over the transcript of a duplicate recording instead of transcribing."""
+        progress.update(
+            ProcessingStage.TRANSCRIBING,
+            f"Same audio as '{duplicate.source}' (similarity {duplicate.score:.2f}), reusing its transcript",
+            0.3,
+            {"duplicate_of": duplicate.source, "similarity": duplicate.score}
+        )
+        self.last_transcription_info = {
+            "duplicate_of": duplicate.source,
+            "duplicate_similarity": duplicate.score,
+            "audio_duration": fingerprint.duration,
+        }
+        if isinstance(duplicate.transcription, SegmentStore):
+            self.last_segments = duplicate.transcription
+            return duplicate.transcription.to_text()
+        self.last_segments = SegmentStore.from_text(duplicate.transcription)
+        return duplicate.transcription
+    
+    def _index_fingerprint(self, input_source: str, fingerprint, transcription: str, progress: ProgressCallback):
+        """Remember the fingerprint and transcript of a transcribed recording."""
+        try:
+            self.fingerprint_index.add(input_source, fingerprint, self.last_segments or transcription)
+        except Exception as e:
+            progress.log(f"Cannot store audio fingerprint: {e}", "warning")
+    
     def _transcribe_audio(
         self,
         audio_path: Path,
         source_name: str,
-        progress: ProgressCallback
+        progress: ProgressCallback,
+        profile: Optional[str] = None,
+        segment_callback: Optional[Callable[[float, float, str], None]] = None
     ) -> Optional[str]:
         """Transcribe audio file using native logging"""
         try:
@@ -441,32 +815,73 @@ class PogadaneBackend:
                 progress.log("No transcription provider available", "error")
                 return None
             
+            # Providers decoding segment by segment report them as they come
+            if segment_callback is not None and hasattr(provider, "on_segment"):
+                provider.on_segment = segment_callback
+            
             # Get settings
             language = getattr(
                 self.config,
                 'WHISPER_LANGUAGE',
                 DEFAULT_CONFIG['WHISPER_LANGUAGE']
             )
-            model = getattr(
+            profile_settings = get_transcription_profile(profile or getattr(
+                self.config,
+                'TRANSCRIPTION_PROFILE',
+                DEFAULT_CONFIG['TRANSCRIPTION_PROFILE']
+            ))
+            # Profiles may pin a model; otherwise the configured model is used
+            model = profile_settings["model"] or getattr(
                 self.config,
                 'WHISPER_MODEL',
                 DEFAULT_CONFIG['WHISPER_MODEL']
             )
             
             # Transcribe - provider expects (audio_path, output_dir, original_stem, language, model)
-            progress.log(f"Starting transcription for '{source_name}' (model: {model}, language: {language})")
+            progress.log(
+                f"Starting transcription for '{source_name}' "
+                f"(model: {model}, language: {language}, profile: {profile_settings['name']})"
+            )
             
             transcription_file = provider.transcribe(
                 audio_path=audio_path,
                 output_dir=self.temp_audio_dir,
                 original_stem=source_name,
                 language=language,
-                model=model
+                model=model,
+                profile=profile_settings["name"]
             )
+            segments = getattr(provider, "last_segments", None)
+            
+            # Provider statistics (model, audio duration, load time, cascade usage)
+            self.last_transcription_info = dict(getattr(provider, "last_run_info", None) or {})
+            if "model_load_seconds" in self.last_transcription_info:
+                sources = self.last_transcription_info.get("model_sources") or {}
+                progress.log(
+                    f"Model load time: {self.last_transcription_info['model_load_seconds']:.2f}s"
+                    + (f" ({', '.join(f'{name}: {src}' for name, src in sources.items())})"
+                       if sources else "")
+                )
+            if self.last_transcription_info.get("loop_aborts"):
+                progress.log(
+                    f"Repetition loops aborted: {self.last_transcription_info['loop_aborts']} "
+                    f"({self.last_transcription_info['loop_seconds_removed']:.0f}s of repeated text removed, "
+                    f"{self.last_transcription_info['loop_seconds_skipped']:.0f}s of non-speech skipped)",
+                    "warning"
+                )
+            if self.last_transcription_info.get("cascade"):
+                progress.log(
+                    f"Cascade: large model '{model}' used for "
+                    f"{self.last_transcription_info['large_model_fraction']:.0%} of audio "
+                    f"({self.last_transcription_info['redecoded_ranges']} range(s), "
+                    f"draft: {self.last_transcription_info['draft_model']})"
+                )
             
             if transcription_file and transcription_file.exists():
                 # Read transcription from file
                 transcription = transcription_file.read_text(encoding='utf-8')
+                # Providers without segment output (executable, transformers) are parsed
+                self.last_segments = segments if segments else SegmentStore.from_text(transcription)
                 progress.log(f"Transcription complete for '{source_name}' ({len(transcription)} chars)")
                 
                 # Clean up transcription file
@@ -485,6 +900,89 @@ class PogadaneBackend:
             logger.exception("Transcription exception")
             return None
     
+    def summarize_text(
+        self,
+        text: str,
+        source_name: str = "",
+        progress_callback: Optional[Callable[[ProgressUpdate], None]] = None
+    ) -> Optional[str]:
+        """
+        Summarize a text with the configured LLM provider.
+        
+        Used for partial summaries of a transcript that is still being decoded.
+        
+        Args:
+            text: Text to summarize
+            source_name: Name used in log messages
+            progress_callback: Optional callback that receives ProgressUpdate objects
+            
+        Returns:
+            Summary, or None on error
+        """
+        progress = ProgressCallback(progress_callback, self.log_store, source_name or None)
+        progress.update(
+            ProcessingStage.SUMMARIZING,
+            "Generating summary...",
+            0.0,
+            {"transcription_length": len(text)}
+        )
+        summary = self._summarize_text(text, source_name, progress)
+        if summary:
+            progress.update(ProcessingStage.COMPLETED, "Summary complete!", 1.0,
+                            {"summary_length": len(summary)})
+        else:
+            progress.update(ProcessingStage.ERROR, "Summary failed", 1.0)
+        return summary
+    
+    def ask_question(
+        self,
+        source: str,
+        question: str,
+        transcription: Optional[Union[str, SegmentStore]] = None
+    ) -> Optional[str]:
+        """
+        Answer a follow-up question about a processed recording.
+        
+        Questions go to a long-lived GGUF provider with one Q&A session per
+        source, so only the first question about a recording evaluates its
+        transcript (see LlamaCppProvider.ask).
+        
+        Args:
+            source: Source of the result (file path or URL)
+            question: Question, e.g. "what did we decide about the budget?"
+            transcription: Transcript of the source (needed for the first question)
+            
+        Returns:
+            Answer, or None on error or when SUMMARY_PROVIDER is not "gguf"
+        """
+        self.last_qa_info = {}
+        provider = self._question_provider()
+        if provider is None:
+            logger.warning("Questions about recordings need SUMMARY_PROVIDER = \"gguf\"")
+            return None
+        if isinstance(transcription, SegmentStore):
+            transcription = transcription.plain_text()
+        language = getattr(self.config, 'SUMMARY_LANGUAGE', DEFAULT_CONFIG['SUMMARY_LANGUAGE'])
+        try:
+            answer = provider.ask(source, question, transcript=transcription, language=language)
+        except ValueError as e:
+            logger.error(str(e))
+            return None
+        self.last_qa_info = dict(provider.last_run_info)
+        return answer
+    
+    def _question_provider(self) -> Optional[LlamaCppProvider]:
+        """The GGUF provider for questions (recreated when the configured model changes)."""
+        provider_type = str(getattr(self.config, 'SUMMARY_PROVIDER', DEFAULT_CONFIG['SUMMARY_PROVIDER']))
+        if provider_type.lower().strip() not in ("gguf", "llama-cpp"):
+            self._qa_provider = None
+            return None
+        model_path = getattr(self.config, 'GGUF_MODEL_PATH', DEFAULT_CONFIG['GGUF_MODEL_PATH'])
+        if self._qa_provider is None or self._qa_provider.model_path != model_path:
+            provider = LLMProviderFactory.create_provider(self.config)
+            self._qa_provider = provider if isinstance(provider, LlamaCppProvider) else None
+        return self._qa_provider
+    
     def _summarize_text(
         self,
         text: str,
@@ -537,6 +1035,8 @@ class PogadaneBackend:
                 language=language,
                 source_name=source_name
             )
+            # Provider statistics (token counts and timings, where the provider reports them)
+            self.last_summary_info = dict(getattr(provider, "last_run_info", None) or {})
             
             if summary:
                 progress.log(f"Summary complete for '{source_name}' ({len(summary)} chars)")
@@ -0,0 +1,328 @@
+"""
+Capability registry: cached, concurrent probing of optional dependencies.
+
+Python packages are probed with ``importlib.util.find_spec`` and
+``importlib.metadata`` without importing them (importing torch alone takes
+seconds), executables with ``shutil.which`` and one short command. All
+probes run concurrently in a thread pool.
+
+Results are cached for ``CAPABILITY_CACHE_TTL`` seconds and dropped early
+when the environment changes: another interpreter, a changed ``PATH`` or a
+package installed or removed (which changes the mtime of site-packages).
+Running services (the Ollama server) can be started and stopped at any
+time, so their probes are reused only for ``CAPABILITY_SERVICE_TTL``
+seconds and a negative result is not reused at all.
+
+The settings dialog's dependency panel and the providers' ``is_available()``
+methods read from the shared registry returned by ``get_registry()``.
+
+Usage:
+    from pogadane.capabilities import get_registry
+    if get_registry().is_available("faster_whisper"):
+        ...
+"""
+
+import importlib.metadata
+import importlib.util
+import logging
+import os
+import platform
+import shutil
+import site
+import subprocess
+import sys
+import sysconfig
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .constants import CAPABILITY_CACHE_TTL, CAPABILITY_PROBE_TIMEOUT, CAPABILITY_SERVICE_TTL
+
+logger = logging.getLogger(__name__)
+
+# A probe returns (available - None if the check itself failed, version text)
+Probe = Callable[[], Tuple[Optional[bool], str]]
+
+
+class Capability(NamedTuple):
+    """Result of probing one dependency."""
+    name: str
+    available: Optional[bool]  # None: the check itself failed
+    version: str  # version or status text shown in the GUI
+    checked_at: float  # time.monotonic() of the probe
+
+
+def probe_interpreter() -> Tuple[Optional[bool], str]:
+    """The running interpreter is always available."""
+    return True, f"Python {platform.python_version()}"
+
+
+def probe_python_package(module: str, distribution: Optional[str] = None) -> Probe:
+    """
+    Create a probe for an installed Python package (without importing it).
+
+    Args:
+        module: Top-level import name (e.g. "faster_whisper")
+        distribution: Distribution name for the version (defaults to module)
+
+    Returns:
+        Probe function
+    """
+    def probe() -> Tuple[Optional[bool], str]:
+        try:
+            if importlib.util.find_spec(module) is None:
+                return False, "Nie znaleziono"
+        except (ImportError, ValueError):
+            return False, "Nie znaleziono"
+        try:
+            return True, importlib.metadata.version(distribution or module)
+        except importlib.metadata.PackageNotFoundError:
+            return True, "Zainstalowano"
+    return probe
+
+
+def probe_executable(command: Sequence[str], timeout: float = CAPABILITY_PROBE_TIMEOUT) -> Probe:
+    """
+    Create a probe for an executable that is run once with arguments.
+
+    The executable counts as available when the command exits with 0; the
+    first line of its output is used as the version text.
+
+    Args:
+        command: Executable and arguments (e.g. ["ffmpeg", "-version"])
+        timeout: Seconds to wait for the command
+
+    Returns:
+        Probe function
+    """
+    def probe() -> Tuple[Optional[bool], str]:
+        executable = shutil.which(command[0])
+        if executable is None and not os.path.isfile(command[0]):
+            return False, "Nie znaleziono"
+        try:
+            result = subprocess.run(
+                [executable or command[0], *command[1:]],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None, "Błąd sprawdzania"
+        if result.returncode != 0:
+            return False, "Nie działa"
+        output = (result.stdout or result.stderr).strip()
+        return True, output.splitlines()[0] if output else "Zainstalowano"
+    return probe
+
+
+# Dependencies known to the registry (name -> probe)
+DEFAULT_PROBES: Dict[str, Probe] = {
+    "python": probe_interpreter,
+    "ffmpeg": probe_executable(["ffmpeg", "-version"]),
+    "yt-dlp": probe_executable(["yt-dlp", "--version"]),
+    "ollama": probe_executable(["ollama", "--version"]),
+    "ollama-server": probe_executable(["ollama", "list"]),
+    "torch": probe_python_package("torch"),
+    "transformers": probe_python_package("transformers"),
+    "faster_whisper": probe_python_package("faster_whisper", "faster-whisper"),
+    "whisper": probe_python_package("whisper", "openai-whisper"),
+    "google.generativeai": probe_python_package("google.generativeai", "google-generativeai"),
+    "llama_cpp": probe_python_package("llama_cpp", "llama-cpp-python"),
+}
+
+# Probes of running services (name -> seconds a positive result is reused)
+SERVICE_TTLS: Dict[str, float] = {
+    "ollama-server": CAPABILITY_SERVICE_TTL,
+}
+
+
+def _site_packages_dirs() -> List[str]:
+    """Directories where pip installs packages for this interpreter."""
+    paths = sysconfig.get_paths()
+    dirs = {paths.get("purelib"), paths.get("platlib")}
+    try:
+        dirs.add(site.getusersitepackages())
+    except AttributeError:  # some embedded/virtualenv builds
+        pass
+    return sorted(d for d in dirs if d)
+
+
+def environment_key() -> tuple:
+    """
+    Fingerprint of the environment the probes depend on.
+
+    Installing or removing a package adds or deletes entries in
+    site-packages, which updates the directory's mtime.
+    """
+    stamps = []
+    for directory in _site_packages_dirs():
+        try:
+            stamps.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            stamps.append(0)
+    return (sys.executable, sys.version, os.environ.get("PATH", ""), tuple(stamps))
+
+
+class CapabilityRegistry:
+    """
+    Thread-safe cache of dependency probe results.
+
+    A name that is being probed is probed only once; concurrent callers
+    wait for the same result.
+
+    Attributes:
+        ttl (float): Seconds a result is reused
+        service_ttls (Dict[str, float]): Shorter TTLs of service probes,
+            whose negative results are never reused
+    """
+
+    def __init__(self, probes: Optional[Dict[str, Probe]] = None, ttl: float = CAPABILITY_CACHE_TTL,
+                 max_workers: int = 8, service_ttls: Optional[Dict[str, float]] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            probes: Probes by name (defaults to DEFAULT_PROBES)
+            ttl: Seconds a result is reused
+            max_workers: Threads used by probe_all()
+            service_ttls: TTLs of service probes by name (defaults to SERVICE_TTLS)
+        """
+        self.ttl = ttl
+        self.service_ttls: Dict[str, float] = dict(SERVICE_TTLS if service_ttls is None else service_ttls)
+        self.max_workers = max_workers
+        self._probes: Dict[str, Probe] = dict(DEFAULT_PROBES if probes is None else probes)
+        self._results: Dict[str, Capability] = {}
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._environment = environment_key()
+
+    def register(self, name: str, probe: Probe) -> None:
+        """Add or replace a probe (drops a cached result of the same name)."""
+        with self._lock:
+            self._probes[name] = probe
+            self._results.pop(name, None)
+
+    def ensure(self, name: str, probe: Probe) -> None:
+        """Register a probe unless one with this name exists (keeps its cached result)."""
+        with self._lock:
+            self._probes.setdefault(name, probe)
+
+    def names(self) -> List[str]:
+        """Names of all registered probes."""
+        with self._lock:
+            return list(self._probes)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget one cached result, or all of them."""
+        with self._lock:
+            if name is None:
+                self._results.clear()
+            else:
+                self._results.pop(name, None)
+
+    def get(self, name: str, refresh: bool = False) -> Capability:
+        """
+        Probe result for one dependency, from the cache when still valid.
+
+        Args:
+            name: Registered probe name
+            refresh: Probe again even if a cached result is valid
+
+        Returns:
+            Capability
+
+        Raises:
+            KeyError: If no probe is registered under this name
+        """
+        future, owner = self._claim(name, refresh)
+        if owner:
+            self._run(name, future)
+        return future.result()
+
+    def is_available(self, name: str) -> bool:
+        """True if the dependency is available (False also for unknown names)."""
+        try:
+            return bool(self.get(name).available)
+        except KeyError:
+            return False
+
+    def probe_all(self, names: Optional[Iterable[str]] = None, refresh: bool = False) -> Dict[str, Capability]:
+        """
+        Probe several dependencies concurrently.
+
+        Args:
+            names: Probe names (defaults to all registered)
+            refresh: Ignore cached results
+
+        Returns:
+            Capability by name, in the order of ``names``
+        """
+        names = list(self.names() if names is None else names)
+        claims = {name: self._claim(name, refresh) for name in names}
+        to_run = [(name, future) for name, (future, owner) in claims.items() if owner]
+        if to_run:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(to_run)),
+                                    thread_name_prefix="capability-probe") as pool:
+                for name, future in to_run:
+                    pool.submit(self._run, name, future)
+        return {name: claims[name][0].result() for name in names}
+
+    def _claim(self, name: str, refresh: bool) -> Tuple[Future, bool]:
+        """
+        Find a cached or in-flight result, or reserve the probe for the caller.
+
+        Returns:
+            Tuple of (future with the result, True if the caller must run the probe)
+        """
+        environment = environment_key()
+        with self._lock:
+            if environment != self._environment:
+                logger.debug("Environment changed, dropping cached capability probes")
+                self._results.clear()
+                self._environment = environment
+            if name not in self._probes:
+                raise KeyError(name)
+            pending = self._pending.get(name)
+            if pending is not None:
+                return pending, False
+            cached = self._results.get(name)
+            if cached is not None and not refresh and time.monotonic() - cached.checked_at < self._ttl(cached):
+                future = Future()
+                future.set_result(cached)
+                return future, False
+            future = Future()
+            self._pending[name] = future
+            return future, True
+
+    def _ttl(self, capability: Capability) -> float:
+        """Seconds a cached result may be reused."""
+        if capability.name not in self.service_ttls:
+            return self.ttl
+        return self.service_ttls[capability.name] if capability.available else 0.0
+
+    def _run(self, name: str, future: Future) -> None:
+        """Run a reserved probe and publish its result."""
+        try:
+            available, version = self._probes[name]()
+        except Exception as e:
+            logger.debug(f"Capability probe '{name}' failed: {e}")
+            available, version = None, "Błąd sprawdzania"
+        capability = Capability(name, available, version, time.monotonic())
+        with self._lock:
+            self._results[name] = capability
+            self._pending.pop(name, None)
+        future.set_result(capability)
+
+
+_registry: Optional[CapabilityRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> CapabilityRegistry:
+    """Shared registry used by the GUI and the providers."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = CapabilityRegistry()
+        return _registry
@@ -0,0 +1,143 @@
+"""
+Cascade transcription helpers.
+
+Cascade mode transcribes audio with a small draft model first and re-decodes
+only the uncertain parts with the large model. This module contains the
+model-independent logic: deciding which draft segments are unreliable,
+turning them into time ranges, and merging the two passes.
+
+Segments are any objects with ``start``, ``end``, ``text``, ``avg_logprob``,
+``no_speech_prob`` and ``compression_ratio`` attributes (faster-whisper
+``Segment`` objects).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Tuple
+
+
+# Two flagged segments closer than this (seconds) are re-decoded together
+MERGE_GAP_SECONDS = 1.0
+
+# Context added on both sides of a re-decoded range (seconds)
+RANGE_PADDING_SECONDS = 0.25
+
+
+@dataclass(frozen=True)
+class CascadeThresholds:
+    """
+    Confidence limits for draft segments.
+
+    Attributes:
+        logprob: Segments with avg_logprob below this are re-decoded
+        compression_ratio: Segments with a higher compression ratio (repetitive
+            text) are re-decoded
+        no_speech: Segments that produced text although no_speech_prob is
+            above this are re-decoded
+    """
+    logprob: float = -0.8
+    compression_ratio: float = 2.0
+    no_speech: float = 0.5
+
+
+def needs_redecode(segment: Any, thresholds: CascadeThresholds) -> bool:
+    """
+    Check whether a draft segment is too uncertain to keep.
+
+    Args:
+        segment: Draft segment
+        thresholds: Confidence limits
+
+    Returns:
+        True if the segment should be re-decoded by the large model
+    """
+    if getattr(segment, "avg_logprob", 0.0) < thresholds.logprob:
+        return True
+    if getattr(segment, "compression_ratio", 0.0) > thresholds.compression_ratio:
+        return True
+    # Text emitted where the model itself believes there is no speech
+    has_text = bool((getattr(segment, "text", "") or "").strip())
+    return has_text and getattr(segment, "no_speech_prob", 0.0) > thresholds.no_speech
+
+
+def select_redecode_ranges(
+    segments: Iterable[Any],
+    duration: float,
+    thresholds: CascadeThresholds = CascadeThresholds(),
+    merge_gap: float = MERGE_GAP_SECONDS,
+    padding: float = RANGE_PADDING_SECONDS,
+) -> List[Tuple[float, float]]:
+    """
+    Build the time ranges the large model has to re-decode.
+
+    Args:
+        segments: Draft segments in time order
+        duration: Audio duration in seconds
+        thresholds: Confidence limits
+        merge_gap: Maximum gap between flagged segments merged into one range
+        padding: Context added around each range
+
+    Returns:
+        Sorted, non-overlapping (start, end) ranges in seconds
+    """
+    ranges: List[Tuple[float, float]] = []
+    for segment in segments:
+        if not needs_redecode(segment, thresholds):
+            continue
+        start = max(0.0, segment.start - padding)
+        end = min(duration, segment.end + padding) if duration else segment.end + padding
+        if ranges and start - ranges[-1][1] <= merge_gap:
+            ranges[-1] = (ranges[-1][0], max(ranges[-1][1], end))
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
+def ranges_to_clip_timestamps(ranges: List[Tuple[float, float]]) -> List[float]:
+    """Flatten ranges into the ``clip_timestamps`` list accepted by WhisperModel.transcribe."""
+    return [value for start_end in ranges for value in start_end]
+
+
+def covered_fraction(ranges: List[Tuple[float, float]], duration: float) -> float:
+    """
+    Fraction of the audio covered by the ranges.
+
+    Args:
+        ranges: Non-overlapping (start, end) ranges
+        duration: Audio duration in seconds
+
+    Returns:
+        Value between 0.0 and 1.0
+    """
+    if duration <= 0:
+        return 0.0
+    return min(1.0, sum(end - start for start, end in ranges) / duration)
+
+
+def _in_ranges(segment: Any, ranges: List[Tuple[float, float]]) -> bool:
+    """True if the segment midpoint lies inside one of the ranges."""
+    middle = (segment.start + segment.end) / 2
+    return any(start <= middle <= end for start, end in ranges)
+
+
+def merge_cascade_segments(
+    draft: Iterable[Any],
+    refined: Iterable[Any],
+    ranges: List[Tuple[float, float]],
+) -> List[Any]:
+    """
+    Replace uncertain draft segments with the large model's output.
+
+    Draft segments whose midpoint falls inside a re-decoded range are dropped
+    and the refined segments for that range are used instead.
+
+    Args:
+        draft: Segments from the draft model
+        refined: Segments from the large model (decoded only inside ranges)
+        ranges: Re-decoded ranges
+
+    Returns:
+        Merged segments sorted by start time
+    """
+    kept = [segment for segment in draft if not _in_ranges(segment, ranges)]
+    replacements = [segment for segment in refined if _in_ranges(segment, ranges)]
+    return sorted(kept + replacements, key=lambda segment: (segment.start, segment.end))
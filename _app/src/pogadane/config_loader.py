@@ -13,6 +13,23 @@ from typing import Any, Dict
 from .constants import DEFAULT_CONFIG
 
 
+def parse_bool(value: Any) -> bool:
+    """
+    Convert a configuration value to bool.
+    
+    Args:
+        value: Bool, or string such as "true", "1", "yes", "on" (GUI and config files may store strings)
+        
+    Returns:
+        Boolean value
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes', 'on')
+    return bool(value)
+
+
 class ConfigLoader:
     """
     Factory class for loading configuration from file or using defaults.
@@ -196,11 +213,8 @@ class ConfigManager:
         if config_obj is None or self._config_path is None:
             return
         
-        # Settings file path (next to config.py)
-        settings_file = self._config_path.parent / "settings.json"
-        
-        # Extract runtime preferences to save
-        runtime_settings = {}
+        # Start from the existing file so other persisted keys are preserved
+        runtime_settings = self._read_settings_file()
         
         # Save theme mode if it exists
         if hasattr(config_obj, 'THEME_MODE'):
@@ -208,6 +222,49 @@ class ConfigManager:
         
         # Save other runtime preferences here as needed
         
+        self._write_settings_file(runtime_settings)
+    
+    def save_runtime_setting(self, key: str, value: Any):
+        """
+        Persist a single runtime setting to .config/settings.json.
+        
+        The value is applied to the in-memory configuration as well, and all
+        other keys already stored in the settings file are preserved.
+        
+        Args:
+            key: Setting key (e.g. 'FASTER_WHISPER_TUNING')
+            value: JSON-serializable value
+        """
+        if self._config is None:
+            self.initialize()
+        setattr(self._config, key, value)
+        
+        if self._config_path is None:
+            return
+        
+        runtime_settings = self._read_settings_file()
+        runtime_settings[key] = value
+        self._write_settings_file(runtime_settings)
+    
+    def _settings_file(self) -> Path:
+        """Path of the runtime settings file (next to config.py)."""
+        return self._config_path.parent / "settings.json"
+    
+    def _read_settings_file(self) -> Dict[str, Any]:
+        """Read the runtime settings file, returning an empty dict if missing or invalid."""
+        settings_file = self._settings_file()
+        if not settings_file.exists():
+            return {}
+        try:
+            with open(settings_file, 'r', encoding='utf-8') as f:
+                settings = json.load(f)
+            return settings if isinstance(settings, dict) else {}
+        except Exception:
+            return {}
+    
+    def _write_settings_file(self, runtime_settings: Dict[str, Any]):
+        """Write the runtime settings file."""
+        settings_file = self._settings_file()
         try:
             with open(settings_file, 'w', encoding='utf-8') as f:
                 json.dump(runtime_settings, f, indent=2)
@@ -224,7 +281,7 @@ class ConfigManager:
         if self._config_path is None:
             return
         
-        settings_file = self._config_path.parent / "settings.json"
+        settings_file = self._settings_file()
         
         if not settings_file.exists():
             return
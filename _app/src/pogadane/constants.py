@@ -15,6 +15,8 @@ APP_NAME = "Pogadane"
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DEP_DIR = PROJECT_ROOT / "dep"
 MODELS_DIR = DEP_DIR / "models"
+LOG_DIR = PROJECT_ROOT / "logs"
+WHISPER_STORE_DIR = MODELS_DIR / "faster-whisper"
 
 # Ensure directories exist
 MODELS_DIR.mkdir(parents=True, exist_ok=True)
@@ -25,6 +27,80 @@ FILE_STATUS_PROCESSING = "⚙️ Przetwarzanie..."
 FILE_STATUS_COMPLETED = "✅ Ukończono"
 FILE_STATUS_ERROR = "❌ Błąd"
 
+# GUI console: lines kept in memory (older lines are spilled to disk, or only
+# kept in the on-disk log when LOG_TO_DISK is on) and minimum time between UI
+# refreshes (s) for job events
+CONSOLE_MAX_LINES = 2000
+CONSOLE_FLUSH_INTERVAL = 0.1
+
+# GUI queue: fixed row height (px, including spacing), number of recycled
+# row controls and rows rendered above/below the visible part of the list
+QUEUE_ROW_HEIGHT = 80
+QUEUE_POOL_ROWS = 48
+QUEUE_OVERSCAN_ROWS = 12
+
+# GUI results browser: the results list is virtualized like the queue, the
+# transcript viewer renders this many lines per page
+RESULTS_ROW_HEIGHT = 56
+RESULTS_POOL_ROWS = 40
+RESULTS_OVERSCAN_ROWS = 10
+TRANSCRIPT_PAGE_LINES = 200
+# Results of the session are spilled to a temp file; this many recently used
+# transcripts and summaries stay in memory
+RESULTS_CACHE_ENTRIES = 8
+# Replaced results leave unused space in the spill file; past this many bytes
+# (and once it outweighs the live results) the file is rewritten without it
+RESULTS_SPILL_COMPACT_BYTES = 16 * 1024 * 1024
+
+# GUI performance tab: per-job metrics kept (and appended to METRICS_FILE),
+# number of recent jobs drawn in the sparklines and listed in the table
+METRICS_FILE = LOG_DIR / "metrics.jsonl"
+METRICS_HISTORY_JOBS = 500
+METRICS_SPARKLINE_POINTS = 30
+METRICS_TABLE_JOBS = 50
+
+# Persistent result store (SQLite with a full-text index over transcripts and
+# summaries) and number of stored results listed for a search in the GUI
+RESULTS_DIR = PROJECT_ROOT / "results"
+RESULTS_DB = RESULTS_DIR / "pogadane.db"
+RESULTS_SEARCH_LIMIT = 200
+
+# Parquet archive of results (python -m pogadane results archive): compression
+# codec and transcript segments per row group
+ARCHIVE_COMPRESSION = "zstd"
+ARCHIVE_ROW_GROUP_ROWS = 50_000
+
+# Semantic search (SEMANTIC_SEARCH_ENABLED): index folder, transcript chunk
+# length in characters, vectors converted per block while searching and
+# fragments listed for a query in the GUI
+SEMANTIC_INDEX_DIR = RESULTS_DIR / "semantic"
+SEMANTIC_CHUNK_CHARS = 400
+SEMANTIC_SEARCH_BLOCK_ROWS = 8192
+SEMANTIC_SEARCH_LIMIT = 50
+
+# Audio fingerprints of transcribed recordings (AUDIO_DEDUPE_ENABLED): index
+# file, decoding rate, analysis frame and hop in samples (256/64 ms), largest
+# shift between two copies of a recording and accepted difference in length
+FINGERPRINT_DB = RESULTS_DIR / "fingerprints.db"
+FINGERPRINT_SAMPLE_RATE = 8000
+FINGERPRINT_FRAME = 2048
+FINGERPRINT_HOP = 512
+FINGERPRINT_MAX_OFFSET_SECONDS = 10.0
+FINGERPRINT_DURATION_TOLERANCE = 0.05
+
+# Bulk import: file types accepted from scanned folders and number of files
+# added to the queue per UI update
+MEDIA_EXTENSIONS = (
+    ".mp3", ".wav", ".m4a", ".ogg", ".flac", ".opus", ".aac", ".wma",
+    ".mp4", ".mkv", ".webm", ".mov", ".avi",
+)
+IMPORT_CHUNK_SIZE = 500
+
+# Questions about a processed recording (GGUF): longest answer and context
+# tokens kept free for questions and answers when the transcript is long
+QA_MAX_ANSWER_TOKENS = 384
+QA_RESERVED_TOKENS = 1024
+
 # Custom prompt option
 CUSTOM_PROMPT_OPTION_TEXT = "(Własny prompt poniżej)"
 
@@ -38,6 +114,30 @@ DEFAULT_CONFIG = {
     "FASTER_WHISPER_VAD_FILTER": False,
     "WHISPER_LANGUAGE": "Polish",
     "WHISPER_MODEL": "turbo",
+    "TRANSCRIPTION_PROFILE": "balanced",  # "fast", "balanced", or "accurate"
+    "CASCADE_ENABLED": False,  # draft with a small model, re-decode uncertain parts with WHISPER_MODEL
+    "CASCADE_DRAFT_MODEL": "small",
+    "CASCADE_LOGPROB_THRESHOLD": -0.8,  # re-decode segments with lower avg_logprob
+    "CASCADE_COMPRESSION_RATIO_THRESHOLD": 2.0,  # ...or more repetitive text
+    "CASCADE_NO_SPEECH_THRESHOLD": 0.5,  # ...or text where no_speech_prob is higher
+    "SHORT_CLIP_BATCHING": False,  # pack short queued files into shared inference batches
+    "SHORT_CLIP_MAX_SECONDS": 30,  # files up to this length are packed (longer ones: split at 30 s)
+    "SHORT_CLIP_BATCH_SIZE": 8,  # windows per batch (FASTER_WHISPER_BATCH_SIZE is used if > 0)
+    "WHISPER_MODEL_STORE": True,  # load models from WHISPER_STORE_DIR when installed there
+    "WHISPER_OFFLINE": False,  # never contact the Hugging Face Hub
+    "LOOP_GUARD_ENABLED": True,  # abort repetition loops and resume at the next speech region
+    "LOOP_GUARD_MAX_REPEATS": 3,  # identical segments in a row treated as a loop
+    "LOOP_GUARD_MIN_REPEAT_WORDS": 3,  # shorter segments ("Tak.") need a long run without pauses
+    "IMPORT_DEDUPE_CONTENT": True,  # skip files with duplicated content in folder imports
+    "AUDIO_DEDUPE_ENABLED": True,  # reuse the transcript of a recording whose audio was transcribed before
+    "AUDIO_DEDUPE_THRESHOLD": 0.85,  # fingerprint similarity (0-1) treated as the same recording
+    "UI_LAG_THRESHOLD_MS": 50,  # log GUI handlers blocking the event loop longer than this (0 = off)
+    "LOG_TO_DISK": True,  # write the processing log to LOG_DIR (pogadane.log + pogadane.jsonl)
+    "LOG_MAX_MB": 10,  # rotate log files at this size
+    "LOG_BACKUPS": 5,  # rotated files kept per format
+    "RESULT_STORE_ENABLED": True,  # keep results in RESULTS_DB (searchable across sessions)
+    "SEMANTIC_SEARCH_ENABLED": False,  # embed transcripts for search by meaning (sentence-transformers)
+    "SEMANTIC_MODEL": "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
     
     # YouTube download
     "YT_DLP_PATH": "yt-dlp",
@@ -48,6 +148,7 @@ DEFAULT_CONFIG = {
     "GGUF_MODEL_PATH": str(MODELS_DIR / "gemma-3-4b-it-Q4_K_M.gguf"),
     "GGUF_CONTEXT_SIZE": 4096,
     "GGUF_GPU_LAYERS": 0,  # 0=CPU only
+    "GGUF_QA_STATE_MB": 1024,  # memory for saved Q&A sessions (evaluated transcripts), LRU
     
     # Prompt templates
     "LLM_PROMPT_TEMPLATES": {
@@ -85,3 +186,69 @@ DEFAULT_WINDOW_HEIGHT = 800
 
 # Processing settings
 TEMP_AUDIO_FOLDER_NAME = "pogadane_temp_audio"
+
+# Transcription speed profiles - decoding parameters bundled with a model choice.
+# "model": None keeps WHISPER_MODEL from config. "balanced" matches the previous
+# hard-coded behaviour (beam search of 5 with library defaults).
+_TEMPERATURE_FALLBACK = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+TRANSCRIPTION_PROFILES = {
+    "fast": {
+        "label": "Szybki - zachłanne dekodowanie, bez znaczników czasu",
+        "model": "small",
+        "beam_size": 1,
+        "best_of": 1,
+        "temperature": 0.0,
+        "condition_on_previous_text": False,
+        "without_timestamps": True,
+        "compression_ratio_threshold": 2.4,
+    },
+    "balanced": {
+        "label": "Zbalansowany - beam search 5 (domyślny)",
+        "model": None,
+        "beam_size": 5,
+        "best_of": 5,
+        "temperature": _TEMPERATURE_FALLBACK,
+        "condition_on_previous_text": True,
+        "without_timestamps": False,
+        "compression_ratio_threshold": 2.4,
+    },
+    "accurate": {
+        "label": "Dokładny - large-v3, szerszy beam search",
+        "model": "large-v3",
+        "beam_size": 8,
+        "best_of": 5,
+        "temperature": _TEMPERATURE_FALLBACK,
+        "condition_on_previous_text": True,
+        "without_timestamps": False,
+        "compression_ratio_threshold": 2.2,
+    },
+}
+DEFAULT_TRANSCRIPTION_PROFILE = "balanced"
+
+# Faster-Whisper calibration (python -m pogadane calibrate)
+TUNING_SETTINGS_KEY = "FASTER_WHISPER_TUNING"  # settings.json key with per-model results
+CALIBRATION_CLIP_SECONDS = 60  # two 30 s windows, enough for batching to matter
+CALIBRATION_MAX_NEW_TOKENS = 64  # cap decoding so every configuration does similar work
+CALIBRATION_COMPUTE_TYPES_CPU = ("int8", "int8_float32", "float32")
+CALIBRATION_COMPUTE_TYPES_CUDA = ("float16", "int8_float16", "int8")
+CALIBRATION_BATCH_SIZES = (0, 4, 8)
+
+# Local CTranslate2 model store (python -m pogadane models)
+MODEL_MANIFEST_NAME = "manifest.json"  # file sizes and SHA-256 of a stored model
+MODEL_VERIFIED_NAME = ".verified.json"  # file stamps of the last successful checksum run
+TRANSFORMERS_WHISPER_IDS = {  # sources for pre-quantized conversion
+    "tiny": "openai/whisper-tiny",
+    "base": "openai/whisper-base",
+    "small": "openai/whisper-small",
+    "medium": "openai/whisper-medium",
+    "large-v2": "openai/whisper-large-v2",
+    "large-v3": "openai/whisper-large-v3",
+    "large": "openai/whisper-large-v3",
+    "turbo": "openai/whisper-large-v3-turbo",
+    "large-v3-turbo": "openai/whisper-large-v3-turbo",
+}
+
+# Dependency probing (capabilities.py)
+CAPABILITY_CACHE_TTL = 600  # seconds a probe result is reused
+CAPABILITY_PROBE_TIMEOUT = 5  # seconds an executable may take to answer
+CAPABILITY_SERVICE_TTL = 15  # seconds a running service (Ollama server) is assumed to stay up
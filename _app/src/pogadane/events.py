@@ -0,0 +1,180 @@
+"""
+Typed job events from the processing worker to the GUI.
+
+The worker publishes ``JobEvent`` objects (job id, stage, progress fraction,
+metrics) to an ``EventBus``. The bus does not poll: the first event after a
+delivery schedules one delivery on the UI event loop (``page.run_task`` in
+Flet), which waits until the frame interval has passed and then hands all
+pending events to the handler at once. Progress events of a job that arrive
+before the previous one was delivered replace it, so high-frequency progress
+costs one UI update per frame.
+
+Usage:
+    bus = EventBus(schedule=lambda: page.run_task(bus.deliver), handler=on_events)
+    bus.publish(JobEvent.progress("job-1", update))
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+from .backend import ProcessingStage, ProgressUpdate
+from .constants import CONSOLE_FLUSH_INTERVAL
+
+
+class EventKind(Enum):
+    """Kinds of job events"""
+    LOG = "log"  # console message
+    PROGRESS = "progress"  # stage/fraction update of a job
+    SEGMENT = "segment"  # transcript segment decoded while the job runs
+    STATUS = "status"  # queue status change of a job
+    RESULT = "result"  # transcription and summary of a job
+    METRICS = "metrics"  # performance metrics of a finished job (payload: JobMetrics)
+    ERROR = "error"  # error message
+    FINISHED = "finished"  # all jobs of the batch are done
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    """
+    One event of a processing job.
+
+    Attributes:
+        kind: Event kind
+        job_id: Job the event belongs to (None for batch-level events)
+        stage: Processing stage (PROGRESS events)
+        fraction: Progress of the job from 0.0 to 1.0 (PROGRESS events)
+        message: Human-readable message
+        status: Queue status text (STATUS events)
+        metrics: Additional numbers and statistics (e.g. transcription info)
+        payload: Event data (RESULT: dict with source, transcription, summary;
+            METRICS: JobMetrics; SEGMENT: dict with source, start, end, text)
+        timestamp: Creation time (time.monotonic)
+    """
+    kind: EventKind
+    job_id: Optional[str] = None
+    stage: Optional[ProcessingStage] = None
+    fraction: Optional[float] = None
+    message: str = ""
+    status: Optional[str] = None
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    payload: Any = None
+    timestamp: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def progress(cls, job_id: str, update: ProgressUpdate) -> "JobEvent":
+        """Create a PROGRESS event from a backend ProgressUpdate."""
+        return cls(
+            EventKind.PROGRESS,
+            job_id=job_id,
+            stage=update.stage,
+            fraction=update.progress,
+            message=update.message,
+            metrics=dict(update.details or {}),
+        )
+
+    @classmethod
+    def segment(cls, job_id: str, source: str, start: float, end: float, text: str) -> "JobEvent":
+        """Create a SEGMENT event for a decoded transcript segment."""
+        return cls(
+            EventKind.SEGMENT,
+            job_id=job_id,
+            payload={"source": source, "start": start, "end": end, "text": text},
+        )
+
+    @classmethod
+    def log(cls, message: str, job_id: Optional[str] = None) -> "JobEvent":
+        """Create a LOG event."""
+        return cls(EventKind.LOG, job_id=job_id, message=message)
+
+
+class EventBus:
+    """
+    Thread-safe, coalescing event channel to a UI event loop.
+
+    Attributes:
+        min_interval (float): Minimum time between two deliveries in seconds
+    """
+
+    def __init__(
+        self,
+        schedule: Callable[[], Any],
+        handler: Callable[[List[JobEvent]], None],
+        min_interval: float = CONSOLE_FLUSH_INTERVAL,
+    ):
+        """
+        Initialize the bus.
+
+        Args:
+            schedule: Called (from any thread) to run ``deliver()`` on the UI loop
+            handler: Receives the pending events on the UI loop
+            min_interval: Minimum time between two deliveries in seconds
+        """
+        self.schedule = schedule
+        self.handler = handler
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._pending: List[JobEvent] = []
+        # Per job: index of the pending PROGRESS event and of the last event
+        # that must stay ordered after it (status, result, error)
+        self._progress_index: Dict[Optional[str], int] = {}
+        self._barrier_index: Dict[Optional[str], int] = {}
+        self._scheduled = False
+        self._last_delivery = 0.0
+
+    def publish(self, event: JobEvent) -> None:
+        """
+        Queue an event for delivery (callable from any thread).
+
+        Args:
+            event: Event to deliver
+        """
+        with self._lock:
+            job = event.job_id
+            if event.kind == EventKind.PROGRESS:
+                index = self._progress_index.get(job)
+                if index is not None and index > self._barrier_index.get(job, -1):
+                    self._pending[index] = event
+                else:
+                    self._progress_index[job] = len(self._pending)
+                    self._pending.append(event)
+            else:
+                # Console lines and segments are only appended; the other
+                # kinds must stay after the progress they follow
+                if event.kind not in (EventKind.LOG, EventKind.SEGMENT):
+                    self._barrier_index[job] = len(self._pending)
+                self._pending.append(event)
+
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self.schedule()
+
+    def drain(self) -> List[JobEvent]:
+        """
+        Take all pending events.
+
+        Returns:
+            Events in publication order (coalesced progress events keep the
+            position of the first one)
+        """
+        with self._lock:
+            events = self._pending
+            self._pending = []
+            self._progress_index.clear()
+            self._barrier_index.clear()
+            self._scheduled = False
+            self._last_delivery = time.monotonic()
+        return events
+
+    async def deliver(self) -> None:
+        """Wait for the frame interval, then pass pending events to the handler."""
+        wait = self.min_interval - (time.monotonic() - self._last_delivery)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        events = self.drain()
+        if events:
+            self.handler(events)
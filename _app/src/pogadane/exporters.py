@@ -0,0 +1,229 @@
+"""
+Streaming export of results to TXT, SRT, VTT, JSONL and Markdown.
+
+Results are written one at a time to an open file, so exporting thousands
+of results needs memory for a single result only. Callers pass an iterable
+of ``(source, transcription, summary)`` items, usually a generator that
+loads each result on demand (``ResultsManager.iter_results`` or the
+result store).
+
+Plain text, JSON lines and Markdown put all results into one file.
+Subtitle formats (SRT, WebVTT) are generated from segment timestamps and
+need one file per recording, so they are written into a folder; results
+without timestamps are skipped.
+
+Usage:
+    stats = export_results(results_manager.iter_results(), "jsonl", "wyniki.jsonl",
+                           total=results_manager.get_result_count(),
+                           progress=lambda done, total: print(done, total))
+"""
+
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, TextIO, Tuple, Union
+
+from .file_utils import get_input_name_stem
+from .segments import SegmentStore
+from .text_utils import format_timestamp
+
+# Format -> (label, file extension)
+EXPORT_FORMATS = {
+    "txt": ("Tekst (TXT)", ".txt"),
+    "md": ("Markdown (MD)", ".md"),
+    "jsonl": ("JSON Lines (JSONL)", ".jsonl"),
+    "srt": ("Napisy SubRip (SRT)", ".srt"),
+    "vtt": ("Napisy WebVTT (VTT)", ".vtt"),
+}
+SUBTITLE_FORMATS = ("srt", "vtt")
+
+ExportItem = Tuple[str, Union[str, SegmentStore], str]
+
+
+class ExportStats(NamedTuple):
+    """Outcome of export_results."""
+    exported: int
+    skipped: int  # results without timestamps (subtitle formats)
+    cancelled: bool
+    files: int  # files written
+
+
+def format_subtitle_time(seconds: float, decimal: str = ",") -> str:
+    """
+    Format seconds as a subtitle timestamp.
+
+    Args:
+        seconds: Time in seconds
+        decimal: Separator before milliseconds ("," for SRT, "." for WebVTT)
+
+    Returns:
+        Timestamp in hh:mm:ss,mmm form
+    """
+    millis = max(0, int(round(seconds * 1000)))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{decimal}{millis:03d}"
+
+
+def iter_txt(index: int, source: str, transcription: Union[str, SegmentStore], summary: str) -> Iterator[str]:
+    """Lines of one result in the plain text export."""
+    yield "=" * 80
+    yield f"WYNIK #{index}: {source}"
+    yield "=" * 80
+    yield ""
+    yield "--- TRANSKRYPCJA ---"
+    if isinstance(transcription, SegmentStore):
+        yield from transcription.iter_lines()
+    else:
+        yield transcription
+    yield ""
+    yield "--- STRESZCZENIE ---"
+    yield summary
+    yield ""
+
+
+def iter_markdown(index: int, source: str, transcription: Union[str, SegmentStore], summary: str) -> Iterator[str]:
+    """Lines of one result in the Markdown export."""
+    yield f"## {index}. {source}"
+    yield ""
+    yield "### Podsumowanie"
+    yield ""
+    yield summary or "_Brak podsumowania._"
+    yield ""
+    yield "### Transkrypcja"
+    yield ""
+    if isinstance(transcription, SegmentStore):
+        for segment in transcription:
+            yield f"- **{format_timestamp(segment.start)}** {segment.text.strip()}"
+    elif transcription:
+        yield transcription
+    yield ""
+
+
+def json_record(source: str, transcription: Union[str, SegmentStore], summary: str) -> str:
+    """One result as a JSON line (segments as start/end/text objects when available)."""
+    record = {"source": source, "summary": summary}
+    if isinstance(transcription, SegmentStore):
+        record["transcription"] = transcription.plain_text()
+        record["segments"] = [
+            {"start": segment.start, "end": segment.end, "text": segment.text}
+            for segment in transcription
+        ]
+    else:
+        record["transcription"] = transcription
+        record["segments"] = None
+    return json.dumps(record, ensure_ascii=False)
+
+
+def write_subtitles(out: TextIO, segments: SegmentStore, fmt: str) -> None:
+    """
+    Write segments as SRT or WebVTT cues.
+
+    Args:
+        out: Text file opened for writing
+        segments: Transcript segments
+        fmt: "srt" or "vtt"
+    """
+    if fmt == "vtt":
+        out.write("WEBVTT\n\n")
+    decimal = "," if fmt == "srt" else "."
+    for number, segment in enumerate(segments, 1):
+        if fmt == "srt":
+            out.write(f"{number}\n")
+        out.write(f"{format_subtitle_time(segment.start, decimal)} --> "
+                  f"{format_subtitle_time(segment.end, decimal)}\n")
+        out.write(f"{segment.text.strip()}\n\n")
+
+
+def subtitle_path(folder: Path, source: str, extension: str, used: set) -> Path:
+    """
+    File name in the export folder for a recording's subtitles.
+
+    Args:
+        folder: Export folder
+        source: Source of the result
+        extension: File extension (with dot)
+        used: Names already written in this export (updated)
+
+    Returns:
+        Path that no other result of the export uses
+    """
+    stem = re.sub(r'[\\/*?:"<>|]', "_", get_input_name_stem(source)) or "wynik"
+    name, number = stem, 1
+    while name.casefold() in used:
+        number += 1
+        name = f"{stem}_{number}"
+    used.add(name.casefold())
+    return folder / f"{name}{extension}"
+
+
+def export_results(items: Iterable[ExportItem], fmt: str, destination: Union[str, Path],
+                   total: Optional[int] = None,
+                   progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                   cancel: Optional[threading.Event] = None) -> ExportStats:
+    """
+    Write results to a file (TXT, MD, JSONL) or a folder (SRT, VTT), one at a time.
+
+    Args:
+        items: (source, transcription, summary) tuples, consumed lazily
+        fmt: Format key from EXPORT_FORMATS
+        destination: Output file, or folder for subtitle formats (created if missing)
+        total: Number of items, passed to progress
+        progress: Called with (results processed, total) after each result
+        cancel: Stops the export after the current result when set
+
+    Returns:
+        ExportStats
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    extension = EXPORT_FORMATS[fmt][1]
+    destination = Path(destination)
+    exported = skipped = files = done = 0
+    cancelled = False
+
+    if fmt in SUBTITLE_FORMATS:
+        destination.mkdir(parents=True, exist_ok=True)
+        used: set = set()
+        for source, transcription, _summary in items:
+            if cancel is not None and cancel.is_set():
+                cancelled = True
+                break
+            if not isinstance(transcription, SegmentStore):
+                transcription = SegmentStore.from_text(transcription or "")
+            if transcription:
+                with open(subtitle_path(destination, source, extension, used), "w", encoding="utf-8") as out:
+                    write_subtitles(out, transcription, fmt)
+                exported += 1
+                files += 1
+            else:
+                skipped += 1
+            done += 1
+            if progress:
+                progress(done, total)
+        return ExportStats(exported, skipped, cancelled, files)
+
+    with open(destination, "w", encoding="utf-8") as out:
+        files = 1
+        if fmt == "md":
+            out.write("# Wyniki Pogadane\n\n")
+        for source, transcription, summary in items:
+            if cancel is not None and cancel.is_set():
+                cancelled = True
+                break
+            done += 1
+            if fmt == "jsonl":
+                out.write(json_record(source, transcription, summary) + "\n")
+            else:
+                lines = iter_txt if fmt == "txt" else iter_markdown
+                for line in lines(done, source, transcription, summary):
+                    out.write(line + "\n")
+            exported += 1
+            if progress:
+                progress(done, total)
+    return ExportStats(exported, skipped, cancelled, files)
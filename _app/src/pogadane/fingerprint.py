@@ -0,0 +1,442 @@
+"""
+Audio fingerprints for finding re-uploaded recordings.
+
+The same meeting often arrives twice: as an MP4 and its MP3 export, or
+re-encoded on another device. Byte hashes (``media_import.partial_hash``)
+differ, but the decoded sound does not. A fingerprint reduces decoded audio
+(mono, 8 kHz) to two features every 64 ms:
+
+- the energy envelope (log power), which follows speech and pauses;
+- a chroma vector (spectral power folded into 12 pitch classes, centered
+  and normalized), which follows voices and music.
+
+Both survive lossy re-encoding, resampling and gain changes. Two
+fingerprints are compared by aligning their envelopes (encoders add up to
+a few seconds of padding), then correlating envelopes and chroma over the
+overlap; the score is scaled by how much of the longer recording overlaps.
+
+``FingerprintIndex`` keeps fingerprints of transcribed recordings together
+with their transcripts in a SQLite file. Candidates are preselected by
+duration, so a lookup compares only recordings of about the same length.
+
+Usage:
+    fingerprint = fingerprint_file("spotkanie.mp4")
+    match = index.find(fingerprint, threshold=0.85)
+    if match:
+        transcription = match.transcription
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from .constants import (
+    FINGERPRINT_DURATION_TOLERANCE,
+    FINGERPRINT_FRAME,
+    FINGERPRINT_HOP,
+    FINGERPRINT_MAX_OFFSET_SECONDS,
+    FINGERPRINT_SAMPLE_RATE,
+)
+from .segments import SegmentStore
+
+# Frames analysed per FFT batch (bounds memory for long recordings)
+BATCH_FRAMES = 512
+
+# Pitch range folded into chroma (A2 to A7)
+CHROMA_MIN_HZ = 110.0
+CHROMA_MAX_HZ = 3520.0
+
+# Frames more than 30 dB below the loudest one are treated as silence in chroma comparison
+SILENCE_DECADES = 3.0
+
+# Shortest overlap (in frames) that is compared at all
+MIN_OVERLAP_FRAMES = 16
+
+# Fractions of a frame tried when refining the alignment of two recordings
+SUBFRAME_STEPS = (-0.5, -0.375, -0.25, -0.125, 0.125, 0.25, 0.375, 0.5)
+
+
+def iter_audio_blocks(path: Union[str, Path], sample_rate: int = FINGERPRINT_SAMPLE_RATE) -> Iterator[np.ndarray]:
+    """
+    Decode an audio or video file as a stream of mono float32 blocks.
+
+    Uses PyAV (installed with faster-whisper); the file is never held in
+    memory as a whole. Packets that fail to decode (damaged parts of a
+    recording) are skipped.
+
+    Args:
+        path: Media file
+        sample_rate: Output sample rate
+
+    Yields:
+        Sample blocks in the range [-1, 1]
+
+    Raises:
+        ImportError: If PyAV is not installed
+        ValueError: If the file has no audio stream
+    """
+    import av
+
+    resampler = av.audio.resampler.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+    with av.open(str(path), metadata_errors="ignore") as container:
+        if not container.streams.audio:
+            raise ValueError(f"No audio stream in {path}")
+        stream = container.streams.audio[0]
+        # A decode error ends container.decode(); demuxing lets us skip one packet
+        for packet in container.demux(stream):
+            try:
+                frames = packet.decode()
+            except av.error.InvalidDataError:
+                continue
+            for frame in frames:
+                for resampled in resampler.resample(frame):
+                    yield resampled.to_ndarray().reshape(-1).astype(np.float32) / 32768.0
+        for resampled in resampler.resample(None):
+            yield resampled.to_ndarray().reshape(-1).astype(np.float32) / 32768.0
+
+
+def _chroma_matrix(frame: int, sample_rate: int) -> np.ndarray:
+    """Matrix folding rFFT power bins into 12 pitch classes."""
+    freqs = np.fft.rfftfreq(frame, 1.0 / sample_rate)
+    matrix = np.zeros((len(freqs), 12), dtype=np.float32)
+    used = (freqs >= CHROMA_MIN_HZ) & (freqs <= CHROMA_MAX_HZ)
+    pitch = np.round(12 * np.log2(freqs[used] / 440.0)).astype(int) % 12
+    matrix[np.flatnonzero(used), pitch] = 1.0
+    return matrix
+
+
+@dataclass
+class AudioFingerprint:
+    """
+    Per-frame features of a recording.
+
+    Attributes:
+        duration: Length of the decoded audio in seconds
+        energy: Log10 power of each frame, shape (frames,)
+        chroma: Centered, unit-length chroma of each frame, shape (frames, 12)
+    """
+    duration: float
+    energy: np.ndarray
+    chroma: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.energy)
+
+    @classmethod
+    def from_samples(cls, blocks: Union[np.ndarray, Iterable[np.ndarray]],
+                     sample_rate: int = FINGERPRINT_SAMPLE_RATE) -> "AudioFingerprint":
+        """
+        Compute the fingerprint of mono audio.
+
+        Args:
+            blocks: Samples, as one array or a stream of blocks (see iter_audio_blocks)
+            sample_rate: Sample rate of the samples
+
+        Returns:
+            AudioFingerprint
+        """
+        if isinstance(blocks, np.ndarray):
+            blocks = [blocks]
+        window = np.hanning(FINGERPRINT_FRAME).astype(np.float32)
+        chroma_matrix = _chroma_matrix(FINGERPRINT_FRAME, sample_rate)
+        batch_samples = FINGERPRINT_FRAME + (BATCH_FRAMES - 1) * FINGERPRINT_HOP
+
+        energies, chromas = [], []
+        pending = np.zeros(0, dtype=np.float32)
+        total = 0
+
+        def analyse(samples: np.ndarray) -> np.ndarray:
+            """Analyse all whole frames of ``samples``; return the samples left over."""
+            count = 1 + (len(samples) - FINGERPRINT_FRAME) // FINGERPRINT_HOP
+            frames = np.lib.stride_tricks.sliding_window_view(samples, FINGERPRINT_FRAME)[::FINGERPRINT_HOP][:count]
+            power = np.abs(np.fft.rfft(frames * window, axis=1)) ** 2
+            energies.append(np.log10(power.sum(axis=1) + 1e-10))
+            chromas.append(power @ chroma_matrix)
+            return samples[count * FINGERPRINT_HOP:]
+
+        for block in blocks:
+            block = np.asarray(block, dtype=np.float32).reshape(-1)
+            total += len(block)
+            pending = np.concatenate([pending, block])
+            if len(pending) >= batch_samples:
+                pending = analyse(pending)
+        if len(pending) >= FINGERPRINT_FRAME:
+            analyse(pending)
+
+        energy = np.concatenate(energies) if energies else np.zeros(0)
+        chroma = np.concatenate(chromas) if chromas else np.zeros((0, 12))
+        # Log-compress, then center: only the shape across pitch classes counts
+        chroma = np.log1p(chroma / (chroma.mean(axis=1, keepdims=True) + 1e-10))
+        chroma -= chroma.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(chroma, axis=1, keepdims=True)
+        chroma = np.divide(chroma, norms, out=np.zeros_like(chroma), where=norms > 1e-6)
+        return cls(total / sample_rate, energy.astype(np.float32), chroma.astype(np.float32))
+
+    def to_blobs(self):
+        """Energy as float16 and chroma as int8 bytes (for storage, about 0.8 MB per hour)."""
+        chroma = np.round(self.chroma * 127).astype(np.int8)
+        return self.energy.astype(np.float16).tobytes(), chroma.tobytes()
+
+    @classmethod
+    def from_blobs(cls, duration: float, energy: bytes, chroma: bytes) -> "AudioFingerprint":
+        """Rebuild a fingerprint stored with to_blobs()."""
+        return cls(
+            duration,
+            np.frombuffer(energy, dtype=np.float16).astype(np.float32),
+            np.frombuffer(chroma, dtype=np.int8).astype(np.float32).reshape(-1, 12) / 127,
+        )
+
+
+def fingerprint_file(path: Union[str, Path]) -> AudioFingerprint:
+    """Decode a media file and compute its fingerprint (see iter_audio_blocks)."""
+    return AudioFingerprint.from_samples(iter_audio_blocks(path), FINGERPRINT_SAMPLE_RATE)
+
+
+def _correlation(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation of two equally long series (0 for constant series)."""
+    x = x - x.mean()
+    y = y - y.mean()
+    denominator = float(np.sqrt(np.dot(x, x) * np.dot(y, y)))
+    return float(np.dot(x, y)) / denominator if denominator > 0 else 0.0
+
+
+def _overlap(length_a: int, length_b: int, lag: int):
+    """Slices of a and b aligned so that a[i] matches b[i + lag]."""
+    start_a, start_b = max(0, -lag), max(0, lag)
+    count = min(length_a - start_a, length_b - start_b)
+    return slice(start_a, start_a + max(count, 0)), slice(start_b, start_b + max(count, 0))
+
+
+def _between_frames(a: np.ndarray, b: np.ndarray, fraction: float):
+    """
+    Align ``a`` with ``b`` shifted by a fraction of a frame (-1 < fraction < 1).
+
+    Values of ``b`` between frames are interpolated linearly; both results
+    are one frame shorter (none for fraction 0).
+    """
+    if fraction == 0:
+        return a, b
+    if fraction > 0:
+        return a[:-1], (1 - fraction) * b[:-1] + fraction * b[1:]
+    return a[1:], (1 + fraction) * b[1:] - fraction * b[:-1]
+
+
+def similarity(a: AudioFingerprint, b: AudioFingerprint,
+               max_offset: float = FINGERPRINT_MAX_OFFSET_SECONDS) -> float:
+    """
+    Score how likely two fingerprints come from the same recording.
+
+    The envelopes are aligned by the lag (up to ``max_offset`` seconds, in
+    steps of an eighth of a frame) with the highest correlation. At that lag the score is the lower of the
+    envelope correlation and the mean chroma similarity of non-silent
+    frames, multiplied by the overlap's share of the longer recording.
+
+    Args:
+        a: First fingerprint
+        b: Second fingerprint
+        max_offset: Largest shift between the recordings in seconds
+
+    Returns:
+        Score from 0 (unrelated) to 1 (same audio)
+    """
+    length_a, length_b = len(a), len(b)
+    if min(length_a, length_b) < MIN_OVERLAP_FRAMES:
+        return 0.0
+    max_lag = int(max_offset * FINGERPRINT_SAMPLE_RATE / FINGERPRINT_HOP)
+    # Silence is floored: its level is mostly encoder and device noise
+    floor_a, floor_b = a.energy.max() - SILENCE_DECADES, b.energy.max() - SILENCE_DECADES
+    energy_a, energy_b = np.maximum(a.energy, floor_a), np.maximum(b.energy, floor_b)
+
+    best_lag, best_envelope = 0, -1.0
+    for lag in range(-max_lag, max_lag + 1):
+        slice_a, slice_b = _overlap(length_a, length_b, lag)
+        if slice_a.stop - slice_a.start < MIN_OVERLAP_FRAMES:
+            continue
+        envelope = _correlation(energy_a[slice_a], energy_b[slice_b])
+        if envelope > best_envelope:
+            best_lag, best_envelope = lag, envelope
+    if best_envelope <= 0:
+        return 0.0
+
+    # Copies are rarely shifted by whole frames: refine the lag between frames
+    slice_a, slice_b = _overlap(length_a, length_b, best_lag)
+    best_fraction = 0.0
+    for fraction in SUBFRAME_STEPS:
+        envelope = _correlation(*_between_frames(energy_a[slice_a], energy_b[slice_b], fraction))
+        if envelope > best_envelope:
+            best_fraction, best_envelope = fraction, envelope
+
+    level_a, level_b = _between_frames(energy_a[slice_a], energy_b[slice_b], best_fraction)
+    chroma_a, chroma_b = _between_frames(a.chroma[slice_a], b.chroma[slice_b], best_fraction)
+    voiced = (level_a > floor_a) & (level_b > floor_b)
+    if not voiced.any():
+        return 0.0
+    chroma_b = chroma_b[voiced]
+    norms = np.linalg.norm(chroma_b, axis=1)
+    chroma = float((np.einsum("ij,ij->i", chroma_a[voiced], chroma_b) / np.maximum(norms, 1e-6)).mean())
+    coverage = (slice_a.stop - slice_a.start) / max(length_a, length_b)
+    return max(min(best_envelope, chroma), 0.0) * coverage
+
+
+@dataclass
+class FingerprintMatch:
+    """
+    A stored recording similar to a looked-up fingerprint.
+
+    Attributes:
+        source: Source of the stored recording
+        score: Similarity (see similarity())
+        transcription: Its transcript (SegmentStore or text)
+    """
+    source: str
+    score: float
+    transcription: Union[str, SegmentStore]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    source TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    energy BLOB NOT NULL,
+    chroma BLOB NOT NULL,
+    transcription TEXT,
+    segments BLOB
+);
+CREATE INDEX IF NOT EXISTS fingerprints_duration ON fingerprints(duration);
+"""
+
+
+class FingerprintIndex:
+    """
+    SQLite file of fingerprints and transcripts of processed recordings.
+
+    The connection is shared between threads and guarded by a lock, like
+    ``ResultStore``.
+
+    Attributes:
+        path (Path): Database file
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (create) the index.
+
+        Args:
+            path: Database file (its folder is created if missing)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def add(self, source: str, fingerprint: AudioFingerprint, transcription: Union[str, SegmentStore]) -> None:
+        """
+        Store the fingerprint and transcript of a recording (replacing an earlier one).
+
+        Args:
+            source: Source identifier (file path or URL)
+            fingerprint: Fingerprint of its audio
+            transcription: Transcript text or SegmentStore
+        """
+        if isinstance(transcription, SegmentStore):
+            text, segments = None, transcription.to_bytes()
+        else:
+            text, segments = transcription, None
+        energy, chroma = fingerprint.to_blobs()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (source, time.time(), fingerprint.duration, energy, chroma, text, segments),
+            )
+
+    @staticmethod
+    def _duration_range(duration: float) -> Tuple[float, float]:
+        """Durations of recordings that may hold the same audio."""
+        margin = duration * FINGERPRINT_DURATION_TOLERANCE + FINGERPRINT_MAX_OFFSET_SECONDS
+        return duration - margin, duration + margin
+
+    def has_candidates(self, duration: float, exclude: Optional[str] = None) -> bool:
+        """
+        Check if any stored recording is long enough to match (no audio is compared).
+
+        Lets callers skip decoding a file when its duration, read from the
+        container header, rules out every stored recording.
+
+        Args:
+            duration: Duration of the recording in seconds
+            exclude: Source to skip (e.g. the recording itself)
+
+        Returns:
+            True if find() could return a match
+        """
+        low, high = self._duration_range(duration)
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM fingerprints WHERE duration BETWEEN ? AND ? AND source IS NOT ? LIMIT 1",
+                (low, high, exclude),
+            ).fetchone() is not None
+
+    def find(self, fingerprint: AudioFingerprint, threshold: float = 0.85,
+             exclude: Optional[str] = None) -> Optional[FingerprintMatch]:
+        """
+        Find the stored recording most similar to a fingerprint.
+
+        Only recordings whose duration differs by less than
+        FINGERPRINT_DURATION_TOLERANCE (plus the allowed offset) are compared.
+
+        Args:
+            fingerprint: Fingerprint to look up
+            threshold: Lowest similarity accepted as a duplicate
+            exclude: Source to skip (e.g. the recording itself)
+
+        Returns:
+            The best match scoring at least ``threshold``, or None
+        """
+        with self._lock:
+            candidates = self._conn.execute(
+                "SELECT source, duration, energy, chroma FROM fingerprints WHERE duration BETWEEN ? AND ?",
+                self._duration_range(fingerprint.duration),
+            ).fetchall()
+        best_source, best_score = None, threshold
+        for source, duration, energy, chroma in candidates:
+            if source == exclude:
+                continue
+            score = similarity(fingerprint, AudioFingerprint.from_blobs(duration, energy, chroma))
+            if score >= best_score:
+                best_source, best_score = source, score
+        if best_source is None:
+            return None
+        with self._lock:
+            text, segments = self._conn.execute(
+                "SELECT transcription, segments FROM fingerprints WHERE source = ?", (best_source,)
+            ).fetchone()
+        transcription = SegmentStore.from_bytes(segments) if segments is not None else text
+        return FingerprintMatch(best_source, best_score, transcription)
+
+    def remove(self, source: str) -> bool:
+        """Forget a recording (True if it was stored)."""
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM fingerprints WHERE source = ?", (source,)).rowcount > 0
+
+    def __contains__(self, source: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM fingerprints WHERE source = ?", (source,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -5,11 +5,15 @@ Beautiful Material Design 3 interface using Flet (Flutter-based)
 """
 
 import flet as ft
+import asyncio
+import atexit
 import threading
-import queue
+import time
+import uuid
 import sys
 import os
 import logging
+import sqlite3
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -21,17 +25,55 @@ from .constants import (
     FILE_STATUS_PROCESSING,
     FILE_STATUS_COMPLETED,
     FILE_STATUS_ERROR,
-    DEFAULT_CONFIG
+    DEFAULT_CONFIG,
+    TRANSCRIPTION_PROFILES,
+    DEFAULT_TRANSCRIPTION_PROFILE,
+    CONSOLE_MAX_LINES,
+    QUEUE_ROW_HEIGHT,
+    QUEUE_POOL_ROWS,
+    QUEUE_OVERSCAN_ROWS,
+    LOG_DIR,
+    RESULTS_ROW_HEIGHT,
+    RESULTS_POOL_ROWS,
+    RESULTS_OVERSCAN_ROWS,
+    IMPORT_CHUNK_SIZE,
+    METRICS_FILE,
+    METRICS_SPARKLINE_POINTS,
+    METRICS_TABLE_JOBS,
+    RESULTS_DB,
+    RESULTS_SEARCH_LIMIT,
+    SEMANTIC_INDEX_DIR,
+    FINGERPRINT_DB,
+    SEMANTIC_SEARCH_LIMIT,
 )
-from .text_utils import strip_ansi, extract_transcription_and_summary
-from .config_loader import ConfigManager
-from .gui_utils import ResultsManager
+from .text_utils import strip_ansi, extract_transcription_and_summary, is_valid_url, parse_timestamp, format_timestamp
+from .config_loader import ConfigManager, parse_bool
+from .gui_utils import ResultsManager, ConsoleBuffer, QueueModel, QueueEntry, UiWatchdog, TranscriptPager
 from .backend import PogadaneBackend, ProgressUpdate, ProcessingStage
+from .events import EventBus, EventKind, JobEvent
+from .log_store import LogStore
+from .metrics import JobMetrics, MetricsHistory
+from .result_store import ResultStore
+from .exporters import EXPORT_FORMATS, SUBTITLE_FORMATS, export_results
+from .segments import SegmentStore
+from .media_import import ContentDeduper, iter_chunks, iter_media_files, read_source_list
+from .capabilities import Capability, get_registry as get_capability_registry
 
 
 # Configure GUI logger
 logger = logging.getLogger(__name__)
 
+# Performance tab cards: JobMetrics attribute, title, value format and color
+PERFORMANCE_METRICS = (
+    ("real_time_factor", "RTF transkrypcji", "rtf", "#2563EB"),
+    ("generation_tokens_per_second", "Generowanie (tok/s)", "rate", "#7C3AED"),
+    ("prompt_tokens_per_second", "Prompt (tok/s)", "rate", "#A78BFA"),
+    ("queue_wait_seconds", "Oczekiwanie w kolejce", "seconds", "#FBBF24"),
+    ("total_seconds", "Czas zadania", "seconds", "#34D399"),
+    ("peak_rss_bytes", "Szczyt pamięci (RSS)", "bytes", "#DC2626"),
+    ("cache_hit_rate", "Trafienia cache modeli", "percent", "#059669"),
+)
+
 
 class PogadaneApp:
     """Main Pogadane Application with Material 3 Expressive Design"""
@@ -260,22 +302,81 @@ class PogadaneApp:
         self.config_module = self.config_manager.config
         
         # Initialize variables
-        self.output_queue = queue.Queue()
+        self.events = EventBus(
+            schedule=lambda: self.page.run_task(self.events.deliver),
+            handler=self._handle_events,
+        )
+        # Logs handlers that block the event loop (UI_LAG_THRESHOLD_MS, 0 = off)
+        self.watchdog = None
+        lag_threshold_ms = getattr(self.config_module, "UI_LAG_THRESHOLD_MS", DEFAULT_CONFIG["UI_LAG_THRESHOLD_MS"])
+        if lag_threshold_ms and float(lag_threshold_ms) > 0:
+            self.watchdog = UiWatchdog(threshold=float(lag_threshold_ms) / 1000)
+            self.page.run_task(self.watchdog.run)
         self.batch_processing_thread = None
+        # Result bodies live in a temp spill file (deleted on exit); only recent ones stay in memory
         self.results_manager = ResultsManager()
+        atexit.register(self.results_manager.close)
+        # The processing log goes to rotating files; the console keeps only
+        # the last CONSOLE_MAX_LINES lines (spilled to a temp file without it)
+        self.log_store = self._open_log_store()
+        self._log_mark = self.log_store.mark() if self.log_store else None
+        self.console_buffer = ConsoleBuffer(CONSOLE_MAX_LINES, spill=self.log_store is None)
+        # Per-job metrics for the performance tab (kept next to the log when LOG_TO_DISK is on)
+        self.metrics_history = MetricsHistory(METRICS_FILE if self.log_store else None)
+        # Results of all sessions, searchable from the results tab (None if disabled)
+        self.result_store = self._open_result_store()
+        # Embeddings of transcript fragments for search by meaning (None if disabled)
+        self.semantic_index = self._open_semantic_index()
+        # Audio fingerprints of transcribed recordings, to reuse transcripts of re-uploads (None if disabled)
+        self.fingerprint_index = self._open_fingerprint_index()
         self.config_fields: Dict = {}
         self.current_font_scale = 1.0  # Track font size scaling
         
         # UI Components
         self.queue_list = None
-        self.queue_items: List[Dict[str, object]] = []
+        self.queue_model = QueueModel()
         self.queue_placeholder = None
+        # Recycled row controls bound to the visible slice of queue_model
+        self._queue_rows: List[Dict[str, object]] = []
+        self._queue_row_by_entry: Dict[int, Dict[str, object]] = {}
+        self._queue_first = 0  # queue position bound to the first row
+        self.queue_top_spacer = None
+        self.queue_bottom_spacer = None
         self.progress_bar = None
         self.progress_text = None
         self.console_output = None
-        self.transcription_output = None
+        self.console_text_color = "#111827"
         self.summary_output = None
-        self.file_selector = None
+        self.transcript_list = None
+        self.results_list = None  # virtualized like the queue list
+        self._results_sources: List[str] = []  # sources matching the filter
+        self._results_filter = ""
+        self._stored_hits: List[str] = []  # sources from result_store matching the filter
+        self._stored_snippets: Dict[str, str] = {}  # source -> text around the match
+        self._results_search_seq = 0  # newer searches make older ones stale
+        self._semantic_mode = False  # results filter searches by meaning
+        self._semantic_times: Dict[str, float] = {}  # source -> start of the best matching fragment
+        self._pending_export: Optional[Tuple[str, List[str]]] = None  # format and sources awaiting a path
+        self._export_progress: Tuple[int, int] = (0, 0)  # results written, total (set by the export thread)
+        self._export_cancel: Optional[threading.Event] = None  # set while an export runs
+        self._results_rows: List[Dict[str, object]] = []
+        self._results_first = 0
+        self._selected_result: Optional[str] = None
+        self._transcript_pager: Optional[TranscriptPager] = None
+        self._transcript_page = 0
+        self._transcript_matches: List[int] = []
+        self._transcript_match_index = -1
+        self._transcript_shown_stop = 0  # line index after the last rendered line
+        self._transcript_follow = False  # the last page is shown: follow live segments
+        # Transcripts of running jobs, growing with each decoded segment
+        self._live_segments: Dict[str, SegmentStore] = {}  # source -> segments so far
+        self._live_jobs: Dict[str, str] = {}  # job id -> source
+        self._live_dirty = False  # segments of the shown result arrived
+        self._live_list_dirty = False  # a live transcript was added to the results
+        self.partial_summary_button = None
+        self.performance_cards: Dict[str, Tuple[ft.Text, ft.LineChart]] = {}
+        self.performance_table = None
+        self.performance_summary_text = None
         self.status_bar = None
         self.status_message_text = None
         self.status_icon = None
@@ -283,14 +384,73 @@ class PogadaneApp:
         self.tabs = None
         self.theme_toggle_button = None  # Reference to theme toggle button
 
+        # Settings dialog and provider panels are built on first use and reused
+        self.settings_dialog = None
+        self._transcription_panels: Dict[str, List[ft.Control]] = {}
+        self._summary_panels: Dict[str, List[ft.Control]] = {}
+
         # Queue processing state
         self.total_items = 0
         self.completed_items = 0
         self.error_items = 0
+        self.job_progress: Dict[str, float] = {}  # job id -> fraction done
+        self._job_entries: Dict[str, Tuple[int, int]] = {}  # job id -> (queue entry id, batch position)
         
         # Build UI
         self.build_ui()
     
+    def _open_log_store(self) -> Optional[LogStore]:
+        """Open the rotating on-disk log (None if disabled or not writable)"""
+        if not parse_bool(getattr(self.config_module, "LOG_TO_DISK", DEFAULT_CONFIG["LOG_TO_DISK"])):
+            return None
+        try:
+            max_mb = float(getattr(self.config_module, "LOG_MAX_MB", DEFAULT_CONFIG["LOG_MAX_MB"]))
+            backups = int(getattr(self.config_module, "LOG_BACKUPS", DEFAULT_CONFIG["LOG_BACKUPS"]))
+            store = LogStore(LOG_DIR, max_bytes=int(max_mb * 1024 * 1024), backups=max(backups, 0))
+        except (OSError, ValueError, TypeError) as ex:
+            logger.warning(f"On-disk log disabled: {ex}")
+            return None
+        # Queued records are written when the application exits
+        atexit.register(store.close)
+        return store
+    
+    def _open_result_store(self) -> Optional[ResultStore]:
+        """Open the persistent result database (None if disabled or not writable)"""
+        if not parse_bool(getattr(self.config_module, "RESULT_STORE_ENABLED", DEFAULT_CONFIG["RESULT_STORE_ENABLED"])):
+            return None
+        try:
+            store = ResultStore(RESULTS_DB)
+        except (OSError, sqlite3.Error) as ex:
+            logger.warning(f"Result store disabled: {ex}")
+            return None
+        atexit.register(store.close)
+        return store
+    
+    def _open_semantic_index(self):
+        """Open the semantic search index (None if disabled or NumPy is missing)"""
+        if not parse_bool(getattr(self.config_module, "SEMANTIC_SEARCH_ENABLED", DEFAULT_CONFIG["SEMANTIC_SEARCH_ENABLED"])):
+            return None
+        try:
+            from .semantic_index import SemanticIndex
+            model = getattr(self.config_module, "SEMANTIC_MODEL", DEFAULT_CONFIG["SEMANTIC_MODEL"])
+            return SemanticIndex(SEMANTIC_INDEX_DIR, model)
+        except (ImportError, OSError, ValueError) as ex:
+            logger.warning(f"Semantic search disabled: {ex}")
+            return None
+    
+    def _open_fingerprint_index(self):
+        """Open the audio fingerprint index (None if disabled, NumPy is missing or not writable)"""
+        if not parse_bool(getattr(self.config_module, "AUDIO_DEDUPE_ENABLED", DEFAULT_CONFIG["AUDIO_DEDUPE_ENABLED"])):
+            return None
+        try:
+            from .fingerprint import FingerprintIndex
+            index = FingerprintIndex(FINGERPRINT_DB)
+        except (ImportError, OSError, sqlite3.Error) as ex:
+            logger.warning(f"Audio deduplication disabled: {ex}")
+            return None
+        atexit.register(index.close)
+        return index
+    
     def build_ui(self):
         """Build the complete Material 3 UI"""
         
@@ -452,7 +612,13 @@ class PogadaneApp:
     
     def create_main_content(self):
         """Create main content area with tabs"""
-        # Tabs
+        # Only the queue tab is shown at startup; the other tabs are built
+        # on first selection (see _ensure_tab_built)
+        self._tab_builders = {
+            1: self.create_results_viewer_tab,
+            2: self.create_console_tab,
+            3: self.create_performance_tab,
+        }
         self.tabs = ft.Tabs(
             selected_index=0,
             animation_duration=300,
@@ -465,14 +631,20 @@ class PogadaneApp:
                 ft.Tab(
                     text="Przeglądarka Wyników",
                     icon=ft.Icons.ANALYTICS_ROUNDED,
-                    content=self.create_results_viewer_tab(),
+                    content=ft.Container(expand=True),
                 ),
                 ft.Tab(
                     text="Konsola",
                     icon=ft.Icons.TERMINAL_ROUNDED,
-                    content=self.create_console_tab(),
+                    content=ft.Container(expand=True),
+                ),
+                ft.Tab(
+                    text="Wydajność",
+                    icon=ft.Icons.SPEED_ROUNDED,
+                    content=ft.Container(expand=True),
                 ),
             ],
+            on_change=self._on_tab_change,
             expand=True,
         )
         
@@ -481,6 +653,23 @@ class PogadaneApp:
             expand=True,
         )
     
+    def _ensure_tab_built(self, index: int) -> bool:
+        """Build a lazily created tab
+        
+        Returns:
+            True if the tab was built now (the caller updates self.tabs)
+        """
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return False
+        self.tabs.tabs[index].content = builder()
+        return True
+
+    def _on_tab_change(self, e):
+        """Build the selected tab on first use"""
+        if self._ensure_tab_built(self.tabs.selected_index):
+            self.tabs.update()
+
     def create_queue_tab(self):
         """Create Material 3 queue management tab"""
 
@@ -514,6 +703,18 @@ class PogadaneApp:
                         animation_duration=200,
                     ),
                 ),
+                ft.OutlinedButton(
+                    "Dodaj folder",
+                    icon=ft.Icons.DRIVE_FOLDER_UPLOAD_ROUNDED,
+                    on_click=self.browse_folder,
+                    style=ft.ButtonStyle(
+                        shape=ft.RoundedRectangleBorder(radius=12),
+                        padding=16,
+                        side=ft.BorderSide(1, "#7C3AED"),
+                        color="#7C3AED",
+                        animation_duration=200,
+                    ),
+                ),
                 ft.OutlinedButton(
                     "Dodaj URL",
                     icon=ft.Icons.LINK_ROUNDED,
@@ -526,6 +727,20 @@ class PogadaneApp:
                         animation_duration=200,
                     ),
                 ),
+                ft.OutlinedButton(
+                    "Importuj listę",
+                    icon=ft.Icons.PLAYLIST_ADD_ROUNDED,
+                    tooltip="Plik TXT lub CSV z adresami URL (kolumny: url, start_time, end_time, profile)",
+                    on_click=self.browse_source_list,
+                    style=ft.ButtonStyle(
+                        shape=ft.RoundedRectangleBorder(radius=12),
+                        padding=16,
+                        side=ft.BorderSide(1, "#7C3AED"),
+                        color="#7C3AED",
+                        animation_duration=200,
+                    ),
+                ),
+                self._create_job_profile_dropdown(),
                 ft.Container(expand=True),
                 ft.FilledButton(
                     "Rozpocznij przetwarzanie",
@@ -574,11 +789,16 @@ class PogadaneApp:
             border_radius=12,
         )
 
+        # Spacers stand in for the rows above and below the rendered slice
+        self.queue_top_spacer = ft.Container(height=0)
+        self.queue_bottom_spacer = ft.Container(height=0)
         self.queue_list = ft.ListView(
-            spacing=8,
+            spacing=0,
             expand=True,
             auto_scroll=False,
             controls=[self.queue_placeholder],
+            on_scroll=self._on_queue_scroll,
+            on_scroll_interval=50,
         )
 
         queue_container = ft.Container(
@@ -614,6 +834,28 @@ class PogadaneApp:
             expand=True,
         )
 
+    def _create_job_profile_dropdown(self):
+        """Create the transcription profile selector applied to newly added queue items"""
+        self.job_profile_dropdown = ft.Dropdown(
+            label="Profil transkrypcji",
+            value=getattr(self.config_module, "TRANSCRIPTION_PROFILE", DEFAULT_TRANSCRIPTION_PROFILE),
+            options=[
+                ft.dropdown.Option(name, name.capitalize())
+                for name in TRANSCRIPTION_PROFILES
+            ],
+            tooltip="Profil przypisywany do nowo dodanych elementów kolejki",
+            border_radius=12,
+            dense=True,
+            text_size=13,
+            width=190,
+        )
+        return self.job_profile_dropdown
+
+    def _current_job_profile(self) -> Optional[str]:
+        """Return the profile selected for newly added queue items"""
+        dropdown = getattr(self, "job_profile_dropdown", None)
+        return dropdown.value if dropdown else None
+
     def open_add_url_dialog(self, e):
         """Prompt user for a URL and add it to the processing queue"""
 
@@ -723,74 +965,42 @@ class PogadaneApp:
         if not entries or not self.queue_list:
             return 0
 
-        added = 0
-        existing_values = {item["value"] for item in self.queue_items}
-
-        for entry in entries:
-            normalized = entry.strip()
-            if not normalized or normalized in existing_values:
-                continue
-
-            queue_item = self._create_queue_item(normalized)
-            self.queue_items.append(queue_item)
-            self.queue_list.controls.append(queue_item["container"])
-            existing_values.add(normalized)
-            added += 1
-
-        if added == 0:
+        added = self.queue_model.add_many(entries, profile=self._current_job_profile())
+        if not added:
             return 0
 
-        if self.queue_placeholder and self.queue_placeholder in self.queue_list.controls:
-            self.queue_list.controls.remove(self.queue_placeholder)
-
-        self.queue_list.update()
+        self._render_queue()
         self.update_queue_count()
 
-        return added
+        return len(added)
 
     def add_queue_entries_with_metadata(self, entries: List[dict]) -> int:
         """Add new items to the processing queue with metadata (time ranges)
         
         Args:
-            entries: List of dicts with keys: url, start_time, end_time
+            entries: List of dicts with keys: url, start_time, end_time, profile, size, mtime (optional)
         """
         if not entries or not self.queue_list:
             return 0
 
         added = 0
-        existing_values = {item["value"] for item in self.queue_items}
-
+        default_profile = self._current_job_profile()
         for entry_data in entries:
-            url = entry_data.get("url", "").strip()
-            if not url or url in existing_values:
-                continue
-
-            start_time = entry_data.get("start_time")
-            end_time = entry_data.get("end_time")
-            
-            # Create display text with time range info
-            display_text = url
-            if start_time or end_time:
-                time_info = f" [{start_time or '0:00'} - {end_time or 'koniec'}]"
-                display_text = url + time_info
-
-            queue_item = self._create_queue_item(url, display_text=display_text)
-            # Store time range metadata
-            queue_item["start_time"] = start_time
-            queue_item["end_time"] = end_time
-            
-            self.queue_items.append(queue_item)
-            self.queue_list.controls.append(queue_item["container"])
-            existing_values.add(url)
-            added += 1
+            entry = self.queue_model.add(
+                entry_data.get("url", ""),
+                start_time=entry_data.get("start_time"),
+                end_time=entry_data.get("end_time"),
+                profile=entry_data.get("profile") or default_profile,
+                size=entry_data.get("size"),
+                mtime=entry_data.get("mtime"),
+            )
+            if entry is not None:
+                added += 1
 
         if added == 0:
             return 0
 
-        if self.queue_placeholder and self.queue_placeholder in self.queue_list.controls:
-            self.queue_list.controls.remove(self.queue_placeholder)
-
-        self.queue_list.update()
+        self._render_queue()
         self.update_queue_count()
 
         return added
@@ -798,44 +1008,73 @@ class PogadaneApp:
     def remove_queue_item(self, entry_value: str):
         """Remove a queue entry by its value"""
 
-        target = None
-        for item in self.queue_items:
-            if item["value"] == entry_value:
-                target = item
-                break
-
-        if not target:
+        if self.queue_model.remove(entry_value) is None:
             return
 
-        if target["container"] in self.queue_list.controls:
-            self.queue_list.controls.remove(target["container"])
-
-        self.queue_items.remove(target)
-
-        if not self.queue_items and self.queue_placeholder:
-            self.queue_list.controls.append(self.queue_placeholder)
-
-        self.queue_list.update()
+        self._render_queue()
         self.update_queue_count()
 
     def update_queue_count(self):
         """Update queue counter in status bar"""
 
         if self.file_count_text:
-            self.file_count_text.value = f"Kolejka: {len(self.queue_items)}"
+            self.file_count_text.value = f"Kolejka: {len(self.queue_model)}"
             self.file_count_text.update()
 
-    def _create_queue_item(self, entry: str, display_text: str = None) -> Dict[str, object]:
-        """Create UI representation for a queue entry
+    def _render_queue(self, update: bool = True):
+        """Bind the recycled rows to the visible slice of the queue model
         
-        Args:
-            entry: The actual value (URL or file path)
-            display_text: Optional display text (e.g., with time range info)
+        Only QUEUE_POOL_ROWS row controls exist; the spacers keep the scroll
+        extent of the full queue. Flet sends only properties that changed.
         """
+        if not self.queue_list:
+            return
+
+        total = len(self.queue_model)
+        if total == 0:
+            self._queue_first = 0
+            self._queue_row_by_entry = {}
+            self.queue_list.controls = [self.queue_placeholder] if self.queue_placeholder else []
+        else:
+            first = min(self._queue_first, max(total - QUEUE_POOL_ROWS, 0))
+            self._queue_first = first
+            entries = self.queue_model.slice(first, first + QUEUE_POOL_ROWS)
+
+            # Row controls are built lazily, only as many as are ever shown
+            while len(self._queue_rows) < len(entries):
+                self._queue_rows.append(self._create_queue_row())
+
+            rows = self._queue_rows[:len(entries)]
+            self._queue_row_by_entry = {}
+            for row, entry in zip(rows, entries):
+                self._bind_queue_row(row, entry)
+
+            self.queue_top_spacer.height = first * QUEUE_ROW_HEIGHT
+            self.queue_bottom_spacer.height = (total - first - len(entries)) * QUEUE_ROW_HEIGHT
+            self.queue_list.controls = [
+                self.queue_top_spacer,
+                *(row["container"] for row in rows),
+                self.queue_bottom_spacer,
+            ]
+
+        if update:
+            self.queue_list.update()
+
+    def _on_queue_scroll(self, e: ft.OnScrollEvent):
+        """Rebind the rows when the viewport leaves the rendered slice"""
+
+        visible_first = int(e.pixels // QUEUE_ROW_HEIGHT)
+        visible_last = int((e.pixels + e.viewport_dimension) // QUEUE_ROW_HEIGHT)
+        if self._queue_first <= visible_first and visible_last < self._queue_first + QUEUE_POOL_ROWS:
+            return
+
+        self._queue_first = max(visible_first - QUEUE_OVERSCAN_ROWS, 0)
+        self._render_queue()
 
-        is_url = entry.lower().startswith("http")
-        icon_name = ft.Icons.LINK_ROUNDED if is_url else ft.Icons.AUDIO_FILE_ROUNDED
-        display_name = (display_text or entry) if is_url else os.path.basename(entry) or entry
+    def _create_queue_row(self) -> Dict[str, object]:
+        """Create the controls of one recycled queue row"""
+
+        row: Dict[str, object] = {"entry_id": None}
 
         status_text = ft.Text("Oczekuje", size=12, weight=ft.FontWeight.W_600, color=self.get_theme_color("#6B7280", "#D1D5DB"))
         
@@ -866,21 +1105,25 @@ class PogadaneApp:
             icon=ft.Icons.CLOSE_ROUNDED,
             tooltip="Usuń z kolejki",
             icon_size=18,
-            on_click=lambda _, value=entry: self.remove_queue_item(value),
+            on_click=lambda _, row=row: self._on_queue_row_remove(row),
             style=ft.ButtonStyle(
                 shape=ft.RoundedRectangleBorder(radius=self.design_tokens["radius"]["full"]),
                 padding=8,
             ),
         )
 
+        icon = ft.Icon(ft.Icons.AUDIO_FILE_ROUNDED, size=22, color="#2563EB")
+        name_text = ft.Text("", size=14, weight=ft.FontWeight.W_600, max_lines=1, overflow=ft.TextOverflow.ELLIPSIS)
+        path_text = ft.Text(
+            "", size=12, color=self.get_theme_color("#6B7280", "#D1D5DB"),
+            max_lines=1, overflow=ft.TextOverflow.ELLIPSIS,
+        )
+
         content = ft.Row(
             [
-                ft.Icon(icon_name, size=22, color="#2563EB" if not is_url else "#7C3AED"),
+                icon,
                 ft.Column(
-                    [
-                        ft.Text(display_name, size=14, weight=ft.FontWeight.W_600),
-                        ft.Text(entry, size=12, color=self.get_theme_color("#6B7280", "#D1D5DB")),
-                    ],
+                    [name_text, path_text],
                     spacing=4,
                     expand=True,
                 ),
@@ -891,95 +1134,129 @@ class PogadaneApp:
             vertical_alignment=ft.CrossAxisAlignment.CENTER,
         )
 
+        # Fixed height so that row positions follow from queue positions
         container = ft.Container(
             content=content,
+            height=QUEUE_ROW_HEIGHT - 8,
+            margin=ft.margin.only(bottom=8),
             border_radius=12,
             padding=16,
             border=ft.border.all(1, "#E5E7EB"),
             bgcolor="#FFFFFF" if self.page.theme_mode == ft.ThemeMode.LIGHT else "#111827",
         )
 
-        return {
-            "value": entry,
-            "status": FILE_STATUS_PENDING,
+        row.update({
+            "container": container,
+            "icon": icon,
+            "name_text": name_text,
+            "path_text": path_text,
             "status_text": status_text,
             "status_chip": status_chip,
             "status_spinner": status_spinner,
-            "container": container,
-            "icon": icon_name,
-            "display_name": display_name,
-        }
+        })
+        return row
 
-    def _set_queue_item_status(self, index: int, status: str):
-        """Update visual status for a queue entry with animated spinner"""
+    def _bind_queue_row(self, row: Dict[str, object], entry: QueueEntry):
+        """Show a queue entry in a recycled row (no UI update)"""
 
-        if index < 0 or index >= len(self.queue_items):
-            return
+        is_light = self.page.theme_mode == ft.ThemeMode.LIGHT
+        row["entry_id"] = entry.id
+        self._queue_row_by_entry[entry.id] = row
 
-        item = self.queue_items[index]
-        status_text: ft.Text = item["status_text"]
-        status_chip: ft.Container = item["status_chip"]
-        status_spinner: ft.ProgressRing = item.get("status_spinner")
-        container: ft.Container = item["container"]
+        icon: ft.Icon = row["icon"]
+        icon.name = ft.Icons.LINK_ROUNDED if entry.is_url else ft.Icons.AUDIO_FILE_ROUNDED
+        icon.color = "#7C3AED" if entry.is_url else "#2563EB"
+        row["name_text"].value = entry.display_name
+        row["path_text"].value = entry.value if entry.size is None else f"{entry.value}  ·  {entry.size / 1024 ** 2:.1f} MB"
+        row["path_text"].color = self.get_theme_color("#6B7280", "#D1D5DB")
+
+        # Material 3 Expressive Dark Mode colors: Surface, Outline
+        container: ft.Container = row["container"]
+        container.bgcolor = "#FFFFFF" if is_light else "#374151"
+        container.border = ft.border.all(1, "#E5E7EB" if is_light else "#6B7280")
+        self._style_queue_row(row, entry.status)
+
+    def _style_queue_row(self, row: Dict[str, object], status: str):
+        """Apply the status look to a queue row (no UI update)"""
+
+        status_text: ft.Text = row["status_text"]
+        status_chip: ft.Container = row["status_chip"]
+        status_spinner: ft.ProgressRing = row["status_spinner"]
+        container: ft.Container = row["container"]
 
         if status == FILE_STATUS_PROCESSING:
             status_text.value = "Przetwarzanie"
             status_text.color = "#2563EB"
             status_chip.bgcolor = "#DBEAFE"
-            if status_spinner:
-                status_spinner.visible = True
+            status_spinner.visible = True
             # Remove click handler during processing
             container.on_click = None
             container.ink = False
+            container.tooltip = None
         elif status == FILE_STATUS_COMPLETED:
             status_text.value = "Zakończono → Zobacz wyniki"
             status_text.color = "#047857"
             status_chip.bgcolor = "#D1FAE5"
-            if status_spinner:
-                status_spinner.visible = False
+            status_spinner.visible = False
             # Add click handler for completed items
-            source_value = item["value"]
-            container.on_click = lambda _, src=source_value: self.view_result_from_queue(src)
+            container.on_click = lambda _, row=row: self._on_queue_row_click(row)
             container.ink = True
             container.tooltip = "Kliknij aby zobaczyć wyniki"
         elif status == FILE_STATUS_ERROR:
             status_text.value = "Błąd"
             status_text.color = "#991B1B"
             status_chip.bgcolor = "#FEE2E2"
-            if status_spinner:
-                status_spinner.visible = False
+            status_spinner.visible = False
             # Remove click handler on error
             container.on_click = None
             container.ink = False
+            container.tooltip = None
         else:
             status_text.value = "Oczekuje"
             status_text.color = self.get_theme_color("#6B7280", "#D1D5DB")
             status_chip.bgcolor = "#E5E7EB"
-            if status_spinner:
-                status_spinner.visible = False
+            status_spinner.visible = False
             # Remove click handler while pending
             container.on_click = None
             container.ink = False
+            container.tooltip = None
+
+    def _on_queue_row_click(self, row: Dict[str, object]):
+        """Open the result of the entry currently shown in a row (or its transcript while it is decoded)"""
+
+        entry = self.queue_model.get(row["entry_id"])
+        if entry is not None and (entry.status == FILE_STATUS_COMPLETED or entry.value in self._live_segments):
+            self.view_result_from_queue(entry.value)
+
+    def _on_queue_row_remove(self, row: Dict[str, object]):
+        """Remove the entry currently shown in a row"""
+
+        entry = self.queue_model.get(row["entry_id"])
+        if entry is not None:
+            self.remove_queue_item(entry.value)
+
+    def _set_queue_entry_status(self, entry_id: int, status: str):
+        """Update the status of a queue entry; only its row is re-sent, if rendered"""
 
-        item["status"] = status
-        status_chip.update()
-        status_text.update()
-        if status_spinner:
-            status_spinner.update()
-        container.update()
+        if not self.queue_model.set_status(entry_id, status):
+            return
+
+        row = self._queue_row_by_entry.get(entry_id)
+        if row is None or row["entry_id"] != entry_id:
+            return
+
+        self._style_queue_row(row, status)
+        row["container"].update()
 
     def view_result_from_queue(self, source: str):
         """Navigate to results tab and display the selected file"""
         # Switch to Results tab (index 1)
+        self._ensure_tab_built(1)
         self.tabs.selected_index = 1
         self.tabs.update()
         
-        # Select the file in the dropdown
-        self.file_selector.value = source
-        self.file_selector.update()
-        
         # Display the results
-        self.display_selected_result(None)
+        self.show_result(source)
         
         # Show success message
         self.show_snackbar(f"📄 Wyświetlanie: {os.path.basename(source)}", success=True)
@@ -988,7 +1265,9 @@ class PogadaneApp:
         """Update global progress bar and text"""
 
         if self.progress_bar:
-            progress_value = (processed / self.total_items) if self.total_items else 0
+            # Running jobs contribute their partial progress
+            done = sum(self.job_progress.values()) if self.job_progress else processed
+            progress_value = (done / self.total_items) if self.total_items else 0
             self.progress_bar.value = min(max(progress_value, 0), 1)
             self.progress_bar.update()
 
@@ -1007,8 +1286,6 @@ class PogadaneApp:
 
         is_light = self.page.theme_mode == ft.ThemeMode.LIGHT
         # Material 3 Expressive Dark Mode colors
-        queue_card_bg = "#FFFFFF" if is_light else "#374151"  # Surface
-        queue_border_color = "#E5E7EB" if is_light else "#6B7280"  # Outline
         queue_placeholder_bg = "#F9FAFB" if is_light else "#374151"  # Surface
 
         # Only update if element is already added to page
@@ -1016,13 +1293,11 @@ class PogadaneApp:
             self.queue_placeholder.bgcolor = queue_placeholder_bg
             self.queue_placeholder.update()
 
-        for item in self.queue_items:
-            container: ft.Container = item["container"]
-            # Only update if element is already added to page
-            if hasattr(container, 'page') and container.page:
-                container.bgcolor = queue_card_bg
-                container.border = ft.border.all(1, queue_border_color)
-                container.update()
+        # Only the rendered rows exist; rebinding restyles them
+        if len(self.queue_model) and self.queue_list and self.queue_list.page:
+            self._render_queue()
+        if self.results_list and self.results_list.page:
+            self._render_results_list()
     
     def get_theme_color(self, light_color: str, dark_color: str = None) -> str:
         """
@@ -1123,20 +1398,21 @@ class PogadaneApp:
             padding=ft.padding.only(bottom=16),
         )
         
-        # Console output with monospace font and better styling
-        self.console_output = ft.TextField(
-            value="",
-            multiline=True,
-            read_only=True,
-            border_radius=16,
-            filled=True,
-            text_size=11,
-            min_lines=25,
+        # Console output: virtualized list of the lines held in the ring buffer
+        self.console_text_color = "#E5E7EB" if self.page.theme_mode == ft.ThemeMode.DARK else "#111827"
+        self.console_output = ft.ListView(
+            controls=[self._console_line(line) for line in self.console_buffer.lines()],
+            spacing=0,
+            auto_scroll=True,
             expand=True,
+        )
+        console_panel = ft.Container(
+            content=self.console_output,
+            border_radius=16,
+            padding=ft.padding.symmetric(horizontal=14, vertical=10),
             bgcolor="#1F2937" if self.page.theme_mode == ft.ThemeMode.DARK else "#F9FAFB",
-            color="#E5E7EB" if self.page.theme_mode == ft.ThemeMode.DARK else "#111827",
-            border_color="#374151",
-            cursor_color="#2563EB",
+            border=ft.border.all(1, "#374151"),
+            expand=True,
         )
         
         # Action buttons
@@ -1182,7 +1458,123 @@ class PogadaneApp:
             content=ft.Column(
                 [
                     console_header,
-                    self.console_output,
+                    console_panel,
+                    ft.Container(height=16),
+                    buttons,
+                ],
+                spacing=0,
+                expand=True,
+            ),
+            padding=24,
+            expand=True,
+        )
+    
+    def create_performance_tab(self):
+        """Create the performance tab with per-job metrics from the backend
+        
+        Summary cards with sparklines of recent jobs, a table of the last
+        jobs and a CSV export. The history file is read in a worker thread
+        after the tab is shown; new jobs arrive as METRICS events.
+        """
+        performance_header = ft.Container(
+            content=ft.Row(
+                [
+                    ft.Icon(ft.Icons.SPEED_ROUNDED, size=24, color="#2563EB"),
+                    ft.Column(
+                        [
+                            ft.Text("Wydajność Przetwarzania", size=18, weight=ft.FontWeight.BOLD),
+                            ft.Text("Czasy etapów, szybkość transkrypcji i modelu językowego, pamięć i cache dla każdego zadania",
+                                    size=13, color=self.muted_text_color),
+                        ],
+                        spacing=2,
+                        expand=True,
+                    ),
+                ],
+                spacing=12,
+            ),
+            padding=ft.padding.only(bottom=16),
+        )
+
+        # Summary cards: average (maximum for memory) over the history and a sparkline of recent jobs
+        self.performance_cards = {}
+        cards = []
+        for name, title, _, color in PERFORMANCE_METRICS:
+            value_text = ft.Text("—", size=20, weight=ft.FontWeight.BOLD)
+            sparkline = ft.LineChart(
+                data_series=[ft.LineChartData(data_points=[], color=color, stroke_width=2, curved=True)],
+                left_axis=ft.ChartAxis(show_labels=False, labels_size=0),
+                bottom_axis=ft.ChartAxis(show_labels=False, labels_size=0),
+                interactive=False,
+                height=36,
+            )
+            self.performance_cards[name] = (value_text, sparkline)
+            cards.append(ft.Container(
+                content=ft.Column(
+                    [
+                        ft.Text(title, size=12, color=self.muted_text_color),
+                        value_text,
+                        sparkline,
+                    ],
+                    spacing=4,
+                ),
+                width=200,
+                padding=12,
+                border_radius=16,
+                border=ft.border.all(1, ft.Colors.OUTLINE_VARIANT),
+            ))
+
+        self.performance_summary_text = ft.Text("Brak zakończonych zadań", size=12, color=self.muted_text_color)
+        self.performance_table = ft.DataTable(
+            columns=[
+                ft.DataColumn(ft.Text("Plik")),
+                ft.DataColumn(ft.Text("Status")),
+                ft.DataColumn(ft.Text("Czas"), numeric=True),
+                ft.DataColumn(ft.Text("Transkrypcja"), numeric=True),
+                ft.DataColumn(ft.Text("Podsumowanie"), numeric=True),
+                ft.DataColumn(ft.Text("RTF"), numeric=True),
+                ft.DataColumn(ft.Text("tok/s"), numeric=True),
+                ft.DataColumn(ft.Text("Kolejka"), numeric=True),
+                ft.DataColumn(ft.Text("RSS"), numeric=True),
+            ],
+            rows=[],
+            column_spacing=20,
+            data_row_min_height=32,
+            data_row_max_height=40,
+        )
+
+        buttons = ft.Row(
+            [
+                ft.FilledButton(
+                    "Eksportuj CSV",
+                    icon=ft.Icons.TABLE_VIEW_ROUNDED,
+                    on_click=self.export_metrics_csv,
+                    style=ft.ButtonStyle(
+                        shape=ft.RoundedRectangleBorder(radius=12),
+                        padding=ft.padding.symmetric(horizontal=20, vertical=12),
+                        bgcolor="#2563EB",
+                        color="#FFFFFF",
+                    ),
+                ),
+                ft.Container(expand=True),
+                self.performance_summary_text,
+            ],
+            spacing=12,
+        )
+
+        self._refresh_performance_tab(update=False)
+        # Jobs of earlier sessions are read from the history file in the background
+        self.page.run_task(self._load_metrics_history)
+
+        return ft.Container(
+            content=ft.Column(
+                [
+                    performance_header,
+                    ft.Row(cards, wrap=True, spacing=12, run_spacing=12),
+                    ft.Container(height=16),
+                    ft.Container(
+                        content=ft.Column([self.performance_table], scroll=ft.ScrollMode.AUTO, expand=True),
+                        expand=True,
+                    ),
                     ft.Container(height=16),
                     buttons,
                 ],
@@ -1192,9 +1584,210 @@ class PogadaneApp:
             padding=24,
             expand=True,
         )
+
+    async def _load_metrics_history(self):
+        """Read the metrics history file in a worker thread and show it"""
+        try:
+            await asyncio.to_thread(self.metrics_history.load)
+        except Exception as ex:
+            logger.warning(f"Cannot load metrics history: {ex}")
+            return
+        self._refresh_performance_tab()
+
+    def _format_metric(self, kind: str, value) -> str:
+        """Format a metric value for the performance tab ("—" without a value)"""
+        if value is None:
+            return "—"
+        if kind == "rtf":
+            return f"{value:.2f}×"
+        if kind == "rate":
+            return f"{value:.1f}"
+        if kind == "seconds":
+            return f"{value:.1f} s" if value < 120 else f"{value / 60:.1f} min"
+        if kind == "bytes":
+            return f"{value / (1024 * 1024):.0f} MB"
+        if kind == "percent":
+            return f"{value:.0%}"
+        return str(value)
+
+    def _refresh_performance_tab(self, update: bool = True):
+        """Show the metrics history on the performance tab (if it was built)"""
+        if not self.performance_table:
+            return
+        summary = self.metrics_history.summary()
+        for name, _, kind, _ in PERFORMANCE_METRICS:
+            value_text, sparkline = self.performance_cards[name]
+            value_text.value = self._format_metric(kind, summary.get(name))
+            values = self.metrics_history.series(name, last=METRICS_SPARKLINE_POINTS)
+            sparkline.data_series[0].data_points = [
+                ft.LineChartDataPoint(x, y) for x, y in enumerate(values)
+            ]
+
+        # Newest jobs first
+        self.performance_table.rows = [
+            self._performance_row(job)
+            for job in reversed(self.metrics_history.jobs(last=METRICS_TABLE_JOBS))
+        ]
+        if summary["jobs"]:
+            self.performance_summary_text.value = (
+                f"Zadań: {summary['jobs']}, błędów: {summary['errors']}"
+            )
+        if update and self.performance_table.page:
+            self.tabs.tabs[3].content.update()
+
+    def _performance_row(self, job: JobMetrics) -> ft.DataRow:
+        """Create the table row of one job"""
+        def cell(text: str) -> ft.DataCell:
+            return ft.DataCell(ft.Text(text, size=12))
+
+        completed = job.status == "completed"
+        return ft.DataRow(cells=[
+            ft.DataCell(ft.Text(os.path.basename(job.source) or job.source, size=12,
+                                max_lines=1, overflow=ft.TextOverflow.ELLIPSIS, width=220,
+                                tooltip=job.source)),
+            cell(FILE_STATUS_COMPLETED if completed else FILE_STATUS_ERROR),
+            cell(self._format_metric("seconds", job.total_seconds)),
+            cell(self._format_metric("seconds", job.stage_seconds.get("transcribing"))),
+            cell(self._format_metric("seconds", job.stage_seconds.get("summarizing"))),
+            cell(self._format_metric("rtf", job.real_time_factor)),
+            cell(self._format_metric("rate", job.generation_tokens_per_second)),
+            cell(self._format_metric("seconds", job.queue_wait_seconds)),
+            cell(self._format_metric("bytes", job.peak_rss_bytes)),
+        ])
+
+    def export_metrics_csv(self, e):
+        """Export the metrics history to a CSV file"""
+        if not len(self.metrics_history):
+            self.show_snackbar("ℹ️ Brak metryk do eksportu", warning=True)
+            return
+        file_picker = ft.FilePicker(on_result=self.on_export_metrics)
+        self.page.overlay.append(file_picker)
+        self.page.update()
+
+        file_picker.save_file(
+            dialog_title="Eksportuj metryki",
+            file_name="pogadane_metryki.csv",
+            allowed_extensions=["csv"],
+        )
+
+    async def on_export_metrics(self, e: ft.FilePickerResultEvent):
+        """Write the metrics CSV in a worker thread"""
+        if not e.path:
+            return
+        try:
+            count = await asyncio.to_thread(self.metrics_history.to_csv, Path(e.path))
+            self.show_snackbar(f"💾 Wyeksportowano metryki {count} zadań: {e.path}", success=True)
+        except Exception as ex:
+            self.show_snackbar(f"❌ Błąd eksportu: {str(ex)}", error=True)
     
+    def export_results(self, fmt: str):
+        """Ask where to export the results listed in the results tab (all formats stream in the background)"""
+        if self._export_cancel is not None:
+            self.show_snackbar("ℹ️ Eksport już trwa", warning=True)
+            return
+        sources = list(self._results_sources)
+        if not sources:
+            self.show_snackbar("ℹ️ Brak wyników do eksportu", warning=True)
+            return
+        self._pending_export = (fmt, sources)
+        file_picker = ft.FilePicker(on_result=self.on_export_results)
+        self.page.overlay.append(file_picker)
+        self.page.update()
+
+        label, extension = EXPORT_FORMATS[fmt]
+        if fmt in SUBTITLE_FORMATS:
+            # One subtitle file per recording
+            file_picker.get_directory_path(dialog_title=f"Folder na napisy - {label}")
+        else:
+            file_picker.save_file(
+                dialog_title=f"Eksportuj wyniki - {label}",
+                file_name=f"pogadane_wyniki{extension}",
+                allowed_extensions=[extension.lstrip(".")],
+            )
+
+    async def on_export_results(self, e: ft.FilePickerResultEvent):
+        """Write the export in a worker thread and show its progress"""
+        pending, self._pending_export = self._pending_export, None
+        if pending is None or not e.path:
+            return
+        fmt, sources = pending
+        total = len(sources)
+        self._export_cancel = threading.Event()
+        self._export_progress = (0, total)
+        self._show_export_progress(True)
+        export = asyncio.ensure_future(asyncio.to_thread(
+            export_results,
+            self._export_items(sources),
+            fmt,
+            Path(e.path),
+            total=total,
+            progress=lambda done, total: setattr(self, "_export_progress", (done, total)),
+            cancel=self._export_cancel,
+        ))
+        try:
+            while not export.done():
+                await asyncio.wait({export}, timeout=0.2)
+                done, total = self._export_progress
+                self.export_progress_bar.value = done / total if total else None
+                self.export_status_text.value = f"Eksport: {done} / {total}"
+                if self.export_progress_bar.page:
+                    self.export_progress_bar.update()
+                    self.export_status_text.update()
+            stats = export.result()
+        except Exception as ex:
+            logger.error(f"Export failed: {ex}", exc_info=True)
+            self.show_snackbar(f"❌ Błąd eksportu: {str(ex)}", error=True)
+            return
+        finally:
+            self._export_cancel = None
+            self._show_export_progress(False)
+
+        message = f"💾 Wyeksportowano {stats.exported} wyników: {e.path}"
+        if stats.skipped:
+            message += f" (pominięto {stats.skipped} bez znaczników czasu)"
+        if stats.cancelled:
+            message = f"⏹️ Eksport przerwany po {stats.exported} wynikach: {e.path}"
+        self.show_snackbar(message, warning=stats.cancelled, success=not stats.cancelled)
+
+    def _export_items(self, sources: List[str]):
+        """Load the exported results one at a time (session results, then the result store)"""
+        for source in sources:
+            if self.results_manager.has_result(source):
+                yield from self.results_manager.iter_results([source])
+            elif self.result_store is not None:
+                stored = self.result_store.get(source)
+                if stored:
+                    yield source, stored["transcription"], stored["summary"]
+
+    def _show_export_progress(self, visible: bool):
+        """Show or hide the export progress in the results header"""
+        for control in (self.export_status_text, self.export_progress_bar, self.export_cancel_button):
+            control.visible = visible
+            if control.page:
+                control.update()
+
+    def _cancel_export(self, e):
+        """Stop the running export after the current result"""
+        if self._export_cancel is not None:
+            self._export_cancel.set()
+
     def create_results_viewer_tab(self):
-        """Create modern results viewer with card-based layout"""
+        """Create modern results viewer with card-based layout
+        
+        The list of results is filtered by name and virtualized like the
+        queue; the transcript is shown one page of lines at a time.
+        """
+
+        # Bulk export progress (shown while an export runs in the background)
+        self.export_status_text = ft.Text("", size=12, color=self.muted_text_color, visible=False)
+        self.export_progress_bar = ft.ProgressBar(width=160, value=0, color="#34D399", visible=False)
+        self.export_cancel_button = ft.IconButton(
+            icon=ft.Icons.CLOSE_ROUNDED,
+            tooltip="Przerwij eksport",
+            icon_size=18,
+            on_click=self._cancel_export,
+            visible=False,
+        )
 
         # Header
         results_header = ft.Container(
@@ -1209,22 +1802,61 @@ class PogadaneApp:
                         spacing=2,
                         expand=True,
                     ),
+                    self.export_status_text,
+                    self.export_progress_bar,
+                    self.export_cancel_button,
+                    ft.PopupMenuButton(
+                        icon=ft.Icons.DOWNLOAD_ROUNDED,
+                        tooltip="Eksportuj wyniki z listy",
+                        items=[
+                            ft.PopupMenuItem(text=label, on_click=lambda _, fmt=fmt: self.export_results(fmt))
+                            for fmt, (label, _extension) in EXPORT_FORMATS.items()
+                        ],
+                    ),
                 ],
                 spacing=12,
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
             ),
             padding=ft.padding.only(bottom=20),
         )
 
-        # File selector with search
-        self.file_selector = ft.Dropdown(
-            label="📁 Wybierz przetworzony plik",
-            hint_text="Wybierz z listy aby zobaczyć wyniki...",
-            on_change=self.display_selected_result,
+        # Filterable results list (results processed before the tab was built are listed too)
+        self.results_filter_field = ft.TextField(
+            label="🔍 Szukaj w wynikach",
+            hint_text=self._results_filter_hint(),
+            on_change=self._on_results_filter_change,
             border_radius=12,
             filled=True,
-            border_color="#2563EB",
-            focused_border_color="#2563EB",
-            width=400,
+            dense=True,
+        )
+        self.semantic_search_switch = ft.Switch(
+            label="Szukaj po znaczeniu",
+            value=False,
+            on_change=self._on_semantic_search_toggle,
+            visible=self.semantic_index is not None,
+            tooltip="Znajdź fragmenty rozmów o podanym temacie, także gdy padły inne słowa",
+        )
+        self.results_count_text = ft.Text("", size=12, color=self.muted_text_color)
+        self.results_top_spacer = ft.Container(height=0)
+        self.results_bottom_spacer = ft.Container(height=0)
+        self.results_list = ft.ListView(
+            spacing=0,
+            expand=True,
+            on_scroll=self._on_results_scroll,
+            on_scroll_interval=50,
+        )
+        results_sidebar = ft.Container(
+            content=ft.Column(
+                [
+                    self.results_filter_field,
+                    self.semantic_search_switch,
+                    self.results_count_text,
+                    self.results_list,
+                ],
+                spacing=8,
+                expand=True,
+            ),
+            width=320,
         )
 
         # Empty state
@@ -1265,6 +1897,39 @@ class PogadaneApp:
             expand=True,
         )
 
+        # Transcript viewer: search, jump to time and page navigation
+        self.transcript_search_field = ft.TextField(
+            hint_text="Szukaj w transkrypcji...",
+            prefix_icon=ft.Icons.SEARCH_ROUNDED,
+            on_submit=self._on_transcript_search,
+            dense=True,
+            border_radius=8,
+            expand=True,
+        )
+        self.transcript_match_text = ft.Text("", size=12, color=self.muted_text_color)
+        self.transcript_jump_field = ft.TextField(
+            hint_text="Idź do (mm:ss)",
+            prefix_icon=ft.Icons.SCHEDULE_ROUNDED,
+            on_submit=self._on_transcript_jump,
+            dense=True,
+            border_radius=8,
+            width=150,
+        )
+        self.transcript_page_text = ft.Text("", size=12, color=self.muted_text_color)
+        self.transcript_prev_button = ft.IconButton(
+            icon=ft.Icons.CHEVRON_LEFT_ROUNDED,
+            tooltip="Poprzednia strona",
+            icon_size=18,
+            on_click=lambda _: self._show_transcript_page(self._transcript_page - 1),
+        )
+        self.transcript_next_button = ft.IconButton(
+            icon=ft.Icons.CHEVRON_RIGHT_ROUNDED,
+            tooltip="Następna strona",
+            icon_size=18,
+            on_click=lambda _: self._show_transcript_page(self._transcript_page + 1),
+        )
+        self.transcript_list = ft.ListView(spacing=2, expand=True)
+
         # Transcription card
         self.transcription_card = ft.Container(
             content=ft.Column(
@@ -1278,26 +1943,48 @@ class PogadaneApp:
                                 icon=ft.Icons.COPY_ROUNDED,
                                 tooltip="Kopiuj do schowka",
                                 icon_size=18,
-                                on_click=lambda _: self.copy_to_clipboard(self.transcription_output.value, "Transkrypcję"),
+                                on_click=lambda _: self.copy_to_clipboard(
+                                    self.results_manager.get_transcription(self._selected_result or ""), "Transkrypcję"
+                                ),
                             ),
                         ],
                         vertical_alignment=ft.CrossAxisAlignment.CENTER,
                     ),
-                    ft.Divider(height=1, color="#E5E7EB"),
-                    ft.Container(
-                        content=ft.TextField(
-                            value="",
-                            multiline=True,
-                            read_only=True,
-                            border=ft.InputBorder.NONE,
-                            text_size=13,
-                            min_lines=15,
-                            expand=True,
-                        ),
-                        expand=True,
+                    ft.Row(
+                        [
+                            self.transcript_search_field,
+                            ft.IconButton(
+                                icon=ft.Icons.KEYBOARD_ARROW_UP_ROUNDED,
+                                tooltip="Poprzednie wystąpienie",
+                                icon_size=18,
+                                on_click=lambda _: self._step_transcript_match(-1),
+                            ),
+                            ft.IconButton(
+                                icon=ft.Icons.KEYBOARD_ARROW_DOWN_ROUNDED,
+                                tooltip="Następne wystąpienie",
+                                icon_size=18,
+                                on_click=lambda _: self._step_transcript_match(1),
+                            ),
+                            self.transcript_match_text,
+                            self.transcript_jump_field,
+                        ],
+                        spacing=4,
+                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
                     ),
-                ],
+                    ft.Divider(height=1, color="#E5E7EB"),
+                    self.transcript_list,
+                    ft.Row(
+                        [
+                            self.transcript_prev_button,
+                            self.transcript_page_text,
+                            self.transcript_next_button,
+                        ],
+                        alignment=ft.MainAxisAlignment.CENTER,
+                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                    ),
+                ],
                 spacing=12,
+                expand=True,
             ),
             border=ft.border.all(1, "#E5E7EB"),
             border_radius=16,
@@ -1306,9 +1993,20 @@ class PogadaneApp:
             expand=True,
             visible=False,
         )
-        self.transcription_output = self.transcription_card.content.controls[2].content
 
-        # Summary card
+        # Summary card; a partial summary can be made while a transcript is still decoded
+        self.partial_summary_button = ft.TextButton(
+            "Podsumuj dotychczasowy tekst",
+            icon=ft.Icons.SUMMARIZE_ROUNDED,
+            on_click=self.summarize_partial,
+            visible=False,
+        )
+        self.summary_output = ft.Markdown(
+            value="",
+            selectable=True,
+            extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
+            on_tap_link=lambda e: self.page.launch_url(e.data),
+        )
         self.summary_card = ft.Container(
             content=ft.Column(
                 [
@@ -1317,27 +2015,24 @@ class PogadaneApp:
                             ft.Icon(ft.Icons.AUTO_AWESOME_ROUNDED, size=20, color="#34D399"),
                             ft.Text("Podsumowanie AI", size=16, weight=ft.FontWeight.BOLD),
                             ft.Container(expand=True),
+                            self.partial_summary_button,
                             ft.IconButton(
                                 icon=ft.Icons.COPY_ROUNDED,
                                 tooltip="Kopiuj do schowka",
                                 icon_size=18,
-                                on_click=lambda _: self.copy_to_clipboard(self.summary_output.value if hasattr(self.summary_output, 'value') else "", "Podsumowanie"),
+                                on_click=lambda _: self.copy_to_clipboard(self.summary_output.value, "Podsumowanie"),
                             ),
                         ],
                         vertical_alignment=ft.CrossAxisAlignment.CENTER,
                     ),
                     ft.Divider(height=1, color="#E5E7EB"),
                     ft.Container(
-                        content=ft.Markdown(
-                            value="",
-                            selectable=True,
-                            extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
-                            on_tap_link=lambda e: self.page.launch_url(e.data),
-                        ),
+                        content=self.summary_output,
                         expand=True,
                     ),
                 ],
                 spacing=12,
+                scroll=ft.ScrollMode.AUTO,
             ),
             border=ft.border.all(1, "#E5E7EB"),
             border_radius=16,
@@ -1346,7 +2041,6 @@ class PogadaneApp:
             expand=True,
             visible=False,
         )
-        self.summary_output = self.summary_card.content.controls[2].content
 
         # Content area with cards
         self.results_content = ft.Column(
@@ -1357,14 +2051,23 @@ class PogadaneApp:
             expand=True,
         )
 
+        self._results_sources = self._filtered_results()
+        self._render_results_list(update=False)
+
         return ft.Container(
             content=ft.Column(
                 [
                     results_header,
-                    self.file_selector,
-                    ft.Container(height=8),
-                    ft.Container(
-                        content=self.results_content,
+                    ft.Row(
+                        [
+                            results_sidebar,
+                            ft.Container(
+                                content=self.results_content,
+                                expand=True,
+                            ),
+                        ],
+                        spacing=16,
+                        vertical_alignment=ft.CrossAxisAlignment.START,
                         expand=True,
                     ),
                 ],
@@ -1375,6 +2078,208 @@ class PogadaneApp:
             expand=True,
         )
 
+    def _render_results_list(self, update: bool = True):
+        """Bind the recycled result rows to the visible slice of the filtered results"""
+        if not self.results_list:
+            return
+
+        sources = self._results_sources
+        total = len(sources)
+        first = min(self._results_first, max(total - RESULTS_POOL_ROWS, 0))
+        self._results_first = first
+        visible = sources[first:first + RESULTS_POOL_ROWS]
+
+        while len(self._results_rows) < len(visible):
+            self._results_rows.append(self._create_result_row())
+
+        rows = self._results_rows[:len(visible)]
+        for row, source in zip(rows, visible):
+            self._bind_result_row(row, source)
+
+        self.results_top_spacer.height = first * RESULTS_ROW_HEIGHT
+        self.results_bottom_spacer.height = (total - first - len(visible)) * RESULTS_ROW_HEIGHT
+        self.results_list.controls = [
+            self.results_top_spacer,
+            *(row["container"] for row in rows),
+            self.results_bottom_spacer,
+        ]
+
+        all_count = len(self.results_manager.results_data)
+        if self._semantic_mode and self._results_filter.strip():
+            self.results_count_text.value = f"Znaleziono po znaczeniu: {total}"
+        elif self._results_filter:
+            stored = sum(1 for source in sources if source not in self.results_manager.results_data)
+            self.results_count_text.value = f"Znaleziono: {total - stored} z {all_count}" + (
+                f" + {stored} z archiwum" if stored else ""
+            )
+        else:
+            self.results_count_text.value = f"Wyniki: {all_count}"
+
+        if update:
+            self.results_list.update()
+            self.results_count_text.update()
+
+    def _on_results_scroll(self, e: ft.OnScrollEvent):
+        """Rebind the result rows when the viewport leaves the rendered slice"""
+
+        visible_first = int(e.pixels // RESULTS_ROW_HEIGHT)
+        visible_last = int((e.pixels + e.viewport_dimension) // RESULTS_ROW_HEIGHT)
+        if self._results_first <= visible_first and visible_last < self._results_first + RESULTS_POOL_ROWS:
+            return
+
+        self._results_first = max(visible_first - RESULTS_OVERSCAN_ROWS, 0)
+        self._render_results_list()
+
+    def _on_results_filter_change(self, e):
+        """Filter the results list by name and search the stored results of all sessions"""
+        self._results_filter = e.control.value or ""
+        self._refresh_results_search()
+
+    def _on_semantic_search_toggle(self, e):
+        """Switch the results filter between words and meaning"""
+        self._semantic_mode = bool(e.control.value)
+        self.results_filter_field.label = "🔍 Szukaj po znaczeniu" if self._semantic_mode else "🔍 Szukaj w wynikach"
+        self.results_filter_field.hint_text = (
+            "Np. gdzie rozmawialiśmy o budżecie..." if self._semantic_mode else self._results_filter_hint()
+        )
+        self.results_filter_field.update()
+        self._refresh_results_search()
+
+    def _results_filter_hint(self) -> str:
+        """Hint of the results filter field in word search mode"""
+        return ("Nazwa pliku, adres URL lub słowa z transkrypcji..."
+                if self.result_store is not None else "Nazwa pliku lub adres URL...")
+
+    def _refresh_results_search(self):
+        """Filter the results list and start the search of the result store or the semantic index"""
+        self._stored_hits = []
+        self._stored_snippets = {}
+        self._semantic_times = {}
+        self._results_search_seq += 1
+        self._results_sources = self._filtered_results()
+        self._results_first = 0
+        self._render_results_list()
+        self.results_list.scroll_to(offset=0)
+        if not self._results_filter.strip():
+            return
+        if self._semantic_mode and self.semantic_index is not None:
+            self.results_count_text.value = "⏳ Szukanie po znaczeniu..."
+            self.results_count_text.update()
+            self.page.run_task(self._search_semantic_index, self._results_filter, self._results_search_seq)
+        elif self.result_store is not None:
+            self.page.run_task(self._search_result_store, self._results_filter, self._results_search_seq)
+
+    def _filtered_results(self) -> List[str]:
+        """Session results matching the filter, followed by the matches from the result store"""
+        if self._semantic_mode and self._results_filter.strip():
+            # Ranked by meaning: only the sources of the found fragments
+            return list(self._stored_hits)
+        sources = self.results_manager.find_sources(self._results_filter)
+        if self._results_filter and self._stored_hits:
+            listed = set(sources)
+            sources += [source for source in self._stored_hits if source not in listed]
+        return sources
+
+    async def _search_result_store(self, query: str, seq: int):
+        """Full-text search of the result store (off the event loop); stale searches are dropped"""
+        try:
+            hits = await asyncio.to_thread(self.result_store.search, query, RESULTS_SEARCH_LIMIT)
+        except (ValueError, sqlite3.Error) as ex:
+            logger.warning(f"Result store search failed: {ex}")
+            return
+        if seq != self._results_search_seq:
+            return
+        self._stored_hits = [hit.source for hit in hits]
+        self._stored_snippets = {hit.source: hit.snippet for hit in hits}
+        self._results_sources = self._filtered_results()
+        self._render_results_list()
+
+    async def _search_semantic_index(self, query: str, seq: int):
+        """Find the fragments closest in meaning (off the event loop; the first search loads the model)"""
+        try:
+            hits = await asyncio.to_thread(self.semantic_index.search, query, SEMANTIC_SEARCH_LIMIT, 1)
+        except ImportError as ex:
+            self.show_snackbar(f"❌ Wyszukiwanie po znaczeniu wymaga: pip install sentence-transformers ({ex})", error=True)
+            hits = []
+        except Exception as ex:
+            logger.error(f"Semantic search failed: {ex}", exc_info=True)
+            hits = []
+        if seq != self._results_search_seq:
+            return
+        self._stored_hits = [hit.source for hit in hits]
+        self._stored_snippets = {
+            hit.source: (f"{format_timestamp(hit.start)} · " if hit.start is not None else "") + hit.text
+            for hit in hits
+        }
+        self._semantic_times = {hit.source: hit.start for hit in hits if hit.start is not None}
+        self._results_sources = self._filtered_results()
+        self._render_results_list()
+
+    def _open_result_row(self, source: Optional[str]):
+        """Show a clicked result, at the found fragment after a search by meaning"""
+        self.show_result(source)
+        seconds = self._semantic_times.get(source)
+        if seconds is not None and self._selected_result == source and self._transcript_pager is not None:
+            line = self._transcript_pager.line_at_time(seconds)
+            if line is not None:
+                self._show_transcript_line(line)
+
+    def _create_result_row(self) -> Dict[str, object]:
+        """Create the controls of one recycled results list row"""
+
+        row: Dict[str, object] = {"source": None}
+        icon = ft.Icon(ft.Icons.AUDIO_FILE_ROUNDED, size=20, color="#2563EB")
+        name_text = ft.Text("", size=13, weight=ft.FontWeight.W_600, max_lines=1, overflow=ft.TextOverflow.ELLIPSIS)
+        path_text = ft.Text("", size=11, color=self.muted_text_color, max_lines=1, overflow=ft.TextOverflow.ELLIPSIS)
+        container = ft.Container(
+            content=ft.Row(
+                [
+                    icon,
+                    ft.Column([name_text, path_text], spacing=2, expand=True),
+                ],
+                spacing=10,
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            ),
+            height=RESULTS_ROW_HEIGHT - 4,
+            margin=ft.margin.only(bottom=4),
+            padding=ft.padding.symmetric(horizontal=12, vertical=6),
+            border_radius=10,
+            ink=True,
+            on_click=lambda _, row=row: self._open_result_row(row["source"]),
+        )
+        row.update({
+            "container": container,
+            "icon": icon,
+            "name_text": name_text,
+            "path_text": path_text,
+        })
+        return row
+
+    def _bind_result_row(self, row: Dict[str, object], source: str):
+        """Show a result in a recycled row (no UI update)"""
+
+        is_url = is_valid_url(source)
+        selected = source == self._selected_result
+        row["source"] = source
+        if source in self._live_segments:
+            # Transcript still being decoded
+            row["icon"].name = ft.Icons.GRAPHIC_EQ_ROUNDED
+            row["icon"].color = "#FBBF24"
+        elif source not in self.results_manager.results_data:
+            # Result of an earlier session, loaded from the result store when opened
+            row["icon"].name = ft.Icons.HISTORY_ROUNDED
+            row["icon"].color = "#059669"
+        else:
+            row["icon"].name = ft.Icons.LINK_ROUNDED if is_url else ft.Icons.AUDIO_FILE_ROUNDED
+            row["icon"].color = "#7C3AED" if is_url else "#2563EB"
+        row["name_text"].value = source if is_url else os.path.basename(source)
+        # A content match shows the text around the found words
+        row["path_text"].value = self._stored_snippets.get(source) or source
+        row["path_text"].color = self.get_theme_color("#6B7280", "#D1D5DB")
+        container: ft.Container = row["container"]
+        container.bgcolor = self.get_theme_color("#DBEAFE", "#1E3A8A") if selected else None
+        container.border = ft.border.all(1, "#2563EB" if selected else self.get_theme_color("#E5E7EB", "#4B5563"))
+
     def create_presets_selector(self):
         """Create fancy preset selector with Fast/Medium/Slow options"""
         
@@ -1753,7 +2658,19 @@ class PogadaneApp:
     # Event Handlers
     
     def open_settings_dialog(self, e):
-        """Open settings dialog window with smart, context-aware UI"""
+        """Open settings dialog window with smart, context-aware UI
+        
+        The dialog is built on first use; later openings reuse it and only
+        reload the field values from the configuration.
+        """
+        if self.settings_dialog is not None:
+            self._load_settings_values()
+            if self.settings_dialog not in self.page.overlay:
+                self.page.overlay.append(self.settings_dialog)
+            self.settings_dialog.open = True
+            self.page.update()
+            return
+        
         # Show loading indicator
         loading_dialog = ft.AlertDialog(
             content=ft.Column(
@@ -1774,391 +2691,438 @@ class PogadaneApp:
         self.page.update()
         
         try:
-            # Clear previous config fields
-            self.config_fields.clear()
-            
-            # Get current values
-            current_transcription_provider = getattr(self.config_module, "TRANSCRIPTION_PROVIDER", "faster-whisper")
-            current_summary_provider = getattr(self.config_module, "SUMMARY_PROVIDER", "transformers")
-            
-            # Create containers for conditional sections
-            self.transcription_settings_container = ft.Column(spacing=8, visible=True)
-            self.summary_settings_container = ft.Column(spacing=8, visible=True)
-            
-            # 🎙️ TRANSCRIPTION PROVIDER SELECTOR (Main Choice)
-            transcription_provider_dropdown = ft.Dropdown(
-                label="🎙️ Silnik Transkrypcji",
-                value=current_transcription_provider,
-                options=[
-                    ft.dropdown.Option(key="faster-whisper", text="Faster-Whisper (Zalecany - 4x szybszy)"),
-                    ft.dropdown.Option(key="whisper", text="OpenAI Whisper (Standardowy)"),
-                ],
-                border_radius=12,
-                filled=True,
-                bgcolor=self.get_theme_color("#F0F9FF"),
-                border_color="#2563EB",
-                focused_border_color="#1D4ED8",
-                label_style=ft.TextStyle(size=14, weight=ft.FontWeight.BOLD),
-                text_size=14,
-                on_change=lambda _: self.update_transcription_settings(),
-            )
-            self.config_fields["TRANSCRIPTION_PROVIDER"] = transcription_provider_dropdown
-            
-            # Build transcription settings based on provider
-            self.build_transcription_settings(current_transcription_provider)
-            
-            # 🤖 SUMMARY PROVIDER SELECTOR (Main Choice)
-            summary_provider_dropdown = ft.Dropdown(
-                label="🤖 Dostawca AI Podsumowań",
-                value=current_summary_provider,
-                options=[
-                    ft.dropdown.Option(key="transformers", text="Transformers (Offline - Zalecany)"),
-                    ft.dropdown.Option(key="gguf", text="GGUF / Llama.cpp (Quantized, bardzo szybki)"),
-                    ft.dropdown.Option(key="ollama", text="Ollama (Lokalny, wymaga instalacji)"),
-                    ft.dropdown.Option(key="google", text="Google Gemini (Cloud, wymaga API)"),
-                ],
-                border_radius=12,
-                filled=True,
-                bgcolor=self.get_theme_color("#F0FDF4"),
-                border_color="#10B981",
-                focused_border_color="#059669",
-                label_style=ft.TextStyle(size=14, weight=ft.FontWeight.BOLD),
-                text_size=14,
-                on_change=lambda _: self.update_summary_settings(),
-            )
-            self.config_fields["SUMMARY_PROVIDER"] = summary_provider_dropdown
+            settings_dialog = self._build_settings_dialog()
             
-            # Build summary settings based on provider
-            self.build_summary_settings(current_summary_provider)
-            
-            # Common settings (always visible)
-            whisper_model = ft.Dropdown(
-                label="Model Whisper",
-                value=getattr(self.config_module, "WHISPER_MODEL", "turbo"),
-                options=[
-                    ft.dropdown.Option("tiny", "Tiny - Najmniejszy, najszybszy"),
-                    ft.dropdown.Option("base", "Base - Mały, szybki"),
-                    ft.dropdown.Option("small", "Small - Zbalansowany"),
-                    ft.dropdown.Option("medium", "Medium - Dobra jakość"),
-                    ft.dropdown.Option("large-v3", "Large-v3 - Najlepsza jakość"),
-                    ft.dropdown.Option("turbo", "Turbo - Zalecany (szybki + dokładny)"),
-                ],
-                border_radius=8,
-                filled=True,
-                text_size=13,
-            )
-            self.config_fields["WHISPER_MODEL"] = whisper_model
-            
-            whisper_language = ft.Dropdown(
-                label="Język Audio",
-                value=getattr(self.config_module, "WHISPER_LANGUAGE", "Polish"),
-                options=[ft.dropdown.Option(lang) for lang in 
-                         ["Polish", "English", "German", "French", "Spanish", "Italian", "Ukrainian", "Russian"]],
-                border_radius=8,
-                filled=True,
-                text_size=13,
-            )
-            self.config_fields["WHISPER_LANGUAGE"] = whisper_language
-            
-            summary_language = ft.Dropdown(
-                label="Język Podsumowania",
-                value=getattr(self.config_module, "SUMMARY_LANGUAGE", "English"),
-                options=[ft.dropdown.Option(lang) for lang in 
-                         ["Polish", "English", "German", "French", "Spanish"]],
-                border_radius=8,
-                filled=True,
-                text_size=13,
-                width=200,
-            )
-            self.config_fields["SUMMARY_LANGUAGE"] = summary_language
-            
-            # Transcription Tab Content
-            transcription_tab_content = ft.Container(
-                content=ft.Column([
-                    ft.Container(
-                        content=ft.Column([
-                            ft.Text(
-                                "Wybierz silnik transkrypcji i skonfiguruj opcje przetwarzania audio",
-                                size=13,
-                                color=self.muted_text_color,
-                                italic=True,
-                            ),
-                        ]),
-                        padding=ft.padding.only(bottom=16),
-                    ),
-                    transcription_provider_dropdown,
-                    ft.Container(height=12),
-                    self.transcription_settings_container,
-                    ft.Container(height=12),
-                    whisper_model,
-                    ft.Container(height=12),
-                    whisper_language,
-                ], spacing=0, scroll=ft.ScrollMode.AUTO),
-                padding=20,
-                expand=True,
-            )
-            
-            # Summary Tab Content
-            summary_tab_content = ft.Container(
-                content=ft.Column([
-                    ft.Container(
-                        content=ft.Column([
-                            ft.Text(
-                                "Wybierz dostawcę AI do generowania podsumowań",
-                                size=13,
-                                color=self.muted_text_color,
-                                italic=True,
-                            ),
-                        ]),
-                        padding=ft.padding.only(bottom=16),
-                    ),
-                    summary_provider_dropdown,
-                    ft.Container(height=12),
-                    self.summary_settings_container,
-                    ft.Container(height=20),
-                    summary_language,
-                ], spacing=0, scroll=ft.ScrollMode.AUTO),
-                padding=20,
-                expand=True,
-            )
-            
-            # Prompt Customization Tab Content
-            prompt_tab_content = ft.Container(
-                content=ft.Column([
-                    ft.Container(
-                        content=ft.Column([
-                            ft.Text(
-                                "Dostosuj prompty używane do generowania podsumowań",
-                                size=13,
-                                color=self.muted_text_color,
-                                italic=True,
-                            ),
-                        ]),
-                        padding=ft.padding.only(bottom=16),
-                    ),
-                    ft.Text("🎯 System Prompt", size=15, weight=ft.FontWeight.BOLD, color="#7C3AED"),
-                    ft.Container(height=4),
-                    ft.TextField(
-                        label="Instrukcja systemowa dla AI",
-                        value=getattr(self.config_module, "SYSTEM_PROMPT", "You are a helpful AI assistant that creates concise summaries."),
-                        multiline=True,
-                        min_lines=3,
-                        max_lines=5,
-                        border_radius=8,
-                        filled=True,
-                        hint_text="Opisz rolę i zachowanie AI...",
-                        on_change=lambda e: setattr(self.config_fields, "SYSTEM_PROMPT", e.control),
-                    ),
-                    ft.Container(height=12),
-                    ft.Text("💬 User Prompt Template", size=15, weight=ft.FontWeight.BOLD, color="#2563EB"),
-                    ft.Container(height=4),
-                    ft.TextField(
-                        label="Szablon pytania (użyj {text} dla transkrypcji)",
-                        value=getattr(self.config_module, "USER_PROMPT_TEMPLATE", "Summarize the following text:\n\n{text}"),
-                        multiline=True,
-                        min_lines=4,
-                        max_lines=6,
-                        border_radius=8,
-                        filled=True,
-                        hint_text="Zbuduj prompt z {text} jako placeholder...",
-                        on_change=lambda e: setattr(self.config_fields, "USER_PROMPT_TEMPLATE", e.control),
-                    ),
-                    ft.Container(height=12),
-                    ft.Container(
-                        content=ft.Column([
-                            ft.Row([
-                                ft.Icon(ft.Icons.LIGHTBULB_OUTLINE, size=16, color="#F59E0B"),
-                                ft.Text("Wskazówki:", size=12, weight=ft.FontWeight.BOLD, color="#F59E0B"),
-                            ], spacing=6),
-                            ft.Text("• Użyj {text} jako miejsca na transkrypcję", size=11, color=self.muted_text_color),
-                            ft.Text("• System prompt definiuje rolę AI (np. ekspert, asystent)", size=11, color=self.muted_text_color),
-                            ft.Text("• User prompt określa zadanie (np. podsumuj, wyciągnij kluczowe punkty)", size=11, color=self.muted_text_color),
-                            ft.Text("• Krótsze prompty = szybsze przetwarzanie", size=11, color=self.muted_text_color),
-                        ], spacing=4),
-                        padding=12,
-                        border=ft.border.all(1, "#FCD34D"),
-                        border_radius=8,
-                        bgcolor="#FFFBEB",
-                    ),
-                ], spacing=0, scroll=ft.ScrollMode.AUTO),
-                padding=20,
-                expand=True,
-            )
+            # Close loading dialog and show settings dialog
+            loading_dialog.open = False
+            self.page.overlay.remove(loading_dialog)
             
-            # Store prompt fields for saving
-            if len(prompt_tab_content.content.controls) > 2:
-                self.config_fields["SYSTEM_PROMPT"] = prompt_tab_content.content.controls[2]
-            if len(prompt_tab_content.content.controls) > 6:
-                self.config_fields["USER_PROMPT_TEMPLATE"] = prompt_tab_content.content.controls[6]
+            # Store dialog reference for updates and later openings
+            self.settings_dialog = settings_dialog
+            self.page.overlay.append(settings_dialog)
+            settings_dialog.open = True
+            self.page.update()
             
-            # Dependencies Check Tab Content - Lazy loaded placeholder
-            self.dependencies_checks_container = ft.Column([
+        except Exception as ex:
+            # Close loading dialog on error
+            loading_dialog.open = False
+            self.page.update()
+            print(f"[ERROR] Failed to open settings dialog: {ex}")
+            import traceback
+            traceback.print_exc()
+    
+    def _load_settings_values(self):
+        """Reset the cached settings fields to the current configuration"""
+        for key, field in self.config_fields.items():
+            if not hasattr(self.config_module, key):
+                continue
+            value = getattr(self.config_module, key)
+            if isinstance(field, ft.Switch):
+                field.value = parse_bool(value)
+            elif hasattr(field, 'value'):
+                field.value = "" if value is None else str(value)
+        
+        for key, rebuild in (("TRANSCRIPTION_PROVIDER", self.build_transcription_settings),
+                             ("SUMMARY_PROVIDER", self.build_summary_settings)):
+            if key in self.config_fields:
+                rebuild(self.config_fields[key].value)
+    
+    def _discard_settings_dialog(self):
+        """Drop the cached settings dialog and provider panels"""
+        if self.settings_dialog is not None and self.settings_dialog in self.page.overlay:
+            self.page.overlay.remove(self.settings_dialog)
+        self.settings_dialog = None
+        self._transcription_panels.clear()
+        self._summary_panels.clear()
+    
+    def _build_settings_dialog(self) -> ft.AlertDialog:
+        """Build the settings dialog and register its fields in config_fields"""
+        # Clear previous config fields
+        self.config_fields.clear()
+        
+        # Get current values
+        current_transcription_provider = getattr(self.config_module, "TRANSCRIPTION_PROVIDER", "faster-whisper")
+        current_summary_provider = getattr(self.config_module, "SUMMARY_PROVIDER", "transformers")
+        
+        # Create containers for conditional sections
+        self.transcription_settings_container = ft.Column(spacing=8, visible=True)
+        self.summary_settings_container = ft.Column(spacing=8, visible=True)
+        
+        # 🎙️ TRANSCRIPTION PROVIDER SELECTOR (Main Choice)
+        transcription_provider_dropdown = ft.Dropdown(
+            label="🎙️ Silnik Transkrypcji",
+            value=current_transcription_provider,
+            options=[
+                ft.dropdown.Option(key="faster-whisper", text="Faster-Whisper (Zalecany - 4x szybszy)"),
+                ft.dropdown.Option(key="whisper", text="OpenAI Whisper (Standardowy)"),
+            ],
+            border_radius=12,
+            filled=True,
+            bgcolor=self.get_theme_color("#F0F9FF"),
+            border_color="#2563EB",
+            focused_border_color="#1D4ED8",
+            label_style=ft.TextStyle(size=14, weight=ft.FontWeight.BOLD),
+            text_size=14,
+            on_change=lambda _: self.update_transcription_settings(),
+        )
+        self.config_fields["TRANSCRIPTION_PROVIDER"] = transcription_provider_dropdown
+        
+        # Build transcription settings based on provider
+        self.build_transcription_settings(current_transcription_provider)
+        
+        # 🤖 SUMMARY PROVIDER SELECTOR (Main Choice)
+        summary_provider_dropdown = ft.Dropdown(
+            label="🤖 Dostawca AI Podsumowań",
+            value=current_summary_provider,
+            options=[
+                ft.dropdown.Option(key="transformers", text="Transformers (Offline - Zalecany)"),
+                ft.dropdown.Option(key="gguf", text="GGUF / Llama.cpp (Quantized, bardzo szybki)"),
+                ft.dropdown.Option(key="ollama", text="Ollama (Lokalny, wymaga instalacji)"),
+                ft.dropdown.Option(key="google", text="Google Gemini (Cloud, wymaga API)"),
+            ],
+            border_radius=12,
+            filled=True,
+            bgcolor=self.get_theme_color("#F0FDF4"),
+            border_color="#10B981",
+            focused_border_color="#059669",
+            label_style=ft.TextStyle(size=14, weight=ft.FontWeight.BOLD),
+            text_size=14,
+            on_change=lambda _: self.update_summary_settings(),
+        )
+        self.config_fields["SUMMARY_PROVIDER"] = summary_provider_dropdown
+        
+        # Build summary settings based on provider
+        self.build_summary_settings(current_summary_provider)
+        
+        # Common settings (always visible)
+        whisper_model = ft.Dropdown(
+            label="Model Whisper",
+            value=getattr(self.config_module, "WHISPER_MODEL", "turbo"),
+            options=[
+                ft.dropdown.Option("tiny", "Tiny - Najmniejszy, najszybszy"),
+                ft.dropdown.Option("base", "Base - Mały, szybki"),
+                ft.dropdown.Option("small", "Small - Zbalansowany"),
+                ft.dropdown.Option("medium", "Medium - Dobra jakość"),
+                ft.dropdown.Option("large-v3", "Large-v3 - Najlepsza jakość"),
+                ft.dropdown.Option("turbo", "Turbo - Zalecany (szybki + dokładny)"),
+            ],
+            border_radius=8,
+            filled=True,
+            text_size=13,
+        )
+        self.config_fields["WHISPER_MODEL"] = whisper_model
+        
+        whisper_language = ft.Dropdown(
+            label="Język Audio",
+            value=getattr(self.config_module, "WHISPER_LANGUAGE", "Polish"),
+            options=[ft.dropdown.Option(lang) for lang in 
+                     ["Polish", "English", "German", "French", "Spanish", "Italian", "Ukrainian", "Russian"]],
+            border_radius=8,
+            filled=True,
+            text_size=13,
+        )
+        self.config_fields["WHISPER_LANGUAGE"] = whisper_language
+        
+        transcription_profile = ft.Dropdown(
+            label="Profil Transkrypcji (domyślny)",
+            value=getattr(self.config_module, "TRANSCRIPTION_PROFILE", DEFAULT_TRANSCRIPTION_PROFILE),
+            options=[
+                ft.dropdown.Option(name, profile["label"])
+                for name, profile in TRANSCRIPTION_PROFILES.items()
+            ],
+            border_radius=8,
+            filled=True,
+            text_size=13,
+            helper_text="Parametry dekodowania; profil może wybrać własny model Whisper",
+        )
+        self.config_fields["TRANSCRIPTION_PROFILE"] = transcription_profile
+        
+        summary_language = ft.Dropdown(
+            label="Język Podsumowania",
+            value=getattr(self.config_module, "SUMMARY_LANGUAGE", "English"),
+            options=[ft.dropdown.Option(lang) for lang in 
+                     ["Polish", "English", "German", "French", "Spanish"]],
+            border_radius=8,
+            filled=True,
+            text_size=13,
+            width=200,
+        )
+        self.config_fields["SUMMARY_LANGUAGE"] = summary_language
+        
+        # Transcription Tab Content
+        transcription_tab_content = ft.Container(
+            content=ft.Column([
                 ft.Container(
                     content=ft.Column([
-                        ft.ProgressRing(width=40, height=40),
-                        ft.Text("Kliknij 'Sprawdź Zależności' aby rozpocząć", size=14, color=self.muted_text_color, text_align=ft.TextAlign.CENTER),
-                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=16),
-                    padding=40,
-                    alignment=ft.alignment.center,
-                ),
-            ], spacing=8)
-            
-            dependencies_tab_content = ft.Container(
-                content=ft.Column([
-                    ft.Container(
-                        content=ft.Column([
-                            ft.Row([
-                                ft.Icon(ft.Icons.CHECKLIST_ROUNDED, size=20, color="#10B981"),
-                                ft.Text("Status Zależności Systemowych", size=16, weight=ft.FontWeight.BOLD),
-                            ], spacing=8),
-                            ft.Text(
-                                "Sprawdź dostępność wymaganych narzędzi i bibliotek",
-                                size=13,
-                                color=self.muted_text_color,
-                                italic=True,
-                            ),
-                        ]),
-                        padding=ft.padding.only(bottom=16),
-                    ),
-                    ft.Container(
-                        content=self.dependencies_checks_container,
-                        padding=16,
-                        border=ft.border.all(1, "#E5E7EB"),
-                        border_radius=12,
-                        bgcolor="#FFFFFF" if self.page.theme_mode == ft.ThemeMode.LIGHT else "#1F2937",
-                    ),
-                    ft.Container(height=12),
-                    ft.Row([
-                        ft.FilledButton(
-                            "Sprawdź Zależności",
-                            icon=ft.Icons.PLAY_ARROW_ROUNDED,
-                            on_click=lambda _: self.load_dependencies_check(),
-                            style=ft.ButtonStyle(
-                                bgcolor="#10B981",
-                                color="#FFFFFF",
-                                shape=ft.RoundedRectangleBorder(radius=8),
-                            ),
-                        ),
-                        ft.OutlinedButton(
-                            "Zainstaluj Brakujące",
-                            icon=ft.Icons.DOWNLOAD_ROUNDED,
-                            on_click=lambda _: self.install_missing_dependencies(),
-                            style=ft.ButtonStyle(
-                                side=ft.BorderSide(1, "#2563EB"),
-                                color="#2563EB",
-                                shape=ft.RoundedRectangleBorder(radius=8),
-                            ),
-                        ),
-                    ], spacing=8),
-                ], spacing=0, scroll=ft.ScrollMode.AUTO),
-                padding=20,
-                expand=True,
-            )
-            
-            # Dialog content with tabs
-            dialog_content = ft.Container(
-                content=ft.Tabs(
-                    selected_index=0,
-                    animation_duration=300,
-                    tabs=[
-                        ft.Tab(
-                            text="Transkrypcja Audio",
-                            icon=ft.Icons.MIC_ROUNDED,
-                            content=transcription_tab_content,
+                        ft.Text(
+                            "Wybierz silnik transkrypcji i skonfiguruj opcje przetwarzania audio",
+                            size=13,
+                            color=self.muted_text_color,
+                            italic=True,
                         ),
-                        ft.Tab(
-                            text="Podsumowania AI",
-                            icon=ft.Icons.AUTO_AWESOME_ROUNDED,
-                            content=summary_tab_content,
+                    ]),
+                    padding=ft.padding.only(bottom=16),
+                ),
+                transcription_provider_dropdown,
+                ft.Container(height=12),
+                self.transcription_settings_container,
+                ft.Container(height=12),
+                whisper_model,
+                ft.Container(height=12),
+                whisper_language,
+                ft.Container(height=12),
+                transcription_profile,
+            ], spacing=0, scroll=ft.ScrollMode.AUTO),
+            padding=20,
+            expand=True,
+        )
+        
+        # Summary Tab Content
+        summary_tab_content = ft.Container(
+            content=ft.Column([
+                ft.Container(
+                    content=ft.Column([
+                        ft.Text(
+                            "Wybierz dostawcę AI do generowania podsumowań",
+                            size=13,
+                            color=self.muted_text_color,
+                            italic=True,
                         ),
-                        ft.Tab(
-                            text="Prompty",
-                            icon=ft.Icons.EDIT_NOTE_ROUNDED,
-                            content=prompt_tab_content,
+                    ]),
+                    padding=ft.padding.only(bottom=16),
+                ),
+                summary_provider_dropdown,
+                ft.Container(height=12),
+                self.summary_settings_container,
+                ft.Container(height=20),
+                summary_language,
+            ], spacing=0, scroll=ft.ScrollMode.AUTO),
+            padding=20,
+            expand=True,
+        )
+        
+        # Prompt Customization Tab Content
+        prompt_tab_content = ft.Container(
+            content=ft.Column([
+                ft.Container(
+                    content=ft.Column([
+                        ft.Text(
+                            "Dostosuj prompty używane do generowania podsumowań",
+                            size=13,
+                            color=self.muted_text_color,
+                            italic=True,
                         ),
-                        ft.Tab(
-                            text="Zależności",
-                            icon=ft.Icons.CHECKLIST_ROUNDED,
-                            content=dependencies_tab_content,
+                    ]),
+                    padding=ft.padding.only(bottom=16),
+                ),
+                ft.Text("🎯 System Prompt", size=15, weight=ft.FontWeight.BOLD, color="#7C3AED"),
+                ft.Container(height=4),
+                ft.TextField(
+                    label="Instrukcja systemowa dla AI",
+                    value=getattr(self.config_module, "SYSTEM_PROMPT", "You are a helpful AI assistant that creates concise summaries."),
+                    multiline=True,
+                    min_lines=3,
+                    max_lines=5,
+                    border_radius=8,
+                    filled=True,
+                    hint_text="Opisz rolę i zachowanie AI...",
+                    on_change=lambda e: setattr(self.config_fields, "SYSTEM_PROMPT", e.control),
+                ),
+                ft.Container(height=12),
+                ft.Text("💬 User Prompt Template", size=15, weight=ft.FontWeight.BOLD, color="#2563EB"),
+                ft.Container(height=4),
+                ft.TextField(
+                    label="Szablon pytania (użyj {text} dla transkrypcji)",
+                    value=getattr(self.config_module, "USER_PROMPT_TEMPLATE", "Summarize the following text:\n\n{text}"),
+                    multiline=True,
+                    min_lines=4,
+                    max_lines=6,
+                    border_radius=8,
+                    filled=True,
+                    hint_text="Zbuduj prompt z {text} jako placeholder...",
+                    on_change=lambda e: setattr(self.config_fields, "USER_PROMPT_TEMPLATE", e.control),
+                ),
+                ft.Container(height=12),
+                ft.Container(
+                    content=ft.Column([
+                        ft.Row([
+                            ft.Icon(ft.Icons.LIGHTBULB_OUTLINE, size=16, color="#F59E0B"),
+                            ft.Text("Wskazówki:", size=12, weight=ft.FontWeight.BOLD, color="#F59E0B"),
+                        ], spacing=6),
+                        ft.Text("• Użyj {text} jako miejsca na transkrypcję", size=11, color=self.muted_text_color),
+                        ft.Text("• System prompt definiuje rolę AI (np. ekspert, asystent)", size=11, color=self.muted_text_color),
+                        ft.Text("• User prompt określa zadanie (np. podsumuj, wyciągnij kluczowe punkty)", size=11, color=self.muted_text_color),
+                        ft.Text("• Krótsze prompty = szybsze przetwarzanie", size=11, color=self.muted_text_color),
+                    ], spacing=4),
+                    padding=12,
+                    border=ft.border.all(1, "#FCD34D"),
+                    border_radius=8,
+                    bgcolor="#FFFBEB",
+                ),
+            ], spacing=0, scroll=ft.ScrollMode.AUTO),
+            padding=20,
+            expand=True,
+        )
+        
+        # Store prompt fields for saving
+        if len(prompt_tab_content.content.controls) > 2:
+            self.config_fields["SYSTEM_PROMPT"] = prompt_tab_content.content.controls[2]
+        if len(prompt_tab_content.content.controls) > 6:
+            self.config_fields["USER_PROMPT_TEMPLATE"] = prompt_tab_content.content.controls[6]
+        
+        # Dependencies Check Tab Content - Lazy loaded placeholder
+        self.dependencies_checks_container = ft.Column([
+            ft.Container(
+                content=ft.Column([
+                    ft.ProgressRing(width=40, height=40),
+                    ft.Text("Kliknij 'Sprawdź Zależności' aby rozpocząć", size=14, color=self.muted_text_color, text_align=ft.TextAlign.CENTER),
+                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=16),
+                padding=40,
+                alignment=ft.alignment.center,
+            ),
+        ], spacing=8)
+        
+        dependencies_tab_content = ft.Container(
+            content=ft.Column([
+                ft.Container(
+                    content=ft.Column([
+                        ft.Row([
+                            ft.Icon(ft.Icons.CHECKLIST_ROUNDED, size=20, color="#10B981"),
+                            ft.Text("Status Zależności Systemowych", size=16, weight=ft.FontWeight.BOLD),
+                        ], spacing=8),
+                        ft.Text(
+                            "Sprawdź dostępność wymaganych narzędzi i bibliotek",
+                            size=13,
+                            color=self.muted_text_color,
+                            italic=True,
                         ),
-                    ],
-                    expand=True,
+                    ]),
+                    padding=ft.padding.only(bottom=16),
                 ),
-                height=600,
-                width=700,
-            )
-            
-            # Create dialog with fade-in animation
-            settings_dialog = ft.AlertDialog(
-                modal=True,
-                title=ft.Row([
-                    ft.Icon(ft.Icons.SETTINGS_ROUNDED, size=28, color="#2563EB"),
-                    ft.Text("Ustawienia", size=24, weight=ft.FontWeight.BOLD),
-                ], spacing=12),
-                content=dialog_content,
-                actions=[
-                    # Left side: Reset button
-                    ft.Container(
-                        content=ft.OutlinedButton(
-                            "Przywróć Domyślne",
-                            icon=ft.Icons.RESTORE_ROUNDED,
-                            on_click=lambda _: self.reset_to_defaults(settings_dialog),
-                            style=ft.ButtonStyle(
-                                shape=ft.RoundedRectangleBorder(radius=12),
-                                color="#DC2626",
-                                side=ft.BorderSide(2, "#DC2626"),
-                            ),
+                ft.Container(
+                    content=self.dependencies_checks_container,
+                    padding=16,
+                    border=ft.border.all(1, "#E5E7EB"),
+                    border_radius=12,
+                    bgcolor="#FFFFFF" if self.page.theme_mode == ft.ThemeMode.LIGHT else "#1F2937",
+                ),
+                ft.Container(height=12),
+                ft.Row([
+                    ft.FilledButton(
+                        "Sprawdź Zależności",
+                        icon=ft.Icons.PLAY_ARROW_ROUNDED,
+                        on_click=lambda _: self.page.run_task(self.load_dependencies_check),
+                        style=ft.ButtonStyle(
+                            bgcolor="#10B981",
+                            color="#FFFFFF",
+                            shape=ft.RoundedRectangleBorder(radius=8),
                         ),
-                        expand=True,
                     ),
-                    # Right side: Cancel and Save buttons
-                    ft.TextButton(
-                        "Anuluj",
-                        on_click=lambda _: self.close_dialog(settings_dialog),
+                    ft.OutlinedButton(
+                        "Zainstaluj Brakujące",
+                        icon=ft.Icons.DOWNLOAD_ROUNDED,
+                        on_click=lambda _: self.install_missing_dependencies(),
                         style=ft.ButtonStyle(
-                            shape=ft.RoundedRectangleBorder(radius=12),
+                            side=ft.BorderSide(1, "#2563EB"),
+                            color="#2563EB",
+                            shape=ft.RoundedRectangleBorder(radius=8),
                         ),
                     ),
-                    ft.FilledButton(
-                        "Zapisz i Zastosuj",
-                        icon=ft.Icons.SAVE_ROUNDED,
-                        on_click=lambda _: self.save_config_from_dialog(settings_dialog),
+                ], spacing=8),
+            ], spacing=0, scroll=ft.ScrollMode.AUTO),
+            padding=20,
+            expand=True,
+        )
+        
+        # Dialog content with tabs
+        dialog_content = ft.Container(
+            content=ft.Tabs(
+                selected_index=0,
+                animation_duration=300,
+                tabs=[
+                    ft.Tab(
+                        text="Transkrypcja Audio",
+                        icon=ft.Icons.MIC_ROUNDED,
+                        content=transcription_tab_content,
+                    ),
+                    ft.Tab(
+                        text="Podsumowania AI",
+                        icon=ft.Icons.AUTO_AWESOME_ROUNDED,
+                        content=summary_tab_content,
+                    ),
+                    ft.Tab(
+                        text="Prompty",
+                        icon=ft.Icons.EDIT_NOTE_ROUNDED,
+                        content=prompt_tab_content,
+                    ),
+                    ft.Tab(
+                        text="Zależności",
+                        icon=ft.Icons.CHECKLIST_ROUNDED,
+                        content=dependencies_tab_content,
+                    ),
+                ],
+                expand=True,
+            ),
+            height=600,
+            width=700,
+        )
+        
+        # Create dialog with fade-in animation
+        settings_dialog = ft.AlertDialog(
+            modal=True,
+            title=ft.Row([
+                ft.Icon(ft.Icons.SETTINGS_ROUNDED, size=28, color="#2563EB"),
+                ft.Text("Ustawienia", size=24, weight=ft.FontWeight.BOLD),
+            ], spacing=12),
+            content=dialog_content,
+            actions=[
+                # Left side: Reset button
+                ft.Container(
+                    content=ft.OutlinedButton(
+                        "Przywróć Domyślne",
+                        icon=ft.Icons.RESTORE_ROUNDED,
+                        on_click=lambda _: self.reset_to_defaults(settings_dialog),
                         style=ft.ButtonStyle(
                             shape=ft.RoundedRectangleBorder(radius=12),
-                            bgcolor="#2563EB",
-                            color="#FFFFFF",
+                            color="#DC2626",
+                            side=ft.BorderSide(2, "#DC2626"),
                         ),
                     ),
-                ],
-                actions_alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-            )
-            
-            # Store dialog reference for updates
-            self.settings_dialog = settings_dialog
-            
-            # Close loading dialog and show settings dialog with animation
-            loading_dialog.open = False
-            self.page.update()
-            
-            # Small delay for smooth transition
-            import time
-            time.sleep(0.1)
-            
-            # Show settings dialog
-            self.page.overlay.append(settings_dialog)
-            settings_dialog.open = True
-            self.page.update()
-            
-        except Exception as ex:
-            # Close loading dialog on error
-            loading_dialog.open = False
-            self.page.update()
-            print(f"[ERROR] Failed to open settings dialog: {ex}")
-            import traceback
-            traceback.print_exc()
+                    expand=True,
+                ),
+                # Right side: Cancel and Save buttons
+                ft.TextButton(
+                    "Anuluj",
+                    on_click=lambda _: self.close_dialog(settings_dialog),
+                    style=ft.ButtonStyle(
+                        shape=ft.RoundedRectangleBorder(radius=12),
+                    ),
+                ),
+                ft.FilledButton(
+                    "Zapisz i Zastosuj",
+                    icon=ft.Icons.SAVE_ROUNDED,
+                    on_click=lambda _: self.page.run_task(self.save_config_from_dialog, settings_dialog),
+                    style=ft.ButtonStyle(
+                        shape=ft.RoundedRectangleBorder(radius=12),
+                        bgcolor="#2563EB",
+                        color="#FFFFFF",
+                    ),
+                ),
+            ],
+            actions_alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+        )
+        
+        return settings_dialog
     
     def build_transcription_settings(self, provider: str):
-        """Build transcription settings UI based on provider"""
+        """Build transcription settings UI based on provider (panels are cached per provider)"""
+        panel = self._transcription_panels.get(provider)
+        if panel is not None:
+            self.transcription_settings_container.controls = list(panel)
+            if self.settings_dialog is not None:
+                self.page.update()
+            return
+        
         self.transcription_settings_container.controls.clear()
         
         if provider == "faster-whisper":
@@ -2209,6 +3173,32 @@ class PogadaneApp:
             )
             self.config_fields["FASTER_WHISPER_VAD_FILTER"] = vad_filter
             
+            cascade_enabled = ft.Checkbox(
+                label="Tryb kaskadowy (szkic małym modelem, poprawki modelem głównym)",
+                value=bool(getattr(self.config_module, "CASCADE_ENABLED", False)),
+            )
+            self.config_fields["CASCADE_ENABLED"] = cascade_enabled
+            
+            cascade_draft_model = ft.Dropdown(
+                label="Model Szkicu (tryb kaskadowy)",
+                value=getattr(self.config_module, "CASCADE_DRAFT_MODEL", "small"),
+                options=[
+                    ft.dropdown.Option("tiny", "Tiny - Najszybszy"),
+                    ft.dropdown.Option("base", "Base - Szybki"),
+                    ft.dropdown.Option("small", "Small - Zalecany"),
+                ],
+                border_radius=8,
+                filled=True,
+                text_size=13,
+            )
+            self.config_fields["CASCADE_DRAFT_MODEL"] = cascade_draft_model
+            
+            short_clip_batching = ft.Checkbox(
+                label="Wspólne partie dla krótkich nagrań (szybsze duże kolejki)",
+                value=bool(getattr(self.config_module, "SHORT_CLIP_BATCHING", False)),
+            )
+            self.config_fields["SHORT_CLIP_BATCHING"] = short_clip_batching
+            
             self.transcription_settings_container.controls = [
                 ft.Container(
                     content=ft.Column([
@@ -2221,6 +3211,12 @@ class PogadaneApp:
                         compute_type,
                         ft.Container(height=12),
                         vad_filter,
+                        ft.Container(height=8),
+                        cascade_enabled,
+                        ft.Container(height=8),
+                        cascade_draft_model,
+                        ft.Container(height=8),
+                        short_clip_batching,
                     ], spacing=0),
                     padding=16,
                     border=ft.border.all(1, "#FCD34D"),
@@ -2248,11 +3244,19 @@ class PogadaneApp:
                 )
             ]
         
-        if hasattr(self, 'settings_dialog'):
+        self._transcription_panels[provider] = list(self.transcription_settings_container.controls)
+        if self.settings_dialog is not None:
             self.page.update()
     
     def build_summary_settings(self, provider: str):
-        """Build summary settings UI based on provider"""
+        """Build summary settings UI based on provider (panels are cached per provider)"""
+        panel = self._summary_panels.get(provider)
+        if panel is not None:
+            self.summary_settings_container.controls = list(panel)
+            if self.settings_dialog is not None:
+                self.page.update()
+            return
+        
         self.summary_settings_container.controls.clear()
         
         if provider == "transformers":
@@ -2447,6 +3451,18 @@ class PogadaneApp:
             )
             self.config_fields["GGUF_N_GPU_LAYERS"] = gpu_layers
             
+            context_size = ft.TextField(
+                label="📏 Rozmiar kontekstu (tokeny)",
+                value=str(getattr(self.config_module, "GGUF_CONTEXT_SIZE", 4096)),
+                border_radius=8,
+                filled=True,
+                bgcolor=self.get_theme_color("#E0F2FE"),
+                text_size=13,
+                helper_text="Więcej = dłuższe transkrypcje w pytaniach o nagranie, ale więcej pamięci",
+                keyboard_type=ft.KeyboardType.NUMBER,
+            )
+            self.config_fields["GGUF_CONTEXT_SIZE"] = context_size
+            
             self.summary_settings_container.controls = [
                 ft.Container(
                     content=ft.Column([
@@ -2458,6 +3474,8 @@ class PogadaneApp:
                         gguf_path,
                         ft.Container(height=8),
                         gpu_layers,
+                        ft.Container(height=8),
+                        context_size,
                         ft.Container(height=12),
                         ft.Container(
                             content=ft.Column([
@@ -2487,31 +3505,19 @@ class PogadaneApp:
                 )
             ]
         
-        if hasattr(self, 'settings_dialog'):
+        self._summary_panels[provider] = list(self.summary_settings_container.controls)
+        if self.settings_dialog is not None:
             self.page.update()
     
-    def _create_dependency_check(self, name: str, command: str, icon, color: str):
+    def _create_dependency_check(self, name: str, icon, color: str, capability: Capability):
         """Create a dependency check row with status indicator"""
-        import subprocess
-        
-        # Check if dependency exists
-        try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            is_available = result.returncode == 0
-            version = result.stdout.split('\n')[0] if is_available else "Nie znaleziono"
-            status_color = "#10B981" if is_available else "#EF4444"
-            status_icon = ft.Icons.CHECK_CIRCLE_ROUNDED if is_available else ft.Icons.ERROR_ROUNDED
-        except Exception:
-            is_available = False
-            version = "Błąd sprawdzania"
+        is_available, version = capability.available, capability.version
+        if is_available is None:
             status_color = "#F59E0B"
             status_icon = ft.Icons.WARNING_ROUNDED
+        else:
+            status_color = "#10B981" if is_available else "#EF4444"
+            status_icon = ft.Icons.CHECK_CIRCLE_ROUNDED if is_available else ft.Icons.ERROR_ROUNDED
         
         return ft.Container(
             content=ft.Row([
@@ -2525,8 +3531,16 @@ class PogadaneApp:
             padding=8,
         )
     
-    def load_dependencies_check(self):
-        """Load and check all dependencies (called when user clicks the button)"""
+    async def load_dependencies_check(self, refresh: bool = False):
+        """Load and check all dependencies (called when user clicks the button)
+        
+        Results come from the shared capability registry: cached probes are
+        shown at once, missing ones run concurrently in worker threads, so
+        the dialog stays responsive while they finish.
+        
+        Args:
+            refresh: Probe again instead of using cached results
+        """
         # Show loading indicator
         self.dependencies_checks_container.controls = [
             ft.Container(
@@ -2540,30 +3554,31 @@ class PogadaneApp:
         ]
         self.page.update()
         
-        # Run actual checks after a brief moment to show loading state
-        import time
-        time.sleep(0.1)
+        checks = [
+            ("Python", "python", ft.Icons.CODE_ROUNDED, "#3B82F6"),
+            ("FFmpeg", "ffmpeg", ft.Icons.VIDEO_LIBRARY_ROUNDED, "#EC4899"),
+            ("yt-dlp", "yt-dlp", ft.Icons.DOWNLOAD_ROUNDED, "#EF4444"),
+            ("PyTorch", "torch", ft.Icons.MEMORY_ROUNDED, "#F97316"),
+            ("Transformers", "transformers", ft.Icons.AUTO_AWESOME_ROUNDED, "#8B5CF6"),
+            ("Faster-Whisper", "faster_whisper", ft.Icons.MIC_ROUNDED, "#06B6D4"),
+        ]
+        capabilities = await asyncio.to_thread(
+            get_capability_registry().probe_all, [key for _, key, _, _ in checks], refresh
+        )
         
         # Build the actual checks
-        self.dependencies_checks_container.controls = [
-            self._create_dependency_check("Python", "python --version", ft.Icons.CODE_ROUNDED, "#3B82F6"),
-            ft.Divider(height=1),
-            self._create_dependency_check("FFmpeg", "ffmpeg -version", ft.Icons.VIDEO_LIBRARY_ROUNDED, "#EC4899"),
-            ft.Divider(height=1),
-            self._create_dependency_check("yt-dlp", "yt-dlp --version", ft.Icons.DOWNLOAD_ROUNDED, "#EF4444"),
-            ft.Divider(height=1),
-            self._create_dependency_check("PyTorch", "python -c \"import torch; print(torch.__version__)\"", ft.Icons.MEMORY_ROUNDED, "#F97316"),
-            ft.Divider(height=1),
-            self._create_dependency_check("Transformers", "python -c \"import transformers; print(transformers.__version__)\"", ft.Icons.AUTO_AWESOME_ROUNDED, "#8B5CF6"),
-            ft.Divider(height=1),
-            self._create_dependency_check("Faster-Whisper", "python -c \"import faster_whisper; print(faster_whisper.__version__)\"", ft.Icons.MIC_ROUNDED, "#06B6D4"),
-        ]
+        rows = []
+        for name, key, icon, color in checks:
+            if rows:
+                rows.append(ft.Divider(height=1))
+            rows.append(self._create_dependency_check(name, icon, color, capabilities[key]))
+        self.dependencies_checks_container.controls = rows
         self.page.update()
         self.show_snackbar("✅ Sprawdzanie zakończone", success=True)
     
     def refresh_dependencies_check(self):
-        """Refresh the dependencies check status (reload the checks)"""
-        self.load_dependencies_check()
+        """Refresh the dependencies check status (probe everything again)"""
+        self.page.run_task(self.load_dependencies_check, True)
     
     def install_missing_dependencies(self):
         """Show instructions for installing missing dependencies"""
@@ -2628,7 +3643,7 @@ class PogadaneApp:
         """Reset all configuration to default values with confirmation"""
         
         # Create confirmation dialog
-        def confirm_reset(e):
+        async def confirm_reset(e):
             confirm_dialog.open = False
             self.page.update()
             
@@ -2664,9 +3679,8 @@ class PogadaneApp:
                 # Update the fields visually
                 self.page.update()
                 
-                # Small delay to show the animation
-                import time
-                time.sleep(0.3)
+                # Small delay to show the animation (without blocking the event loop)
+                await asyncio.sleep(0.3)
                 
                 # Close reset dialog
                 reset_dialog.open = False
@@ -2718,7 +3732,7 @@ class PogadaneApp:
         confirm_dialog.open = True
         self.page.update()
     
-    def save_config_from_dialog(self, dialog):
+    async def save_config_from_dialog(self, dialog):
         """Save configuration from dialog with loading animation and close it"""
         # Show saving indicator
         saving_dialog = ft.AlertDialog(
@@ -2740,17 +3754,19 @@ class PogadaneApp:
         self.page.update()
         
         try:
-            # Save configuration
-            self.save_config(None)
+            # Save configuration (file I/O runs in a worker thread)
+            saved = await self.save_config(None)
             
             # Small delay to show the saving animation
-            import time
-            time.sleep(0.3)
+            await asyncio.sleep(0.3)
             
             # Close saving dialog
             saving_dialog.open = False
             self.page.update()
             
+            if not saved:
+                return
+            
             # Close settings dialog
             self.close_dialog(dialog)
             
@@ -2781,6 +3797,9 @@ class PogadaneApp:
             if e and hasattr(e.control, 'icon'):
                 e.control.icon = ft.Icons.DARK_MODE_ROUNDED
         
+        # Cached settings panels use theme colors; rebuild them on next opening
+        self._discard_settings_dialog()
+        
         # Animate the transition
         self.page.update()
         self.refresh_theme_sensitive_elements()
@@ -2795,12 +3814,14 @@ class PogadaneApp:
         
         # Update text fields font sizes (only if they exist and are on the page)
         if self.console_output and hasattr(self.console_output, 'page') and self.console_output.page:
-            self.console_output.text_size = int(12 * self.current_font_scale)
+            for line in self.console_output.controls:
+                line.size = int(11 * self.current_font_scale)
             self.console_output.update()
         
-        if self.transcription_output and hasattr(self.transcription_output, 'page') and self.transcription_output.page:
-            self.transcription_output.text_size = int(12 * self.current_font_scale)
-            self.transcription_output.update()
+        if self.transcript_list and self.transcript_list.page:
+            for line in self.transcript_list.controls:
+                line.size = int(12 * self.current_font_scale)
+            self.transcript_list.update()
         
         # Note: Markdown control doesn't support text_size property, it uses its own styling
         # Font size for summary (Markdown) is handled by the Markdown renderer
@@ -2849,6 +3870,94 @@ class PogadaneApp:
             else:
                 self.show_snackbar("ℹ️ Wszystkie pliki są już w kolejce", warning=True)
     
+    def browse_folder(self, e):
+        """Browse for a folder to import recursively"""
+        folder_picker = ft.FilePicker(on_result=self.on_folder_selected)
+        self.page.overlay.append(folder_picker)
+        self.page.update()
+        
+        folder_picker.get_directory_path(dialog_title="Wybierz folder z nagraniami")
+    
+    def on_folder_selected(self, e: ft.FilePickerResultEvent):
+        """Scan the selected folder in the background"""
+        if not e.path:
+            return
+        
+        self.update_status(f"🔍 Skanowanie folderu {os.path.basename(e.path) or e.path}...")
+        threading.Thread(target=self._import_folder, args=(e.path,), daemon=True).start()
+    
+    def browse_source_list(self, e):
+        """Browse for a TXT/CSV list of URLs or file paths"""
+        file_picker = ft.FilePicker(on_result=self.on_source_list_selected)
+        self.page.overlay.append(file_picker)
+        self.page.update()
+        
+        file_picker.pick_files(
+            dialog_title="Wybierz listę adresów URL",
+            allowed_extensions=["txt", "csv"],
+            allow_multiple=False,
+        )
+    
+    def on_source_list_selected(self, e: ft.FilePickerResultEvent):
+        """Read the selected list in the background"""
+        if not e.files or not e.files[0].path:
+            return
+        
+        threading.Thread(target=self._import_source_list, args=(e.files[0].path,), daemon=True).start()
+    
+    def _import_folder(self, folder: str):
+        """Stream media files of a folder into the queue (runs in a worker thread)"""
+        dedupe = parse_bool(getattr(
+            self.config_module, "IMPORT_DEDUPE_CONTENT", DEFAULT_CONFIG["IMPORT_DEDUPE_CONTENT"]
+        ))
+        deduper = ContentDeduper() if dedupe else None
+        
+        files = iter_media_files(folder)
+        if deduper:
+            files = deduper.filter(files)
+        
+        counter = {"added": 0}
+        for chunk in iter_chunks(files, IMPORT_CHUNK_SIZE):
+            sources = [{"url": f.path, "size": f.size, "mtime": f.mtime} for f in chunk]
+            self.page.run_task(self._add_imported_sources, sources, counter)
+        
+        skipped = deduper.duplicates if deduper else 0
+        self.page.run_task(self._finish_import, counter, "plik(ów) z folderu", skipped)
+    
+    def _import_source_list(self, path: str):
+        """Add the sources of a TXT/CSV list to the queue (runs in a worker thread)"""
+        try:
+            sources = read_source_list(path)
+        except (OSError, UnicodeDecodeError) as ex:
+            logger.error(f"Failed to read source list {path}: {ex}")
+            self.page.run_task(self._report_import_error, f"Nie można odczytać listy: {ex}")
+            return
+        
+        counter = {"added": 0}
+        for chunk in iter_chunks(sources, IMPORT_CHUNK_SIZE):
+            self.page.run_task(self._add_imported_sources, chunk, counter)
+        self.page.run_task(self._finish_import, counter, "element(ów) z listy", 0)
+    
+    async def _add_imported_sources(self, sources: List[dict], counter: Dict[str, int]):
+        """Add one chunk of imported sources to the queue (UI loop)"""
+        counter["added"] += self.add_queue_entries_with_metadata(sources)
+    
+    async def _finish_import(self, counter: Dict[str, int], what: str, skipped: int):
+        """Report the result of a bulk import (UI loop)"""
+        added = counter["added"]
+        message = f"Dodano {added} {what}"
+        if skipped:
+            message += f" (pominięto duplikaty: {skipped})"
+        self.update_status(message)
+        if added:
+            self.show_snackbar(f"📁 {message}", success=True)
+        else:
+            self.show_snackbar("ℹ️ Nie znaleziono nowych elementów do dodania", warning=True)
+    
+    async def _report_import_error(self, message: str):
+        """Show an import error (UI loop)"""
+        self.show_snackbar(f"❌ {message}", error=True)
+    
     def browse_file(self, text_field: ft.TextField):
         """Browse for a single file"""
         file_picker = ft.FilePicker(
@@ -2870,27 +3979,33 @@ class PogadaneApp:
     
     def start_batch_processing(self, e):
         """Start real batch processing with backend integration"""
-        if not self.queue_items:
+        if not len(self.queue_model):
             self.show_snackbar("⚠️ Kolejka jest pusta", error=True)
             return
         
         # Build input sources with metadata (time ranges)
         input_sources = []
-        for item in self.queue_items:
+        self._job_entries = {}
+        for idx, entry in enumerate(self.queue_model):
+            job_id = uuid.uuid4().hex[:12]
+            self._job_entries[job_id] = (entry.id, idx)
             source_data = {
-                "value": item["value"],
-                "start_time": item.get("start_time"),
-                "end_time": item.get("end_time"),
+                "job_id": job_id,
+                "value": entry.value,
+                "start_time": entry.start_time,
+                "end_time": entry.end_time,
+                "profile": entry.profile,
             }
             input_sources.append(source_data)
         
         self.total_items = len(input_sources)
         self.completed_items = 0
         self.error_items = 0
+        self.job_progress = {source["job_id"]: 0.0 for source in input_sources}
         self._update_progress(0)
 
-        for idx in range(self.total_items):
-            self._set_queue_item_status(idx, FILE_STATUS_PENDING)
+        self.queue_model.reset_statuses(FILE_STATUS_PENDING)
+        self._render_queue()
         
         if self.status_icon:
             self.status_icon.color = "#2563EB"
@@ -2899,46 +4014,61 @@ class PogadaneApp:
         self.update_status("🚀 Rozpoczynam przetwarzanie...")
         self.show_snackbar("🚀 Rozpoczęto przetwarzanie", success=True)
         
-        # Start real backend processing in background thread
+        # Start real backend processing in background thread; its events
+        # are delivered to the page's event loop by self.events
         threading.Thread(
             target=self._execute_batch_processing_logic,
             args=(input_sources,),
             daemon=True
         ).start()
-        
-        # Start queue poller
-        threading.Thread(
-            target=self._poll_output_queue_for_batch,
-            daemon=True
-        ).start()
     
     def _execute_batch_processing_logic(self, input_sources):
         """Execute batch processing using native progress callbacks - no stdout capture"""
         
         # Initialize backend (will use the same ConfigManager singleton as GUI)
         backend = PogadaneBackend()
+        backend.log_store = self.log_store
+        backend.fingerprint_index = self.fingerprint_index
+        self._record_log(f"Rozpoczęto przetwarzanie: {len(input_sources)} pozycji w kolejce")
+        # Queue wait of a job: time from here to the start of its processing
+        batch_started = time.monotonic()
         
         # Set environment variables for better compatibility
         os.environ['TQDM_DISABLE'] = '1'  # Disable tqdm progress bars
         os.environ['HF_HUB_DISABLE_PROGRESS_BARS'] = '1'  # Disable HuggingFace progress bars
         
+        # Transcribe short files together in shared batches (SHORT_CLIP_BATCHING)
+        try:
+            backend.prepare_batch(
+                input_sources,
+                progress_callback=lambda update: self.events.publish(
+                    JobEvent.log(f"🎤 {update.message}\n")
+                )
+            )
+        except Exception as ex:
+            logger.error(f"Short-clip batching failed: {ex}", exc_info=True)
+        
         for i, source_data in enumerate(input_sources):
             # Extract source info (can be dict with metadata or just string for backward compat)
             if isinstance(source_data, dict):
                 input_src = source_data["value"]
                 start_time = source_data.get("start_time")
                 end_time = source_data.get("end_time")
+                profile = source_data.get("profile")
+                job_id = source_data.get("job_id") or str(i)
             else:
                 input_src = source_data
                 start_time = None
                 end_time = None
+                profile = None
+                job_id = str(i)
             
             # Update queue status to PROCESSING
-            self.output_queue.put(("update_status", str(i), FILE_STATUS_PROCESSING))
+            self.events.publish(JobEvent(EventKind.STATUS, job_id=job_id, status=FILE_STATUS_PROCESSING))
             
             try:
                 # Define progress callback for this file
-                def progress_callback(update: ProgressUpdate):
+                def progress_callback(update: ProgressUpdate, job_id=job_id):
                     """Handle progress updates from backend"""
                     # Map stages to icons
                     icon_map = {
@@ -2956,137 +4086,269 @@ class PogadaneApp:
                     # Format message with icon and progress
                     log_message = f"{icon} [{update.progress:.0%}] {update.message}\n"
                     
-                    # Send to console
-                    self.output_queue.put(("log", log_message, "", ""))
+                    # Every message goes to the console; progress events may be coalesced
+                    self.events.publish(JobEvent.log(log_message, job_id))
+                    self.events.publish(JobEvent.progress(job_id, update))
+                    
+                    # Report how much audio needed the large model in cascade mode
+                    info = (update.details or {}).get("transcription_info") or {}
+                    if update.stage == ProcessingStage.COMPLETED and info.get("cascade"):
+                        message = (f"🔀 Kaskada: duży model użyty dla {info['large_model_fraction']:.0%} nagrania "
+                                   f"(szkic: {info['draft_model']})")
+                        self._record_log(message, source=input_src, job_id=job_id)
+                        self.events.publish(JobEvent.log(message + "\n", job_id))
+                    if update.stage == ProcessingStage.COMPLETED and info.get("duplicate_of"):
+                        message = (f"♻️ Ten sam dźwięk co {info['duplicate_of']} "
+                                   f"(podobieństwo {info['duplicate_similarity']:.2f}) - użyto jego transkrypcji")
+                        self._record_log(message, source=input_src, job_id=job_id)
+                        self.events.publish(JobEvent.log(message + "\n", job_id))
+                    if update.stage == ProcessingStage.COMPLETED and info.get("model_load_seconds"):
+                        message = f"⏱️ Wczytanie modelu: {info['model_load_seconds']:.2f} s"
+                        self._record_log(message, source=input_src, job_id=job_id)
+                        self.events.publish(JobEvent.log(message + "\n", job_id))
                 
                 # Process file using backend with native callbacks
+                job_started = time.monotonic()
                 transcription, summary = backend.process_file(
                     input_src,
                     progress_callback=progress_callback,
                     start_time=start_time,
-                    end_time=end_time
+                    end_time=end_time,
+                    profile=profile,
+                    # Decoded segments are shown in the results tab while decoding runs
+                    segment_callback=lambda start, end, text, job_id=job_id, source=input_src: self.events.publish(
+                        JobEvent.segment(job_id, source, start, end, text)
+                    )
                 )
                 
+                metrics = backend.last_job_metrics
+                if metrics is not None:
+                    metrics.job_id = job_id
+                    metrics.queue_wait_seconds = job_started - batch_started
+                    self.metrics_history.append(metrics)
+                    self.events.publish(JobEvent(EventKind.METRICS, job_id=job_id, payload=metrics))
+                
                 # Check results
                 if transcription or summary:
-                    self.output_queue.put(("result", input_src, transcription or "", summary or ""))
-                    self.output_queue.put(("update_status", str(i), FILE_STATUS_COMPLETED))
+                    # Hand over the compact segment store instead of the rendered string when available
+                    transcription = backend.last_segments or transcription
+                    self._store_result(input_src, job_id, transcription, summary, backend.job_provenance(), metrics)
+                    self.events.publish(JobEvent(
+                        EventKind.RESULT,
+                        job_id=job_id,
+                        metrics=dict(backend.last_transcription_info),
+                        payload={
+                            "source": input_src,
+                            "transcription": transcription or "",
+                            "summary": summary or "",
+                        },
+                    ))
+                    self.events.publish(JobEvent(EventKind.STATUS, job_id=job_id, status=FILE_STATUS_COMPLETED))
                 else:
-                    self.output_queue.put(("error", f"⚠️ Nie znaleziono wyników dla: {input_src}", "", ""))
-                    self.output_queue.put(("update_status", str(i), FILE_STATUS_ERROR))
+                    message = f"⚠️ Nie znaleziono wyników dla: {input_src}"
+                    self._record_log(message, level="warning", source=input_src, job_id=job_id)
+                    self.events.publish(JobEvent(EventKind.ERROR, job_id=job_id, message=message))
+                    self.events.publish(JobEvent(EventKind.STATUS, job_id=job_id, status=FILE_STATUS_ERROR))
                     
             except Exception as ex:
                 logger.error(f"Error processing {input_src}: {ex}", exc_info=True)
-                self.output_queue.put(("error", f"❌ Błąd podczas przetwarzania {input_src}: {ex}", "", ""))
-                self.output_queue.put(("update_status", str(i), FILE_STATUS_ERROR))
+                message = f"❌ Błąd podczas przetwarzania {input_src}: {ex}"
+                self._record_log(message, level="error", source=input_src, job_id=job_id)
+                self.events.publish(JobEvent(EventKind.ERROR, job_id=job_id, message=message))
+                self.events.publish(JobEvent(EventKind.STATUS, job_id=job_id, status=FILE_STATUS_ERROR))
         
         # Signal completion
-        self.output_queue.put(("finished_all", "", "", ""))
+        self._record_log("Zakończono przetwarzanie kolejki")
+        self.events.publish(JobEvent(EventKind.FINISHED))
     
-    def _poll_output_queue_for_batch(self):
-        """Poll output queue and update UI (adapted for Flet)"""
-        while True:
+    def _store_result(self, source, job_id, transcription, summary, provenance, metrics):
+        """Save a finished job in the result store and the semantic index (worker thread)"""
+        if self.result_store is not None:
             try:
-                msg = self.output_queue.get(timeout=0.1)
-                msg_type = msg[0]
-                
-                if msg_type == "log":
-                    # Update console output
-                    data = msg[1]
-                    self.console_output.value += data
-                    self.console_output.update()
-                    
-                    # Extract percentage from console output and update progress bar
-                    # Format: 🔧 [0%] or 📄 [10%] or 🎤 [30%] etc.
-                    import re
-                    percentage_match = re.search(r'\[(\d+)%\]', data)
-                    if percentage_match:
-                        percentage = int(percentage_match.group(1))
-                        # Update progress bar to reflect percentage
-                        if self.progress_bar and hasattr(self.progress_bar, 'page') and self.progress_bar.page:
-                            # Calculate progress: base progress + current item's sub-progress
-                            if self.total_items > 0:
-                                # Each item contributes (1/total_items) to overall progress
-                                base_progress = self.completed_items / self.total_items
-                                current_item_progress = (percentage / 100) / self.total_items
-                                total_progress = base_progress + current_item_progress
-                                self.progress_bar.value = min(max(total_progress, 0), 1)
-                                self.progress_bar.update()
-                    
-                elif msg_type == "error":
-                    # Show error in console
-                    data = msg[1]
-                    self.console_output.value += f"\n❌ {data}\n"
-                    self.console_output.update()
-                    self.show_snackbar(f"❌ {data}", error=True)
-                    
-                elif msg_type == "update_status":
-                    # Update queue item status
-                    item_index = int(msg[1])
-                    status = msg[2]
-
-                    self._set_queue_item_status(item_index, status)
-
-                    if status == FILE_STATUS_PROCESSING:
-                        self._update_progress(
-                            self.completed_items,
-                            f"Postęp: Przetwarzanie {item_index + 1}/{self.total_items}",
-                        )
-                    elif status == FILE_STATUS_COMPLETED:
-                        self.completed_items += 1
-                        self._update_progress(self.completed_items)
-                    elif status == FILE_STATUS_ERROR:
-                        self.error_items += 1
-                        self.completed_items += 1
-                        self._update_progress(
-                            self.completed_items,
-                            f"Postęp: Błąd w pliku {item_index + 1}",
-                        )
-                        if self.status_icon:
-                            self.status_icon.color = "#DC2626"
-                            self.status_icon.update()
-                    
-                elif msg_type == "result":
-                    # Add result to results manager
-                    source = msg[1]
-                    transcription = msg[2]
-                    summary = msg[3]
-                    
-                    self.results_manager.add_result(source, transcription, summary)
-                    
-                    # Update file selector dropdown
-                    self.file_selector.options.append(
-                        ft.dropdown.Option(text=os.path.basename(source), key=source)
-                    )
-                    self.file_selector.update()
-                    
-                    self.show_snackbar(f"✅ Zakończono: {os.path.basename(source)}", success=True)
-                    
-                elif msg_type == "finished_all":
-                    # All processing complete
-                    self._update_progress(self.total_items, "Postęp: Zakończono wszystkie pliki")
-                    
-                    if self.status_icon:
-                        self.status_icon.color = "#34D399" if self.error_items == 0 else "#FBBF24"
-                        self.status_icon.update()
-                    
-                    if self.error_items:
-                        self.update_status(f"⚠️ Zakończono z błędami ({self.error_items})")
-                        self.show_snackbar("⚠️ Przetwarzanie zakończone z błędami", warning=True)
-                    else:
-                        self.update_status("✅ Przetwarzanie zakończone!")
-                        self.show_snackbar("✅ Przetwarzanie zakończone!", success=True)
-                    
-                    # Exit polling loop
-                    break
-                    
-            except queue.Empty:
-                # No messages, continue polling
-                continue
+                self.result_store.add(source, transcription or "", summary or "", job_id=job_id,
+                                      provenance=provenance, metrics=metrics)
+            except sqlite3.Error as ex:
+                logger.error(f"Cannot store result of {source}: {ex}")
+                self._record_log(f"⚠️ Nie zapisano wyniku w archiwum: {ex}", level="warning", source=source, job_id=job_id)
+        if self.semantic_index is not None:
+            if not isinstance(transcription, SegmentStore):
+                transcription = SegmentStore.from_text(transcription or "") or transcription or ""
+            try:
+                self.semantic_index.add(source, transcription)
+            except ImportError as ex:
+                # The embedding model cannot be loaded: stop trying for every job
+                self.semantic_index = None
+                self._record_log(f"⚠️ Wyszukiwanie po znaczeniu wyłączone (pip install sentence-transformers): {ex}",
+                                 level="warning", source=source, job_id=job_id)
             except Exception as ex:
-                # Log any polling errors
-                print(f"Error in queue poller: {ex}")
-                continue
+                logger.error(f"Cannot index {source} for semantic search: {ex}", exc_info=True)
+    
+    def _record_log(self, message: str, level: str = "info", **fields):
+        """Write a GUI message to the on-disk log (any thread; no-op without a log)"""
+        if self.log_store:
+            self.log_store.write(message, level=level, origin="gui", **fields)
+    
+    def _handle_events(self, events: List[JobEvent]):
+        """
+        Apply a delivered batch of job events on the page's event loop.
+        
+        Events only change in-memory state; the console and the progress
+        bar are sent to the client once per batch.
+        
+        Args:
+            events: Events in publication order
+        """
+        finished = False
+        for event in events:
+            try:
+                finished = self._apply_event(event) or finished
+            except Exception as ex:
+                logger.error(f"Error handling {event.kind.value} event: {ex}", exc_info=True)
+        
+        try:
+            self._flush_console()
+            self._flush_live_transcript()
+            self._refresh_job_progress()
+            if finished:
+                self._finish_batch()
+        except Exception as ex:
+            logger.error(f"Error updating UI: {ex}", exc_info=True)
+    
+    def _apply_event(self, event: JobEvent) -> bool:
+        """
+        Apply one job event.
+        
+        Args:
+            event: Event to apply
+            
+        Returns:
+            True when the batch has finished
+        """
+        if event.kind == EventKind.LOG:
+            # Console text is buffered; shown on the next flush
+            self.console_buffer.append(event.message)
+            
+        elif event.kind == EventKind.PROGRESS:
+            if event.job_id in self.job_progress and event.fraction is not None:
+                self.job_progress[event.job_id] = min(max(event.fraction, 0.0), 1.0)
+            
+        elif event.kind == EventKind.SEGMENT:
+            self._append_live_segment(event.job_id, event.payload)
+            
+        elif event.kind == EventKind.ERROR:
+            # Show error in console
+            self.console_buffer.append(f"\n❌ {event.message}\n")
+            self.show_snackbar(f"❌ {event.message}", error=True)
+            
+        elif event.kind == EventKind.STATUS:
+            # Update queue item status
+            entry_id, item_index = self._job_entries.get(event.job_id, (None, -1))
+            status = event.status
+
+            self._set_queue_entry_status(entry_id, status)
+            if status in (FILE_STATUS_COMPLETED, FILE_STATUS_ERROR):
+                self._end_live_transcript(event.job_id)
+
+            if status == FILE_STATUS_PROCESSING:
+                self._update_progress(
+                    self.completed_items,
+                    f"Postęp: Przetwarzanie {item_index + 1}/{self.total_items}",
+                )
+            elif status == FILE_STATUS_COMPLETED:
+                self.completed_items += 1
+                self.job_progress[event.job_id] = 1.0
+                self._update_progress(self.completed_items)
+            elif status == FILE_STATUS_ERROR:
+                self.error_items += 1
+                self.completed_items += 1
+                self.job_progress[event.job_id] = 1.0
+                self._update_progress(
+                    self.completed_items,
+                    f"Postęp: Błąd w pliku {item_index + 1}",
+                )
+                if self.status_icon:
+                    self.status_icon.color = "#DC2626"
+                    self.status_icon.update()
+            
+        elif event.kind == EventKind.RESULT:
+            # Add result to results manager
+            source = event.payload["source"]
+            
+            # The final transcript replaces the live one
+            self._live_segments.pop(source, None)
+            self.results_manager.add_result(
+                source, event.payload["transcription"], event.payload["summary"]
+            )
+            
+            # Update the results list (if the results tab was built)
+            if self.results_list:
+                self._results_sources = self._filtered_results()
+                self._render_results_list()
+                if source == self._selected_result and self.results_content.page:
+                    self.show_result(source, page=self._transcript_page)
+            
+            self.show_snackbar(f"✅ Zakończono: {os.path.basename(source)}", success=True)
+            
+        elif event.kind == EventKind.METRICS:
+            # The job is already in metrics_history; redraw the tab if it was built
+            self._refresh_performance_tab()
+            
+        elif event.kind == EventKind.FINISHED:
+            return True
+        
+        return False
+    
+    def _finish_batch(self):
+        """Show the final state after all queued items were processed."""
+        self._update_progress(self.total_items, "Postęp: Zakończono wszystkie pliki")
+        
+        if self.status_icon:
+            self.status_icon.color = "#34D399" if self.error_items == 0 else "#FBBF24"
+            self.status_icon.update()
+        
+        if self.error_items:
+            self.update_status(f"⚠️ Zakończono z błędami ({self.error_items})")
+            self.show_snackbar("⚠️ Przetwarzanie zakończone z błędami", warning=True)
+        else:
+            self.update_status("✅ Przetwarzanie zakończone!")
+            self.show_snackbar("✅ Przetwarzanie zakończone!", success=True)
+    
+    def _refresh_job_progress(self):
+        """Show the combined progress of all jobs on the progress bar."""
+        if self.progress_bar and hasattr(self.progress_bar, 'page') and self.progress_bar.page:
+            if self.total_items > 0:
+                # Each job contributes (1/total_items) to overall progress
+                total_progress = sum(self.job_progress.values()) / self.total_items
+                self.progress_bar.value = min(max(total_progress, 0), 1)
+                self.progress_bar.update()
+    
+    def _console_line(self, line: str) -> ft.Text:
+        """Create the control for one console line."""
+        return ft.Text(
+            line,
+            size=int(11 * self.current_font_scale),
+            color=self.console_text_color,
+            selectable=True,
+        )
+    
+    def _flush_console(self):
+        """
+        Send buffered console lines to the client in one update.
+        
+        Only the new lines are added and lines that left the ring buffer are
+        removed, so the update size does not grow with the console length.
+        """
+        if not self.console_buffer.has_pending:
+            return
+        new_lines, removed = self.console_buffer.drain()
+        if not self.console_output:
+            return
+        controls = self.console_output.controls
+        if removed:
+            del controls[:removed]
+        controls.extend(self._console_line(line) for line in new_lines)
+        if hasattr(self.console_output, 'page') and self.console_output.page:
+            self.console_output.update()
 
     
     def save_console_log(self, e):
@@ -3101,7 +4363,7 @@ class PogadaneApp:
             allowed_extensions=["txt"],
         )
     
-    def on_save_log(self, e: ft.FilePickerResultEvent):
+    async def on_save_log(self, e: ft.FilePickerResultEvent):
         """Handle log save with animated feedback"""
         if e.path:
             # Show saving animation
@@ -3117,12 +4379,17 @@ class PogadaneApp:
             self.page.update()
             
             try:
-                with open(e.path, 'w', encoding='utf-8') as f:
-                    f.write(self.console_output.value or "")
+                # The file is copied/written in a worker thread: the on-disk
+                # log since the session start (or the last clear), otherwise
+                # the spilled and in-memory console lines
+                if self.log_store:
+                    await asyncio.to_thread(self.log_store.copy_text, Path(e.path), self._log_mark)
+                else:
+                    snapshot = self.console_buffer.snapshot()
+                    await asyncio.to_thread(ConsoleBuffer.write_snapshot, snapshot, Path(e.path))
                 
                 # Close saving animation
-                import time
-                time.sleep(0.3)
+                await asyncio.sleep(0.3)
                 saving_snackbar.open = False
                 self.page.update()
                 
@@ -3133,18 +4400,20 @@ class PogadaneApp:
                 self.page.update()
                 self.show_snackbar(f"❌ Błąd zapisu: {str(ex)}", error=True)
     
-    def clear_console(self, e):
+    async def clear_console(self, e):
         """Clear console output with animation"""
         # Fade out animation
-        if self.console_output.value:
+        if self.console_buffer.total_lines:
             self.console_output.opacity = 0.3
             self.console_output.update()
             
-            import time
-            time.sleep(0.2)
+            await asyncio.sleep(0.2)
             
-            # Clear content
-            self.console_output.value = ""
+            # Clear content; a later "save log" starts here
+            self.console_buffer.clear()
+            if self.log_store:
+                self._log_mark = await asyncio.to_thread(self.log_store.mark)
+            self.console_output.controls.clear()
             
             # Fade back in
             self.console_output.opacity = 1.0
@@ -3155,25 +4424,51 @@ class PogadaneApp:
         else:
             self.show_snackbar("ℹ️ Konsola jest już pusta", success=True)
     
-    def display_selected_result(self, e):
-        """Display selected file results in card-based layout"""
-        if not self.file_selector.value:
-            return
+    def show_result(self, source: Optional[str], page: Optional[int] = None):
+        """Display the results of a source in card-based layout
         
-        # Get the selected file's source key
-        source = self.file_selector.value
+        Args:
+            source: Result to show
+            page: Transcript page (default: the first one, or the last one
+                of a transcript that is still being decoded)
+        """
+        if not source or not self.results_list:
+            return
         
-        # Retrieve results from manager
-        result = self.results_manager.get_result(source)
+        # Retrieve results from manager (results of earlier sessions from the result store)
+        found = self.results_manager.has_result(source)
+        if not found and self.result_store is not None:
+            stored = self.result_store.get(source)
+            if stored:
+                self.results_manager.add_result(source, stored["transcription"], stored["summary"])
+                found = True
         
-        if result:
-            # Update transcription
-            transcription_text = result.get("transcription", "")
-            self.transcription_output.value = transcription_text if transcription_text else "⚠️ Brak transkrypcji."
+        if found:
+            previous = self._selected_result
+            live = source in self._live_segments
+            self._selected_result = source
+            self._transcript_pager = TranscriptPager.from_results(self.results_manager, source)
+            self._transcript_matches = []
+            self._transcript_match_index = -1
+            self.transcript_search_field.value = ""
+            self.transcript_jump_field.value = ""
+            self.transcript_match_text.value = ""
+            if page is None:
+                page = self._transcript_pager.page_count - 1 if live else 0
+            self._show_transcript_page(page, update=False)
             
             # Update summary
-            summary_text = result.get("summary", "")
-            self.summary_output.value = summary_text if summary_text else "⚠️ Brak podsumowania."
+            summary_text = self.results_manager.get_summary(source)
+            if summary_text:
+                self.summary_output.value = summary_text
+            elif live:
+                self.summary_output.value = (
+                    "⏳ Transkrypcja w toku — podsumowanie powstanie po jej zakończeniu.\n\n"
+                    "Możesz już teraz wygenerować podsumowanie częściowe z dotychczasowego tekstu."
+                )
+            else:
+                self.summary_output.value = "⚠️ Brak podsumowania."
+            self.partial_summary_button.visible = live
             
             # Show cards, hide empty state
             self.results_empty_state.visible = False
@@ -3193,15 +4488,217 @@ class PogadaneApp:
             ]
             
             self.results_content.update()
+            if previous != source:
+                self._render_results_list()
             self.update_status(f"📄 Wyświetlanie: {os.path.basename(source)}")
         else:
             # Show empty state if no results
+            self._selected_result = None
+            self._transcript_pager = None
             self.results_empty_state.visible = True
             self.transcription_card.visible = False
             self.summary_card.visible = False
             self.results_content.controls = [self.results_empty_state]
             self.results_content.update()
     
+    def _show_transcript_page(self, page: int, highlight: Optional[int] = None, update: bool = True):
+        """Render one page of transcript lines
+        
+        Args:
+            page: Page number (clamped to the valid range)
+            highlight: Line index to highlight and scroll to
+            update: Send the changes to the page
+        """
+        pager = self._transcript_pager
+        if pager is None:
+            return
+        
+        page = min(max(page, 0), pager.page_count - 1)
+        self._transcript_page = page
+        first, _ = pager.page_range(page)
+        lines = pager.page_lines(page)
+        text_size = int(12 * self.current_font_scale)
+        highlight_color = self.get_theme_color("#FEF3C7", "#78350F")
+        
+        if lines:
+            self.transcript_list.controls = [
+                self._transcript_line(
+                    first + offset, line, text_size,
+                    highlight_color if first + offset == highlight else None,
+                )
+                for offset, line in enumerate(lines)
+            ]
+        else:
+            self.transcript_list.controls = [ft.Text("⚠️ Brak transkrypcji.", size=text_size)]
+        self._transcript_shown_stop = first + len(lines)
+        self._transcript_follow = page >= pager.page_count - 1
+        
+        self._update_transcript_navigation()
+        self.transcript_jump_field.disabled = not pager.has_timestamps
+        
+        if update:
+            self.transcription_card.update()
+            if highlight is not None:
+                self.transcript_list.scroll_to(key=f"line-{highlight}", duration=200)
+            else:
+                self.transcript_list.scroll_to(offset=0)
+    
+    def _transcript_line(self, index: int, line: str, text_size: int, bgcolor: Optional[str] = None) -> ft.Text:
+        """Create the control for one transcript line"""
+        return ft.Text(line, size=text_size, selectable=True, key=f"line-{index}", bgcolor=bgcolor)
+    
+    def _update_transcript_navigation(self):
+        """Show the page number and enable the page buttons (no UI update)"""
+        pager = self._transcript_pager
+        page = self._transcript_page
+        self.transcript_page_text.value = f"Strona {page + 1} / {pager.page_count}  ·  {len(pager)} linii"
+        self.transcript_prev_button.disabled = page == 0
+        self.transcript_next_button.disabled = page >= pager.page_count - 1
+    
+    def _append_live_segment(self, job_id: str, segment: dict):
+        """Add a segment decoded by a running job to its live transcript"""
+        source = segment["source"]
+        store = self._live_segments.get(source)
+        if store is None:
+            # First segment of the job: list the transcript among the results while it grows
+            store = self._live_segments[source] = SegmentStore()
+            self._live_jobs[job_id] = source
+            self.results_manager.add_result(source, store, "", status="live", pinned=True)
+            self._live_list_dirty = True
+        store.append(segment["start"], segment["end"], segment["text"])
+        if source == self._selected_result:
+            self._live_dirty = True
+    
+    def _end_live_transcript(self, job_id: str):
+        """Stop treating the transcript of a finished job as live
+        
+        A failed job keeps the part decoded so far among the results.
+        """
+        source = self._live_jobs.pop(job_id, None)
+        if source is None or self._live_segments.pop(source, None) is None:
+            return
+        self.results_manager.unpin(source, status="error")
+        if self.results_list:
+            self._render_results_list()
+            if source == self._selected_result and self.results_content.page:
+                self.show_result(source, page=self._transcript_page)
+    
+    def _flush_live_transcript(self):
+        """
+        Show the segments decoded since the last delivery.
+        
+        Only the new lines are added to the page being shown; when it is the
+        last page and fills up, the viewer moves on to the next page.
+        """
+        if self._live_list_dirty:
+            self._live_list_dirty = False
+            if self.results_list:
+                self._results_sources = self._filtered_results()
+                self._render_results_list()
+        if not self._live_dirty:
+            return
+        self._live_dirty = False
+        pager = self._transcript_pager
+        if pager is None or not self.transcript_list or not self.transcript_list.page:
+            return
+        
+        if self._transcript_follow and self._transcript_page < pager.page_count - 1:
+            self._show_transcript_page(pager.page_count - 1)
+            self.transcript_list.scroll_to(offset=-1)
+            return
+        first, stop = pager.page_range(self._transcript_page)
+        shown = self._transcript_shown_stop
+        if stop > shown:
+            if shown == first:
+                self.transcript_list.controls.clear()  # "no transcript" placeholder
+            text_size = int(12 * self.current_font_scale)
+            self.transcript_list.controls.extend(
+                self._transcript_line(index, pager.line(index), text_size) for index in range(shown, stop)
+            )
+            self._transcript_shown_stop = stop
+        self._update_transcript_navigation()
+        self.transcription_card.update()
+        if self._transcript_follow:
+            self.transcript_list.scroll_to(offset=-1)
+    
+    async def summarize_partial(self, e):
+        """Summarize the part of a running transcription decoded so far"""
+        source = self._selected_result
+        store = self._live_segments.get(source)
+        if not store:
+            self.show_snackbar("ℹ️ Brak zdekodowanego tekstu do podsumowania", warning=True)
+            return
+        
+        # Snapshot taken on the event loop; decoding continues meanwhile
+        text = store.to_text()
+        decoded_until = format_timestamp(store.end(len(store) - 1))
+        self.partial_summary_button.disabled = True
+        self.summary_output.value = f"⏳ Generowanie podsumowania częściowego (do {decoded_until})..."
+        self.summary_card.update()
+        try:
+            summary = await asyncio.to_thread(self._summarize_partial, text, source)
+        except Exception as ex:
+            logger.error(f"Partial summary failed: {ex}", exc_info=True)
+            summary = None
+        self.partial_summary_button.disabled = False
+        
+        # The final result may have arrived meanwhile; it is not replaced
+        if source not in self._live_segments:
+            if self.summary_card.page:
+                self.summary_card.update()
+            return
+        if summary:
+            summary = f"**Podsumowanie częściowe** (do {decoded_until})\n\n{summary}"
+            self.results_manager.add_result(source, store, summary, status="live", pinned=True)
+        if source == self._selected_result:
+            self.summary_output.value = summary or "❌ Nie udało się wygenerować podsumowania częściowego."
+            self.summary_card.update()
+    
+    def _summarize_partial(self, text: str, source: str) -> Optional[str]:
+        """Summarize a transcript fragment with the configured LLM (worker thread)"""
+        backend = PogadaneBackend()
+        backend.log_store = self.log_store
+        return backend.summarize_text(text, os.path.basename(source) or source)
+    
+    def _show_transcript_line(self, line: int):
+        """Show the page containing a line and highlight it"""
+        self._show_transcript_page(self._transcript_pager.page_of(line), highlight=line)
+    
+    def _on_transcript_search(self, e):
+        """Search the transcript and show the first match"""
+        if self._transcript_pager is None:
+            return
+        query = self.transcript_search_field.value or ""
+        self._transcript_matches = self._transcript_pager.search(query)
+        self._transcript_match_index = -1
+        if not self._transcript_matches:
+            self.transcript_match_text.value = "Brak wyników" if query.strip() else ""
+            self.transcript_match_text.update()
+            return
+        self._step_transcript_match(1)
+    
+    def _step_transcript_match(self, step: int):
+        """Go to the next (step=1) or previous (step=-1) search match"""
+        if not self._transcript_matches:
+            return
+        self._transcript_match_index = (self._transcript_match_index + step) % len(self._transcript_matches)
+        self.transcript_match_text.value = f"{self._transcript_match_index + 1} / {len(self._transcript_matches)}"
+        self._show_transcript_line(self._transcript_matches[self._transcript_match_index])
+    
+    def _on_transcript_jump(self, e):
+        """Show the transcript line playing at the entered time"""
+        if self._transcript_pager is None:
+            return
+        seconds = parse_timestamp(self.transcript_jump_field.value or "")
+        if seconds is None:
+            self.show_snackbar("⚠️ Podaj czas w formacie mm:ss lub hh:mm:ss", warning=True)
+            return
+        line = self._transcript_pager.line_at_time(seconds)
+        if line is None:
+            self.show_snackbar("⚠️ Ta transkrypcja nie ma znaczników czasu", warning=True)
+            return
+        self._show_transcript_line(line)
+    
     def copy_to_clipboard(self, text: str, content_type: str):
         """Copy text to clipboard with feedback"""
         if not text or text.startswith("⚠️"):
@@ -3214,15 +4711,16 @@ class PogadaneApp:
         except Exception as ex:
             self.show_snackbar(f"❌ Błąd kopiowania: {str(ex)}", error=True)
     
-    def save_config(self, e):
-        """Save configuration to file - preserves comments and structure"""
+    async def save_config(self, e) -> bool:
+        """Save configuration to file - preserves comments and structure
+        
+        Field values are read on the event loop; rewriting and reloading
+        config.py runs in a worker thread.
+        
+        Returns:
+            True if the configuration was saved
+        """
         try:
-            config_path = self.config_manager.config_path
-            
-            # Read existing config file to preserve comments and structure
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_lines = f.readlines()
-            
             # Build a mapping of values to update
             updates = {}
             for key, field in self.config_fields.items():
@@ -3232,7 +4730,7 @@ class PogadaneApp:
                     value = field.value
                     
                     # Special type conversions for known integer fields
-                    if key in ["FASTER_WHISPER_BATCH_SIZE", "GGUF_N_GPU_LAYERS"]:
+                    if key in ["FASTER_WHISPER_BATCH_SIZE", "GGUF_N_GPU_LAYERS", "GGUF_CONTEXT_SIZE"]:
                         try:
                             value = int(value) if value else 0
                         except (ValueError, TypeError):
@@ -3241,63 +4739,80 @@ class PogadaneApp:
                     
                     updates[key] = value
             
-            # Update lines in place, preserving comments and structure
-            new_lines = []
-            for line in config_lines:
-                stripped = line.strip()
-                
-                # Skip empty lines and comments
-                if not stripped or stripped.startswith('#'):
-                    new_lines.append(line)
-                    continue
-                
-                # Check if this line is a config assignment
-                if '=' in line:
-                    # Extract the variable name (before =)
-                    var_name = line.split('=')[0].strip()
-                    
-                    # If this variable is in our updates, replace it
-                    if var_name in updates:
-                        value = updates[var_name]
-                        
-                        # Preserve inline comments if they exist
-                        inline_comment = ""
-                        if '#' in line:
-                            comment_start = line.index('#')
-                            inline_comment = " " + line[comment_start:]
-                        
-                        # Format the new value
-                        if isinstance(value, bool):
-                            new_line = f"{var_name} = {value}{inline_comment}"
-                        elif isinstance(value, str):
-                            new_line = f'{var_name} = "{value}"{inline_comment}'
-                        elif isinstance(value, (int, float)):
-                            new_line = f"{var_name} = {value}{inline_comment}"
-                        else:
-                            new_line = f'{var_name} = "{value}"{inline_comment}'
-                        
-                        new_lines.append(new_line if new_line.endswith('\n') else new_line + '\n')
-                    else:
-                        # Keep the line as-is if not in our updates
-                        new_lines.append(line)
-                else:
-                    # Keep non-assignment lines as-is
-                    new_lines.append(line)
-            
-            # Write updated config back to file
-            with open(config_path, 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
-            
-            # Reload config
-            self.config_manager.reload()
+            await asyncio.to_thread(self._write_config_file, updates)
             self.config_module = self.config_manager.config
             
+            # New default profile applies to items added from now on
+            if getattr(self, "job_profile_dropdown", None) and "TRANSCRIPTION_PROFILE" in updates:
+                self.job_profile_dropdown.value = updates["TRANSCRIPTION_PROFILE"]
+                self.job_profile_dropdown.update()
+            
             self.show_snackbar("Konfiguracja zapisana pomyślnie!", success=True)
             self.update_status("Konfiguracja zapisana")
         except Exception as ex:
             self.show_snackbar(f"Błąd zapisu konfiguracji: {str(ex)}", error=True)
             import traceback
             traceback.print_exc()
+            return False
+        return True
+    
+    def _write_config_file(self, updates: Dict[str, object]):
+        """Write updated values into config.py and reload it (runs in a worker thread)"""
+        config_path = self.config_manager.config_path
+        
+        # Read existing config file to preserve comments and structure
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config_lines = f.readlines()
+        
+        # Update lines in place, preserving comments and structure
+        new_lines = []
+        for line in config_lines:
+            stripped = line.strip()
+            
+            # Skip empty lines and comments
+            if not stripped or stripped.startswith('#'):
+                new_lines.append(line)
+                continue
+            
+            # Check if this line is a config assignment
+            if '=' in line:
+                # Extract the variable name (before =)
+                var_name = line.split('=')[0].strip()
+                
+                # If this variable is in our updates, replace it
+                if var_name in updates:
+                    value = updates[var_name]
+                    
+                    # Preserve inline comments if they exist
+                    inline_comment = ""
+                    if '#' in line:
+                        comment_start = line.index('#')
+                        inline_comment = " " + line[comment_start:]
+                    
+                    # Format the new value
+                    if isinstance(value, bool):
+                        new_line = f"{var_name} = {value}{inline_comment}"
+                    elif isinstance(value, str):
+                        new_line = f'{var_name} = "{value}"{inline_comment}'
+                    elif isinstance(value, (int, float)):
+                        new_line = f"{var_name} = {value}{inline_comment}"
+                    else:
+                        new_line = f'{var_name} = "{value}"{inline_comment}'
+                    
+                    new_lines.append(new_line if new_line.endswith('\n') else new_line + '\n')
+                else:
+                    # Keep the line as-is if not in our updates
+                    new_lines.append(line)
+            else:
+                # Keep non-assignment lines as-is
+                new_lines.append(line)
+        
+        # Write updated config back to file
+        with open(config_path, 'w', encoding='utf-8') as f:
+            f.writelines(new_lines)
+        
+        # Reload config
+        self.config_manager.reload()
     
     def update_status(self, message: str):
         """Update status bar message"""
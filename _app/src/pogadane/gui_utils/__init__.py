@@ -3,8 +3,16 @@ GUI utility modules for Pogadane application.
 
 This package contains helper classes for GUI components:
 - ResultsManager: Processed results storage and management
+- ConsoleBuffer: Bounded console line buffer with disk spill
+- QueueModel: Processing queue entries indexed by id and value
+- UiWatchdog: Logs handlers that block the GUI event loop
+- TranscriptPager: Paged transcript lines with time lookup and search
 """
 
 from .results_manager import ResultsManager
+from .console_buffer import ConsoleBuffer
+from .queue_model import QueueModel, QueueEntry
+from .ui_watchdog import UiWatchdog
+from .transcript_view import TranscriptPager
 
-__all__ = ["ResultsManager"]
+__all__ = ["ResultsManager", "ConsoleBuffer", "QueueModel", "QueueEntry", "UiWatchdog", "TranscriptPager"]
@@ -0,0 +1,188 @@
+"""
+ConsoleBuffer - Bounded line buffer for the GUI console.
+
+Keeps only the most recent lines in memory (a ring); older lines are
+appended to a spill file on disk so the full log can still be saved, or
+dropped when the application keeps its own on-disk log (see LogStore).
+New lines are collected until the GUI flushes them, which lets the poller
+drain many messages and update the UI once per frame.
+"""
+
+import os
+import tempfile
+from collections import deque
+from pathlib import Path
+from typing import Deque, List, NamedTuple, Optional, Tuple
+
+
+class ConsoleSnapshot(NamedTuple):
+    """Console content at one point in time (see ConsoleBuffer.snapshot)."""
+    spill_path: Optional[Path]
+    spill_size: int  # bytes of the spill file that belong to the snapshot
+    lines: List[str]
+
+
+class ConsoleBuffer:
+    """
+    Ring buffer of console lines with disk spill and pending-line tracking.
+
+    Attributes:
+        max_lines (int): Number of lines kept in memory
+        total_lines (int): Number of lines appended since the last clear
+    """
+
+    def __init__(self, max_lines: int = 2000, spill_dir: Optional[Path] = None, spill: bool = True):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            max_lines: Number of lines kept in memory (and shown in the console)
+            spill_dir: Directory for the spill file (defaults to the system temp dir)
+            spill: Write evicted lines to the spill file (False drops them)
+        """
+        self.max_lines = max_lines
+        self.spill_dir = spill_dir
+        self.spill = spill
+        self.total_lines = 0
+        self._lines: Deque[str] = deque()
+        self._pending: List[str] = []
+        self._evicted_since_flush = 0
+        self._spill_path: Optional[Path] = None
+        self._spill_file = None
+
+    def append(self, text: str) -> int:
+        """
+        Add console text (one message, possibly several lines).
+
+        Args:
+            text: Message text; a trailing newline does not add an empty line
+
+        Returns:
+            Number of lines added
+        """
+        lines = text.split("\n")
+        if len(lines) > 1 and lines[-1] == "":
+            lines.pop()
+        for line in lines:
+            if len(self._lines) >= self.max_lines:
+                self._spill(self._lines.popleft())
+                self._evicted_since_flush += 1
+            self._lines.append(line)
+            self._pending.append(line)
+        self.total_lines += len(lines)
+        return len(lines)
+
+    def drain(self) -> Tuple[List[str], int]:
+        """
+        Take the lines added since the last drain.
+
+        Returns:
+            Tuple of (new lines still in the ring, number of lines to remove
+            from the front of the displayed list)
+        """
+        pending = self._pending[-self.max_lines:]
+        # Lines that were added and evicted before ever being shown are not removed twice
+        shown_evicted = self._evicted_since_flush - (len(self._pending) - len(pending))
+        self._pending = []
+        self._evicted_since_flush = 0
+        return pending, shown_evicted
+
+    @property
+    def has_pending(self) -> bool:
+        """True if lines were added since the last drain."""
+        return bool(self._pending)
+
+    def lines(self) -> List[str]:
+        """Lines currently held in memory."""
+        return list(self._lines)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    @property
+    def spilled_lines(self) -> int:
+        """Number of lines moved to the spill file."""
+        return self.total_lines - len(self._lines)
+
+    def _spill(self, line: str):
+        """Append an evicted line to the spill file."""
+        if not self.spill:
+            return
+        if self._spill_file is None:
+            fd, path = tempfile.mkstemp(prefix="pogadane_console_", suffix=".log",
+                                        dir=str(self.spill_dir) if self.spill_dir else None)
+            self._spill_path = Path(path)
+            self._spill_file = os.fdopen(fd, "w", encoding="utf-8")
+        self._spill_file.write(line + "\n")
+
+    def snapshot(self) -> ConsoleSnapshot:
+        """
+        Capture the complete log cheaply, for writing it outside the GUI thread.
+
+        Returns:
+            ConsoleSnapshot for write_snapshot()
+        """
+        spill_size = 0
+        if self._spill_file is not None:
+            self._spill_file.flush()
+            spill_size = self._spill_file.tell()
+        return ConsoleSnapshot(self._spill_path, spill_size, list(self._lines))
+
+    @staticmethod
+    def write_snapshot(snapshot: ConsoleSnapshot, path: Path) -> None:
+        """
+        Write a snapshot (spilled and in-memory lines) to a file.
+
+        Only reads the spill file, so it can run in a worker thread while
+        new lines are appended.
+
+        Args:
+            snapshot: Result of snapshot()
+            path: Destination file
+        """
+        # Binary copy of the spill file (written in text mode, so it already
+        # uses the platform line separator); in-memory lines are encoded alike
+        with open(path, "wb") as out:
+            if snapshot.spill_path is not None:
+                with open(snapshot.spill_path, "rb") as spilled:
+                    remaining = snapshot.spill_size
+                    while remaining > 0:
+                        chunk = spilled.read(min(remaining, 1 << 20))
+                        if not chunk:
+                            break
+                        out.write(chunk)
+                        remaining -= len(chunk)
+            for line in snapshot.lines:
+                out.write((line + os.linesep).encode("utf-8"))
+
+    def save(self, path: Path) -> None:
+        """
+        Write the complete log (spilled and in-memory lines) to a file.
+
+        Args:
+            path: Destination file
+        """
+        self.write_snapshot(self.snapshot(), path)
+
+    def text(self) -> str:
+        """In-memory lines joined as text."""
+        return "\n".join(self._lines)
+
+    def clear(self) -> None:
+        """Remove all lines and delete the spill file."""
+        self._lines.clear()
+        self._pending = []
+        self._evicted_since_flush = 0
+        self.total_lines = 0
+        self.close()
+
+    def close(self) -> None:
+        """Close and delete the spill file."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+            try:
+                self._spill_path.unlink()
+            except OSError:
+                pass
+            self._spill_path = None
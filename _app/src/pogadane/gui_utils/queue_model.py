@@ -0,0 +1,218 @@
+"""
+QueueModel - Processing queue data, separate from its on-screen rows.
+
+Entries are plain slotted objects indexed by id and by value, so adding,
+finding, removing and updating the status of an entry does not touch any
+UI control. The GUI renders only the visible slice of the model.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from ..constants import FILE_STATUS_PENDING
+
+
+@dataclass
+class QueueEntry:
+    """
+    One item of the processing queue.
+
+    Attributes:
+        id: Unique, stable identifier
+        value: File path or URL (unique within the queue)
+        display_name: Short name shown in the queue
+        is_url: True for URLs
+        status: One of the FILE_STATUS_* values
+        start_time: Optional download start (URLs)
+        end_time: Optional download end (URLs)
+        profile: Transcription profile for this item
+        size: File size in bytes, if known
+        mtime: File modification time, if known
+    """
+    __slots__ = ("id", "value", "display_name", "is_url", "status",
+                 "start_time", "end_time", "profile", "size", "mtime")
+
+    id: int
+    value: str
+    display_name: str
+    is_url: bool
+    status: str
+    start_time: Optional[str]
+    end_time: Optional[str]
+    profile: Optional[str]
+    size: Optional[int]
+    mtime: Optional[float]
+
+
+def make_display_name(value: str, start_time: Optional[str] = None,
+                      end_time: Optional[str] = None) -> str:
+    """
+    Name shown for a queue value.
+
+    Args:
+        value: File path or URL
+        start_time: Optional start of the time range (URLs)
+        end_time: Optional end of the time range (URLs)
+
+    Returns:
+        File name for paths; the URL with its time range for URLs
+    """
+    if value.lower().startswith("http"):
+        if start_time or end_time:
+            return f"{value} [{start_time or '0:00'} - {end_time or 'koniec'}]"
+        return value
+    return os.path.basename(value) or value
+
+
+class QueueModel:
+    """
+    Ordered processing queue with O(1) lookup by id and value.
+
+    Attributes:
+        version (int): Incremented on every change of order or content
+    """
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self._entries: Dict[int, QueueEntry] = {}
+        self._by_value: Dict[str, int] = {}
+        self._order: List[int] = []
+        self._next_id = 1
+        self.version = 0
+
+    def add(self, value: str, start_time: Optional[str] = None, end_time: Optional[str] = None,
+            profile: Optional[str] = None, size: Optional[int] = None,
+            mtime: Optional[float] = None) -> Optional[QueueEntry]:
+        """
+        Append an entry unless its value is already queued.
+
+        Args:
+            value: File path or URL
+            start_time: Optional start of the time range (URLs)
+            end_time: Optional end of the time range (URLs)
+            profile: Transcription profile
+            size: File size in bytes, if known
+            mtime: File modification time, if known
+
+        Returns:
+            The new QueueEntry, or None for empty or duplicate values
+        """
+        value = (value or "").strip()
+        if not value or value in self._by_value:
+            return None
+        entry = QueueEntry(
+            id=self._next_id,
+            value=value,
+            display_name=make_display_name(value, start_time, end_time),
+            is_url=value.lower().startswith("http"),
+            status=FILE_STATUS_PENDING,
+            start_time=start_time,
+            end_time=end_time,
+            profile=profile,
+            size=size,
+            mtime=mtime,
+        )
+        self._next_id += 1
+        self._entries[entry.id] = entry
+        self._by_value[value] = entry.id
+        self._order.append(entry.id)
+        self.version += 1
+        return entry
+
+    def add_many(self, values: Iterable[str], profile: Optional[str] = None) -> List[QueueEntry]:
+        """
+        Append many values at once.
+
+        Args:
+            values: File paths or URLs
+            profile: Transcription profile for all of them
+
+        Returns:
+            Entries that were added (duplicates are skipped)
+        """
+        added = []
+        for value in values:
+            entry = self.add(value, profile=profile)
+            if entry is not None:
+                added.append(entry)
+        return added
+
+    def remove(self, value: str) -> Optional[QueueEntry]:
+        """
+        Remove an entry by value.
+
+        Returns:
+            The removed entry, or None if it was not queued
+        """
+        entry_id = self._by_value.pop(value, None)
+        if entry_id is None:
+            return None
+        entry = self._entries.pop(entry_id)
+        self._order.remove(entry_id)
+        self.version += 1
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._by_value.clear()
+        self._order.clear()
+        self.version += 1
+
+    def get(self, entry_id: int) -> Optional[QueueEntry]:
+        """Entry by id."""
+        return self._entries.get(entry_id)
+
+    def find(self, value: str) -> Optional[QueueEntry]:
+        """Entry by value."""
+        entry_id = self._by_value.get(value)
+        return self._entries.get(entry_id) if entry_id is not None else None
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._by_value
+
+    def set_status(self, entry_id: int, status: str) -> bool:
+        """
+        Change the status of an entry.
+
+        Args:
+            entry_id: Entry id
+            status: New FILE_STATUS_* value
+
+        Returns:
+            True if the status changed
+        """
+        entry = self._entries.get(entry_id)
+        if entry is None or entry.status == status:
+            return False
+        entry.status = status
+        return True
+
+    def reset_statuses(self, status: str = FILE_STATUS_PENDING) -> None:
+        """Set every entry to the same status."""
+        for entry in self._entries.values():
+            entry.status = status
+
+    def index_of(self, entry_id: int) -> int:
+        """
+        Position of an entry in the queue.
+
+        Returns:
+            Index, or -1 if not queued
+        """
+        try:
+            return self._order.index(entry_id)
+        except ValueError:
+            return -1
+
+    def slice(self, start: int, stop: int) -> List[QueueEntry]:
+        """Entries at positions ``start`` to ``stop`` (exclusive)."""
+        return [self._entries[entry_id] for entry_id in self._order[max(start, 0):stop]]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[QueueEntry]:
+        for entry_id in list(self._order):
+            yield self._entries[entry_id]
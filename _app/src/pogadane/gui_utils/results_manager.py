@@ -3,107 +3,480 @@ ResultsManager - Manages processed results storage.
 
 This module handles storage and retrieval of processing results
 following the Single Responsibility Principle.
+
+Only a lightweight index (sizes and status per source) is kept in memory.
+Transcription and summary bodies are appended to a spill file on disk and
+loaded on demand through a small LRU cache, so a long session does not keep
+every transcript in RAM. A replaced result is written over its old record
+when it fits; otherwise the old record becomes dead space, and the file is
+rewritten without it once dead space passes RESULTS_SPILL_COMPACT_BYTES and
+outweighs the live records. Transcriptions in segment format are stored as
+compact SegmentStore bytes and rendered to text only when requested.
 """
 
-from typing import Dict, Any, Optional
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+from ..constants import RESULTS_CACHE_ENTRIES, RESULTS_SPILL_COMPACT_BYTES
+from ..exporters import ExportItem, iter_txt
+from ..segments import SegmentStore
+
+# Transcription and summary of one result
+Payload = Tuple[Union[str, SegmentStore], str]
+
+
+class _Location(NamedTuple):
+    """Position of a spilled result in the spill file."""
+    offset: int
+    transcription_bytes: int
+    summary_bytes: int
+    segments: bool  # transcription bytes are SegmentStore.to_bytes()
+    capacity: int  # bytes reserved at offset (at least the size of both bodies)
 
 
 class ResultsManager:
     """
     Manages processed results storage.
-    
+
     Handles:
     - Storage of transcription and summary results
     - Results retrieval by source identifier
     - Results metadata tracking
-    
+
     Attributes:
-        results_data (Dict[str, Dict[str, str]]): Stored results indexed by source
+        results_data (Dict[str, Dict[str, Any]]): Index of stored results by
+            source: "status", "transcription_bytes", "summary_chars" and
+            "segments" (segment count, None for plain text transcriptions)
+        cache_size (int): Number of result bodies kept in memory
+        compact_bytes (int): Unused spill file bytes that trigger compaction
     """
-    
-    def __init__(self):
-        """Initialize ResultsManager with empty storage."""
-        self.results_data: Dict[str, Dict[str, str]] = {}
-    
-    def add_result(self, source: str, transcription: str, summary: str) -> None:
+
+    def __init__(self, cache_size: int = RESULTS_CACHE_ENTRIES, spill_dir: Optional[Path] = None,
+                 spill: bool = True, compact_bytes: int = RESULTS_SPILL_COMPACT_BYTES):
+        """
+        Initialize ResultsManager with empty storage.
+
+        Args:
+            cache_size: Number of recently used result bodies kept in memory
+            spill_dir: Directory for the spill file (defaults to the system temp dir)
+            spill: Keep result bodies on disk (False keeps all of them in memory)
+            compact_bytes: Unused spill file bytes after which the file is
+                rewritten without them (if they also outweigh the live records)
+        """
+        self.results_data: Dict[str, Dict[str, Any]] = {}
+        self.cache_size = cache_size
+        self.compact_bytes = compact_bytes
+        self.spill_dir = spill_dir
+        self.spill = spill
+        self._cache: "OrderedDict[str, Payload]" = OrderedDict()
+        self._locations: Dict[str, _Location] = {}
+        self._memory: Dict[str, Payload] = {}  # bodies not on disk (spill off or pinned)
+        self._pinned: set = set()  # results that change after being added (live transcripts)
+        self._spill_path: Optional[Path] = None
+        self._spill_file = None
+        self._dead_bytes = 0  # spill file bytes not used by any record
+        self._lock = threading.Lock()
+
+    def add_result(self, source: str, transcription: Union[str, SegmentStore], summary: str,
+                   status: str = "completed", pinned: bool = False) -> None:
         """
         Add or update processing result.
-        
+
         Args:
             source: Source identifier (file path or URL)
-            transcription: Transcription text
+            transcription: Transcription text or SegmentStore
             summary: Summary text
+            status: Result status shown in the index ("completed", "live", "error")
+            pinned: Keep the given objects in memory without writing them to
+                disk, for a SegmentStore that is still growing; see unpin()
+        """
+        transcription = self._compact(transcription)
+        summary = summary or ""
+        with self._lock:
+            self._cache.pop(source, None)
+            previous = self._locations.pop(source, None)
+            self._memory.pop(source, None)
+            self._pinned.discard(source)
+            if pinned:
+                self._pinned.add(source)
+                self._memory[source] = (transcription, summary)
+                size = None
+                self._release(previous)
+            else:
+                size = self._store(source, transcription, summary, previous)
+            self.results_data[source] = {
+                "status": status,
+                "transcription_bytes": size,
+                "summary_chars": len(summary),
+                "segments": len(transcription) if isinstance(transcription, SegmentStore) else None,
+            }
+
+    def unpin(self, source: str, status: Optional[str] = None) -> None:
         """
-        self.results_data[source] = {
-            "transcription": transcription,
-            "summary": summary
-        }
-    
+        Store a pinned result like any other (e.g. when its transcript stops growing).
+
+        Args:
+            source: Source identifier
+            status: New status (default: keep the current one)
+        """
+        with self._lock:
+            if source not in self._pinned:
+                return
+            payload = self._memory[source]
+        self.add_result(source, payload[0], payload[1],
+                        status=status or self.results_data[source]["status"])
+
+    @staticmethod
+    def _compact(transcription: Union[str, SegmentStore]) -> Union[str, SegmentStore]:
+        """
+        Convert a transcription string to a SegmentStore when it renders back identically.
+
+        Args:
+            transcription: Transcription text or SegmentStore
+
+        Returns:
+            SegmentStore, or the original value if it is not in segment format
+        """
+        if not isinstance(transcription, str):
+            return transcription
+        store = SegmentStore.from_text(transcription)
+        if store is not None and store.to_text() == transcription:
+            return store
+        return transcription
+
+    def _store(self, source: str, transcription: Union[str, SegmentStore], summary: str,
+               previous: Optional[_Location] = None) -> int:
+        """
+        Write result bodies to the spill file (in memory if spilling is off or fails).
+
+        Args:
+            source: Source identifier
+            transcription: Transcription text or SegmentStore
+            summary: Summary text
+            previous: Record of the result being replaced, reused if the new one fits
+
+        Returns:
+            Size of the stored transcription in bytes
+        """
+        segments = isinstance(transcription, SegmentStore)
+        data = transcription.to_bytes() if segments else (transcription or "").encode("utf-8")
+        summary_data = summary.encode("utf-8")
+        size = len(data) + len(summary_data)
+        if self.spill and self._open_spill():
+            if previous is not None and size <= previous.capacity:
+                offset, capacity = previous.offset, previous.capacity
+                self._dead_bytes -= previous.capacity - previous.transcription_bytes - previous.summary_bytes
+                self._spill_file.seek(offset)
+            else:
+                self._release(previous)
+                self._spill_file.seek(0, os.SEEK_END)
+                offset, capacity = self._spill_file.tell(), size
+            self._spill_file.write(data)
+            self._spill_file.write(summary_data)
+            self._dead_bytes += capacity - size
+            self._locations[source] = _Location(offset, len(data), len(summary_data), segments, capacity)
+            self._remember(source, (transcription, summary))
+            self._maybe_compact()
+        else:
+            self._release(previous)
+            self._memory[source] = (transcription, summary)
+        return len(data)
+
+    def _release(self, location: Optional[_Location]) -> None:
+        """Count the record of a dropped result as unused space."""
+        if location is not None:
+            self._dead_bytes += location.capacity
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the spill file without unused space once there is enough of it."""
+        if self._dead_bytes < self.compact_bytes:
+            return
+        live = sum(location.transcription_bytes + location.summary_bytes for location in self._locations.values())
+        if self._dead_bytes <= live:
+            return
+        try:
+            fd, path = tempfile.mkstemp(prefix="pogadane_results_", suffix=".bin",
+                                        dir=str(self._spill_path.parent))
+        except OSError:
+            return
+        compacted = os.fdopen(fd, "w+b")
+        locations = {}
+        for source, location in sorted(self._locations.items(), key=lambda item: item[1].offset):
+            self._spill_file.seek(location.offset)
+            size = location.transcription_bytes + location.summary_bytes
+            locations[source] = location._replace(offset=compacted.tell(), capacity=size)
+            compacted.write(self._spill_file.read(size))
+        self._spill_file.close()
+        try:
+            self._spill_path.unlink()
+        except OSError:
+            pass
+        self._spill_file, self._spill_path = compacted, Path(path)
+        self._locations = locations
+        self._dead_bytes = 0
+
+    def _open_spill(self) -> bool:
+        """Create the spill file on first use (False if it cannot be created)."""
+        if self._spill_file is None:
+            try:
+                fd, path = tempfile.mkstemp(prefix="pogadane_results_", suffix=".bin",
+                                            dir=str(self.spill_dir) if self.spill_dir else None)
+            except OSError:
+                self.spill = False
+                return False
+            self._spill_path = Path(path)
+            self._spill_file = os.fdopen(fd, "w+b")
+        return True
+
+    def _remember(self, source: str, payload: Payload) -> None:
+        """Put result bodies in the LRU cache, evicting the least recently used."""
+        self._cache[source] = payload
+        self._cache.move_to_end(source)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _load(self, source: str, cache: bool = True) -> Optional[Payload]:
+        """
+        Get the bodies of a result from memory, the cache or the spill file.
+
+        Args:
+            source: Source identifier
+            cache: Keep a result read from disk in the LRU cache (False for
+                one-pass reads such as exports, which would flush the cache)
+
+        Returns:
+            Tuple of (transcription, summary), or None if not found
+        """
+        with self._lock:
+            payload = self._memory.get(source)
+            if payload is not None:
+                return payload
+            payload = self._cache.get(source)
+            if payload is not None:
+                if cache:
+                    self._cache.move_to_end(source)
+                return payload
+            location = self._locations.get(source)
+            if location is None:
+                return None
+            self._spill_file.seek(location.offset)
+            data = self._spill_file.read(location.transcription_bytes)
+            summary = self._spill_file.read(location.summary_bytes).decode("utf-8")
+            transcription = SegmentStore.from_bytes(data) if location.segments else data.decode("utf-8")
+            payload = (transcription, summary)
+            if cache:
+                self._remember(source, payload)
+            return payload
+
+    def has_result(self, source: str) -> bool:
+        """
+        Check if a result is stored for a source.
+
+        Args:
+            source: Source identifier
+
+        Returns:
+            True if the source has a result
+        """
+        return source in self.results_data
+
     def get_result(self, source: str) -> Optional[Dict[str, str]]:
         """
         Retrieve result by source identifier.
-        
+
         Args:
             source: Source identifier
-            
+
         Returns:
             Dictionary with transcription and summary, or None if not found
         """
-        return self.results_data.get(source)
-    
+        payload = self._load(source)
+        if payload is None:
+            return None
+        return {"transcription": str(payload[0]), "summary": payload[1]}
+
+    def get_transcription(self, source: str) -> str:
+        """
+        Get the transcription of a source as text.
+
+        Args:
+            source: Source identifier
+
+        Returns:
+            Transcription text (empty string if not found)
+        """
+        payload = self._load(source)
+        if payload is None:
+            return ""
+        return str(payload[0])
+
+    def get_summary(self, source: str) -> str:
+        """
+        Get the summary of a source.
+
+        Args:
+            source: Source identifier
+
+        Returns:
+            Summary text (empty string if not found)
+        """
+        payload = self._load(source)
+        return payload[1] if payload is not None else ""
+
+    def get_segments(self, source: str) -> Optional[SegmentStore]:
+        """
+        Get the transcription of a source as segments.
+
+        Args:
+            source: Source identifier
+
+        Returns:
+            SegmentStore, or None if not found or not in segment format
+        """
+        payload = self._load(source)
+        if payload is None:
+            return None
+        return payload[0] if isinstance(payload[0], SegmentStore) else None
+
+    def iter_transcription_lines(self, source: str) -> Iterator[str]:
+        """
+        Lazily iterate over transcription lines without rendering the whole text.
+
+        Args:
+            source: Source identifier
+
+        Yields:
+            Transcription lines
+        """
+        segments = self.get_segments(source)
+        if segments is not None:
+            yield from segments.iter_lines()
+        else:
+            transcription = self.get_transcription(source)
+            if transcription:
+                yield from transcription.split("\n")
+
     def get_all_sources(self) -> list:
         """
         Get list of all processed sources.
-        
+
         Returns:
             List of source identifiers
         """
         return list(self.results_data.keys())
-    
+
+    def find_sources(self, query: str = "") -> list:
+        """
+        Get sources whose name or path contains a text (case-insensitive).
+
+        Args:
+            query: Text to look for; empty returns all sources
+
+        Returns:
+            Matching source identifiers in the order they were added
+        """
+        needle = query.strip().casefold()
+        if not needle:
+            return self.get_all_sources()
+        return [source for source in self.results_data if needle in source.casefold()]
+
     def clear_all(self) -> None:
-        """Clear all stored results."""
-        self.results_data.clear()
-    
+        """Clear all stored results and delete the spill file."""
+        with self._lock:
+            self.results_data.clear()
+            self._cache.clear()
+            self._locations.clear()
+            self._memory.clear()
+            self._pinned.clear()
+        self.close()
+
+    def close(self) -> None:
+        """Close and delete the spill file (spilled results are lost)."""
+        with self._lock:
+            if self._spill_file is None:
+                return
+            for source in self._locations:
+                self.results_data.pop(source, None)
+            self._locations.clear()
+            self._cache.clear()
+            self._spill_file.close()
+            self._spill_file = None
+            self._dead_bytes = 0
+            try:
+                self._spill_path.unlink()
+            except OSError:
+                pass
+            self._spill_path = None
+
     def has_results(self) -> bool:
         """
         Check if any results are stored.
-        
+
         Returns:
             True if results exist, False otherwise
         """
         return bool(self.results_data)
-    
+
     def get_result_count(self) -> int:
         """
         Get total number of stored results.
-        
+
         Returns:
             Number of results
         """
         return len(self.results_data)
-    
+
+    def iter_results(self, sources: Optional[Iterable[str]] = None) -> Iterator[ExportItem]:
+        """
+        Lazily load results one at a time, without filling the LRU cache.
+
+        Args:
+            sources: Sources to load (default: all, in the order they were added);
+                unknown sources are skipped
+
+        Yields:
+            Tuples of (source, transcription, summary); the transcription is a
+            SegmentStore or a string
+        """
+        for source in self.get_all_sources() if sources is None else sources:
+            payload = self._load(source, cache=False)
+            if payload is not None:
+                yield source, payload[0], payload[1]
+
+    def iter_export_lines(self) -> Iterator[str]:
+        """
+        Lazily produce the lines of the text export, one result at a time.
+
+        Yields:
+            Export lines (without newlines)
+        """
+        if not self.results_data:
+            yield "Brak wyników do eksportu."
+            return
+
+        for i, (source, transcription, summary) in enumerate(self.iter_results(), 1):
+            yield from iter_txt(i, source, transcription, summary)
+
+    def export_to_file(self, path: Union[str, Path]) -> None:
+        """
+        Write the text export of all results to a file without building it in memory.
+
+        Args:
+            path: Destination file
+        """
+        with open(path, "w", encoding="utf-8") as out:
+            for line in self.iter_export_lines():
+                out.write(line + "\n")
+
     def export_all_results(self) -> str:
         """
         Export all results as formatted text.
-        
+
         Returns:
             Formatted text containing all results
         """
-        if not self.results_data:
-            return "Brak wyników do eksportu."
-        
-        lines = []
-        for i, (source, data) in enumerate(self.results_data.items(), 1):
-            lines.append(f"{'=' * 80}")
-            lines.append(f"WYNIK #{i}: {source}")
-            lines.append(f"{'=' * 80}")
-            lines.append("")
-            lines.append("--- TRANSKRYPCJA ---")
-            lines.append(data.get("transcription", "Brak transkrypcji."))
-            lines.append("")
-            lines.append("--- STRESZCZENIE ---")
-            lines.append(data.get("summary", "Brak streszczenia."))
-            lines.append("")
-        
-        return "\n".join(lines)
-
+        return "\n".join(self.iter_export_lines())
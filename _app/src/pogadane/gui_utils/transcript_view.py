@@ -0,0 +1,157 @@
+"""
+TranscriptPager - Paged access and search for the transcript viewer.
+
+The results viewer shows one page of transcript lines at a time instead of
+the whole transcript in a single text widget. Lines are rendered on demand
+from the SegmentStore (or taken from plain text), jumping to a time uses the
+segment binary search, and in-transcript search runs against a case-folded
+copy of the segment texts with a line offset column, built on first search.
+A SegmentStore that is still growing (live transcription) can be paged and
+searched too: lines appended later are added to the search index on the
+next search.
+
+Usage:
+    pager = TranscriptPager.from_results(results_manager, source)
+    lines = pager.page_lines(0)
+    matches = pager.search("budżet")
+    page = pager.page_of(matches[0])
+"""
+
+from array import array
+from bisect import bisect_right
+from typing import List, Optional, Tuple, Union
+
+from ..constants import TRANSCRIPT_PAGE_LINES
+from ..segments import SegmentStore
+
+
+class TranscriptPager:
+    """
+    Transcript split into pages of lines, with time lookup and search.
+
+    Attributes:
+        page_size (int): Lines per page
+    """
+
+    def __init__(self, transcription: Union[str, SegmentStore, None], page_size: int = TRANSCRIPT_PAGE_LINES):
+        """
+        Initialize the pager.
+
+        Args:
+            transcription: SegmentStore or plain transcript text
+            page_size: Lines per page
+        """
+        self.page_size = max(1, page_size)
+        if isinstance(transcription, SegmentStore):
+            self._segments: Optional[SegmentStore] = transcription
+            self._lines: Optional[List[str]] = None
+        else:
+            self._segments = None
+            self._lines = transcription.split("\n") if transcription else []
+        self._corpus: Optional[str] = None
+        self._line_starts: Optional[array] = None
+
+    @classmethod
+    def from_results(cls, results_manager, source: str, page_size: int = TRANSCRIPT_PAGE_LINES) -> "TranscriptPager":
+        """Create a pager for a result stored in a ResultsManager."""
+        transcription = results_manager.get_segments(source)
+        if transcription is None:
+            transcription = results_manager.get_transcription(source)
+        return cls(transcription, page_size)
+
+    @property
+    def has_timestamps(self) -> bool:
+        """True if lines have segment times (jump to time is possible)."""
+        return self._segments is not None
+
+    def __len__(self) -> int:
+        return len(self._segments) if self._segments is not None else len(self._lines)
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages (at least 1)."""
+        return max(1, -(-len(self) // self.page_size))
+
+    def page_range(self, page: int) -> Tuple[int, int]:
+        """
+        Line index range of a page.
+
+        Args:
+            page: Page number (clamped to the valid range)
+
+        Returns:
+            (first, stop) line indices
+        """
+        page = min(max(page, 0), self.page_count - 1)
+        first = page * self.page_size
+        return first, min(first + self.page_size, len(self))
+
+    def page_of(self, line: int) -> int:
+        """Page containing a line."""
+        return max(line, 0) // self.page_size
+
+    def line(self, index: int) -> str:
+        """Render one line."""
+        if self._segments is not None:
+            return self._segments.line(index)
+        return self._lines[index]
+
+    def page_lines(self, page: int) -> List[str]:
+        """Render the lines of one page."""
+        first, stop = self.page_range(page)
+        if self._segments is not None:
+            return list(self._segments.iter_lines(first, stop))
+        return self._lines[first:stop]
+
+    def line_at_time(self, seconds: float) -> Optional[int]:
+        """
+        Line playing at a given time.
+
+        Returns:
+            Line index, or None without timestamps or for an empty transcript
+        """
+        if self._segments is None or not self._segments:
+            return None
+        return self._segments.index_at(seconds)
+
+    def search(self, query: str) -> List[int]:
+        """
+        Find lines containing a text (case-insensitive).
+
+        Args:
+            query: Text to find
+
+        Returns:
+            Indices of matching lines in ascending order
+        """
+        needle = query.strip().casefold()
+        if not needle:
+            return []
+        corpus, line_starts = self._search_index()
+        matches = []
+        position = corpus.find(needle)
+        while position >= 0:
+            line = bisect_right(line_starts, position) - 1
+            matches.append(line)
+            # Continue after this line: one hit per line is enough
+            position = corpus.find(needle, line_starts[line + 1])
+        return matches
+
+    def _search_index(self) -> Tuple[str, array]:
+        """Case-folded texts of all lines joined by newlines, and their start offsets."""
+        if self._corpus is None:
+            self._corpus = ""
+            self._line_starts = array("Q", [0])
+        indexed = len(self._line_starts) - 1
+        if indexed < len(self):
+            # First search, or lines were appended since the last one
+            if self._segments is not None:
+                texts = (self._segments.text(index) for index in range(indexed, len(self._segments)))
+            else:
+                texts = iter(self._lines[indexed:])
+            folded = [text.casefold().replace("\n", " ") for text in texts]
+            line_starts = self._line_starts
+            for text in folded:
+                line_starts.append(line_starts[-1] + len(text) + 1)
+            self._corpus += "".join(text + "\n" for text in folded)
+        return self._corpus, self._line_starts
@@ -0,0 +1,110 @@
+"""
+UiWatchdog - Detects handlers that block the GUI event loop.
+
+A heartbeat task on the event loop records the time of every tick; a
+watcher thread checks the heartbeat. When it is older than the threshold,
+the watcher samples the stack of the event loop thread (which shows the
+blocking handler) and, once the loop responds again, logs how long it was
+blocked and where.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Frames from this package are preferred when naming the blocking code
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class UiStall(NamedTuple):
+    """One period in which the event loop did not respond."""
+    duration: float  # seconds
+    location: str  # "file:line in function" of the blocking code
+    stack: str  # formatted stack of the event loop thread
+
+
+class UiWatchdog:
+    """
+    Logs event loop stalls longer than a threshold.
+
+    Attributes:
+        threshold (float): Stall length (s) that is reported
+        stalls (deque): Most recent stalls (UiStall)
+    """
+
+    def __init__(self, threshold: float = 0.05, interval: Optional[float] = None, history: int = 50):
+        """
+        Initialize the watchdog.
+
+        Args:
+            threshold: Stall length in seconds that is reported
+            interval: Heartbeat period in seconds (defaults to threshold / 2)
+            history: Number of stalls kept in ``stalls``
+        """
+        self.threshold = threshold
+        self.interval = interval if interval is not None else threshold / 2
+        self.stalls: Deque[UiStall] = deque(maxlen=history)
+        self._beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    async def run(self) -> None:
+        """Heartbeat task; run it on the event loop (e.g. ``page.run_task(watchdog.run)``)."""
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, name="ui-watchdog", daemon=True)
+        self._watcher.start()
+        try:
+            while not self._stop.is_set():
+                self._beat = time.monotonic()
+                await asyncio.sleep(self.interval)
+        finally:
+            self._stop.set()
+
+    def stop(self) -> None:
+        """Stop the heartbeat and the watcher thread."""
+        self._stop.set()
+
+    def _watch(self) -> None:
+        """Watcher thread: sample the loop thread while it does not respond."""
+        stalled_since = None
+        sample = None
+        while not self._stop.wait(self.interval / 2):
+            beat = self._beat
+            # The heartbeat is expected every interval; anything beyond that is lag
+            lag = time.monotonic() - beat - self.interval
+            if lag > self.threshold:
+                if stalled_since is None:
+                    stalled_since = beat
+                    sample = self._sample_loop_stack()
+            elif stalled_since is not None:
+                self._report(beat - stalled_since - self.interval, sample)
+                stalled_since = None
+
+    def _sample_loop_stack(self):
+        """Stack frames of the event loop thread, innermost last."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        return traceback.extract_stack(frame) if frame is not None else []
+
+    def _report(self, duration: float, stack) -> None:
+        """Record and log a finished stall."""
+        location = "unknown location"
+        if stack:
+            own = [f for f in stack if os.path.abspath(f.filename).startswith(_PACKAGE_DIR)
+                   and not f.filename.endswith("ui_watchdog.py")]
+            frame = own[-1] if own else stack[-1]
+            location = f"{os.path.basename(frame.filename)}:{frame.lineno} in {frame.name}"
+        stall = UiStall(duration, location, "".join(traceback.format_list(stack)))
+        self.stalls.append(stall)
+        logger.warning(f"UI event loop blocked for {duration * 1000:.0f} ms: {location}")
+        logger.debug(f"Blocking stack:\n{stall.stack}")
@@ -0,0 +1,638 @@
+"""
+Hardware detection and faster-whisper calibration.
+
+This module probes the host machine (CPU instruction sets, core count, RAM,
+CUDA devices) without importing heavy frameworks such as torch, and provides
+a one-time calibration routine that measures which faster-whisper
+configuration (compute type, CPU threads, batch size) runs fastest for a given
+model on this machine.
+
+The winning configuration is persisted per model in ``.config/settings.json``
+under ``FASTER_WHISPER_TUNING`` and picked up automatically by
+``FasterWhisperLibraryProvider`` whenever ``FASTER_WHISPER_COMPUTE_TYPE`` is
+left at ``"auto"``.
+
+Usage:
+    python -m pogadane calibrate --model turbo
+"""
+
+import os
+import sys
+import time
+import hashlib
+import platform
+import subprocess
+import logging
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from .constants import (
+    CALIBRATION_BATCH_SIZES,
+    CALIBRATION_CLIP_SECONDS,
+    CALIBRATION_COMPUTE_TYPES_CPU,
+    CALIBRATION_COMPUTE_TYPES_CUDA,
+    CALIBRATION_MAX_NEW_TOKENS,
+    TUNING_SETTINGS_KEY,
+)
+from .short_clips import clip_timestamps_for
+
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Whisper models operate on 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+# Minimum RAM (in GiB) required before larger batch sizes are tried
+_MIN_RAM_GB_FOR_LARGE_BATCH = 8
+
+
+@dataclass(frozen=True)
+class HardwareInfo:
+    """
+    Snapshot of the hardware relevant for transcription performance.
+
+    Attributes:
+        cpu_model: Human-readable CPU name
+        logical_cores: Number of logical CPUs (hardware threads)
+        physical_cores: Number of physical CPU cores
+        ram_bytes: Total installed memory in bytes (0 if unknown)
+        cpu_flags: Lower-case CPU feature flags (e.g. "avx2", "avx512f")
+        cuda_devices: Number of CUDA devices visible to CTranslate2
+    """
+    cpu_model: str
+    logical_cores: int
+    physical_cores: int
+    ram_bytes: int
+    cpu_flags: FrozenSet[str] = field(default_factory=frozenset)
+    cuda_devices: int = 0
+
+    @property
+    def has_avx2(self) -> bool:
+        """True if the CPU supports AVX2."""
+        return "avx2" in self.cpu_flags
+
+    @property
+    def has_avx512(self) -> bool:
+        """True if the CPU supports AVX-512 Foundation."""
+        return "avx512f" in self.cpu_flags
+
+    @property
+    def has_vnni(self) -> bool:
+        """True if the CPU supports VNNI (fast int8 dot products)."""
+        return bool({"avx512_vnni", "avx512vnni", "avx_vnni", "avxvnni"} & self.cpu_flags)
+
+    @property
+    def ram_gb(self) -> float:
+        """Total RAM in GiB."""
+        return self.ram_bytes / (1024 ** 3)
+
+    def fingerprint(self) -> str:
+        """
+        Short stable identifier of this hardware.
+
+        Used to discard stored tuning results when settings are copied
+        to a different machine.
+
+        Returns:
+            12-character hex digest
+        """
+        key = f"{self.cpu_model}|{self.logical_cores}|{self.physical_cores}|{self.cuda_devices}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+    def summary(self) -> str:
+        """One-line human-readable description."""
+        features = [name for name, present in (
+            ("AVX2", self.has_avx2),
+            ("AVX-512", self.has_avx512),
+            ("VNNI", self.has_vnni),
+        ) if present]
+        return (
+            f"{self.cpu_model} | {self.physical_cores} cores / {self.logical_cores} threads | "
+            f"{self.ram_gb:.1f} GB RAM | {', '.join(features) or 'no AVX2'} | "
+            f"CUDA devices: {self.cuda_devices}"
+        )
+
+
+@dataclass
+class CalibrationResult:
+    """
+    Timing of a single faster-whisper configuration.
+
+    Attributes:
+        model: Model name that was timed
+        device: "cpu" or "cuda"
+        compute_type: CTranslate2 compute type
+        cpu_threads: Number of intra-op CPU threads (0 = library default)
+        batch_size: Batch size (0 = sequential WhisperModel.transcribe)
+        seconds: Wall-clock transcription time of the clip
+        rtf: Real-time factor (seconds / clip duration, lower is faster)
+        error: Error message if the configuration failed
+    """
+    model: str
+    device: str
+    compute_type: str
+    cpu_threads: int
+    batch_size: int
+    seconds: float = 0.0
+    rtf: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the configuration ran successfully."""
+        return self.error is None
+
+    def __str__(self):
+        if not self.ok:
+            return (f"{self.compute_type:>13} threads={self.cpu_threads:<3} "
+                    f"batch={self.batch_size:<3} FAILED: {self.error}")
+        return (f"{self.compute_type:>13} threads={self.cpu_threads:<3} "
+                f"batch={self.batch_size:<3} {self.seconds:6.2f}s  RTF={self.rtf:.3f}")
+
+
+def _read_proc_cpuinfo() -> str:
+    """Read /proc/cpuinfo (Linux) or return empty string."""
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8", errors="ignore") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+def detect_cpu_flags() -> FrozenSet[str]:
+    """
+    Detect CPU instruction set extensions.
+
+    Uses /proc/cpuinfo on Linux, sysctl on macOS and
+    IsProcessorFeaturePresent on Windows (AVX2/AVX-512 only).
+
+    Returns:
+        Frozen set of lower-case feature flags
+    """
+    flags = set()
+
+    if sys.platform.startswith("linux"):
+        for line in _read_proc_cpuinfo().splitlines():
+            if line.startswith("flags") and ":" in line:
+                flags.update(line.split(":", 1)[1].split())
+                break
+
+    elif sys.platform == "darwin":
+        for key in ("machdep.cpu.features", "machdep.cpu.leaf7_features"):
+            try:
+                out = subprocess.run(
+                    ["sysctl", "-n", key], capture_output=True, text=True, timeout=2
+                ).stdout
+                flags.update(token.lower().replace(".", "_") for token in out.split())
+            except (OSError, subprocess.SubprocessError):
+                pass
+
+    elif os.name == "nt":
+        try:
+            import ctypes
+            is_present = ctypes.windll.kernel32.IsProcessorFeaturePresent
+            # PF_AVX2_INSTRUCTIONS_AVAILABLE = 40, PF_AVX512F_INSTRUCTIONS_AVAILABLE = 41
+            if is_present(40):
+                flags.add("avx2")
+            if is_present(41):
+                flags.add("avx512f")
+        except Exception:
+            pass
+
+    return frozenset(flag.lower() for flag in flags)
+
+
+def detect_cpu_model() -> str:
+    """Return a human-readable CPU model name."""
+    if sys.platform.startswith("linux"):
+        for line in _read_proc_cpuinfo().splitlines():
+            if line.startswith("model name") and ":" in line:
+                return line.split(":", 1)[1].strip()
+    return platform.processor() or platform.machine() or "unknown CPU"
+
+
+def detect_physical_cores() -> int:
+    """
+    Count physical CPU cores.
+
+    Falls back to the logical CPU count when the topology is unknown.
+
+    Returns:
+        Number of physical cores (at least 1)
+    """
+    logical = os.cpu_count() or 1
+
+    try:
+        import psutil
+        physical = psutil.cpu_count(logical=False)
+        if physical:
+            return physical
+    except ImportError:
+        pass
+
+    if sys.platform.startswith("linux"):
+        cores = set()
+        physical_id = core_id = None
+        for line in _read_proc_cpuinfo().splitlines():
+            if line.startswith("physical id"):
+                physical_id = line.split(":", 1)[1].strip()
+            elif line.startswith("core id"):
+                core_id = line.split(":", 1)[1].strip()
+            elif not line.strip():
+                if core_id is not None:
+                    cores.add((physical_id, core_id))
+                physical_id = core_id = None
+        if core_id is not None:
+            cores.add((physical_id, core_id))
+        if cores:
+            return len(cores)
+
+    return logical
+
+
+def detect_total_ram() -> int:
+    """
+    Detect total installed RAM.
+
+    Returns:
+        RAM size in bytes, or 0 if it cannot be determined
+    """
+    if os.name == "nt":
+        try:
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return int(status.ullTotalPhys)
+        except Exception:
+            pass
+        return 0
+
+    try:
+        return int(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES"))
+    except (ValueError, OSError, AttributeError):
+        return 0
+
+
+def detect_cuda_device_count() -> int:
+    """
+    Count CUDA devices usable by faster-whisper.
+
+    Asks CTranslate2 directly instead of importing torch, which is slow to
+    import and not required by faster-whisper.
+
+    Returns:
+        Number of CUDA devices (0 if none or CTranslate2 is missing)
+    """
+    try:
+        import ctranslate2
+        return int(ctranslate2.get_cuda_device_count())
+    except Exception:
+        return 0
+
+
+@lru_cache(maxsize=1)
+def probe_hardware() -> HardwareInfo:
+    """
+    Probe the current machine (cached for the lifetime of the process).
+
+    Returns:
+        HardwareInfo snapshot
+    """
+    return HardwareInfo(
+        cpu_model=detect_cpu_model(),
+        logical_cores=os.cpu_count() or 1,
+        physical_cores=detect_physical_cores(),
+        ram_bytes=detect_total_ram(),
+        cpu_flags=detect_cpu_flags(),
+        cuda_devices=detect_cuda_device_count(),
+    )
+
+
+def resolve_device(device: str) -> str:
+    """
+    Resolve "auto" to a concrete faster-whisper device.
+
+    Args:
+        device: "auto", "cpu" or "cuda"
+
+    Returns:
+        "cuda" if requested/available, otherwise "cpu"
+    """
+    if device == "auto":
+        return "cuda" if probe_hardware().cuda_devices > 0 else "cpu"
+    return device
+
+
+def default_compute_type(device: str) -> str:
+    """Compute type used when no calibration result is available."""
+    return "float16" if device == "cuda" else "int8"
+
+
+def supported_compute_types(device: str) -> Tuple[str, ...]:
+    """
+    Compute types worth calibrating on the given device.
+
+    Filters the candidate list through CTranslate2's own capability query
+    when available.
+
+    Args:
+        device: "cpu" or "cuda"
+
+    Returns:
+        Tuple of compute type names
+    """
+    candidates = CALIBRATION_COMPUTE_TYPES_CUDA if device == "cuda" else CALIBRATION_COMPUTE_TYPES_CPU
+    try:
+        import ctranslate2
+        supported = set(ctranslate2.get_supported_compute_types(device))
+        filtered = tuple(ct for ct in candidates if ct in supported)
+        return filtered or candidates
+    except Exception:
+        return candidates
+
+
+def candidate_configs(
+    hardware: HardwareInfo,
+    device: str,
+    compute_types: Optional[Tuple[str, ...]] = None,
+    batch_sizes: Tuple[int, ...] = CALIBRATION_BATCH_SIZES,
+) -> List[Tuple[str, int, int]]:
+    """
+    Build the list of configurations to time.
+
+    Args:
+        hardware: Probed hardware
+        device: "cpu" or "cuda"
+        compute_types: Compute types to try (defaults to supported_compute_types)
+        batch_sizes: Batch sizes to try (0 = sequential decoding)
+
+    Returns:
+        List of (compute_type, cpu_threads, batch_size) tuples
+    """
+    compute_types = compute_types or supported_compute_types(device)
+
+    if device == "cuda":
+        thread_options = [0]
+    else:
+        thread_options = sorted({
+            max(1, hardware.physical_cores // 2),
+            hardware.physical_cores,
+            hardware.logical_cores,
+        })
+
+    # Large batches multiply activation memory - skip them on small machines
+    if hardware.ram_bytes and hardware.ram_gb < _MIN_RAM_GB_FOR_LARGE_BATCH:
+        batch_sizes = tuple(b for b in batch_sizes if b <= 4) or (0,)
+
+    return [
+        (compute_type, threads, batch)
+        for compute_type in compute_types
+        for threads in thread_options
+        for batch in batch_sizes
+    ]
+
+
+def synthetic_clip(seconds: float = CALIBRATION_CLIP_SECONDS, sample_rate: int = SAMPLE_RATE):
+    """
+    Generate a deterministic speech-like test signal.
+
+    A harmonic voice-like tone with a gliding pitch, syllable-rate amplitude
+    modulation and a little noise. It exercises the encoder exactly like real
+    audio of the same duration; decoding is capped during calibration so that
+    every configuration does comparable work.
+
+    Args:
+        seconds: Clip duration in seconds
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        float32 NumPy array with values in [-1, 1]
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate), dtype=np.float64) / sample_rate
+
+    pitch = 120.0 + 30.0 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 9))
+    syllables = 0.5 * (1.0 + np.sin(2 * np.pi * 3.0 * t))
+
+    signal = 0.25 * voiced * syllables + 0.01 * rng.standard_normal(t.shape)
+    return np.clip(signal, -1.0, 1.0).astype(np.float32)
+
+
+def _window_timestamps(duration: float, window: float = 30.0) -> List[dict]:
+    """Split a duration into clip windows accepted by BatchedInferencePipeline."""
+    windows = []
+    start = 0.0
+    while start < duration:
+        windows.append({"start": start, "end": min(start + window, duration)})
+        start += window
+    return windows
+
+
+def _time_transcription(model, audio, batch_size: int, language: str, faster_whisper) -> float:
+    """Run one transcription of the clip and return elapsed seconds."""
+    duration = len(audio) / SAMPLE_RATE
+    options = dict(
+        language=language,
+        beam_size=5,
+        temperature=0.0,
+        max_new_tokens=CALIBRATION_MAX_NEW_TOKENS,
+    )
+
+    start = time.perf_counter()
+    if batch_size > 0:
+        pipeline = faster_whisper.BatchedInferencePipeline(model=model)
+        segments, _ = pipeline.transcribe(
+            audio,
+            batch_size=batch_size,
+            # Seconds for faster-whisper 1.2+, sample indices for 1.1.x
+            clip_timestamps=clip_timestamps_for(_window_timestamps(duration), faster_whisper),
+            vad_filter=False,
+            **options,
+        )
+    else:
+        segments, _ = model.transcribe(audio, vad_filter=False, **options)
+
+    # Segments are generated lazily - consume them to do the actual work
+    for _ in segments:
+        pass
+    return time.perf_counter() - start
+
+
+def calibrate_faster_whisper(
+    model: str,
+    device: str = "auto",
+    clip_seconds: float = CALIBRATION_CLIP_SECONDS,
+    language: str = "pl",
+    audio=None,
+    configs: Optional[List[Tuple[str, int, int]]] = None,
+    log: Callable[[str], None] = print,
+) -> List[CalibrationResult]:
+    """
+    Time faster-whisper configurations on this machine.
+
+    Every (compute_type, cpu_threads) pair is loaded once and warmed up,
+    then each batch size is timed on the same clip.
+
+    Args:
+        model: Model name or path (e.g. "turbo")
+        device: "auto", "cpu" or "cuda"
+        clip_seconds: Duration of the synthetic clip
+        language: Language code passed to the decoder
+        audio: Optional float32 16 kHz waveform to use instead of the synthetic clip
+        configs: Optional explicit list of (compute_type, cpu_threads, batch_size)
+        log: Callable receiving progress messages
+
+    Returns:
+        Results sorted from fastest to slowest (failed configurations last)
+
+    Raises:
+        ImportError: If faster-whisper is not installed
+    """
+    import faster_whisper
+    from .model_store import resolve_model_path
+
+    hardware = probe_hardware()
+    device = resolve_device(device)
+    if audio is None:
+        audio = synthetic_clip(clip_seconds)
+    duration = len(audio) / SAMPLE_RATE
+    configs = configs or candidate_configs(hardware, device)
+
+    log(f"🔧 Hardware: {hardware.summary()}")
+    log(f"⏱️ Calibrating '{model}' on {device} with a {duration:.0f}s clip "
+        f"({len(configs)} configurations)")
+
+    # Group batch sizes per loaded model to avoid reloading weights
+    grouped: Dict[Tuple[str, int], List[int]] = {}
+    for compute_type, threads, batch in configs:
+        grouped.setdefault((compute_type, threads), []).append(batch)
+
+    results: List[CalibrationResult] = []
+    for (compute_type, threads), batches in grouped.items():
+        try:
+            stored_path = resolve_model_path(model, compute_type)
+            whisper_model = faster_whisper.WhisperModel(
+                str(stored_path) if stored_path else model,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=threads,
+                local_files_only=stored_path is not None,
+            )
+            # Warm-up run (allocations, kernel selection) is not timed
+            _time_transcription(whisper_model, audio[:SAMPLE_RATE * 5], 0, language, faster_whisper)
+        except Exception as e:
+            for batch in batches:
+                result = CalibrationResult(model, device, compute_type, threads, batch, error=str(e))
+                results.append(result)
+                log(f"   {result}")
+            continue
+
+        for batch in batches:
+            result = CalibrationResult(model, device, compute_type, threads, batch)
+            try:
+                result.seconds = _time_transcription(
+                    whisper_model, audio, batch, language, faster_whisper
+                )
+                result.rtf = result.seconds / duration if duration else 0.0
+            except Exception as e:
+                result.error = str(e)
+            results.append(result)
+            log(f"   {result}")
+
+        del whisper_model
+
+    return sorted(results, key=lambda r: (not r.ok, r.seconds))
+
+
+def build_tuning_entry(best: CalibrationResult, hardware: Optional[HardwareInfo] = None) -> Dict[str, Any]:
+    """
+    Convert the winning calibration result to a settings.json entry.
+
+    Args:
+        best: Fastest successful calibration result
+        hardware: Hardware the result was measured on (defaults to this machine)
+
+    Returns:
+        JSON-serializable dictionary
+    """
+    hardware = hardware or probe_hardware()
+    entry = asdict(best)
+    entry.pop("error", None)
+    entry.pop("model", None)
+    entry["hardware"] = hardware.fingerprint()
+    entry["calibrated_at"] = datetime.now().isoformat(timespec="seconds")
+    return entry
+
+
+def save_tuning(model: str, best: CalibrationResult, config_manager=None) -> Dict[str, Any]:
+    """
+    Persist the fastest configuration for a model into settings.json.
+
+    Args:
+        model: Model name the result applies to
+        best: Fastest successful calibration result
+        config_manager: ConfigManager instance (defaults to the singleton)
+
+    Returns:
+        The complete tuning dictionary that was saved
+    """
+    from .config_loader import ConfigManager
+
+    manager = config_manager or ConfigManager()
+    tuning = dict(manager.get(TUNING_SETTINGS_KEY, {}) or {})
+    tuning[model] = build_tuning_entry(best)
+    manager.save_runtime_setting(TUNING_SETTINGS_KEY, tuning)
+    return tuning
+
+
+def lookup_tuning(
+    tuning: Optional[Dict[str, Any]],
+    model: str,
+    device: str,
+    hardware: Optional[HardwareInfo] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Find a stored calibration result that applies to this machine.
+
+    Args:
+        tuning: The FASTER_WHISPER_TUNING dictionary from settings
+        model: Model name
+        device: Resolved device ("cpu" or "cuda")
+        hardware: Current hardware (defaults to this machine)
+
+    Returns:
+        Tuning entry or None if missing, stale or for a different device
+    """
+    if not isinstance(tuning, dict):
+        return None
+    entry = tuning.get(model)
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("device") != device:
+        return None
+    hardware = hardware or probe_hardware()
+    if entry.get("hardware") != hardware.fingerprint():
+        return None
+    return entry
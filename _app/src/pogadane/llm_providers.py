@@ -9,12 +9,20 @@ allowing easy switching between:
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import re
 import subprocess
 import sys
+import threading
+import time
 import logging
 from pathlib import Path
 
+from .capabilities import get_registry
+from .constants import QA_MAX_ANSWER_TOKENS, QA_RESERVED_TOKENS
+
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -25,8 +33,14 @@ class LLMProvider(ABC):
     Abstract base class for LLM providers.
     
     Implements the Strategy pattern for summarization providers.
+    
+    Providers report statistics of the last summarize() call in
+    ``last_run_info`` where available: prompt_tokens, completion_tokens,
+    prompt_eval_seconds and generation_seconds.
     """
     
+    last_run_info: Dict[str, Any] = {}
+    
     @abstractmethod
     def summarize(self, text: str, prompt: str, language: str, source_name: str = "") -> Optional[str]:
         """
@@ -77,12 +91,14 @@ class OllamaProvider(LLMProvider):
         print(f"\n🔄 Summarizing '{source_name}' with Ollama ({self.model_name})")
         
         full_prompt = self._build_prompt(text, prompt, language)
+        self.last_run_info = {}
         
         try:
             process = self._run_ollama_command(full_prompt)
             
             if process and process.returncode == 0 and process.stdout:
                 summary = process.stdout.strip()
+                self.last_run_info = parse_ollama_stats(process.stderr or "")
                 print(f"✅ Summary OK for '{source_name}' (Ollama).")
                 return summary
             else:
@@ -94,18 +110,9 @@ class OllamaProvider(LLMProvider):
             return None
     
     def is_available(self) -> bool:
-        """Check if Ollama is installed and model is available."""
-        try:
-            # Check if ollama command exists
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        """Check if Ollama is installed (cached) and its server responds (``ollama list``, probed again when down)."""
+        registry = get_registry()
+        return registry.is_available("ollama") and registry.is_available("ollama-server")
     
     def _build_prompt(self, text: str, prompt: str, language: str) -> str:
         """Build the full prompt for Ollama."""
@@ -117,7 +124,8 @@ class OllamaProvider(LLMProvider):
         """Execute Ollama command with proper error handling."""
         from .file_utils import run_subprocess
         
-        cmd = ["ollama", "run", self.model_name]
+        # --verbose prints token counts and timings to stderr
+        cmd = ["ollama", "run", "--verbose", self.model_name]
         return run_subprocess(cmd, input_data=prompt_data, debug_mode=self.debug_mode)
     
     def _handle_error(self, process: Optional[subprocess.CompletedProcess], source_name: str):
@@ -130,6 +138,58 @@ class OllamaProvider(LLMProvider):
             print(f"❌ Summary failed for '{source_name}' (Ollama). No output generated.", file=sys.stderr)
 
 
+_OLLAMA_STATS = {
+    "prompt eval count": "prompt_tokens",
+    "prompt eval duration": "prompt_eval_seconds",
+    "eval count": "completion_tokens",
+    "eval duration": "generation_seconds",
+}
+_GO_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ns|us|µs|ms|s|m|h)")
+_GO_DURATION_UNITS = {"ns": 1e-9, "us": 1e-6, "µs": 1e-6, "ms": 1e-3, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_go_duration(text: str) -> Optional[float]:
+    """
+    Parse a Go duration as printed by Ollama (e.g. "1m2.5s", "102.3ms").
+    
+    Returns:
+        Seconds, or None if the text is not a duration
+    """
+    text = text.strip()
+    parts = _GO_DURATION_PART.findall(text)
+    if not parts or "".join(value + unit for value, unit in parts) != text:
+        return None
+    return sum(float(value) * _GO_DURATION_UNITS[unit] for value, unit in parts)
+
+
+def parse_ollama_stats(output: str) -> Dict[str, Any]:
+    """
+    Read token counts and timings from ``ollama run --verbose`` statistics.
+    
+    Args:
+        output: stderr of the ollama process
+        
+    Returns:
+        Dict with prompt_tokens, completion_tokens, prompt_eval_seconds and
+        generation_seconds (only the values found)
+    """
+    stats: Dict[str, Any] = {}
+    for line in output.splitlines():
+        name, _, value = line.partition(":")
+        key = _OLLAMA_STATS.get(name.strip().lower())
+        if not key or not value.strip():
+            continue
+        if key.endswith("_tokens"):
+            count = value.split()[0]
+            if count.isdigit():
+                stats[key] = int(count)
+        else:
+            seconds = parse_go_duration(value)
+            if seconds is not None:
+                stats[key] = seconds
+    return stats
+
+
 class GoogleGeminiProvider(LLMProvider):
     """
     Google Gemini API provider implementation.
@@ -153,6 +213,7 @@ class GoogleGeminiProvider(LLMProvider):
     
     def summarize(self, text: str, prompt: str, language: str, source_name: str = "") -> Optional[str]:
         """Generate summary using Google Gemini."""
+        self.last_run_info = {}
         if not self._ensure_library_loaded():
             return None
         
@@ -169,7 +230,15 @@ class GoogleGeminiProvider(LLMProvider):
             full_prompt = self._build_prompt(text, prompt, language)
             
             print(f"   Sending prompt to Google for '{source_name}'...")
+            started = time.perf_counter()
             response = model.generate_content(full_prompt)
+            # The API reports token counts; the call time covers prompt and generation
+            usage = getattr(response, "usage_metadata", None)
+            self.last_run_info = {
+                "prompt_tokens": getattr(usage, "prompt_token_count", None),
+                "completion_tokens": getattr(usage, "candidates_token_count", None),
+                "generation_seconds": time.perf_counter() - started,
+            }
             
             if response.parts:
                 summary = "".join(p.text for p in response.parts if hasattr(p, 'text')).strip()
@@ -188,7 +257,7 @@ class GoogleGeminiProvider(LLMProvider):
     
     def is_available(self) -> bool:
         """Check if Google Gemini API is available."""
-        return self._ensure_library_loaded() and bool(self.api_key)
+        return bool(self.api_key) and get_registry().is_available("google.generativeai")
     
     def _ensure_library_loaded(self) -> bool:
         """Ensure google-generativeai library is loaded."""
@@ -321,6 +390,7 @@ class TransformersProvider(LLMProvider):
     
     def summarize(self, text: str, prompt: str, language: str, source_name: str = "") -> Optional[str]:
         """Generate summary using Transformers."""
+        self.last_run_info = {}
         if not self._ensure_pipeline_loaded():
             return None
         
@@ -393,12 +463,15 @@ class TransformersProvider(LLMProvider):
                         gen_params["min_length"] = min_length
                     
                     # Use more conservative settings to avoid errors
+                    started = time.perf_counter()
                     result = self._pipeline(input_text, **gen_params)
+                    generation_seconds = time.perf_counter() - started
                     
                     if result and len(result) > 0:
                         summary = result[0]["summary_text"] if "summary_text" in result[0] else result[0].get("generated_text", "")
                         
                         if summary:
+                            self.last_run_info = self._run_info(input_text, summary, generation_seconds)
                             # Check for repetitive gibberish (common with multilingual issues)
                             # If the same phrase appears more than 3 times, it's likely broken
                             words = summary.split()
@@ -437,8 +510,20 @@ class TransformersProvider(LLMProvider):
             return None
     
     def is_available(self) -> bool:
-        """Check if transformers library is available."""
-        return self._ensure_library_loaded()
+        """Check if transformers library is installed (without importing it)."""
+        return get_registry().is_available("transformers")
+    
+    def _run_info(self, input_text: str, summary: str, generation_seconds: float) -> Dict[str, Any]:
+        """Token counts of a pipeline call (the pipeline does not time prompt evaluation separately)."""
+        info: Dict[str, Any] = {"generation_seconds": generation_seconds}
+        tokenizer = getattr(self._pipeline, "tokenizer", None)
+        if tokenizer is not None:
+            try:
+                info["prompt_tokens"] = len(tokenizer(input_text)["input_ids"])
+                info["completion_tokens"] = len(tokenizer(summary)["input_ids"])
+            except Exception:
+                pass
+        return info
     
     def _ensure_library_loaded(self) -> bool:
         """Ensure transformers library is loaded."""
@@ -541,6 +626,27 @@ class TransformersProvider(LLMProvider):
         }
 
 
+@dataclass
+class QASession:
+    """
+    Conversation about one transcript (see LlamaCppProvider.ask).
+    
+    Attributes:
+        key: Session identifier (usually the source of the result)
+        context: Prompt prefix holding the instructions and the transcript
+        turns: Questions and answers so far
+        state: Saved llama.cpp state after the last answer (None if evicted)
+        state_bytes: Size of the saved state
+        truncated: The transcript was cut to fit the context window
+    """
+    key: str
+    context: str
+    truncated: bool = False
+    turns: List[Tuple[str, str]] = field(default_factory=list)
+    state: Any = None
+    state_bytes: int = 0
+
+
 class LlamaCppProvider(LLMProvider):
     """
     Llama.cpp GGUF model provider implementation.
@@ -551,9 +657,18 @@ class LlamaCppProvider(LLMProvider):
     Supported formats:
     - GGUF quantized models (Q4_K_M, Q5_K_M, Q8_0, etc.)
     - Works with Gemma, Llama, Mistral, and other GGUF models
+    
+    Besides summaries, the provider answers follow-up questions about a
+    transcript (ask()). Each conversation is a QASession whose prompt starts
+    with the transcript; after every answer the evaluated model state (the
+    KV cache) is saved, so the next question only evaluates the new tokens.
+    Saved states are kept in memory up to a budget and the least recently
+    used ones are dropped first (the conversation then continues after one
+    re-evaluation of the transcript).
     """
     
-    def __init__(self, model_path: str, debug_mode: bool = False, n_ctx: int = 4096, n_gpu_layers: int = 0):
+    def __init__(self, model_path: str, debug_mode: bool = False, n_ctx: int = 4096, n_gpu_layers: int = 0,
+                 qa_state_mb: float = 1024):
         """
         Initialize Llama.cpp provider.
         
@@ -562,18 +677,26 @@ class LlamaCppProvider(LLMProvider):
             debug_mode: Enable debug logging
             n_ctx: Context window size (default: 4096)
             n_gpu_layers: Number of layers to offload to GPU (0 = CPU only)
+            qa_state_mb: Memory for saved Q&A session states in MB
         """
         self.model_path = model_path
         self.debug_mode = debug_mode
         self.n_ctx = n_ctx
         self.n_gpu_layers = n_gpu_layers
+        self.qa_state_budget = int(qa_state_mb * 1024 * 1024)
         self._llm = None
         self._llama_cpp = None
+        self._sessions: "OrderedDict[str, QASession]" = OrderedDict()  # least recently used first
+        self._active_session: Optional[str] = None  # session whose state is loaded in the model
+        self._lock = threading.Lock()
     
     def summarize(self, text: str, prompt: str, language: str, source_name: str = "") -> Optional[str]:
         """Generate summary using Llama.cpp GGUF model."""
+        self.last_run_info = {}
         if not self._ensure_model_loaded():
             return None
+        # The summary replaces the model state of the last Q&A session
+        self._active_session = None
         
         print(f"\n🔄 Summarizing '{source_name}' with GGUF model ({Path(self.model_path).name})")
         
@@ -583,19 +706,35 @@ class LlamaCppProvider(LLMProvider):
             
             print(f"   Generating summary...")
             
-            # Generate summary with llama.cpp
-            response = self._llm(
+            # Generate summary with llama.cpp; streamed so that the time to the
+            # first token (prompt evaluation) and the generation are measured apart
+            started = time.perf_counter()
+            first_token_at = None
+            pieces = []
+            for chunk in self._llm(
                 full_prompt,
                 max_tokens=512,  # Maximum tokens to generate
                 temperature=0.7,
                 top_p=0.9,
                 repeat_penalty=1.1,
                 stop=["</s>", "\n\n\n"],  # Stop sequences
-                echo=False  # Don't echo the prompt
-            )
+                echo=False,  # Don't echo the prompt
+                stream=True
+            ):
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                if chunk and chunk.get('choices'):
+                    pieces.append(chunk['choices'][0].get('text', ''))
+            finished = time.perf_counter()
             
-            if response and 'choices' in response and len(response['choices']) > 0:
-                summary = response['choices'][0]['text'].strip()
+            if pieces:
+                self.last_run_info = {
+                    "prompt_tokens": len(self._llm.tokenize(full_prompt.encode("utf-8"))),
+                    "completion_tokens": len(pieces),  # one token per streamed chunk
+                    "prompt_eval_seconds": first_token_at - started,
+                    "generation_seconds": finished - first_token_at,
+                }
+                summary = "".join(pieces).strip()
                 
                 if summary:
                     print(f"✅ Summary OK for '{source_name}' (GGUF).")
@@ -611,9 +750,184 @@ class LlamaCppProvider(LLMProvider):
                 traceback.print_exc()
             return None
     
+    def ask(self, session_key: str, question: str, transcript: Optional[str] = None,
+            language: str = "Polish", max_tokens: int = QA_MAX_ANSWER_TOKENS) -> Optional[str]:
+        """
+        Answer a question about a transcript, continuing the session's conversation.
+        
+        The first question of a session evaluates the transcript; follow-up
+        questions reuse the saved model state and only evaluate the question
+        and the previous answer. ``last_run_info`` reports the evaluated
+        ("prompt_tokens") and reused ("cached_tokens") prompt tokens, and
+        whether the answer is based on a transcript cut to fit the context
+        window ("transcript_truncated"; raise n_ctx to avoid it).
+        
+        Args:
+            session_key: Session identifier, e.g. the source of the result
+            question: Question about the recording
+            transcript: Transcript text (required for a new session, ignored afterwards)
+            language: Language of the answers
+            max_tokens: Maximum length of the answer in tokens
+            
+        Returns:
+            Answer, or None on failure
+            
+        Raises:
+            ValueError: If the session does not exist and no transcript is given
+        """
+        with self._lock:
+            self.last_run_info = {}
+            session = self._sessions.get(session_key)
+            if session is None and transcript is None:
+                raise ValueError(f"No Q&A session for '{session_key}'; pass the transcript")
+            if not self._ensure_model_loaded():
+                return None
+            try:
+                if session is None:
+                    context, truncated = self._qa_context(transcript, language, max_tokens)
+                    session = QASession(session_key, context, truncated)
+                    self._sessions[session_key] = session
+                self._sessions.move_to_end(session_key)
+                if self._active_session != session_key and session.state is not None:
+                    self._llm.load_state(session.state)
+                self._active_session = session_key
+                
+                tokens = self._qa_tokens(session, question, max_tokens)
+                cached = self._cached_prefix(tokens)
+                started = time.perf_counter()
+                first_token_at = None
+                pieces = []
+                for chunk in self._llm(
+                    tokens,
+                    max_tokens=max_tokens,
+                    temperature=0.3,
+                    top_p=0.9,
+                    repeat_penalty=1.1,
+                    stop=self._qa_stops(),
+                    stream=True,
+                ):
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    if chunk and chunk.get('choices'):
+                        pieces.append(chunk['choices'][0].get('text', ''))
+                finished = time.perf_counter()
+                answer = "".join(pieces).strip()
+                
+                self.last_run_info = {
+                    "prompt_tokens": len(tokens) - cached,
+                    "cached_tokens": cached,
+                    "completion_tokens": len(pieces),  # one token per streamed chunk
+                    "prompt_eval_seconds": (first_token_at or finished) - started,
+                    "generation_seconds": finished - (first_token_at or finished),
+                    "transcript_truncated": session.truncated,
+                }
+                if not answer:
+                    return None
+                session.turns.append((question, answer))
+                session.state = self._llm.save_state()
+                session.state_bytes = int(getattr(session.state, "llama_state_size", 0))
+                self._evict_qa_states()
+                return answer
+            except Exception as e:
+                print(f"❌ GGUF model error answering a question about '{session_key}': {e}", file=sys.stderr)
+                if self.debug_mode:
+                    import traceback
+                    traceback.print_exc()
+                # The model state no longer matches any saved session
+                self._active_session = None
+                return None
+    
+    def close_session(self, session_key: str) -> bool:
+        """Forget a Q&A session and its saved state (True if it existed)."""
+        with self._lock:
+            if self._active_session == session_key:
+                self._active_session = None
+            return self._sessions.pop(session_key, None) is not None
+    
+    def session_turns(self, session_key: str) -> List[Tuple[str, str]]:
+        """Questions and answers of a session (empty if unknown)."""
+        session = self._sessions.get(session_key)
+        return list(session.turns) if session else []
+    
+    @property
+    def qa_state_bytes(self) -> int:
+        """Memory held by saved Q&A session states."""
+        return sum(session.state_bytes for session in self._sessions.values())
+    
+    def _evict_qa_states(self):
+        """Drop saved states of the least recently used sessions above the memory budget."""
+        for session in self._sessions.values():
+            if self.qa_state_bytes <= self.qa_state_budget:
+                break
+            # The active session stays cheap while its state is loaded in the model
+            session.state, session.state_bytes = None, 0
+    
+    def _cached_prefix(self, tokens: List[int]) -> int:
+        """Number of leading prompt tokens already evaluated in the model (reused by llama.cpp)."""
+        evaluated = list(self._llm.input_ids[:self._llm.n_tokens])
+        count = 0
+        # llama.cpp evaluates at least the last prompt token again
+        for old, new in zip(evaluated, tokens[:-1]):
+            if old != new:
+                break
+            count += 1
+        return count
+    
+    def _is_gemma(self) -> bool:
+        return "gemma" in self.model_path.lower()
+    
+    def _qa_stops(self) -> List[str]:
+        return ["<end_of_turn>", "</s>"] if self._is_gemma() else ["</s>", "### Question:"]
+    
+    def _qa_context(self, transcript: str, language: str, max_tokens: int) -> Tuple[str, bool]:
+        """
+        Prompt prefix of a session: instructions and the transcript, cut to fit the context.
+        
+        Returns:
+            Tuple of (prompt prefix, True if the transcript was cut)
+        """
+        instructions = (f"Answer questions about the transcript of a recording below. Answer briefly in "
+                        f"{language}, using only the transcript. If it does not contain the answer, say so.")
+        budget = max(self.n_ctx - max(QA_RESERVED_TOKENS, max_tokens * 2), 256)
+        transcript_tokens = self._llm.tokenize(transcript.encode("utf-8"), add_bos=False)
+        truncated = len(transcript_tokens) > budget
+        if truncated:
+            logger.warning(f"Transcript of {len(transcript_tokens)} tokens cut to {budget} for Q&A "
+                           f"(n_ctx={self.n_ctx}); questions about the rest will not be answered")
+            transcript = self._llm.detokenize(transcript_tokens[:budget]).decode("utf-8", errors="ignore")
+        if self._is_gemma():
+            return f"<start_of_turn>user\n{instructions}\n\nTranscript:\n{transcript}\n\n", truncated
+        return f"### Instruction:\n{instructions}\n\n### Input:\n{transcript}\n\n", truncated
+    
+    def _qa_prompt(self, session: QASession, question: str) -> str:
+        """Full prompt of the next question: context, previous turns and the question."""
+        parts = [session.context]
+        if self._is_gemma():
+            for number, (asked, answer) in enumerate(session.turns):
+                if number:
+                    parts.append("<start_of_turn>user\n")
+                parts.append(f"Question: {asked}<end_of_turn>\n<start_of_turn>model\n{answer}<end_of_turn>\n")
+            parts.append("<start_of_turn>user\n" if session.turns else "")
+            parts.append(f"Question: {question}<end_of_turn>\n<start_of_turn>model\n")
+        else:
+            for asked, answer in session.turns:
+                parts.append(f"### Question:\n{asked}\n\n### Response:\n{answer}\n\n")
+            parts.append(f"### Question:\n{question}\n\n### Response:\n")
+        return "".join(parts)
+    
+    def _qa_tokens(self, session: QASession, question: str, max_tokens: int) -> List[int]:
+        """Tokens of the next prompt; the oldest turns are dropped when it does not fit the context."""
+        while True:
+            tokens = self._llm.tokenize(self._qa_prompt(session, question).encode("utf-8"), special=True)
+            if len(tokens) + max_tokens <= self.n_ctx or not session.turns:
+                return tokens
+            session.turns.pop(0)
+    
     def is_available(self) -> bool:
-        """Check if llama-cpp-python is available and model exists."""
-        if not self._ensure_library_loaded():
+        """Check if llama-cpp-python is installed and model exists."""
+        if not get_registry().is_available("llama_cpp"):
+            print("❌ Error: llama-cpp-python library not installed.", file=sys.stderr)
+            print("   Install with: pip install llama-cpp-python", file=sys.stderr)
             return False
         
         # Check if model file exists
@@ -728,6 +1042,8 @@ class LLMProviderFactory:
             transformers_device = config.get('TRANSFORMERS_DEVICE', 'auto')
             gguf_model_path = config.get('GGUF_MODEL_PATH', '')
             gguf_n_gpu_layers = int(config.get('GGUF_N_GPU_LAYERS', 0))
+            gguf_n_ctx = int(config.get('GGUF_CONTEXT_SIZE', 4096))
+            gguf_qa_state_mb = float(config.get('GGUF_QA_STATE_MB', 1024))
             use_debug = config.get('DEBUG_MODE', False) if not debug_mode else debug_mode
         else:
             # Attribute-based config object (standard usage)
@@ -739,6 +1055,8 @@ class LLMProviderFactory:
             transformers_device = getattr(config, 'TRANSFORMERS_DEVICE', 'auto')
             gguf_model_path = getattr(config, 'GGUF_MODEL_PATH', '')
             gguf_n_gpu_layers = int(getattr(config, 'GGUF_N_GPU_LAYERS', 0))
+            gguf_n_ctx = int(getattr(config, 'GGUF_CONTEXT_SIZE', 4096))
+            gguf_qa_state_mb = float(getattr(config, 'GGUF_QA_STATE_MB', 1024))
             use_debug = getattr(config, 'DEBUG_MODE', False) if not debug_mode else debug_mode
         
         # Ensure provider_type is a string
@@ -755,7 +1073,8 @@ class LLMProviderFactory:
         elif provider_type == "transformers":
             return TransformersProvider(transformers_model, use_debug, transformers_device)
         elif provider_type == "gguf" or provider_type == "llama-cpp":
-            return LlamaCppProvider(gguf_model_path, use_debug, n_gpu_layers=gguf_n_gpu_layers)
+            return LlamaCppProvider(gguf_model_path, use_debug, n_ctx=gguf_n_ctx,
+                                    n_gpu_layers=gguf_n_gpu_layers, qa_state_mb=gguf_qa_state_mb)
         else:
             print(f"❌ Error: Unknown provider type '{provider_type}'", file=sys.stderr)
             print(f"   Supported types: ollama, google, transformers, gguf", file=sys.stderr)
@@ -0,0 +1,276 @@
+"""
+Rotating on-disk processing log.
+
+Every record is written twice: as one JSON object per line to
+``<name>.jsonl`` (for tools) and as a readable line to ``<name>.log``.
+Both files are rotated by size (``<name>.log.1`` ... ``<name>.log.N``), so
+multi-day batch sessions use bounded disk space and no memory beyond the
+write queue.
+
+Writers only put records on a queue; a background thread formats them,
+appends them in batches and flushes at most every ``flush_interval``
+seconds. ``ProgressCallback`` (backend) and the GUI feed the same store.
+
+Saving the log is a file copy: ``copy_text`` streams the text log written
+since a ``mark()`` (e.g. the start of the session or the last "clear
+console") to another file, across rotated files.
+
+Usage:
+    store = LogStore(LOG_DIR)
+    session = store.mark()
+    store.write("Transcribing...", stage="transcribing", progress=0.4)
+    store.copy_text("saved.log", since=session)
+    store.close()
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_COPY_CHUNK = 1 << 20
+
+
+class LogPosition(NamedTuple):
+    """Position in the text log, stable across rotations (see LogStore.mark)."""
+    rotation: int  # number of text log rotations before this position
+    offset: int  # byte offset in the file that was current at that time
+
+
+class _Flush(NamedTuple):
+    """Queue item asking the writer to flush and signal ``done``."""
+    done: threading.Event
+
+
+class _RotatingFile:
+    """
+    Append-only text file rotated when it grows past ``max_bytes``.
+
+    The size is counted as records are written, so checking it does not
+    flush the write buffer after every record.
+    """
+
+    def __init__(self, path: Path, max_bytes: int, backups: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.rotations = 0
+        self._open()
+
+    def _open(self) -> None:
+        # Binary, so that the counted size is the byte offset used by copy_text
+        self._handle = open(self.path, "ab")
+        self._size = self._handle.tell()
+
+    def write(self, text: str) -> None:
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        data = text.encode("utf-8")
+        self._handle.write(data)
+        self._size += len(data)
+        if self.max_bytes and self._size >= self.max_bytes:
+            self.rotate()
+
+    def tell(self) -> int:
+        return self._size
+
+    def flush(self) -> None:
+        self._handle.flush()
+
+    def rotate(self) -> None:
+        """Shift ``path.N-1`` -> ``path.N`` ... ``path`` -> ``path.1`` and start a new file."""
+        self._handle.close()
+        for index in range(self.backups, 0, -1):
+            source = self.backup_path(index - 1)
+            if source.exists():
+                os.replace(source, self.backup_path(index))
+        if self.backups == 0:
+            self.path.unlink()
+        self.rotations += 1
+        self._open()
+
+    def backup_path(self, index: int) -> Path:
+        """Path of the file rotated ``index`` times (0 is the current file)."""
+        return self.path if index == 0 else self.path.with_name(f"{self.path.name}.{index}")
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class LogStore:
+    """
+    Structured, size-rotated log written by a background thread.
+
+    Attributes:
+        directory (Path): Folder with the log files
+        text_path (Path): Current human-readable log file
+        jsonl_path (Path): Current JSON lines log file
+    """
+
+    def __init__(self, directory: Union[str, Path], name: str = "pogadane",
+                 max_bytes: int = 10 * 1024 * 1024, backups: int = 5, flush_interval: float = 0.5):
+        """
+        Open (append to) the log files and start the writer thread.
+
+        Args:
+            directory: Folder for the log files (created if missing)
+            name: Base file name
+            max_bytes: Size at which a file is rotated (0 = never)
+            backups: Number of rotated files kept per format
+            flush_interval: Maximum seconds between buffered writes reaching the disk
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self._text = _RotatingFile(self.directory / f"{name}.log", max_bytes, backups)
+        self._jsonl = _RotatingFile(self.directory / f"{name}.jsonl", max_bytes, backups)
+        self.text_path = self._text.path
+        self.jsonl_path = self._jsonl.path
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        # Held by the writer while writing; copy_text holds it to read a stable file set
+        self._file_lock = threading.Lock()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name="log-store-writer", daemon=True)
+        self._writer.start()
+
+    def write(self, message: str, level: str = "info", **fields: Any) -> None:
+        """
+        Queue a record (never blocks on disk I/O).
+
+        Args:
+            message: Human-readable message (may span several lines)
+            level: Log level name (info, warning, error)
+            **fields: Structured fields stored in the JSON record
+                (e.g. source, job_id, stage, progress)
+        """
+        if self._closed:
+            return
+        record = {"time": time.time(), "level": level, "message": message}
+        record.update((key, value) for key, value in fields.items() if value is not None)
+        self._queue.put(record)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued records are written and flushed.
+
+        Returns:
+            True if the writer finished within the timeout
+        """
+        if self._closed or not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(_Flush(done))
+        return done.wait(timeout)
+
+    def mark(self) -> LogPosition:
+        """Current end of the text log (flushes queued records first)."""
+        self.flush()
+        with self._file_lock:
+            return LogPosition(self._text.rotations, self._text.tell())
+
+    def copy_text(self, destination: Union[str, Path], since: Optional[LogPosition] = None) -> int:
+        """
+        Stream the text log (from a mark, across rotated files) to a file.
+
+        Args:
+            destination: File to write
+            since: Start position (defaults to everything still on disk)
+
+        Returns:
+            Number of bytes written
+        """
+        self.flush()
+        written = 0
+        with self._file_lock, open(destination, "wb") as out:
+            # Index 0 is the current file; higher indices are older files
+            oldest, offset = self._text.backups, 0
+            if since is not None:
+                age = self._text.rotations - since.rotation
+                if age <= self._text.backups:
+                    oldest, offset = age, since.offset
+            for index in range(oldest, -1, -1):
+                path = self._text.backup_path(index)
+                if not path.exists():
+                    continue
+                with open(path, "rb") as source:
+                    source.seek(offset)
+                    while True:
+                        chunk = source.read(_COPY_CHUNK)
+                        if not chunk:
+                            break
+                        out.write(chunk)
+                        written += len(chunk)
+                offset = 0
+        return written
+
+    def close(self) -> None:
+        """Write all queued records and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+
+    # ------------------------------------------------------------------ writer thread
+
+    @staticmethod
+    def format_text(record: dict) -> str:
+        """Render a record as text log line(s)."""
+        stamp = datetime.fromtimestamp(record["time"]).strftime("%Y-%m-%d %H:%M:%S")
+        prefix = f"{stamp} {record['level'].upper():<7}"
+        if record.get("stage"):
+            prefix += f" [{record['stage']}]"
+        lines = str(record["message"]).rstrip("\n").split("\n")
+        return "".join(f"{prefix} {line}\n" for line in lines)
+
+    def _run(self) -> None:
+        """Writer loop: batch queued records, write both formats, flush periodically."""
+        last_flush = time.monotonic()
+        dirty = False
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval if dirty else None)
+            except queue.Empty:
+                item = _Flush(None)
+            items = [item]
+            # Drain what is already queued so that it is written in one go
+            while item is not None and len(items) < 1000:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                items.append(item)
+
+            with self._file_lock:
+                for item in items:
+                    if item is None or isinstance(item, _Flush):
+                        continue
+                    try:
+                        self._text.write(self.format_text(item))
+                        self._jsonl.write(json.dumps(item, ensure_ascii=False, default=str) + "\n")
+                        dirty = True
+                    except (OSError, TypeError, ValueError) as e:
+                        logger.error(f"Cannot write log record: {e}")
+                stop = any(item is None for item in items)
+                flush_requested = any(isinstance(item, _Flush) for item in items)
+                if dirty and (stop or flush_requested or time.monotonic() - last_flush >= self.flush_interval):
+                    self._text.flush()
+                    self._jsonl.flush()
+                    dirty = False
+                    last_flush = time.monotonic()
+                if stop:
+                    self._text.close()
+                    self._jsonl.close()
+
+            for item in items:
+                if isinstance(item, _Flush) and item.done is not None:
+                    item.done.set()
+            if stop:
+                return
@@ -0,0 +1,277 @@
+"""
+Detection of Whisper hallucination loops.
+
+On long silent or noisy stretches Whisper can get stuck repeating one phrase
+("Dziękuję za uwagę." for hundreds of segments). ``RepetitionGuard`` watches
+the streamed segments and reports a loop as soon as either
+
+- the same (normalized) segment text repeats several times in a row, or
+- one word n-gram covers most of the recent words.
+
+Short phrases ("Tak.", "Dobrze.") are often repeated in real speech, so a
+run of them counts as a loop only when it is much longer and its segments
+follow each other without pauses, as looping segments do.
+
+The caller then drops the repeated segments (the first occurrence is kept),
+skips ahead to the next speech region and resumes decoding there. Segments
+before ``RepetitionGuard.cut_point()`` can no longer be dropped by a later
+loop, so a caller showing segments live can report them right away.
+
+Segments are any objects with ``start``, ``end`` and ``text`` attributes.
+"""
+
+import re
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+# Identical segments in a row treated as a loop
+MAX_SEGMENT_REPEATS = 3
+
+# Segments with fewer words are short phrases...
+MIN_REPEAT_WORDS = 3
+
+# ...which form a loop only after this many repeats with gaps of at most MAX_REPEAT_GAP seconds
+MAX_SHORT_PHRASE_REPEATS = 8
+MAX_REPEAT_GAP = 0.1
+
+# Word n-gram length used for repetition counting
+NGRAM_SIZE = 3
+
+# Recent words inspected for n-gram repetition
+WINDOW_WORDS = 48
+
+# Minimum words in the window before n-gram repetition is judged
+MIN_WINDOW_WORDS = 18
+
+# Share of window words covered by the most frequent n-gram that signals a loop
+NGRAM_COVERAGE = 0.6
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+@dataclass
+class LoopEvent:
+    """
+    A detected repetition loop.
+
+    Attributes:
+        cut_at: Segments starting at or after this time are the loop (dropped)
+        loop_end: End time of the last looping segment
+        phrase: The repeated words
+        repeats: Number of segments in the loop, including the kept first one
+    """
+    cut_at: float
+    loop_end: float
+    phrase: str
+    repeats: int
+
+
+def normalize_words(text: str) -> Tuple[str, ...]:
+    """Lowercase words of a segment without punctuation."""
+    return tuple(_WORD_PATTERN.findall((text or "").lower()))
+
+
+def _contains(words: Tuple[str, ...], ngram: Tuple[str, ...]) -> bool:
+    """True if ``ngram`` occurs in ``words``."""
+    size = len(ngram)
+    return any(words[i:i + size] == ngram for i in range(len(words) - size + 1))
+
+
+class RepetitionGuard:
+    """
+    Online repetition detector for a stream of segments.
+
+    Usage:
+        guard = RepetitionGuard()
+        for segment in segments:
+            event = guard.feed(segment)
+            if event:
+                ...
+    """
+
+    def __init__(
+        self,
+        max_segment_repeats: int = MAX_SEGMENT_REPEATS,
+        min_repeat_words: int = MIN_REPEAT_WORDS,
+        max_short_phrase_repeats: int = MAX_SHORT_PHRASE_REPEATS,
+        ngram_size: int = NGRAM_SIZE,
+        window_words: int = WINDOW_WORDS,
+        min_window_words: int = MIN_WINDOW_WORDS,
+        ngram_coverage: float = NGRAM_COVERAGE,
+    ):
+        """
+        Initialize the guard.
+
+        Args:
+            max_segment_repeats: Identical segments in a row that form a loop
+            min_repeat_words: Segments with fewer words are short phrases
+            max_short_phrase_repeats: Identical short phrases in a row, without
+                pauses between them, that form a loop
+            ngram_size: Word n-gram length
+            window_words: Number of recent words inspected
+            min_window_words: Words required before n-gram repetition is judged
+            ngram_coverage: Share of window words covered by one n-gram that forms a loop
+        """
+        self.max_segment_repeats = max_segment_repeats
+        self.min_repeat_words = min_repeat_words
+        self.max_short_phrase_repeats = max_short_phrase_repeats
+        self.ngram_size = ngram_size
+        self.window_words = window_words
+        self.min_window_words = min_window_words
+        self.ngram_coverage = ngram_coverage
+        self.reset()
+
+    def reset(self):
+        """Forget all previously seen segments."""
+        self._segments: deque = deque(maxlen=self.window_words)
+        self._words: deque = deque(maxlen=self.window_words)
+
+    def feed(self, segment: Any) -> Optional[LoopEvent]:
+        """
+        Inspect the next segment.
+
+        Args:
+            segment: Next decoded segment
+
+        Returns:
+            LoopEvent if the stream is looping, otherwise None
+        """
+        words = normalize_words(segment.text)
+        if not words:
+            return None
+        self._segments.append((segment, words))
+        self._words.extend(words)
+
+        event = self._identical_run()
+        if event is None:
+            event = self._ngram_loop()
+        return event
+
+    def cut_point(self) -> Optional[float]:
+        """
+        Earliest start of a seen segment that a later loop event could still drop.
+
+        A loop always ends at the newest segment and keeps its first
+        segment, so only repeats of the newest segment's text or n-grams
+        that run back from it are at risk.
+
+        Returns:
+            Start time in seconds, or None if every seen segment is final
+        """
+        if not self._segments:
+            return None
+        last_words = self._segments[-1][1]
+        run = self._identical_length()
+        size = self.ngram_size
+        for ngram in {last_words[i:i + size] for i in range(len(last_words) - size + 1)}:
+            ngram_run = 0
+            for _, segment_words in reversed(self._segments):
+                if not _contains(segment_words, ngram):
+                    break
+                ngram_run += 1
+            run = max(run, ngram_run)
+        if run < 2:
+            return None
+        return self._segments[len(self._segments) - run + 1][0].start
+
+    def _identical_length(self) -> int:
+        """Number of segments in a row, ending at the newest, with its text."""
+        last_words = self._segments[-1][1]
+        short = len(last_words) < self.min_repeat_words
+        run = 0
+        later = None
+        for segment, words in reversed(self._segments):
+            if words != last_words:
+                break
+            if short and later is not None and later.start - segment.end > MAX_REPEAT_GAP:
+                break
+            run += 1
+            later = segment
+        return run
+
+    def _identical_run(self) -> Optional[LoopEvent]:
+        """Loop of identical segment texts ending at the newest segment."""
+        last_words = self._segments[-1][1]
+        short = len(last_words) < self.min_repeat_words
+        run = self._identical_length()
+        if run < (self.max_short_phrase_repeats if short else self.max_segment_repeats):
+            return None
+        return self._event(run, " ".join(last_words))
+
+    def _ngram_loop(self) -> Optional[LoopEvent]:
+        """Loop of one n-gram dominating the recent words."""
+        if len(self._words) < self.min_window_words:
+            return None
+        words = list(self._words)
+        size = self.ngram_size
+        counts = Counter(tuple(words[i:i + size]) for i in range(len(words) - size + 1))
+        ngram, count = counts.most_common(1)[0]
+        if count * size < self.ngram_coverage * len(words):
+            return None
+
+        # Segments in a row (ending at the newest) that contain the n-gram
+        run = 0
+        for _, segment_words in reversed(self._segments):
+            if not _contains(segment_words, ngram):
+                break
+            run += 1
+        if run < 2:
+            # Repetition inside a single segment is left to Whisper's compression-ratio check
+            return None
+        return self._event(run, " ".join(ngram))
+
+    def _event(self, run: int, phrase: str) -> LoopEvent:
+        """Build the event for a loop of ``run`` segments (the first one is kept)."""
+        segments = list(self._segments)
+        first_repeat = segments[len(segments) - run + 1][0]
+        return LoopEvent(
+            cut_at=first_repeat.start,
+            loop_end=segments[-1][0].end,
+            phrase=phrase,
+            repeats=run,
+        )
+
+
+def resume_point(speech_regions: Optional[Sequence[Tuple[float, float]]],
+                 position: float, duration: float) -> float:
+    """
+    Where to resume decoding after a loop.
+
+    Args:
+        speech_regions: Sorted (start, end) speech regions in seconds, or None
+            if unknown (decoding resumes right after the loop)
+        position: End of the loop in seconds
+        duration: Audio duration in seconds
+
+    Returns:
+        Start of the next speech region (or ``position`` if it lies inside
+        speech); ``duration`` if no speech follows
+    """
+    if speech_regions is None:
+        return min(position, duration)
+    for start, end in speech_regions:
+        if end <= position:
+            continue
+        return max(start, position)
+    return duration
+
+
+def regions_after(speech_regions: Sequence[Tuple[float, float]], position: float) -> List[float]:
+    """
+    Flat clip_timestamps of the speech after ``position``.
+
+    Args:
+        speech_regions: Sorted (start, end) speech regions in seconds
+        position: Time from which decoding resumes
+
+    Returns:
+        [start, end, ...] list in seconds
+    """
+    clips = []
+    for start, end in speech_regions:
+        if end <= position:
+            continue
+        clips.extend((max(start, position), end))
+    return clips
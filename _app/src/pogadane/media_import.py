@@ -0,0 +1,235 @@
+"""
+Bulk import of media files and URL lists into the processing queue.
+
+Folders are scanned with ``os.scandir`` as a stream: files are yielded
+directory by directory, so the caller can add them to the queue in chunks
+while the scan continues. Duplicated content (the same recording under
+different names) can be skipped using a partial-content hash that reads
+only a few blocks of each file, and only for files of equal size.
+
+Usage:
+    for chunk in iter_chunks(iter_media_files(folder), 500):
+        add(chunk)
+"""
+
+import csv
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from .constants import MEDIA_EXTENSIONS
+
+# Bytes read from the start, middle and end of a file for the partial hash
+PARTIAL_HASH_BLOCK = 64 * 1024
+
+
+class ScannedFile(NamedTuple):
+    """Media file found by a folder scan."""
+    path: str
+    size: int
+    mtime: float
+
+
+def iter_media_files(
+    root: Union[str, Path],
+    extensions: Iterable[str] = MEDIA_EXTENSIONS,
+    recursive: bool = True,
+) -> Iterator[ScannedFile]:
+    """
+    Stream media files below a folder.
+
+    Directories are walked depth-first in name order without following
+    symlinks; entries that cannot be read (permissions, broken links) are
+    skipped. Files are yielded after each directory has been read.
+
+    Args:
+        root: Folder to scan
+        extensions: Accepted file extensions (lowercase, with dot)
+        recursive: Also scan subfolders
+
+    Yields:
+        ScannedFile for every matching file
+    """
+    extensions = {ext.lower() for ext in extensions}
+    pending = [str(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                files = []
+                subdirs = []
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                subdirs.append(entry.path)
+                            continue
+                        if os.path.splitext(entry.name)[1].lower() not in extensions:
+                            continue
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    files.append(ScannedFile(entry.path, stat.st_size, stat.st_mtime))
+        except OSError:
+            continue
+        files.sort()
+        yield from files
+        # Reversed so that subfolders are visited in name order
+        pending.extend(sorted(subdirs, reverse=True))
+
+
+def iter_chunks(items: Iterable, size: int) -> Iterator[list]:
+    """
+    Group a stream into lists of at most ``size`` items.
+
+    Args:
+        items: Any iterable
+        size: Maximum chunk length
+
+    Yields:
+        Non-empty lists
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def partial_hash(path: Union[str, Path], size: Optional[int] = None,
+                 block: int = PARTIAL_HASH_BLOCK) -> str:
+    """
+    Hash the size and the first, middle and last block of a file.
+
+    Files up to three blocks long are hashed completely.
+
+    Args:
+        path: File to hash
+        size: File size, if already known
+        block: Block length in bytes
+
+    Returns:
+        Hex digest
+    """
+    if size is None:
+        size = os.path.getsize(path)
+    digest = hashlib.blake2b(str(size).encode("ascii"), digest_size=16)
+    with open(path, "rb") as handle:
+        if size <= 3 * block:
+            digest.update(handle.read())
+        else:
+            for offset in (0, (size - block) // 2, size - block):
+                handle.seek(offset)
+                digest.update(handle.read(block))
+    return digest.hexdigest()
+
+
+class ContentDeduper:
+    """
+    Detects files with the same content during a scan.
+
+    Files are grouped by size first; a partial hash is computed only when a
+    second file of the same size appears, so unique sizes cost no reads.
+
+    Attributes:
+        duplicates (int): Number of files reported as duplicates
+    """
+
+    def __init__(self):
+        """Initialize an empty deduper."""
+        self._first_by_size: Dict[int, str] = {}
+        self._hashes: set = set()
+        self.duplicates = 0
+
+    def is_duplicate(self, file: ScannedFile) -> bool:
+        """
+        Check a scanned file against all files seen so far.
+
+        Args:
+            file: File from the scan
+
+        Returns:
+            True if a file with the same content was seen before
+        """
+        first = self._first_by_size.get(file.size)
+        if first is None:
+            self._first_by_size[file.size] = file.path
+            return False
+        try:
+            if first:
+                # Second file of this size: hash the first one now
+                self._hashes.add(partial_hash(first, file.size))
+                self._first_by_size[file.size] = ""
+            digest = partial_hash(file.path, file.size)
+        except OSError:
+            return False
+        if digest in self._hashes:
+            self.duplicates += 1
+            return True
+        self._hashes.add(digest)
+        return False
+
+    def filter(self, files: Iterable[ScannedFile]) -> Iterator[ScannedFile]:
+        """Yield only files whose content was not seen before."""
+        for file in files:
+            if not self.is_duplicate(file):
+                yield file
+
+
+def read_source_list(path: Union[str, Path]) -> List[Dict[str, Optional[str]]]:
+    """
+    Read queue sources (URLs or file paths) from a TXT or CSV file.
+
+    TXT: one source per line; empty lines and lines starting with ``#`` are
+    ignored. CSV: columns ``url``, ``start_time``, ``end_time`` and
+    ``profile`` when the first row is a header with a ``url`` column,
+    otherwise the same values by position.
+
+    Args:
+        path: List file
+
+    Returns:
+        Dicts with keys url, start_time, end_time, profile (as accepted by
+        the GUI's add_queue_entries_with_metadata)
+    """
+    path = Path(path)
+    with open(path, "r", encoding="utf-8-sig", newline="") as handle:
+        if path.suffix.lower() != ".csv":
+            return [
+                {"url": line.strip(), "start_time": None, "end_time": None, "profile": None}
+                for line in handle
+                if line.strip() and not line.lstrip().startswith("#")
+            ]
+
+        sample = handle.read(4096)
+        handle.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        rows = list(csv.reader(handle, dialect))
+
+    columns = ["url", "start_time", "end_time", "profile"]
+    if rows and "url" in [cell.strip().lower() for cell in rows[0]]:
+        columns = [cell.strip().lower() for cell in rows[0]]
+        rows = rows[1:]
+
+    sources = []
+    for row in rows:
+        values = dict(zip(columns, (cell.strip() for cell in row)))
+        url = values.get("url", "")
+        if not url or url.startswith("#"):
+            continue
+        sources.append({
+            "url": url,
+            "start_time": values.get("start_time") or None,
+            "end_time": values.get("end_time") or None,
+            "profile": values.get("profile") or None,
+        })
+    return sources
@@ -0,0 +1,354 @@
+"""
+Per-job performance metrics.
+
+The backend collects a ``JobMetrics`` record for every processed file: time
+spent in each processing stage, transcription real-time factor, LLM prompt
+evaluation and generation speed, peak memory and model cache usage. The GUI
+adds the time a job waited in the queue, keeps the records of recent jobs in
+a ``MetricsHistory`` (appended to a JSON lines file, so the history survives
+restarts) and can export them as CSV.
+
+Usage:
+    history = MetricsHistory(METRICS_FILE)
+    history.load()
+    history.append(backend.last_job_metrics)
+    history.series("real_time_factor")
+    history.to_csv("metrics.csv")
+"""
+
+import csv
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Union
+
+from .constants import METRICS_HISTORY_JOBS
+
+logger = logging.getLogger(__name__)
+
+# Timed processing stages (ProcessingStage values), in processing order
+STAGES = ("initializing", "downloading", "copying", "transcribing", "summarizing", "cleaning")
+
+
+@dataclass
+class JobMetrics:
+    """
+    Performance numbers of one processed file.
+
+    Attributes:
+        source: Input file path or URL
+        job_id: Queue job id (set by the GUI)
+        started_at: Start time (time.time)
+        status: "completed" or "error"
+        stage_seconds: Seconds spent in each stage (ProcessingStage value -> seconds)
+        audio_seconds: Duration of the transcribed audio
+        queue_wait_seconds: Time between the start of the batch and the start of the job
+        prompt_tokens: Prompt tokens evaluated by the LLM
+        completion_tokens: Tokens generated by the LLM
+        prompt_eval_seconds: Time the LLM spent evaluating the prompt
+        generation_seconds: Time the LLM spent generating
+        peak_rss_bytes: Peak resident memory of the process at the end of the job
+        cache_hits: Models taken from memory or from local files
+        cache_misses: Models downloaded
+    """
+    source: str
+    job_id: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+    status: str = "completed"
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    audio_seconds: Optional[float] = None
+    queue_wait_seconds: Optional[float] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    prompt_eval_seconds: Optional[float] = None
+    generation_seconds: Optional[float] = None
+    peak_rss_bytes: Optional[int] = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def total_seconds(self) -> float:
+        """Processing time of the job (all stages)."""
+        return sum(self.stage_seconds.values())
+
+    @property
+    def real_time_factor(self) -> Optional[float]:
+        """Transcription time divided by audio duration (below 1 is faster than real time)."""
+        transcribing = self.stage_seconds.get("transcribing")
+        if not transcribing or not self.audio_seconds:
+            return None
+        return transcribing / self.audio_seconds
+
+    @property
+    def prompt_tokens_per_second(self) -> Optional[float]:
+        """LLM prompt evaluation speed."""
+        return _rate(self.prompt_tokens, self.prompt_eval_seconds)
+
+    @property
+    def generation_tokens_per_second(self) -> Optional[float]:
+        """LLM generation speed."""
+        return _rate(self.completion_tokens, self.generation_seconds)
+
+    @property
+    def cache_hit_rate(self) -> Optional[float]:
+        """Fraction of model loads served from memory or local files."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Stored fields as a JSON-serializable dict."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobMetrics":
+        """Create metrics from ``to_dict()`` output (unknown keys are ignored)."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+def _rate(count: Optional[int], seconds: Optional[float]) -> Optional[float]:
+    """Items per second, or None without data."""
+    if not count or not seconds:
+        return None
+    return count / seconds
+
+
+# Columns of the CSV export: stored fields, stage times and derived values
+CSV_COLUMNS = (
+    ["job_id", "source", "started", "status", "queue_wait_seconds"]
+    + [f"{stage}_seconds" for stage in STAGES]
+    + ["total_seconds", "audio_seconds", "real_time_factor",
+       "prompt_tokens", "completion_tokens", "prompt_eval_seconds", "generation_seconds",
+       "prompt_tokens_per_second", "generation_tokens_per_second",
+       "peak_rss_mb", "cache_hits", "cache_misses", "cache_hit_rate"]
+)
+
+
+def csv_row(metrics: JobMetrics) -> List[Any]:
+    """Values of one job in CSV_COLUMNS order (empty for missing values)."""
+    values = {
+        "job_id": metrics.job_id,
+        "source": metrics.source,
+        "started": datetime.fromtimestamp(metrics.started_at).isoformat(timespec="seconds"),
+        "total_seconds": metrics.total_seconds,
+        "real_time_factor": metrics.real_time_factor,
+        "prompt_tokens_per_second": metrics.prompt_tokens_per_second,
+        "generation_tokens_per_second": metrics.generation_tokens_per_second,
+        "peak_rss_mb": metrics.peak_rss_bytes / (1024 * 1024) if metrics.peak_rss_bytes else None,
+        "cache_hit_rate": metrics.cache_hit_rate,
+    }
+    for stage in STAGES:
+        values[f"{stage}_seconds"] = metrics.stage_seconds.get(stage)
+    row = []
+    for column in CSV_COLUMNS:
+        value = values[column] if column in values else getattr(metrics, column)
+        if isinstance(value, float):
+            value = round(value, 4)
+        row.append("" if value is None else value)
+    return row
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Peak resident memory of this process.
+
+    Returns:
+        Bytes, or None if it cannot be determined
+    """
+    if os.name == "nt":
+        try:
+            import ctypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", ctypes.c_ulong),
+                    ("PageFaultCount", ctypes.c_ulong),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return int(counters.PeakWorkingSetSize)
+        except Exception:
+            pass
+        return None
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except (ImportError, OSError, ValueError):
+        return None
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+class MetricsHistory:
+    """
+    Metrics of recent jobs, optionally appended to a JSON lines file.
+
+    Safe to use from the processing thread and the UI thread.
+
+    Attributes:
+        path (Optional[Path]): History file (None keeps the history in memory only)
+        max_jobs (int): Number of jobs kept
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_jobs: int = METRICS_HISTORY_JOBS):
+        """
+        Initialize an empty history (see load()).
+
+        Args:
+            path: History file
+            max_jobs: Number of jobs kept in memory and in the file
+        """
+        self.path = Path(path) if path else None
+        self.max_jobs = max(1, max_jobs)
+        self._jobs: Deque[JobMetrics] = deque(maxlen=self.max_jobs)
+        self._lock = threading.Lock()
+
+    def load(self) -> int:
+        """
+        Read the last ``max_jobs`` jobs from the history file.
+
+        The file is rewritten with only those jobs when it has grown to
+        several times that size.
+
+        Returns:
+            Number of jobs in the history
+        """
+        if not self.path or not self.path.exists():
+            return len(self)
+        total = 0
+        lines: Deque[str] = deque(maxlen=self.max_jobs)
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        lines.append(line)
+                        total += 1
+        except OSError as e:
+            logger.warning(f"Cannot read metrics history: {e}")
+            return len(self)
+
+        jobs = []
+        for line in lines:
+            try:
+                jobs.append(JobMetrics.from_dict(json.loads(line)))
+            except (ValueError, TypeError):
+                continue
+        with self._lock:
+            self._jobs = deque(jobs, maxlen=self.max_jobs)
+            if total > 4 * self.max_jobs:
+                self._rewrite(lines)
+        return len(jobs)
+
+    def append(self, metrics: JobMetrics) -> None:
+        """Add the metrics of a finished job (and append them to the file)."""
+        with self._lock:
+            self._jobs.append(metrics)
+            if not self.path:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as handle:
+                    handle.write(json.dumps(metrics.to_dict(), ensure_ascii=False) + "\n")
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"Cannot write metrics history: {e}")
+
+    def _rewrite(self, lines) -> None:
+        """Replace the history file with the given lines."""
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                handle.writelines(lines)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Cannot compact metrics history: {e}")
+
+    def jobs(self, last: Optional[int] = None) -> List[JobMetrics]:
+        """
+        Jobs in the order they finished.
+
+        Args:
+            last: Only the most recent jobs
+        """
+        with self._lock:
+            jobs = list(self._jobs)
+        return jobs[-last:] if last else jobs
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def series(self, name: str, last: Optional[int] = None) -> List[float]:
+        """
+        Values of one metric (attribute or property of JobMetrics) for plotting.
+
+        Jobs without a value are skipped.
+
+        Args:
+            name: Metric name (e.g. "real_time_factor")
+            last: Only the most recent jobs
+        """
+        values = (getattr(job, name) for job in self.jobs(last))
+        return [float(value) for value in values if value is not None]
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """
+        Aggregates over the history for the dashboard.
+
+        Returns:
+            Dict with average real_time_factor, prompt/generation tokens per
+            second and queue wait, the highest peak_rss_bytes, the overall
+            cache_hit_rate and the number of jobs/errors
+        """
+        jobs = self.jobs()
+
+        def mean(name: str) -> Optional[float]:
+            values = [getattr(job, name) for job in jobs]
+            values = [value for value in values if value is not None]
+            return sum(values) / len(values) if values else None
+
+        hits = sum(job.cache_hits for job in jobs)
+        lookups = hits + sum(job.cache_misses for job in jobs)
+        peaks = [job.peak_rss_bytes for job in jobs if job.peak_rss_bytes]
+        return {
+            "jobs": len(jobs),
+            "errors": sum(1 for job in jobs if job.status != "completed"),
+            "real_time_factor": mean("real_time_factor"),
+            "prompt_tokens_per_second": mean("prompt_tokens_per_second"),
+            "generation_tokens_per_second": mean("generation_tokens_per_second"),
+            "queue_wait_seconds": mean("queue_wait_seconds"),
+            "total_seconds": mean("total_seconds"),
+            "peak_rss_bytes": max(peaks) if peaks else None,
+            "cache_hit_rate": hits / lookups if lookups else None,
+        }
+
+    def to_csv(self, destination: Union[str, Path]) -> int:
+        """
+        Write the history as CSV (CSV_COLUMNS).
+
+        Returns:
+            Number of jobs written
+        """
+        jobs = self.jobs()
+        with open(destination, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(csv_row(job) for job in jobs)
+        return len(jobs)
@@ -0,0 +1,381 @@
+"""
+Local store of CTranslate2 Whisper models.
+
+Models are kept in ``MODELS_DIR/faster-whisper/<name>[-<quantization>]`` as
+ready-to-load CTranslate2 directories (``model.bin``, ``config.json``,
+tokenizer and vocabulary files). Every directory has a ``manifest.json`` with
+the size and SHA-256 of each file. Loading a stored model passes its path to
+``WhisperModel`` with ``local_files_only=True``, so no Hugging Face Hub
+lookup happens and transcription works offline.
+
+Hashing a multi-gigabyte ``model.bin`` on every load would cost more than it
+saves, so a successful full check is remembered in ``.verified.json``
+(file sizes and modification times). Later loads re-hash only when a file
+changed.
+
+Usage:
+    python -m pogadane models install turbo --quantization int8
+    python -m pogadane models list
+    python -m pogadane models verify --full
+"""
+
+import hashlib
+import json
+import shutil
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .constants import (
+    WHISPER_STORE_DIR,
+    MODEL_MANIFEST_NAME,
+    MODEL_VERIFIED_NAME,
+    TRANSFORMERS_WHISPER_IDS,
+)
+
+
+# Files a CTranslate2 Whisper model directory must contain
+REQUIRED_FILES = ("model.bin", "config.json")
+
+# Files copied from a converted model (besides REQUIRED_FILES)
+OPTIONAL_FILES = ("tokenizer.json", "preprocessor_config.json",
+                  "vocabulary.json", "vocabulary.txt")
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+@dataclass
+class StoredModel:
+    """
+    A model directory in the local store.
+
+    Attributes:
+        name: Model name (e.g. "turbo", "large-v3")
+        quantization: Weight quantization applied at conversion (None = as published)
+        path: Model directory
+        size_bytes: Total size of the model files
+        source: Where the model came from (Hub repository or imported path)
+    """
+    name: str
+    quantization: Optional[str]
+    path: Path
+    size_bytes: int
+    source: str
+
+    def __str__(self) -> str:
+        quantization = self.quantization or "—"
+        return (f"{self.name:<18} {quantization:<14} {self.size_bytes / 1024**2:>9.0f} MB  "
+                f"{self.path}")
+
+
+def store_dir(root: Optional[Path] = None) -> Path:
+    """Directory holding stored models."""
+    return Path(root) if root else WHISPER_STORE_DIR
+
+
+def model_dir_name(name: str, quantization: Optional[str] = None) -> str:
+    """Directory name of a stored model."""
+    safe_name = name.replace("/", "--")
+    return f"{safe_name}-{quantization}" if quantization else safe_name
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Compute the SHA-256 of a file in chunks.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(directory: Path, name: str, quantization: Optional[str], source: str) -> dict:
+    """
+    Describe the files of a model directory.
+
+    Args:
+        directory: Model directory
+        name: Model name
+        quantization: Quantization applied at conversion (or None)
+        source: Origin of the model
+
+    Returns:
+        Manifest dictionary
+    """
+    files = {}
+    for path in sorted(Path(directory).iterdir()):
+        if not path.is_file() or path.name in (MODEL_MANIFEST_NAME, MODEL_VERIFIED_NAME):
+            continue
+        files[path.name] = {"size": path.stat().st_size, "sha256": file_sha256(path)}
+    return {
+        "name": name,
+        "quantization": quantization,
+        "source": source,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "files": files,
+    }
+
+
+def read_manifest(directory: Path) -> Optional[dict]:
+    """
+    Read the manifest of a model directory.
+
+    Returns:
+        Manifest dictionary, or None if missing or unreadable
+    """
+    try:
+        manifest = json.loads((Path(directory) / MODEL_MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) and "files" in manifest else None
+
+
+def _file_stamps(directory: Path, names) -> Dict[str, list]:
+    """Current (size, mtime_ns) of the given files."""
+    stamps = {}
+    for name in names:
+        stat = (Path(directory) / name).stat()
+        stamps[name] = [stat.st_size, stat.st_mtime_ns]
+    return stamps
+
+
+def verify_model(directory: Path, full: bool = False) -> bool:
+    """
+    Check a stored model against its manifest.
+
+    Sizes are always checked. Checksums are computed when ``full`` is True
+    or when files changed since the last successful check.
+
+    Args:
+        directory: Model directory
+        full: Always recompute checksums
+
+    Returns:
+        True if all files match the manifest
+    """
+    directory = Path(directory)
+    manifest = read_manifest(directory)
+    if manifest is None:
+        return False
+    files = manifest["files"]
+    if any(name not in files for name in REQUIRED_FILES):
+        return False
+
+    for name, expected in files.items():
+        path = directory / name
+        if not path.is_file() or path.stat().st_size != expected.get("size"):
+            return False
+
+    stamps = _file_stamps(directory, files)
+    verified_file = directory / MODEL_VERIFIED_NAME
+    if not full:
+        try:
+            if json.loads(verified_file.read_text(encoding="utf-8")) == stamps:
+                return True
+        except (OSError, ValueError):
+            pass
+
+    for name, expected in files.items():
+        if file_sha256(directory / name) != expected.get("sha256"):
+            return False
+
+    try:
+        verified_file.write_text(json.dumps(stamps), encoding="utf-8")
+    except OSError:
+        pass
+    return True
+
+
+def list_models(root: Optional[Path] = None) -> List[StoredModel]:
+    """
+    List models in the store.
+
+    Args:
+        root: Store directory (defaults to WHISPER_STORE_DIR)
+
+    Returns:
+        Stored models sorted by directory name
+    """
+    directory = store_dir(root)
+    if not directory.is_dir():
+        return []
+    models = []
+    for path in sorted(directory.iterdir()):
+        manifest = read_manifest(path) if path.is_dir() else None
+        if manifest is None:
+            continue
+        models.append(StoredModel(
+            name=manifest.get("name", path.name),
+            quantization=manifest.get("quantization"),
+            path=path,
+            size_bytes=sum(entry.get("size", 0) for entry in manifest["files"].values()),
+            source=manifest.get("source", ""),
+        ))
+    return models
+
+
+def find_model(name: str, compute_type: Optional[str] = None,
+               root: Optional[Path] = None) -> Optional[StoredModel]:
+    """
+    Find the stored model that best matches a compute type.
+
+    Preference: quantization equal to ``compute_type`` (no conversion at load
+    time), then the model as published, then any other quantization.
+
+    Args:
+        name: Model name
+        compute_type: CTranslate2 compute type the model will run with
+        root: Store directory
+
+    Returns:
+        StoredModel or None if the model is not stored
+    """
+    candidates = [model for model in list_models(root) if model.name == name]
+    if not candidates:
+        return None
+
+    def rank(model: StoredModel) -> int:
+        if compute_type and model.quantization == compute_type:
+            return 0
+        return 1 if model.quantization is None else 2
+
+    return min(candidates, key=rank)
+
+
+def _finish(staging: Path, target: Path, name: str, quantization: Optional[str],
+            source: str) -> StoredModel:
+    """Write the manifest and move a staged model directory into place."""
+    manifest = build_manifest(staging, name, quantization, source)
+    missing = [required for required in REQUIRED_FILES if required not in manifest["files"]]
+    if missing:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise ValueError(f"Not a CTranslate2 Whisper model, missing: {', '.join(missing)}")
+    (staging / MODEL_MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+    if target.exists():
+        shutil.rmtree(target)
+    staging.rename(target)
+    verify_model(target)
+    return StoredModel(
+        name=name,
+        quantization=quantization,
+        path=target,
+        size_bytes=sum(entry["size"] for entry in manifest["files"].values()),
+        source=source,
+    )
+
+
+def install_model(name: str, quantization: Optional[str] = None,
+                  root: Optional[Path] = None) -> StoredModel:
+    """
+    Download (and optionally pre-quantize) a model into the store.
+
+    Without quantization the published CTranslate2 conversion is downloaded
+    with faster-whisper. With quantization the original Transformers model
+    is converted by CTranslate2, which requires the ``transformers`` package.
+
+    Args:
+        name: Model name ("turbo", "large-v3", ...)
+        quantization: CTranslate2 quantization (e.g. "int8", "int8_float16")
+        root: Store directory
+
+    Returns:
+        The installed StoredModel
+
+    Raises:
+        ImportError: If a required library is missing
+        ValueError: If the model cannot be converted or is invalid
+    """
+    target = store_dir(root) / model_dir_name(name, quantization)
+    staging = target.with_name(target.name + ".partial")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.parent.mkdir(parents=True, exist_ok=True)
+
+    if quantization:
+        from ctranslate2.converters import TransformersConverter
+
+        source = TRANSFORMERS_WHISPER_IDS.get(name, name)
+        if "/" not in source:
+            raise ValueError(f"No Transformers model known for '{name}'")
+        converter = TransformersConverter(
+            source, copy_files=["tokenizer.json", "preprocessor_config.json"]
+        )
+        converter.convert(str(staging), quantization=quantization, force=True)
+    else:
+        from faster_whisper import download_model
+
+        source = name
+        download_model(name, output_dir=str(staging))
+        # Drop Hub bookkeeping created next to the files
+        shutil.rmtree(staging / ".cache", ignore_errors=True)
+
+    return _finish(staging, target, name, quantization, source)
+
+
+def import_model(source_dir: Path, name: str, quantization: Optional[str] = None,
+                 root: Optional[Path] = None) -> StoredModel:
+    """
+    Copy an already converted CTranslate2 model directory into the store.
+
+    Useful for offline machines: convert or download once, copy the
+    directory, then import it.
+
+    Args:
+        source_dir: Directory with model.bin, config.json and tokenizer files
+        name: Model name to register
+        quantization: Quantization of the weights (if known)
+        root: Store directory
+
+    Returns:
+        The imported StoredModel
+
+    Raises:
+        ValueError: If the directory is not a CTranslate2 Whisper model
+    """
+    source_dir = Path(source_dir)
+    target = store_dir(root) / model_dir_name(name, quantization)
+    staging = target.with_name(target.name + ".partial")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+
+    for file_name in REQUIRED_FILES + OPTIONAL_FILES:
+        path = source_dir / file_name
+        if path.is_file():
+            shutil.copy2(path, staging / file_name)
+
+    return _finish(staging, target, name, quantization, str(source_dir))
+
+
+def resolve_model_path(name: str, compute_type: Optional[str] = None,
+                       root: Optional[Path] = None) -> Optional[Path]:
+    """
+    Path of a verified stored model, for loading without Hub resolution.
+
+    Args:
+        name: Model name
+        compute_type: CTranslate2 compute type the model will run with
+        root: Store directory
+
+    Returns:
+        Model directory, or None if the model is not stored or fails verification
+    """
+    stored = find_model(name, compute_type, root)
+    if stored is None:
+        return None
+    if not verify_model(stored.path):
+        print(f"⚠️ Stored model '{stored.path}' does not match its manifest - ignoring it",
+              file=sys.stderr)
+        return None
+    return stored.path
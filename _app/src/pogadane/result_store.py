@@ -0,0 +1,390 @@
+"""
+Persistent result store with full-text search.
+
+Results are kept in a SQLite database in WAL mode, so the GUI can write
+finished jobs while other processes (``python -m pogadane results search``)
+read the same file. Each row carries the transcription (segment files keep
+their compact ``SegmentStore`` form), the summary and the provenance of the
+result: models, profile, language and the job's performance metrics.
+
+An FTS5 index over source names, transcripts and summaries is kept in sync
+by triggers, so searching thousands of transcripts is an index lookup
+instead of a scan. On SQLite builds without FTS5 the store still works and
+searching falls back to a (slow) substring scan.
+
+Usage:
+    store = ResultStore(RESULTS_DB)
+    store.add("nagranie.mp3", transcription, summary, provenance=provenance)
+    for hit in store.search("budżet", profile="fast"):
+        print(hit.source, hit.snippet)
+    store.close()
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Union
+
+from .metrics import JobMetrics
+from .segments import SegmentStore
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# Columns that can be used in filters (exact match unless noted in _where)
+FILTER_COLUMNS = ("source", "status", "profile", "transcription_model", "summary_model", "since", "until")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL UNIQUE,
+    job_id TEXT,
+    created_at REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'completed',
+    transcription TEXT NOT NULL DEFAULT '',
+    segments BLOB,
+    summary TEXT NOT NULL DEFAULT '',
+    transcription_model TEXT,
+    summary_model TEXT,
+    profile TEXT,
+    language TEXT,
+    audio_seconds REAL,
+    processing_seconds REAL,
+    provenance TEXT,
+    metrics TEXT
+);
+CREATE INDEX IF NOT EXISTS results_created_at ON results(created_at);
+"""
+
+# External-content index: the texts live only in the results table
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS results_fts USING fts5(
+    source, transcription, summary,
+    content='results', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS results_ai AFTER INSERT ON results BEGIN
+    INSERT INTO results_fts(rowid, source, transcription, summary)
+    VALUES (new.id, new.source, new.transcription, new.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS results_ad AFTER DELETE ON results BEGIN
+    INSERT INTO results_fts(results_fts, rowid, source, transcription, summary)
+    VALUES ('delete', old.id, old.source, old.transcription, old.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS results_au AFTER UPDATE ON results BEGIN
+    INSERT INTO results_fts(results_fts, rowid, source, transcription, summary)
+    VALUES ('delete', old.id, old.source, old.transcription, old.summary);
+    INSERT INTO results_fts(rowid, source, transcription, summary)
+    VALUES (new.id, new.source, new.transcription, new.summary);
+END;
+"""
+
+# Row columns returned by filter() and get() (texts are loaded by get() only)
+_META_COLUMNS = (
+    "source", "job_id", "created_at", "status", "transcription_model", "summary_model",
+    "profile", "language", "audio_seconds", "processing_seconds",
+)
+
+
+class SearchHit(NamedTuple):
+    """A search result: the matching source and a fragment around the match."""
+    source: str
+    created_at: float
+    snippet: str
+    score: float  # bm25 rank, lower is better (0 without FTS5)
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn user input into an FTS5 query that cannot be a syntax error.
+
+    Every word is quoted and must occur; the last one also matches as a
+    prefix, so results appear while a word is being typed.
+
+    Args:
+        text: Words typed by the user
+
+    Returns:
+        FTS5 MATCH expression (empty if there are no words)
+    """
+    words = text.split()
+    if not words:
+        return ""
+    terms = ['"' + word.replace('"', '""') + '"' for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+class ResultStore:
+    """
+    SQLite database of processing results with a full-text index.
+
+    The connection is shared between threads and guarded by a lock; SQLite
+    serializes writers anyway and WAL mode keeps readers unblocked.
+
+    Attributes:
+        path (Path): Database file
+        has_fts (bool): Whether the FTS5 index is available
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (create) the database.
+
+        Args:
+            path: Database file (its folder is created if missing)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # Safe with WAL: a crash can lose the last commits, never corrupt the file
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self.has_fts = self._create_fts()
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def _create_fts(self) -> bool:
+        """Create the FTS5 index and its triggers (False if FTS5 is not compiled in)."""
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable ({e}); using substring search")
+            return False
+        # Rank source-name matches higher; ORDER BY rank lets FTS5 score only what it returns
+        self._conn.execute("INSERT INTO results_fts(results_fts, rank) VALUES ('rank', 'bm25(2.0, 1.0, 1.0)')")
+        return True
+
+    def add(self, source: str, transcription: Union[str, SegmentStore], summary: str = "",
+            job_id: Optional[str] = None, status: str = "completed",
+            provenance: Optional[Dict[str, Any]] = None,
+            metrics: Optional[JobMetrics] = None, created_at: Optional[float] = None) -> None:
+        """
+        Store the result of a job, replacing an earlier result of the same source.
+
+        Args:
+            source: Source identifier (file path or URL)
+            transcription: Transcription text or SegmentStore
+            summary: Summary text
+            job_id: Queue job id
+            status: "completed" or "error" (e.g. a partial transcript of a failed job)
+            provenance: Models and parameters that produced the result (see
+                PogadaneBackend.job_provenance); "transcription_model",
+                "summary_model", "profile" and "language" are also stored
+                as filterable columns
+            metrics: Performance metrics of the job
+            created_at: Time the result was produced (default: now), e.g. when
+                results are restored from an archive
+        """
+        self.add_many([dict(source=source, transcription=transcription, summary=summary, job_id=job_id,
+                            status=status, provenance=provenance, metrics=metrics, created_at=created_at)])
+
+    def add_many(self, results: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store several results in one transaction (much faster than add() in a loop).
+
+        Args:
+            results: Dictionaries of add() arguments
+
+        Returns:
+            Number of results stored
+        """
+        rows = [self._row(**result) for result in results]
+        if not rows:
+            return 0
+        columns = ", ".join(rows[0])
+        placeholders = ", ".join(f":{name}" for name in rows[0])
+        with self._lock, self._conn:
+            # DELETE + INSERT rather than INSERT OR REPLACE: REPLACE does not fire
+            # the delete trigger, which would leave stale index entries behind
+            for row in rows:
+                self._conn.execute("DELETE FROM results WHERE source = ?", (row["source"],))
+                self._conn.execute(f"INSERT INTO results ({columns}) VALUES ({placeholders})", row)
+        return len(rows)
+
+    @staticmethod
+    def _row(source: str, transcription: Union[str, SegmentStore], summary: str = "",
+             job_id: Optional[str] = None, status: str = "completed",
+             provenance: Optional[Dict[str, Any]] = None,
+             metrics: Optional[JobMetrics] = None, created_at: Optional[float] = None) -> Dict[str, Any]:
+        """Build the table row of a result (see add())."""
+        provenance = provenance or {}
+        if not isinstance(transcription, SegmentStore):
+            segments = SegmentStore.from_text(transcription or "")
+            if segments is not None and segments.to_text() == transcription:
+                transcription = segments
+        if isinstance(transcription, SegmentStore):
+            text, blob = transcription.plain_text(), transcription.to_bytes()
+        else:
+            text, blob = transcription, None
+
+        row = {
+            "source": source,
+            "job_id": job_id,
+            "created_at": time.time() if created_at is None else created_at,
+            "status": status,
+            "transcription": text,
+            "segments": blob,
+            "summary": summary or "",
+            "transcription_model": provenance.get("transcription_model"),
+            "summary_model": provenance.get("summary_model"),
+            "profile": provenance.get("profile"),
+            "language": provenance.get("language"),
+            "audio_seconds": metrics.audio_seconds if metrics else None,
+            "processing_seconds": metrics.total_seconds if metrics else None,
+            "provenance": json.dumps(provenance, ensure_ascii=False, default=str),
+            "metrics": json.dumps(metrics.to_dict()) if metrics else None,
+        }
+        return row
+
+    def get(self, source: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a stored result.
+
+        Args:
+            source: Source identifier
+
+        Returns:
+            Dictionary with the metadata columns, "transcription" (SegmentStore
+            or string), "summary", "provenance" (dict) and "metrics" (JobMetrics
+            or None); None if the source is not stored
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM results WHERE source = ?", (source,)).fetchone()
+        if row is None:
+            return None
+        result = {name: row[name] for name in _META_COLUMNS}
+        result["transcription"] = (
+            SegmentStore.from_bytes(row["segments"]) if row["segments"] is not None else row["transcription"]
+        )
+        result["summary"] = row["summary"]
+        result["provenance"] = json.loads(row["provenance"]) if row["provenance"] else {}
+        result["metrics"] = JobMetrics.from_dict(json.loads(row["metrics"])) if row["metrics"] else None
+        return result
+
+    def sources(self) -> set:
+        """Sources of all stored results."""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT source FROM results")}
+
+    def delete(self, source: str) -> bool:
+        """Remove a stored result (True if it existed)."""
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM results WHERE source = ?", (source,)).rowcount > 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def search(self, query: str, limit: int = 50, raw: bool = False, **filters: Any) -> List[SearchHit]:
+        """
+        Find results whose source name, transcript or summary contain the words.
+
+        Args:
+            query: Words to find (all must occur; diacritics are ignored)
+            limit: Maximum number of hits
+            raw: Pass the query to FTS5 unchanged (AND/OR/NOT, "phrases", prefix*)
+            **filters: Restrict the results, see filter()
+
+        Returns:
+            Best matches first
+
+        Raises:
+            ValueError: If a raw query is not valid FTS5 syntax or a filter is unknown
+        """
+        if not self.has_fts:
+            return self._scan(query, limit, filters)
+        match = query.strip() if raw else fts_query(query)
+        if not match:
+            return []
+        where, params = self._where(filters, prefix="r.")
+        sql = (
+            "SELECT r.source, r.created_at, "
+            "snippet(results_fts, -1, '[', ']', '…', 12) AS snippet, "
+            "results_fts.rank AS score "
+            "FROM results_fts JOIN results r ON r.id = results_fts.rowid "
+            f"WHERE results_fts MATCH ?{' AND ' + where if where else ''} "
+            "ORDER BY results_fts.rank LIMIT ?"
+        )
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, [match, *params, limit]).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query: {e}") from e
+        return [SearchHit(row["source"], row["created_at"], row["snippet"], row["score"]) for row in rows]
+
+    def _scan(self, query: str, limit: int, filters: Dict[str, Any]) -> List[SearchHit]:
+        """Substring search used when FTS5 is not available."""
+        words = query.split()
+        if not words:
+            return []
+        where, params = self._where(filters)
+        conditions = [where] if where else []
+        for word in words:
+            conditions.append("(source LIKE ? OR transcription LIKE ? OR summary LIKE ?)")
+            params.extend([f"%{word}%"] * 3)
+        sql = (f"SELECT source, created_at, substr(summary, 1, 80) AS snippet FROM results "
+               f"WHERE {' AND '.join(conditions)} ORDER BY created_at DESC LIMIT ?")
+        with self._lock:
+            rows = self._conn.execute(sql, [*params, limit]).fetchall()
+        return [SearchHit(row["source"], row["created_at"], row["snippet"], 0.0) for row in rows]
+
+    def filter(self, limit: Optional[int] = 100, offset: int = 0, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        List stored results by metadata, newest first.
+
+        Args:
+            limit: Maximum number of rows (None = all)
+            offset: Rows to skip (paging)
+            **filters: source (substring of the name), status, profile,
+                transcription_model, summary_model (exact values), since and
+                until (Unix timestamps of created_at)
+
+        Returns:
+            Metadata of the results (without texts; use get() for those)
+
+        Raises:
+            ValueError: If a filter is unknown
+        """
+        where, params = self._where(filters)
+        sql = (f"SELECT {', '.join(_META_COLUMNS)} FROM results"
+               f"{' WHERE ' + where if where else ''} ORDER BY created_at DESC LIMIT ? OFFSET ?")
+        with self._lock:
+            rows = self._conn.execute(sql, [*params, -1 if limit is None else limit, offset]).fetchall()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def _where(filters: Dict[str, Any], prefix: str = ""):
+        """Build the SQL condition and parameters of metadata filters (None values are ignored)."""
+        conditions, params = [], []
+        for name, value in filters.items():
+            if name not in FILTER_COLUMNS:
+                raise ValueError(f"Unknown filter: {name}")
+            if value is None:
+                continue
+            if name == "source":
+                conditions.append(f"{prefix}source LIKE ? ESCAPE '\\'")
+                escaped = str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                params.append(f"%{escaped}%")
+            elif name == "since":
+                conditions.append(f"{prefix}created_at >= ?")
+                params.append(float(value))
+            elif name == "until":
+                conditions.append(f"{prefix}created_at < ?")
+                params.append(float(value))
+            else:
+                conditions.append(f"{prefix}{name} = ?")
+                params.append(value)
+        return " AND ".join(conditions), params
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
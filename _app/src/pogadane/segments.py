@@ -0,0 +1,421 @@
+"""
+Compact, array-backed storage for transcript segments.
+
+A transcript of a few hours has thousands of segments. Keeping each of them
+as a Python object (plus a formatted line string, plus token and word
+objects) costs hundreds of bytes per segment and per word. ``SegmentStore``
+keeps the same information in a handful of flat buffers:
+
+- segment start/end times in ``array('f')`` columns, kept at the 10 ms
+  resolution of the rendered ``[12.34s -> 15.67s]`` format,
+- all segment texts in one UTF-8 ``bytearray`` with an offsets column,
+- optional word timestamps stored the same way,
+- optional per-segment average log-probability (decoder confidence).
+
+Lines in the familiar ``[12.34s -> 15.67s] text`` format are rendered lazily,
+time lookup uses binary search, and the store can be saved to and loaded
+from a compact binary file.
+
+Usage:
+    store = SegmentStore.from_segments(segments)
+    index = store.index_at(125.0)
+    print(store.line(index))
+    text = store.to_text()
+"""
+
+import math
+import re
+import struct
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+
+# One transcript line: "[12.34s -> 15.67s] text"
+LINE_PATTERN = re.compile(r'^\[(\d+(?:\.\d+)?)s -> (\d+(?:\.\d+)?)s\] (.*)$')
+
+# Times are rounded like the rendered lines, so float32 storage renders exactly
+TIME_DECIMALS = 2
+
+_MAGIC = b"PSEG1\n"
+_HEADER = struct.Struct("<IIII")  # segments, words, text bytes, word text bytes
+# Optional trailer with one float32 log-probability per segment (readers
+# of stores without it simply stop before it)
+_LOGPROB_MARKER = b"LOGP"
+
+
+class Segment(NamedTuple):
+    """A single segment materialized from a SegmentStore."""
+    start: float
+    end: float
+    text: str
+
+
+class Word(NamedTuple):
+    """A single word with timestamps."""
+    start: float
+    end: float
+    word: str
+
+
+def format_line(start: float, end: float, text: str) -> str:
+    """Format a segment as a transcript line."""
+    return f"[{start:.2f}s -> {end:.2f}s] {text}"
+
+
+class SegmentStore:
+    """
+    Column-oriented container of transcript segments.
+
+    Segments must be appended in chronological order of their start time.
+    """
+
+    __slots__ = (
+        "_starts", "_ends", "_text", "_offsets",
+        "_word_starts", "_word_ends", "_word_text", "_word_offsets", "_word_index",
+        "_logprobs",
+    )
+
+    def __init__(self):
+        """Create an empty store."""
+        self._starts = array("f")
+        self._ends = array("f")
+        self._text = bytearray()
+        self._offsets = array("I", [0])
+        self._word_starts = array("f")
+        self._word_ends = array("f")
+        self._word_text = bytearray()
+        self._word_offsets = array("I", [0])
+        # First word index of every segment (plus end sentinel)
+        self._word_index = array("I", [0])
+        # Average log-probability per segment (NaN if unknown); empty if no segment has one
+        self._logprobs = array("f")
+
+    # ------------------------------------------------------------------ building
+
+    def append(self, start: float, end: float, text: str, words: Optional[Iterable[Any]] = None,
+               logprob: Optional[float] = None):
+        """
+        Append a segment.
+
+        Args:
+            start: Start time in seconds
+            end: End time in seconds
+            text: Segment text
+            words: Optional words with ``start``, ``end`` and ``word`` attributes
+                (or (start, end, word) tuples)
+            logprob: Optional average log-probability of the segment's tokens
+        """
+        if logprob is not None and not self._logprobs:
+            self._logprobs.extend([math.nan] * len(self._starts))
+        if self._logprobs or logprob is not None:
+            self._logprobs.append(math.nan if logprob is None else logprob)
+        self._starts.append(round(start, TIME_DECIMALS))
+        self._ends.append(round(end, TIME_DECIMALS))
+        self._text += text.encode("utf-8")
+        self._offsets.append(len(self._text))
+
+        for word in words or ():
+            if isinstance(word, tuple):
+                word_start, word_end, word_text = word[:3]
+            else:
+                word_start, word_end, word_text = word.start, word.end, word.word
+            self._word_starts.append(round(word_start, TIME_DECIMALS))
+            self._word_ends.append(round(word_end, TIME_DECIMALS))
+            self._word_text += word_text.encode("utf-8")
+            self._word_offsets.append(len(self._word_text))
+        self._word_index.append(len(self._word_starts))
+
+    def extend(self, segments: Iterable[Any]):
+        """
+        Append segment objects (e.g. faster-whisper segments).
+
+        Args:
+            segments: Objects with ``start``, ``end``, ``text`` and optional
+                ``words`` and ``avg_logprob``
+        """
+        for segment in segments:
+            self.append(segment.start, segment.end, segment.text, getattr(segment, "words", None),
+                        getattr(segment, "avg_logprob", None))
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Any]) -> "SegmentStore":
+        """Build a store from segment objects."""
+        store = cls()
+        store.extend(segments)
+        return store
+
+    @classmethod
+    def from_columns(cls, starts: Iterable[float], ends: Iterable[float], texts: Iterable[str],
+                     logprobs: Optional[Iterable[Optional[float]]] = None) -> "SegmentStore":
+        """
+        Build a store from columns of segment values (e.g. read from a table).
+
+        Faster than appending segments one by one; word timestamps are not set.
+
+        Args:
+            starts: Start times in seconds
+            ends: End times in seconds
+            texts: Segment texts
+            logprobs: Optional average log-probabilities (None for unknown values)
+        """
+        store = cls()
+        store._starts = array("f", [round(start, TIME_DECIMALS) for start in starts])
+        store._ends = array("f", [round(end, TIME_DECIMALS) for end in ends])
+        encoded = [text.encode("utf-8") for text in texts]
+        if not len(store._starts) == len(store._ends) == len(encoded):
+            raise ValueError("Segment columns differ in length")
+        store._text = bytearray(b"".join(encoded))
+        store._offsets = array("I", accumulate(map(len, encoded), initial=0))
+        store._word_index = array("I", [0]) * (len(encoded) + 1)
+        logprobs = list(logprobs or ())
+        if any(logprob is not None for logprob in logprobs):
+            store._logprobs = array("f", [math.nan if logprob is None else logprob for logprob in logprobs])
+        return store
+
+    @classmethod
+    def from_text(cls, text: str) -> Optional["SegmentStore"]:
+        """
+        Parse a transcript in ``[start s -> end s] text`` line format.
+
+        Args:
+            text: Transcript text
+
+        Returns:
+            SegmentStore, or None if any line is not in segment format
+        """
+        if not text:
+            return None
+        store = cls()
+        for line in text.split("\n"):
+            match = LINE_PATTERN.match(line)
+            if not match:
+                return None
+            store.append(float(match.group(1)), float(match.group(2)), match.group(3))
+        return store
+
+    # ------------------------------------------------------------------ access
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __bool__(self) -> bool:
+        return len(self._starts) > 0
+
+    def __getitem__(self, index: int) -> Segment:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        return Segment(self.start(index), self.end(index), self.text(index))
+
+    def __iter__(self) -> Iterator[Segment]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SegmentStore):
+            return NotImplemented
+        # Log-probabilities are compared as bytes: unknown values are NaN, and NaN != NaN
+        return (all(getattr(self, name) == getattr(other, name)
+                    for name in self.__slots__ if name != "_logprobs")
+                and self._logprobs.tobytes() == other._logprobs.tobytes())
+
+    def text(self, index: int) -> str:
+        """Text of one segment."""
+        return self._text[self._offsets[index]:self._offsets[index + 1]].decode("utf-8")
+
+    def start(self, index: int) -> float:
+        """Start time of one segment."""
+        return round(self._starts[index], TIME_DECIMALS)
+
+    def end(self, index: int) -> float:
+        """End time of one segment."""
+        return round(self._ends[index], TIME_DECIMALS)
+
+    def words(self, index: int) -> List[Word]:
+        """
+        Word timestamps of one segment.
+
+        Returns:
+            List of Word tuples (empty if words were not stored)
+        """
+        result = []
+        for w in range(self._word_index[index], self._word_index[index + 1]):
+            result.append(Word(
+                round(self._word_starts[w], TIME_DECIMALS),
+                round(self._word_ends[w], TIME_DECIMALS),
+                self._word_text[self._word_offsets[w]:self._word_offsets[w + 1]].decode("utf-8"),
+            ))
+        return result
+
+    def logprob(self, index: int) -> Optional[float]:
+        """Average log-probability of one segment (None if not recorded)."""
+        if not self._logprobs or math.isnan(self._logprobs[index]):
+            return None
+        return self._logprobs[index]
+
+    @property
+    def has_logprobs(self) -> bool:
+        """True if log-probabilities are stored."""
+        return len(self._logprobs) > 0
+
+    @property
+    def has_words(self) -> bool:
+        """True if word timestamps are stored."""
+        return len(self._word_starts) > 0
+
+    @property
+    def duration(self) -> float:
+        """End time of the last segment (0.0 if empty)."""
+        return round(self._ends[-1], TIME_DECIMALS) if self._ends else 0.0
+
+    def index_at(self, seconds: float) -> int:
+        """
+        Find the segment playing at a given time (binary search).
+
+        Args:
+            seconds: Time in seconds
+
+        Returns:
+            Index of the last segment starting at or before ``seconds``
+            (0 for times before the first segment, -1 if empty)
+        """
+        if not self._starts:
+            return -1
+        return max(0, bisect_right(self._starts, seconds) - 1)
+
+    def range_between(self, start: float, end: float) -> Tuple[int, int]:
+        """
+        Index range of segments overlapping a time window.
+
+        Args:
+            start: Window start in seconds
+            end: Window end in seconds
+
+        Returns:
+            (first, stop) indices suitable for ``range(first, stop)``
+        """
+        first = self.index_at(start)
+        if first < 0:
+            return 0, 0
+        if self._ends[first] < start:
+            first += 1
+        stop = bisect_right(self._starts, end)
+        return first, max(first, stop)
+
+    # ------------------------------------------------------------------ rendering
+
+    def line(self, index: int) -> str:
+        """Render one segment as a transcript line."""
+        return format_line(self._starts[index], self._ends[index], self.text(index))
+
+    def iter_lines(self, first: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """
+        Lazily render transcript lines.
+
+        Args:
+            first: Index of the first segment
+            stop: Index after the last segment (defaults to the end)
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        for index in range(first, stop):
+            yield self.line(index)
+
+    def to_text(self, first: int = 0, stop: Optional[int] = None) -> str:
+        """Render segments as newline-joined transcript lines."""
+        return "\n".join(self.iter_lines(first, stop))
+
+    def plain_text(self) -> str:
+        """All segment texts without timestamps."""
+        return " ".join(self.text(index).strip() for index in range(len(self)))
+
+    def __str__(self) -> str:
+        return self.to_text()
+
+    # ------------------------------------------------------------------ size / persistence
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the buffers in bytes."""
+        columns = (self._starts, self._ends, self._offsets, self._logprobs,
+                   self._word_starts, self._word_ends, self._word_offsets, self._word_index)
+        return (sum(column.itemsize * len(column) for column in columns)
+                + len(self._text) + len(self._word_text))
+
+    def to_bytes(self) -> bytes:
+        """Serialize the store to a compact binary representation."""
+        parts = [
+            _MAGIC,
+            _HEADER.pack(len(self), len(self._word_starts), len(self._text), len(self._word_text)),
+        ]
+        for column in (self._starts, self._ends, self._offsets,
+                       self._word_starts, self._word_ends, self._word_offsets, self._word_index):
+            little = array(column.typecode, column)
+            if struct.pack("=I", 1) != struct.pack("<I", 1):
+                little.byteswap()
+            parts.append(little.tobytes())
+        parts.append(bytes(self._text))
+        parts.append(bytes(self._word_text))
+        if self._logprobs:
+            little = array("f", self._logprobs)
+            if struct.pack("=I", 1) != struct.pack("<I", 1):
+                little.byteswap()
+            parts.append(_LOGPROB_MARKER)
+            parts.append(little.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, memoryview]) -> "SegmentStore":
+        """
+        Deserialize a store created by ``to_bytes``.
+
+        Raises:
+            ValueError: If the data is not a serialized SegmentStore
+        """
+        data = memoryview(data)
+        if bytes(data[:len(_MAGIC)]) != _MAGIC:
+            raise ValueError("Not a segment store")
+        position = len(_MAGIC)
+        segments, words, text_bytes, word_text_bytes = _HEADER.unpack_from(data, position)
+        position += _HEADER.size
+
+        store = cls()
+        big_endian = struct.pack("=I", 1) != struct.pack("<I", 1)
+
+        def read(typecode: str, count: int) -> array:
+            nonlocal position
+            column = array(typecode)
+            size = column.itemsize * count
+            column.frombytes(data[position:position + size])
+            if big_endian:
+                column.byteswap()
+            position += size
+            return column
+
+        store._starts = read("f", segments)
+        store._ends = read("f", segments)
+        store._offsets = read("I", segments + 1)
+        store._word_starts = read("f", words)
+        store._word_ends = read("f", words)
+        store._word_offsets = read("I", words + 1)
+        store._word_index = read("I", segments + 1)
+        store._text = bytearray(data[position:position + text_bytes])
+        position += text_bytes
+        store._word_text = bytearray(data[position:position + word_text_bytes])
+        position += word_text_bytes
+        if bytes(data[position:position + len(_LOGPROB_MARKER)]) == _LOGPROB_MARKER:
+            position += len(_LOGPROB_MARKER)
+            store._logprobs = read("f", segments)
+        return store
+
+    def save(self, path: Path):
+        """Write the store to a file."""
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Path) -> "SegmentStore":
+        """Read a store written by ``save``."""
+        return cls.from_bytes(Path(path).read_bytes())
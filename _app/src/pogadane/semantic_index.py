@@ -0,0 +1,455 @@
+"""
+Local semantic search over transcript fragments.
+
+Transcripts are split into chunks of consecutive segments (about
+``SEMANTIC_CHUNK_CHARS`` characters each), every chunk is embedded with a
+small sentence-embedding model running on the CPU and the normalized
+vectors are kept as one float16 NumPy matrix. A query is embedded the same
+way and compared with all chunks by a brute-force dot product in blocks;
+for tens of thousands of chunks this is a few milliseconds, so no
+approximate index is needed.
+
+The index is stored in a folder and updated incrementally:
+
+- ``vectors.f16``: float16 vectors appended as raw rows,
+- ``chunks.jsonl``: one record per added result (its source and chunk
+  times and texts, matching the next rows of ``vectors.f16``) or removed
+  result,
+- ``index.json``: embedding model and vector size; an index built with a
+  different model is discarded.
+
+Removed and replaced results only mark their rows as deleted; the files are
+rewritten when deleted rows outnumber the live ones.
+
+The default embedder uses the optional ``sentence-transformers`` package
+(``pip install sentence-transformers``); any callable mapping a list of
+texts to a 2-D array can be used instead.
+
+Usage:
+    index = SemanticIndex(SEMANTIC_INDEX_DIR, "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2")
+    index.add("spotkanie.mp3", segments)
+    for hit in index.search("kiedy rozmawialiśmy o budżecie", per_source=1):
+        print(hit.source, hit.start, hit.text)
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .constants import SEMANTIC_CHUNK_CHARS, SEMANTIC_SEARCH_BLOCK_ROWS
+from .segments import SegmentStore
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Texts -> (len(texts), dim) array of vectors
+Embedder = Callable[[List[str]], np.ndarray]
+
+
+class Chunk(NamedTuple):
+    """A fragment of a transcript (times are None without timestamps)."""
+    start: Optional[float]
+    end: Optional[float]
+    text: str
+
+
+class SemanticHit(NamedTuple):
+    """A transcript fragment similar to the query."""
+    source: str
+    start: Optional[float]
+    end: Optional[float]
+    text: str
+    score: float  # cosine similarity, higher is better
+
+
+def chunk_transcription(transcription: Union[str, SegmentStore],
+                        max_chars: int = SEMANTIC_CHUNK_CHARS) -> List[Chunk]:
+    """
+    Split a transcription into chunks of consecutive segments (or words).
+
+    Args:
+        transcription: SegmentStore or plain text
+        max_chars: Approximate chunk length; a single longer segment is kept whole
+
+    Returns:
+        Chunks in transcript order
+    """
+    chunks: List[Chunk] = []
+    if isinstance(transcription, SegmentStore):
+        start, end, texts, size = None, None, [], 0
+        for index in range(len(transcription)):
+            text = transcription.text(index).strip()
+            if not text:
+                continue
+            if texts and size + len(text) > max_chars:
+                chunks.append(Chunk(start, end, " ".join(texts)))
+                texts, size = [], 0
+            if not texts:
+                start = transcription.start(index)
+            texts.append(text)
+            size += len(text) + 1
+            end = transcription.end(index)
+        if texts:
+            chunks.append(Chunk(start, end, " ".join(texts)))
+        return chunks
+
+    words, size = [], 0
+    for word in (transcription or "").split():
+        if words and size + len(word) > max_chars:
+            chunks.append(Chunk(None, None, " ".join(words)))
+            words, size = [], 0
+        words.append(word)
+        size += len(word) + 1
+    if words:
+        chunks.append(Chunk(None, None, " ".join(words)))
+    return chunks
+
+
+class SentenceEmbedder:
+    """
+    sentence-transformers model loaded on first use.
+
+    Attributes:
+        model_name (str): Hugging Face model id
+        device (str): Torch device ("cpu")
+    """
+
+    def __init__(self, model_name: str, device: str = "cpu"):
+        self.model_name = model_name
+        self.device = device
+        self._model = None
+        self._lock = threading.Lock()
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts.
+
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+                self._model = SentenceTransformer(self.model_name, device=self.device)
+        return self._model.encode(texts, batch_size=32, normalize_embeddings=True,
+                                  convert_to_numpy=True, show_progress_bar=False)
+
+
+class SemanticIndex:
+    """
+    Embedding index of transcript chunks with incremental add/remove.
+
+    Methods are thread-safe; embedding runs outside the lock, so searches
+    are not blocked while a long transcript is being indexed.
+
+    Attributes:
+        directory (Path): Index folder
+        model_name (str): Embedding model recorded with the vectors
+        dim (int): Vector size (0 until the first vectors are added)
+    """
+
+    def __init__(self, directory: Union[str, Path], model_name: str,
+                 embedder: Optional[Embedder] = None, max_chars: int = SEMANTIC_CHUNK_CHARS):
+        """
+        Open (create) an index.
+
+        Args:
+            directory: Index folder (created if missing)
+            model_name: Embedding model; an index built with another model is discarded
+            embedder: Function embedding texts (default: SentenceEmbedder(model_name))
+            max_chars: Chunk length, see chunk_transcription()
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        self.embed = embedder or SentenceEmbedder(model_name)
+        self.max_chars = max_chars
+        self.dim = 0
+        self._lock = threading.Lock()
+        self._vectors = np.zeros((0, 0), dtype=np.float16)  # capacity >= _count rows
+        self._count = 0
+        self._alive = np.zeros(0, dtype=bool)
+        self._row_source = np.zeros(0, dtype=np.int32)
+        self._starts = np.zeros(0, dtype=np.float32)  # NaN without timestamps
+        self._ends = np.zeros(0, dtype=np.float32)
+        self._texts: List[str] = []
+        self._source_names: List[str] = []  # source number -> source
+        self._rows: Dict[str, Tuple[int, int]] = {}  # live source -> (first row, row count)
+        self._dead = 0
+        self._load()
+
+    # ------------------------------------------------------------------ files
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.directory / "vectors.f16"
+
+    @property
+    def _chunks_path(self) -> Path:
+        return self.directory / "chunks.jsonl"
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.directory / "index.json"
+
+    def _load(self) -> None:
+        """Read the index files (a missing, foreign or damaged index starts empty)."""
+        try:
+            meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = None
+        if not meta or meta.get("version") != INDEX_VERSION or meta.get("model") != self.model_name:
+            if meta:
+                logger.info(f"Semantic index built with {meta.get('model')}; rebuilding for {self.model_name}")
+            self._reset_files()
+            return
+        self.dim = int(meta["dim"])
+        if not self.dim:
+            return
+        vectors = np.zeros(0, dtype=np.float16)
+        records = []
+        if self._vectors_path.exists():
+            vectors = np.fromfile(self._vectors_path, dtype=np.float16)
+        vectors = vectors[:len(vectors) // self.dim * self.dim].reshape(-1, self.dim)
+        self._vectors = np.zeros((0, self.dim), dtype=np.float16)
+        clean = True
+        if self._chunks_path.exists():
+            with open(self._chunks_path, encoding="utf-8") as log:
+                for line in log:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        clean = False  # a record cut off by a crash ends the log
+                        break
+        rows = 0
+        for record in records:
+            if "remove" in record:
+                self._remove_rows(record["remove"])
+                continue
+            chunks = [Chunk(*chunk) for chunk in record["chunks"]]
+            if rows + len(chunks) > len(vectors):
+                clean = False  # vectors of the last result were not fully written
+                break
+            self._append_rows(record["source"], chunks, vectors[rows:rows + len(chunks)])
+            rows += len(chunks)
+        if not clean or rows != len(vectors):
+            logger.warning("Semantic index was not closed cleanly; rewriting it")
+            self._rewrite()
+
+    def _reset_files(self) -> None:
+        """Start an empty index on disk."""
+        self._vectors_path.write_bytes(b"")
+        self._chunks_path.write_text("", encoding="utf-8")
+        self._write_meta()
+
+    def _write_meta(self) -> None:
+        self._meta_path.write_text(json.dumps({
+            "version": INDEX_VERSION, "model": self.model_name, "dim": self.dim,
+        }), encoding="utf-8")
+
+    def _rewrite(self) -> None:
+        """Write the live rows to new files, dropping deleted ones."""
+        order = sorted(self._rows.items(), key=lambda item: item[1][0])
+        vectors = [self._vectors[first:first + count] for _source, (first, count) in order]
+        chunks = [(source, self._chunks(first, count)) for source, (first, count) in order]
+        for name in ("_alive", "_row_source", "_starts", "_ends"):
+            setattr(self, name, getattr(self, name)[:0])
+        self._vectors = np.zeros((0, self.dim), dtype=np.float16)
+        self._count, self._dead, self._texts, self._source_names, self._rows = 0, 0, [], [], {}
+        for (source, source_chunks), source_vectors in zip(chunks, vectors):
+            self._append_rows(source, source_chunks, source_vectors)
+
+        vectors_tmp = self._vectors_path.with_suffix(".tmp")
+        chunks_tmp = self._chunks_path.with_suffix(".tmp")
+        self._vectors[:self._count].tofile(vectors_tmp)
+        with open(chunks_tmp, "w", encoding="utf-8") as log:
+            for source, source_chunks in chunks:
+                log.write(self._record(source, source_chunks) + "\n")
+        os.replace(vectors_tmp, self._vectors_path)
+        os.replace(chunks_tmp, self._chunks_path)
+        self._write_meta()
+
+    @staticmethod
+    def _record(source: str, chunks: Sequence[Chunk]) -> str:
+        return json.dumps({"source": source, "chunks": [list(chunk) for chunk in chunks]}, ensure_ascii=False)
+
+    # ------------------------------------------------------------------ rows
+
+    def _append_rows(self, source: str, chunks: Sequence[Chunk], vectors: np.ndarray) -> None:
+        """Add rows in memory (caller holds the lock or is the constructor)."""
+        self._remove_rows(source)
+        count = len(chunks)
+        needed = self._count + count
+        if needed > len(self._alive):
+            capacity = max(needed, 2 * len(self._alive), 1024)
+            grown = np.zeros((capacity, self.dim), dtype=np.float16)
+            grown[:self._count] = self._vectors[:self._count]
+            self._vectors = grown
+            for name, dtype in (("_alive", bool), ("_row_source", np.int32),
+                                ("_starts", np.float32), ("_ends", np.float32)):
+                column = np.zeros(capacity, dtype=dtype)
+                column[:self._count] = getattr(self, name)[:self._count]
+                setattr(self, name, column)
+        rows = slice(self._count, needed)
+        self._vectors[rows] = vectors
+        self._alive[rows] = True
+        self._row_source[rows] = len(self._source_names)
+        self._starts[rows] = [math.nan if chunk.start is None else chunk.start for chunk in chunks]
+        self._ends[rows] = [math.nan if chunk.end is None else chunk.end for chunk in chunks]
+        self._texts.extend(chunk.text for chunk in chunks)
+        self._source_names.append(source)
+        self._rows[source] = (self._count, count)
+        self._count = needed
+
+    def _remove_rows(self, source: str) -> bool:
+        span = self._rows.pop(source, None)
+        if span is None:
+            return False
+        first, count = span
+        self._alive[first:first + count] = False
+        self._dead += count
+        return True
+
+    def _chunks(self, first: int, count: int) -> List[Chunk]:
+        return [
+            Chunk(None if math.isnan(self._starts[row]) else round(float(self._starts[row]), 2),
+                  None if math.isnan(self._ends[row]) else round(float(self._ends[row]), 2),
+                  self._texts[row])
+            for row in range(first, first + count)
+        ]
+
+    def _normalized(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    # ------------------------------------------------------------------ public API
+
+    def add(self, source: str, transcription: Union[str, SegmentStore]) -> int:
+        """
+        Index a result, replacing an earlier version of the same source.
+
+        Args:
+            source: Source identifier (file path or URL)
+            transcription: SegmentStore or plain text
+
+        Returns:
+            Number of chunks indexed
+
+        Raises:
+            ImportError: If the default embedder's library is not installed
+        """
+        chunks = chunk_transcription(transcription, self.max_chars)
+        if not chunks:
+            self.remove(source)
+            return 0
+        vectors = self._normalized(self.embed([chunk.text for chunk in chunks])).astype(np.float16)
+        with self._lock:
+            if not self.dim:
+                self.dim = vectors.shape[1]
+                self._vectors = np.zeros((0, self.dim), dtype=np.float16)
+                self._write_meta()
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"Embedding size {vectors.shape[1]} does not match the index ({self.dim})")
+            self._append_rows(source, chunks, vectors)
+            with open(self._vectors_path, "ab") as out:
+                vectors.tofile(out)
+            with open(self._chunks_path, "a", encoding="utf-8") as log:
+                log.write(self._record(source, chunks) + "\n")
+            self._compact_if_needed()
+        return len(chunks)
+
+    def remove(self, source: str) -> bool:
+        """Remove a result from the index (True if it was indexed)."""
+        with self._lock:
+            if not self._remove_rows(source):
+                return False
+            with open(self._chunks_path, "a", encoding="utf-8") as log:
+                log.write(json.dumps({"remove": source}, ensure_ascii=False) + "\n")
+            self._compact_if_needed()
+        return True
+
+    def _compact_if_needed(self) -> None:
+        if self._dead > 1000 and self._dead > self._count - self._dead:
+            self._rewrite()
+
+    def __contains__(self, source: str) -> bool:
+        return source in self._rows
+
+    def __len__(self) -> int:
+        """Number of indexed chunks."""
+        return self._count - self._dead
+
+    @property
+    def sources(self) -> List[str]:
+        """Indexed sources."""
+        with self._lock:
+            return list(self._rows)
+
+    def search(self, query: str, limit: int = 10, per_source: Optional[int] = None) -> List[SemanticHit]:
+        """
+        Find the chunks closest in meaning to a query.
+
+        Args:
+            query: Question or description, e.g. "where we discussed the budget"
+            limit: Maximum number of hits
+            per_source: Keep at most this many hits of one source (None = no limit)
+
+        Returns:
+            Best matches first
+
+        Raises:
+            ImportError: If the default embedder's library is not installed
+        """
+        if limit <= 0 or not query.strip() or not len(self):
+            return []
+        vector = self._normalized(self.embed([query.strip()]))[0]
+        with self._lock:
+            count = self._count
+            scores = np.empty(count, dtype=np.float32)
+            # float16 has no BLAS kernels: convert one block at a time to keep memory flat
+            for first in range(0, count, SEMANTIC_SEARCH_BLOCK_ROWS):
+                block = self._vectors[first:min(first + SEMANTIC_SEARCH_BLOCK_ROWS, count)]
+                np.dot(block.astype(np.float32), vector, out=scores[first:first + len(block)])
+            scores[~self._alive[:count]] = -np.inf
+            if per_source is None:
+                wanted = min(limit, count)
+                top = np.argpartition(-scores, wanted - 1)[:wanted]
+                top = top[np.argsort(-scores[top], kind="stable")]
+            else:
+                # Hits of other sources can be far down the ranking
+                top = np.argsort(-scores, kind="stable")
+            hits, per = [], {}
+            for row in top:
+                if not np.isfinite(scores[row]):
+                    break
+                source = self._source_names[self._row_source[row]]
+                if per_source is not None:
+                    if per.get(source, 0) >= per_source:
+                        continue
+                    per[source] = per.get(source, 0) + 1
+                chunk = self._chunks(int(row), 1)[0]
+                hits.append(SemanticHit(source, chunk.start, chunk.end, chunk.text, float(scores[row])))
+                if len(hits) >= limit:
+                    break
+        return hits
+
+    def clear(self) -> None:
+        """Remove everything from the index."""
+        with self._lock:
+            self.dim = 0
+            self._vectors = np.zeros((0, 0), dtype=np.float16)
+            self._count = self._dead = 0
+            self._alive = self._alive[:0]
+            self._row_source = self._row_source[:0]
+            self._starts = self._starts[:0]
+            self._ends = self._ends[:0]
+            self._texts, self._source_names, self._rows = [], [], {}
+            self._reset_files()
@@ -0,0 +1,272 @@
+"""
+Cross-file batching for short recordings.
+
+``BatchedInferencePipeline`` batches 30-second windows of a single file. For
+queues of many short voice notes the per-call overhead dominates, so this
+module packs windows from many files into one shared timeline: the files are
+concatenated (each padded to a whole second so offsets are exact), every file
+contributes its own windows as ``clip_timestamps``, and the decoded segments
+are routed back to their source file by offset. Files are packed by the
+length of their decoded audio: container headers (VBR MP3s, damaged files)
+can understate it, and a file longer than its slot would be cut off.
+
+Windows never cross file boundaries: clip_timestamps are used as given
+(VAD re-chunking, which would merge speech across files, is switched off)
+and every window is decoded without the text of the previous one. Text of
+one file therefore cannot appear in another, but results may still differ
+slightly from a separate run of each file (e.g. language detection and
+padding of the batch).
+"""
+
+import math
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+SAMPLE_RATE = 16000
+
+# Longest window accepted by Whisper
+WINDOW_SECONDS = 30.0
+
+# Audio per shared inference call (bounds memory of the concatenated waveform)
+GROUP_SECONDS = 600.0
+
+
+@dataclass
+class ClipGroup:
+    """
+    Files packed into one inference call.
+
+    Attributes:
+        indices: Indices of the files (in the caller's list)
+        offsets: Start of each file in the concatenated timeline (seconds)
+        durations: Duration of each file (seconds)
+        windows: clip_timestamps dictionaries ({"start", "end"} in seconds)
+    """
+    indices: List[int] = field(default_factory=list)
+    offsets: List[float] = field(default_factory=list)
+    durations: List[float] = field(default_factory=list)
+    windows: List[Dict[str, float]] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        """Length of the concatenated timeline."""
+        if not self.offsets:
+            return 0.0
+        return self.offsets[-1] + math.ceil(self.durations[-1])
+
+
+def probe_audio_duration(path: Path) -> Optional[float]:
+    """
+    Read the duration of an audio file from its container header.
+
+    Uses PyAV (installed with faster-whisper) without decoding the audio.
+
+    Args:
+        path: Audio file path
+
+    Returns:
+        Duration in seconds, or None if it cannot be determined
+    """
+    try:
+        import av
+        with av.open(str(path), metadata_errors="ignore") as container:
+            if container.duration:
+                return container.duration / av.time_base
+            stream = container.streams.audio[0]
+            if stream.duration and stream.time_base:
+                return float(stream.duration * stream.time_base)
+    except Exception:
+        pass
+    return None
+
+
+def split_windows(duration: float, window: float = WINDOW_SECONDS) -> List[tuple]:
+    """
+    Split a file into consecutive windows no longer than ``window`` seconds.
+
+    Args:
+        duration: File duration in seconds
+        window: Maximum window length
+
+    Returns:
+        List of (start, end) tuples relative to the file
+    """
+    windows = []
+    start = 0.0
+    while start < duration:
+        windows.append((start, min(start + window, duration)))
+        start += window
+    return windows
+
+
+def pack_clips(
+    durations: Sequence[float],
+    group_seconds: float = GROUP_SECONDS,
+    window: float = WINDOW_SECONDS,
+) -> List[ClipGroup]:
+    """
+    Pack files into groups with a shared timeline.
+
+    Each file starts at a whole second, so ``offset * 16000`` is an exact
+    sample index inside the concatenated waveform.
+
+    Args:
+        durations: Duration of each file in seconds
+        group_seconds: Maximum timeline length of a group
+        window: Maximum window length
+
+    Returns:
+        List of ClipGroup objects covering every file with a positive duration
+    """
+    groups: List[ClipGroup] = []
+    current = ClipGroup()
+
+    for index, duration in enumerate(durations):
+        if duration <= 0:
+            continue
+        if current.indices and current.total_seconds + math.ceil(duration) > group_seconds:
+            groups.append(current)
+            current = ClipGroup()
+        _add_clip(current, index, duration, window)
+
+    if current.indices:
+        groups.append(current)
+    return groups
+
+
+def pack_waveforms(
+    waveforms: Iterable[Tuple[int, Any]],
+    group_seconds: float = GROUP_SECONDS,
+    window: float = WINDOW_SECONDS,
+) -> Iterator[Tuple[ClipGroup, Dict[int, Any]]]:
+    """
+    Pack decoded files into groups as they arrive (see pack_clips).
+
+    Slots and windows are sized from the decoded length, so every file fits
+    its slot whatever its header said. Only one group of waveforms is held
+    at a time.
+
+    Args:
+        waveforms: (file index, float32 16 kHz waveform) pairs
+        group_seconds: Maximum timeline length of a group
+        window: Maximum window length
+
+    Yields:
+        Tuples of (group, waveforms of its files by index)
+    """
+    current, current_waveforms = ClipGroup(), {}
+    for index, waveform in waveforms:
+        duration = len(waveform) / SAMPLE_RATE
+        if duration <= 0:
+            continue
+        if current.indices and current.total_seconds + math.ceil(duration) > group_seconds:
+            yield current, current_waveforms
+            current, current_waveforms = ClipGroup(), {}
+        _add_clip(current, index, duration, window)
+        current_waveforms[index] = waveform
+    if current.indices:
+        yield current, current_waveforms
+
+
+def _add_clip(group: ClipGroup, index: int, duration: float, window: float) -> None:
+    """Append a file at the end of a group's timeline."""
+    offset = group.total_seconds
+    group.indices.append(index)
+    group.offsets.append(offset)
+    group.durations.append(duration)
+    for start, end in split_windows(duration, window):
+        group.windows.append({"start": offset + start, "end": offset + end})
+
+
+def _version(module: Any) -> Optional[Tuple[int, int]]:
+    """Major and minor version of a module (None if unknown)."""
+    match = re.match(r"(\d+)\.(\d+)", str(getattr(module, "__version__", "")))
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def clip_timestamps_for(windows: List[Dict[str, float]], faster_whisper: Any) -> List[Dict[str, float]]:
+    """
+    Express windows in the clip_timestamps units of the installed faster-whisper.
+
+    ``BatchedInferencePipeline`` reads "start" and "end" as sample indices
+    (16 kHz) in faster-whisper 1.1.x and as seconds from 1.2.0 on. Passing
+    seconds to 1.1.x would decode only the first few milliseconds of audio.
+
+    Args:
+        windows: Windows in seconds
+        faster_whisper: The imported faster_whisper module
+
+    Returns:
+        Windows in seconds, or in samples for faster-whisper older than 1.2
+    """
+    version = _version(faster_whisper)
+    if version is None or version >= (1, 2):
+        return windows
+    return [
+        {"start": int(round(window["start"] * SAMPLE_RATE)), "end": int(round(window["end"] * SAMPLE_RATE))}
+        for window in windows
+    ]
+
+
+def concatenate_group(group: ClipGroup, waveforms: Dict[int, Any]):
+    """
+    Build the concatenated waveform of a group.
+
+    Args:
+        group: Packed group
+        waveforms: Mapping of file index to float32 16 kHz waveform
+
+    Returns:
+        float32 NumPy array covering the whole group timeline
+
+    Raises:
+        ValueError: If a waveform is longer than the slot packed for it
+    """
+    import numpy as np
+
+    audio = np.zeros(int(group.total_seconds * SAMPLE_RATE), dtype=np.float32)
+    for index, offset, duration in zip(group.indices, group.offsets, group.durations):
+        waveform = waveforms[index]
+        if len(waveform) > math.ceil(duration) * SAMPLE_RATE:
+            raise ValueError(f"File {index} decodes to {len(waveform) / SAMPLE_RATE:.2f}s, "
+                             f"longer than its {duration:.2f}s slot")
+        start = int(offset) * SAMPLE_RATE
+        audio[start:start + len(waveform)] = waveform
+    return audio
+
+
+@dataclass
+class RoutedSegment:
+    """Segment re-based onto its source file's timeline."""
+    start: float
+    end: float
+    text: str
+
+
+def route_segments(segments: Iterable[Any], group: ClipGroup) -> Dict[int, List[RoutedSegment]]:
+    """
+    Assign segments of a shared inference call back to their source files.
+
+    Args:
+        segments: Segments with absolute start/end in the group timeline
+        group: The group the segments were decoded from
+
+    Returns:
+        Mapping of file index to its segments with file-relative times
+    """
+    routed: Dict[int, List[RoutedSegment]] = {index: [] for index in group.indices}
+    for segment in segments:
+        # Tolerate rounding just before a file boundary
+        position = bisect_right(group.offsets, segment.start + 1e-3) - 1
+        position = max(position, 0)
+        offset = group.offsets[position]
+        duration = group.durations[position]
+        routed[group.indices[position]].append(RoutedSegment(
+            start=max(0.0, round(segment.start - offset, 3)),
+            end=min(duration, round(segment.end - offset, 3)),
+            text=segment.text,
+        ))
+    return routed
@@ -6,7 +6,7 @@ ANSI code stripping, and markdown rendering.
 """
 
 import re
-from typing import Tuple
+from typing import Optional, Tuple
 from tkinter import Text, END, DISABLED, NORMAL
 
 
@@ -141,3 +141,98 @@ def is_valid_url(text: str) -> bool:
         True if text starts with http:// or https:// (case-insensitive)
     """
     return re.match(r'^https?://', text, re.IGNORECASE) is not None
+
+
+def parse_timestamp(text: str) -> Optional[float]:
+    """
+    Parse a time given as seconds, mm:ss or hh:mm:ss.
+    
+    Args:
+        text: Time text, e.g. "95", "1:35", "1:02:03" or "12.5"
+        
+    Returns:
+        Time in seconds, or None if the text is not a valid time
+    """
+    parts = (text or "").strip().split(":")
+    if not parts[0] or len(parts) > 3:
+        return None
+    try:
+        values = [float(part) for part in parts]
+    except ValueError:
+        return None
+    if any(value < 0 for value in values) or any(value >= 60 for value in values[1:]):
+        return None
+    seconds = 0.0
+    for value in values:
+        seconds = seconds * 60 + value
+    return seconds
+
+
+def format_timestamp(seconds: float) -> str:
+    """
+    Format seconds as mm:ss, or h:mm:ss from one hour (inverse of parse_timestamp).
+    
+    Args:
+        seconds: Time in seconds (fractions are dropped)
+        
+    Returns:
+        Time text, e.g. "1:35" or "1:02:03"
+    """
+    minutes, secs = divmod(int(max(seconds, 0)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+def normalize_for_wer(text: str) -> list:
+    """
+    Normalize a transcript into a list of words for error-rate scoring.
+    
+    Removes segment timestamps such as "[0.00s -> 2.50s]", punctuation and
+    case differences.
+    
+    Args:
+        text: Transcript or reference text
+        
+    Returns:
+        List of lower-case words
+    """
+    text = re.sub(r'\[\d+(?:\.\d+)?s\s*->\s*\d+(?:\.\d+)?s\]', ' ', text or "")
+    text = re.sub(r"[^\w\s']", ' ', text.lower())
+    return text.split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """
+    Compute the word error rate (WER) of a hypothesis against a reference.
+    
+    WER = (substitutions + deletions + insertions) / number of reference words,
+    computed with a word-level Levenshtein distance on normalized text.
+    
+    Args:
+        reference: Ground-truth transcript
+        hypothesis: Transcript to score
+        
+    Returns:
+        Word error rate (0.0 = identical; can exceed 1.0 with many insertions)
+    """
+    ref = normalize_for_wer(reference)
+    hyp = normalize_for_wer(hypothesis)
+    
+    if not ref:
+        return 0.0 if not hyp else float(len(hyp))
+    
+    # Single-row dynamic programming over hypothesis words
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, start=1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, start=1):
+            current[j] = min(
+                previous[j] + 1,  # deletion
+                current[j - 1] + 1,  # insertion
+                previous[j - 1] + (ref_word != hyp_word),  # substitution / match
+            )
+        previous = current
+    
+    return previous[-1] / len(ref)
@@ -18,15 +18,66 @@ Usage:
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Dict, List
 import sys
-import subprocess
 import logging
+import time
+
+from .config_loader import parse_bool
+from .capabilities import get_registry, probe_executable
 
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Profile keys that are passed to the decoder (the rest is metadata)
+PROFILE_DECODE_KEYS = (
+    "beam_size",
+    "best_of",
+    "temperature",
+    "condition_on_previous_text",
+    "without_timestamps",
+    "compression_ratio_threshold",
+)
+
+
+def get_transcription_profile(name: Optional[str]) -> dict:
+    """
+    Look up a named transcription profile.
+    
+    Args:
+        name: Profile name ("fast", "balanced", "accurate"); None selects the default
+        
+    Returns:
+        Copy of the profile dictionary (unknown names fall back to the default profile)
+    """
+    from .constants import TRANSCRIPTION_PROFILES, DEFAULT_TRANSCRIPTION_PROFILE
+    
+    key = (name or DEFAULT_TRANSCRIPTION_PROFILE).strip().lower()
+    if key not in TRANSCRIPTION_PROFILES:
+        logger.warning(f"Unknown transcription profile '{name}', using '{DEFAULT_TRANSCRIPTION_PROFILE}'")
+        key = DEFAULT_TRANSCRIPTION_PROFILE
+    
+    profile = dict(TRANSCRIPTION_PROFILES[key])
+    profile["name"] = key
+    return profile
+
+
+def profile_decode_options(profile: dict) -> dict:
+    """
+    Extract decoder keyword arguments from a profile.
+    
+    Args:
+        profile: Profile dictionary from get_transcription_profile
+        
+    Returns:
+        Dictionary of decoding options (temperature tuples converted to lists)
+    """
+    options = {key: profile[key] for key in PROFILE_DECODE_KEYS if key in profile}
+    if isinstance(options.get("temperature"), tuple):
+        options["temperature"] = list(options["temperature"])
+    return options
+
 
 class TranscriptionProvider(ABC):
     """Abstract base class for transcription providers."""
@@ -38,7 +89,8 @@ class TranscriptionProvider(ABC):
         output_dir: Path, 
         original_stem: str,
         language: str = "Polish",
-        model: str = "base"
+        model: str = "base",
+        profile: Optional[str] = None
     ) -> Optional[Path]:
         """
         Transcribe audio file.
@@ -49,6 +101,8 @@ class TranscriptionProvider(ABC):
             original_stem: Original filename stem
             language: Transcription language
             model: Model size/name
+            profile: Decoding profile name (see TRANSCRIPTION_PROFILES);
+                None uses the provider's default
             
         Returns:
             Path to transcription file or None on failure
@@ -94,16 +148,11 @@ class FasterWhisperProvider(TranscriptionProvider):
         if exe.is_file():
             return True
         
-        # Try to find in PATH
-        try:
-            result = subprocess.run(
-                [self.exe_path, "--help"],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        # Try to find in PATH (the probe result is cached by the registry)
+        name = f"exe:{self.exe_path}"
+        registry = get_registry()
+        registry.ensure(name, probe_executable([self.exe_path, "--help"]))
+        return registry.is_available(name)
     
     def transcribe(
         self,
@@ -111,7 +160,8 @@ class FasterWhisperProvider(TranscriptionProvider):
         output_dir: Path,
         original_stem: str,
         language: str = "Polish",
-        model: str = "turbo"
+        model: str = "turbo",
+        profile: Optional[str] = None
     ) -> Optional[Path]:
         """Transcribe using faster-whisper executable."""
         if not audio_path.is_file():
@@ -135,6 +185,16 @@ class FasterWhisperProvider(TranscriptionProvider):
             "--output_dir", str(output_dir)
         ]
         
+        # Decoding profile (temperature fallback keeps the executable's default)
+        if profile:
+            options = profile_decode_options(get_transcription_profile(profile))
+            cmd.extend([
+                "--beam_size", str(options["beam_size"]),
+                "--best_of", str(options["best_of"]),
+                "--condition_on_previous_text", str(options["condition_on_previous_text"]),
+                "--compression_ratio_threshold", str(options["compression_ratio_threshold"]),
+            ])
+        
         # Add diarization if enabled
         if self.enable_diarization:
             print(f"   Diarization: ENABLED ({self.diarize_method})")
@@ -227,7 +287,12 @@ class FasterWhisperLibraryProvider(TranscriptionProvider):
     
     def __init__(self, debug_mode: bool = False, device: str = "auto", 
                  compute_type: str = "auto", batch_size: int = 0,
-                 vad_filter: bool = False):
+                 vad_filter: bool = False, cpu_threads: int = 0,
+                 tuning: Optional[dict] = None, profile: Optional[str] = None,
+                 cascade_draft_model: Optional[str] = None,
+                 cascade_thresholds: Optional[Any] = None,
+                 use_model_store: bool = True, offline: bool = False,
+                 loop_guard: bool = True, loop_max_repeats: int = 3, loop_min_repeat_words: int = 3):
         """
         Initialize Faster-Whisper library provider.
         
@@ -237,28 +302,69 @@ class FasterWhisperLibraryProvider(TranscriptionProvider):
             compute_type: Quantization type ("float16", "int8", "int8_float16", or "auto")
             batch_size: Batch size for transcription (0=no batching, higher=faster but more memory)
             vad_filter: Enable Voice Activity Detection filtering
+            cpu_threads: Number of CPU threads (0=CTranslate2 default)
+            tuning: Per-model calibration results (FASTER_WHISPER_TUNING setting),
+                used when compute_type is "auto"
+            profile: Default decoding profile name (TRANSCRIPTION_PROFILE setting)
+            cascade_draft_model: Small model for cascade mode (None = cascade disabled);
+                uncertain draft segments are re-decoded with the requested model
+            cascade_thresholds: CascadeThresholds deciding which draft segments are uncertain
+            use_model_store: Load models installed in the local model store from disk
+            offline: Never contact the Hugging Face Hub (models must be cached or stored)
+            loop_guard: Abort hallucination loops and resume at the next speech region
+            loop_max_repeats: Identical segments in a row treated as a loop
+            loop_min_repeat_words: Shorter segments ("Tak.") need a much longer
+                run without pauses to count as a loop
         """
         self.debug_mode = debug_mode
         self.device = device
         self.compute_type = compute_type
         self.batch_size = batch_size
         self.vad_filter = vad_filter
+        self.cpu_threads = cpu_threads
+        self.tuning = tuning or {}
+        self.profile = profile
+        self.cascade_draft_model = cascade_draft_model
+        if cascade_thresholds is None:
+            from .cascade import CascadeThresholds
+            cascade_thresholds = CascadeThresholds()
+        self.cascade_thresholds = cascade_thresholds
+        self.use_model_store = use_model_store
+        self.offline = offline
+        self.loop_guard = loop_guard
+        self.loop_max_repeats = loop_max_repeats
+        self.loop_min_repeat_words = loop_min_repeat_words
         self._faster_whisper = None
-        self._model = None
-        self._batched_model = None
-        self._current_model_name = None
+        self._models = {}
+        # Statistics of the last transcribe() call (model, duration, cascade usage)
+        self.last_run_info = {}
+        # Segments of the last transcribe() call (SegmentStore)
+        self.last_segments = None
+        # Called with (start, end, text) for each segment as soon as it is decoded
+        # (with the loop guard: as soon as a later loop can no longer drop it)
+        self.on_segment: Optional[Callable[[float, float, str], None]] = None
     
     def is_available(self) -> bool:
-        """Check if faster-whisper library is installed."""
-        try:
-            import faster_whisper
-            self._faster_whisper = faster_whisper
+        """Check if faster-whisper library is installed (without importing it)."""
+        if get_registry().is_available("faster_whisper"):
             return True
-        except ImportError:
-            if self.debug_mode:
-                print("❌ Error: faster-whisper library not installed.", file=sys.stderr)
-                print("   Install with: pip install faster-whisper", file=sys.stderr)
-            return False
+        if self.debug_mode:
+            print("❌ Error: faster-whisper library not installed.", file=sys.stderr)
+            print("   Install with: pip install faster-whisper", file=sys.stderr)
+        return False
+    
+    def _ensure_library_loaded(self) -> bool:
+        """Import faster-whisper on first use."""
+        if self._faster_whisper is None:
+            if not self.is_available():
+                return False
+            try:
+                import faster_whisper
+                self._faster_whisper = faster_whisper
+            except ImportError as e:
+                print(f"❌ Error: faster-whisper could not be imported: {e}", file=sys.stderr)
+                return False
+        return True
     
     def transcribe(
         self,
@@ -266,12 +372,12 @@ class FasterWhisperLibraryProvider(TranscriptionProvider):
         output_dir: Path,
         original_stem: str,
         language: str = "Polish",
-        model: str = "turbo"
+        model: str = "turbo",
+        profile: Optional[str] = None
     ) -> Optional[Path]:
         """Transcribe using faster-whisper Python library."""
-        if not self._faster_whisper:
-            if not self.is_available():
-                return None
+        if not self._ensure_library_loaded():
+            return None
         
         if not audio_path.is_file():
             print(f"❌ Error: Audio file not found: '{audio_path}'", file=sys.stderr)
@@ -280,92 +386,51 @@ class FasterWhisperLibraryProvider(TranscriptionProvider):
         output_format = "txt"
         output_path = output_dir / f"{original_stem}_transcription.{output_format}"
         
+        decode_profile = get_transcription_profile(profile or self.profile)
+        decode_options = profile_decode_options(decode_profile)
+        
         print(f"\n🔄 Transcribing with Faster-Whisper (Python): {audio_path}")
-        print(f"   Model: {model}, Language: {language}")
+        print(f"   Model: {model}, Language: {language}, Profile: {decode_profile['name']}")
         
         try:
-            # Load model if needed
-            if self._model is None or self._current_model_name != model:
-                print(f"   Loading Faster-Whisper model '{model}'...")
-                
-                # Determine device
-                if self.device == "auto":
-                    try:
-                        import torch
-                        device = "cuda" if torch.cuda.is_available() else "cpu"
-                    except ImportError:
-                        device = "cpu"
-                else:
-                    device = self.device
-                
-                # Determine compute type
-                if self.compute_type == "auto":
-                    if device == "cuda":
-                        compute_type = "float16"
-                    else:
-                        compute_type = "int8"
-                else:
-                    compute_type = self.compute_type
-                
-                print(f"   Using device: {device}, compute_type: {compute_type}")
-                
-                # Load the model
-                self._model = self._faster_whisper.WhisperModel(
-                    model,
-                    device=device,
-                    compute_type=compute_type
-                )
-                self._current_model_name = model
-                
-                # Create batched pipeline if batch_size > 0
-                if self.batch_size > 0:
-                    print(f"   Using batched transcription (batch_size={self.batch_size})")
-                    self._batched_model = self._faster_whisper.BatchedInferencePipeline(
-                        model=self._model
-                    )
-            
             # Map language names to codes
             language_code = self._get_language_code(language)
+            self.last_run_info = {"model": model, "profile": decode_profile["name"],
+                                  "model_load_seconds": 0.0}
+            self.last_segments = None
             
             # Transcribe
             print(f"   Transcribing...")
-            
-            # Use batched or regular transcription
-            if self.batch_size > 0 and self._batched_model:
-                segments, info = self._batched_model.transcribe(
-                    str(audio_path),
-                    language=language_code,
-                    batch_size=self.batch_size
+            guarded = False
+            if self.cascade_draft_model and self.cascade_draft_model != model:
+                segments, info = self._transcribe_cascade(
+                    str(audio_path), language_code, model, decode_options
                 )
             else:
-                segments, info = self._model.transcribe(
-                    str(audio_path),
-                    language=language_code,
-                    beam_size=5,
-                    vad_filter=self.vad_filter
-                )
+                segments, info = self._decode(model, str(audio_path), language_code, decode_options)
+                if self.loop_guard:
+                    segments = self._guard_loops(
+                        segments, info.duration, str(audio_path), model, language_code, decode_options
+                    )
+                    guarded = True
             
             # Print detected language info
             if hasattr(info, 'language') and hasattr(info, 'language_probability'):
                 print(f"   Detected language: {info.language} (probability: {info.language_probability:.2f})")
+            if hasattr(info, 'duration'):
+                self.last_run_info["audio_duration"] = info.duration
             
-            # Gather segments and build transcription text
-            transcription_lines = []
-            segment_count = 0
+            # Gather segments and build transcription text (_guard_loops reports them itself)
+            if self.on_segment is not None and not guarded:
+                segments = self._notify_segments(segments)
+            self.last_segments = self._collect(segments)
+            segment_count = len(self.last_segments)
+            transcription_text = self.last_segments.to_text()
             
-            for segment in segments:
-                # Format: [start -> end] text
-                transcription_lines.append(
-                    f"[{segment.start:.2f}s -> {segment.end:.2f}s] {segment.text}"
-                )
-                segment_count += 1
-            
-            if not transcription_lines:
+            if not segment_count:
                 print(f"❌ Error: Empty transcription result", file=sys.stderr)
                 return None
             
-            transcription_text = "\n".join(transcription_lines)
-            
             # Save to file
             output_path.parent.mkdir(parents=True, exist_ok=True)
             output_path.write_text(transcription_text, encoding='utf-8')
@@ -382,6 +447,483 @@ class FasterWhisperLibraryProvider(TranscriptionProvider):
                 traceback.print_exc()
             return None
     
+    def transcribe_short_clips(
+        self,
+        audio_paths: List[Path],
+        durations: List[float],
+        language: str = "Polish",
+        model: str = "turbo",
+        profile: Optional[str] = None,
+        batch_size: int = 8
+    ) -> Dict[Path, str]:
+        """
+        Transcribe many short files in shared batched inference calls.
+        
+        Windows from several files are packed into one timeline and decoded
+        together by BatchedInferencePipeline; segments are routed back to
+        their source file. Windows never cross file boundaries and are decoded
+        without VAD re-chunking or previous-text conditioning, so text cannot
+        leak from one file into another (see short_clips). Files are packed
+        by their decoded length, which can exceed the header duration.
+        
+        Args:
+            audio_paths: Audio files to transcribe
+            durations: Duration of each file in seconds from its header
+                (only reported; packing uses the decoded audio)
+            language: Transcription language
+            model: Model size/name
+            profile: Decoding profile name
+            batch_size: Number of windows per inference batch
+            
+        Returns:
+            Mapping of audio path to transcription text (files without speech
+            are omitted; so are files that failed to decode and the files of a
+            group that failed, listed in last_run_info["short_clip_failed"])
+        """
+        from .short_clips import pack_waveforms, concatenate_group, route_segments, clip_timestamps_for
+        
+        if not self._ensure_library_loaded():
+            return {}
+        
+        decode_profile = get_transcription_profile(profile or self.profile)
+        batched_options = {
+            key: value for key, value in profile_decode_options(decode_profile).items()
+            if key not in ("condition_on_previous_text", "without_timestamps")
+        }
+        language_code = self._get_language_code(language)
+        
+        print(f"\n🔄 Batched short-clip transcription: {len(audio_paths)} files "
+              f"({sum(durations):.0f}s of audio)")
+        print(f"   Model: {model}, Language: {language}, Profile: {decode_profile['name']}")
+        
+        results: Dict[Path, str] = {}
+        groups = 0
+        self.last_run_info = {"model_load_seconds": 0.0}
+        
+        failed: List[Path] = []
+        
+        def decoded():
+            # A file that cannot be decoded is left to single-file transcription
+            for index, path in enumerate(audio_paths):
+                try:
+                    yield index, self._faster_whisper.decode_audio(str(path))
+                except Exception as e:
+                    print(f"   ⚠️ Cannot decode '{path}' for batching: {e}", file=sys.stderr)
+                    failed.append(path)
+        
+        try:
+            whisper_model, batched_model, _ = self._load_model(model)
+            if batched_model is None:
+                batched_model = self._faster_whisper.BatchedInferencePipeline(model=whisper_model)
+        except Exception as e:
+            print(f"❌ Batched transcription error: {e}", file=sys.stderr)
+            if self.debug_mode:
+                import traceback
+                traceback.print_exc()
+            batched_model = None
+        
+        if batched_model is not None:
+            for group, waveforms in pack_waveforms(decoded()):
+                groups += 1
+                # An error costs only this group; its files fall back to single-file transcription
+                try:
+                    audio = concatenate_group(group, waveforms)
+                    del waveforms
+                    
+                    segments, _ = batched_model.transcribe(
+                        audio,
+                        language=language_code,
+                        batch_size=batch_size,
+                        clip_timestamps=clip_timestamps_for(group.windows, self._faster_whisper),
+                        # Keep the windows as given: VAD would merge speech across files
+                        vad_filter=False,
+                        condition_on_previous_text=False,
+                        **batched_options
+                    )
+                    group_results = {}
+                    for index, file_segments in route_segments(segments, group).items():
+                        store = self._collect(file_segments)
+                        if store:
+                            group_results[audio_paths[index]] = store.to_text()
+                except Exception as e:
+                    names = ", ".join(audio_paths[index].name for index in group.indices)
+                    print(f"❌ Batched transcription error in group of {names}: {e}", file=sys.stderr)
+                    if self.debug_mode:
+                        import traceback
+                        traceback.print_exc()
+                    failed.extend(audio_paths[index] for index in group.indices)
+                    continue
+                results.update(group_results)
+                print(f"   ✅ Group done: {len(group.indices)} files, {len(group.windows)} windows")
+        
+        self.last_run_info.update({
+            "model": model,
+            "profile": decode_profile["name"],
+            "short_clip_files": len(audio_paths),
+            "short_clip_groups": groups,
+            "short_clip_transcribed": len(results),
+            "short_clip_failed": [str(path) for path in failed],
+        })
+        return results
+    
+    def _load_model(self, model: str):
+        """
+        Load a model (cached) together with its batched pipeline.
+        
+        Up to two models are kept in memory so that cascade mode can switch
+        between the draft and the large model without reloading. Models taken
+        from memory or local files count as cache hits in last_run_info,
+        downloaded models as misses.
+        
+        Args:
+            model: Model name or path
+            
+        Returns:
+            Tuple of (WhisperModel, BatchedInferencePipeline or None, batch_size)
+        """
+        if model in self._models:
+            self._count_cache_lookup(True)
+            return self._models[model]
+        
+        print(f"   Loading Faster-Whisper model '{model}'...")
+        device, compute_type, cpu_threads, batch_size = self._resolve_runtime(model)
+        
+        print(f"   Using device: {device}, compute_type: {compute_type}"
+              + (f", cpu_threads: {cpu_threads}" if cpu_threads else ""))
+        
+        model_path, local_only = self._model_location(model, compute_type)
+        
+        started = time.perf_counter()
+        whisper_model = self._faster_whisper.WhisperModel(
+            model_path,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            local_files_only=local_only
+        )
+        load_seconds = time.perf_counter() - started
+        print(f"   Model loaded in {load_seconds:.2f}s")
+        self.last_run_info["model_load_seconds"] = (
+            self.last_run_info.get("model_load_seconds", 0.0) + load_seconds
+        )
+        source = "store" if model_path != model else ("cache" if local_only else "hub")
+        self.last_run_info.setdefault("model_sources", {})[model] = source
+        self._count_cache_lookup(source != "hub")
+        
+        # Create batched pipeline if batch_size > 0
+        batched_model = None
+        if batch_size > 0:
+            print(f"   Using batched transcription (batch_size={batch_size})")
+            batched_model = self._faster_whisper.BatchedInferencePipeline(model=whisper_model)
+        
+        if len(self._models) >= 2:
+            # Drop the least recently loaded model
+            self._models.pop(next(iter(self._models)))
+        self._models[model] = (whisper_model, batched_model, batch_size)
+        return self._models[model]
+    
+    def _count_cache_lookup(self, hit: bool):
+        """Count a model lookup in last_run_info (model_cache_hits / model_cache_misses)."""
+        key = "model_cache_hits" if hit else "model_cache_misses"
+        self.last_run_info[key] = self.last_run_info.get(key, 0) + 1
+    
+    def _model_location(self, model: str, compute_type: str):
+        """
+        Decide where a model is loaded from.
+        
+        Args:
+            model: Model name or path
+            compute_type: Resolved CTranslate2 compute type
+            
+        Returns:
+            Tuple of (name or directory passed to WhisperModel, local_files_only)
+        """
+        if self.use_model_store and not Path(model).is_dir():
+            from .model_store import resolve_model_path
+            stored_path = resolve_model_path(model, compute_type)
+            if stored_path is not None:
+                print(f"   Using stored model: {stored_path}")
+                return str(stored_path), True
+        return model, self.offline
+    
+    def _decode(self, model: str, audio, language_code: str, decode_options: dict,
+                clip_timestamps: Optional[list] = None):
+        """
+        Run one decoding pass.
+        
+        Args:
+            model: Model name or path
+            audio: Audio file path or 16 kHz float32 waveform
+            language_code: Whisper language code
+            decode_options: Decoding options from the profile
+            clip_timestamps: Optional flat [start, end, ...] list in seconds;
+                only these ranges are decoded
+            
+        Returns:
+            Tuple of (segments iterable, TranscriptionInfo)
+        """
+        whisper_model, batched_model, batch_size = self._load_model(model)
+        
+        # Use batched or regular transcription
+        if batched_model and batch_size > 0 and clip_timestamps is None:
+            # Batched chunks are decoded independently: previous-text
+            # conditioning does not apply and chunk-level timestamps are used
+            batched_options = {
+                key: value for key, value in decode_options.items()
+                if key not in ("condition_on_previous_text", "without_timestamps")
+            }
+            return batched_model.transcribe(
+                audio,
+                language=language_code,
+                batch_size=batch_size,
+                **batched_options
+            )
+        
+        options = dict(decode_options)
+        if clip_timestamps is not None:
+            options["clip_timestamps"] = clip_timestamps
+        return whisper_model.transcribe(
+            audio,
+            language=language_code,
+            vad_filter=self.vad_filter and clip_timestamps is None,
+            **options
+        )
+    
+    def _transcribe_cascade(self, audio_path: str, language_code: str, model: str,
+                            decode_options: dict):
+        """
+        Transcribe with the draft model and re-decode uncertain ranges with the large model.
+        
+        Args:
+            audio_path: Audio file path
+            language_code: Whisper language code
+            model: Large model name
+            decode_options: Decoding options from the profile
+            
+        Returns:
+            Tuple of (merged segment list, draft TranscriptionInfo)
+        """
+        from .cascade import (
+            select_redecode_ranges, ranges_to_clip_timestamps,
+            covered_fraction, merge_cascade_segments,
+        )
+        
+        # Decode the file once - both passes work on the same waveform
+        audio = self._faster_whisper.decode_audio(audio_path)
+        
+        print(f"   Cascade: draft pass with '{self.cascade_draft_model}'")
+        # Segment-level timestamps are needed to locate uncertain ranges
+        draft_options = dict(decode_options, without_timestamps=False)
+        draft_segments, info = self._decode(
+            self.cascade_draft_model, audio, language_code, draft_options
+        )
+        draft_segments = list(draft_segments)
+        
+        duration = info.duration
+        ranges = select_redecode_ranges(draft_segments, duration, self.cascade_thresholds)
+        fraction = covered_fraction(ranges, duration)
+        
+        segments = draft_segments
+        if ranges:
+            print(f"   Cascade: re-decoding {len(ranges)} range(s) "
+                  f"({fraction:.0%} of audio) with '{model}'")
+            # Ranges are independent - do not carry text across them
+            refine_options = dict(decode_options, condition_on_previous_text=False)
+            refined, _ = self._decode(
+                model, audio, language_code, refine_options,
+                clip_timestamps=ranges_to_clip_timestamps(ranges)
+            )
+            segments = merge_cascade_segments(draft_segments, list(refined), ranges)
+        else:
+            print(f"   Cascade: draft is confident, large model not needed")
+        
+        self.last_run_info.update({
+            "cascade": True,
+            "draft_model": self.cascade_draft_model,
+            "redecoded_ranges": len(ranges),
+            "large_model_fraction": fraction,
+        })
+        return segments, info
+    
+    def _guard_loops(self, segments, duration: float, audio_path: str, model: str,
+                     language_code: str, decode_options: dict) -> list:
+        """
+        Consume segments, aborting hallucination loops as they appear.
+        
+        When a loop is detected the repeated segments are dropped, decoding
+        stops and restarts at the next speech region (Silero VAD) without
+        conditioning on the looping text. Segments are reported to
+        on_segment while decoding runs, once no later loop can drop them
+        (RepetitionGuard.cut_point), so nothing reported is ever taken back.
+        
+        Args:
+            segments: Segment iterable from _decode (lazily decoded)
+            duration: Audio duration in seconds
+            audio_path: Audio file path
+            model: Model name
+            language_code: Whisper language code
+            decode_options: Decoding options from the profile
+            
+        Returns:
+            List of kept segments
+        """
+        from .loop_guard import RepetitionGuard, resume_point, regions_after
+        
+        guard = RepetitionGuard(
+            max_segment_repeats=self.loop_max_repeats,
+            min_repeat_words=self.loop_min_repeat_words
+        )
+        kept = []
+        reported = 0  # leading segments of kept already passed to on_segment
+        audio = audio_path
+        speech_regions = None
+        aborts = 0
+        seconds_skipped = 0.0
+        seconds_removed = 0.0
+        
+        while True:
+            event = None
+            for segment in segments:
+                kept.append(segment)
+                event = guard.feed(segment)
+                if event:
+                    break
+                reported = self._report_final(kept, reported, guard.cut_point())
+            if event is None:
+                break
+            
+            seconds_removed += sum(s.end - s.start for s in kept if s.start >= event.cut_at)
+            kept = [s for s in kept if s.start < event.cut_at]
+            aborts += 1
+            
+            if speech_regions is None:
+                audio = self._faster_whisper.decode_audio(audio_path)
+                speech_regions = self._speech_regions(audio)
+            resume_at = resume_point(speech_regions, event.loop_end, duration)
+            seconds_skipped += resume_at - event.loop_end
+            print(f"   ⚠️ Repetition loop \"{event.phrase}\" ({event.repeats}x) at "
+                  f"{event.cut_at:.1f}s - resuming at {resume_at:.1f}s")
+            
+            if self.vad_filter and speech_regions:
+                clip_timestamps = regions_after(speech_regions, resume_at)
+            else:
+                clip_timestamps = [resume_at, duration]
+            # Segments kept before the loop are final now
+            reported = self._report_final(kept, reported, None)
+            if resume_at >= duration or not clip_timestamps:
+                break
+            
+            guard.reset()
+            resume_options = dict(decode_options, condition_on_previous_text=False)
+            segments, _ = self._decode(
+                model, audio, language_code, resume_options, clip_timestamps=clip_timestamps
+            )
+        
+        self._report_final(kept, reported, None)
+        if aborts:
+            self.last_run_info.update({
+                "loop_aborts": aborts,
+                "loop_seconds_skipped": seconds_skipped,
+                "loop_seconds_removed": seconds_removed,
+            })
+        return kept
+    
+    def _speech_regions(self, audio):
+        """
+        Detect speech regions with faster-whisper's Silero VAD.
+        
+        Args:
+            audio: 16 kHz float32 waveform
+            
+        Returns:
+            List of (start, end) tuples in seconds, or None if VAD is unavailable
+        """
+        try:
+            timestamps = self._faster_whisper.vad.get_speech_timestamps(audio)
+        except Exception as e:
+            logger.warning(f"VAD unavailable, resuming right after the loop: {e}")
+            return None
+        return [(chunk["start"] / 16000, chunk["end"] / 16000) for chunk in timestamps]
+    
+    def _notify_segments(self, segments):
+        """
+        Pass segments through, reporting each one to on_segment.
+        
+        Segments are decoded lazily, so the callback runs while decoding
+        continues (in cascade mode only after the re-decoding pass).
+        """
+        for segment in segments:
+            self._report(segment)
+            yield segment
+    
+    def _report(self, segment):
+        """Pass one segment to on_segment (errors are logged, not raised)."""
+        try:
+            self.on_segment(segment.start, segment.end, segment.text)
+        except Exception as e:
+            logger.error(f"Error in segment callback: {e}")
+    
+    def _report_final(self, kept: list, reported: int, cut_point: Optional[float]) -> int:
+        """
+        Report kept segments that start before ``cut_point`` (all if None).
+        
+        Returns:
+            Number of leading segments of ``kept`` reported so far
+        """
+        if self.on_segment is None:
+            return reported
+        while reported < len(kept) and (cut_point is None or kept[reported].start < cut_point):
+            self._report(kept[reported])
+            reported += 1
+        return reported
+    
+    @staticmethod
+    def _collect(segments):
+        """
+        Collect segments into a compact SegmentStore.
+        
+        Args:
+            segments: Iterable of segments
+            
+        Returns:
+            SegmentStore rendering lines as "[start -> end] text"
+        """
+        from .segments import SegmentStore
+        return SegmentStore.from_segments(segments)
+    
+    def _resolve_runtime(self, model: str):
+        """
+        Resolve device, compute type, CPU threads and batch size for a model.
+        
+        With compute_type "auto", a matching result of
+        ``python -m pogadane calibrate`` is used if one was recorded on this
+        machine; otherwise float16 (CUDA) or int8 (CPU) is chosen.
+        
+        Args:
+            model: Model name
+            
+        Returns:
+            Tuple of (device, compute_type, cpu_threads, batch_size)
+        """
+        from .hardware import resolve_device, default_compute_type, lookup_tuning
+        
+        device = resolve_device(self.device)
+        compute_type = self.compute_type
+        cpu_threads = self.cpu_threads
+        batch_size = self.batch_size
+        
+        if compute_type == "auto":
+            entry = lookup_tuning(self.tuning, model, device)
+            if entry:
+                compute_type = entry.get("compute_type") or default_compute_type(device)
+                cpu_threads = cpu_threads or int(entry.get("cpu_threads", 0))
+                batch_size = batch_size or int(entry.get("batch_size", 0))
+                print(f"   Using calibrated settings from {entry.get('calibrated_at', '?')}")
+            else:
+                compute_type = default_compute_type(device)
+        
+        return device, compute_type, cpu_threads, batch_size
+    
     def _get_language_code(self, language: str) -> str:
         """Convert language name to Whisper language code."""
         language_map = {
@@ -447,16 +989,26 @@ class WhisperProvider(TranscriptionProvider):
         self._current_model_name = None
     
     def is_available(self) -> bool:
-        """Check if whisper library is installed."""
-        try:
-            import whisper
-            self._whisper = whisper
+        """Check if whisper library is installed (without importing it)."""
+        if get_registry().is_available("whisper"):
             return True
-        except ImportError:
-            if self.debug_mode:
-                print("❌ Error: whisper library not installed.", file=sys.stderr)
-                print("   Install with: pip install openai-whisper", file=sys.stderr)
-            return False
+        if self.debug_mode:
+            print("❌ Error: whisper library not installed.", file=sys.stderr)
+            print("   Install with: pip install openai-whisper", file=sys.stderr)
+        return False
+    
+    def _ensure_library_loaded(self) -> bool:
+        """Import whisper on first use."""
+        if self._whisper is None:
+            if not self.is_available():
+                return False
+            try:
+                import whisper
+                self._whisper = whisper
+            except ImportError as e:
+                print(f"❌ Error: whisper could not be imported: {e}", file=sys.stderr)
+                return False
+        return True
     
     def transcribe(
         self,
@@ -464,12 +1016,12 @@ class WhisperProvider(TranscriptionProvider):
         output_dir: Path,
         original_stem: str,
         language: str = "Polish",
-        model: str = "base"
+        model: str = "base",
+        profile: Optional[str] = None
     ) -> Optional[Path]:
         """Transcribe using OpenAI Whisper library."""
-        if not self._whisper:
-            if not self.is_available():
-                return None
+        if not self._ensure_library_loaded():
+            return None
         
         if not audio_path.is_file():
             print(f"❌ Error: Audio file not found: '{audio_path}'", file=sys.stderr)
@@ -506,10 +1058,14 @@ class WhisperProvider(TranscriptionProvider):
             
             # Transcribe
             print(f"   Transcribing...")
+            decode_options = {}
+            if profile:
+                decode_options = profile_decode_options(get_transcription_profile(profile))
             result = self._model.transcribe(
                 str(audio_path),
                 language=language_code,
-                verbose=self.debug_mode
+                verbose=self.debug_mode,
+                **decode_options
             )
             
             # Extract text
@@ -586,7 +1142,7 @@ class TranscriptionProviderFactory:
         Returns:
             TranscriptionProvider instance or None
         """
-        from .constants import DEFAULT_CONFIG
+        from .constants import DEFAULT_CONFIG, TUNING_SETTINGS_KEY
         
         provider_type = getattr(
             config, 
@@ -625,20 +1181,58 @@ class TranscriptionProviderFactory:
                 'FASTER_WHISPER_VAD_FILTER',
                 DEFAULT_CONFIG.get('FASTER_WHISPER_VAD_FILTER', False)
             )
-            # Convert vad_filter to bool
-            if isinstance(vad_filter_raw, bool):
-                vad_filter = vad_filter_raw
-            elif isinstance(vad_filter_raw, str):
-                vad_filter = vad_filter_raw.lower() in ('true', '1', 'yes', 'on')
-            else:
-                vad_filter = bool(vad_filter_raw)
+            vad_filter = parse_bool(vad_filter_raw)
+            
+            # Cascade mode: draft with a small model, re-decode uncertain parts
+            cascade_draft_model = None
+            cascade_thresholds = None
+            if parse_bool(getattr(config, 'CASCADE_ENABLED', DEFAULT_CONFIG.get('CASCADE_ENABLED', False))):
+                from .cascade import CascadeThresholds
+                cascade_draft_model = getattr(
+                    config,
+                    'CASCADE_DRAFT_MODEL',
+                    DEFAULT_CONFIG.get('CASCADE_DRAFT_MODEL', 'small')
+                )
+                try:
+                    cascade_thresholds = CascadeThresholds(
+                        logprob=float(getattr(
+                            config, 'CASCADE_LOGPROB_THRESHOLD',
+                            DEFAULT_CONFIG.get('CASCADE_LOGPROB_THRESHOLD', -0.8))),
+                        compression_ratio=float(getattr(
+                            config, 'CASCADE_COMPRESSION_RATIO_THRESHOLD',
+                            DEFAULT_CONFIG.get('CASCADE_COMPRESSION_RATIO_THRESHOLD', 2.0))),
+                        no_speech=float(getattr(
+                            config, 'CASCADE_NO_SPEECH_THRESHOLD',
+                            DEFAULT_CONFIG.get('CASCADE_NO_SPEECH_THRESHOLD', 0.5))),
+                    )
+                except (ValueError, TypeError):
+                    logger.warning("Invalid cascade threshold value, using defaults")
+                    cascade_thresholds = CascadeThresholds()
             
             provider = FasterWhisperLibraryProvider(
                 debug_mode=debug_mode,
                 device=device,
                 compute_type=compute_type,
                 batch_size=batch_size,
-                vad_filter=vad_filter
+                vad_filter=vad_filter,
+                tuning=getattr(config, TUNING_SETTINGS_KEY, None),
+                profile=getattr(
+                    config,
+                    'TRANSCRIPTION_PROFILE',
+                    DEFAULT_CONFIG.get('TRANSCRIPTION_PROFILE', 'balanced')
+                ),
+                cascade_draft_model=cascade_draft_model,
+                cascade_thresholds=cascade_thresholds,
+                use_model_store=parse_bool(getattr(
+                    config, 'WHISPER_MODEL_STORE', DEFAULT_CONFIG.get('WHISPER_MODEL_STORE', True))),
+                offline=parse_bool(getattr(
+                    config, 'WHISPER_OFFLINE', DEFAULT_CONFIG.get('WHISPER_OFFLINE', False))),
+                loop_guard=parse_bool(getattr(
+                    config, 'LOOP_GUARD_ENABLED', DEFAULT_CONFIG.get('LOOP_GUARD_ENABLED', True))),
+                loop_max_repeats=int(getattr(
+                    config, 'LOOP_GUARD_MAX_REPEATS', DEFAULT_CONFIG['LOOP_GUARD_MAX_REPEATS'])),
+                loop_min_repeat_words=int(getattr(
+                    config, 'LOOP_GUARD_MIN_REPEAT_WORDS', DEFAULT_CONFIG['LOOP_GUARD_MIN_REPEAT_WORDS']))
             )
             
         elif provider_type == "whisper":
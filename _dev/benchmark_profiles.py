@@ -0,0 +1,133 @@
+"""
+Benchmarks transcription profiles (fast / balanced / accurate) on a local corpus.
+
+The corpus is a directory of audio files, each with a reference transcript
+stored next to it under the same name with a .txt extension:
+
+    corpus/
+        spotkanie_01.mp3
+        spotkanie_01.txt
+        wyklad_02.wav
+        wyklad_02.txt
+
+For every profile the script reports the real-time factor (RTF = processing
+time / audio duration, lower is faster) and the word error rate (WER) against
+the references, as a Markdown table ready to paste into
+_dev/doc/transcription_profiles.md.
+
+Run from project root:
+    python _dev/benchmark_profiles.py path/to/corpus
+    python _dev/benchmark_profiles.py path/to/corpus --profiles fast balanced --model turbo
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+# Make the pogadane package importable when run from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent / "_app" / "src"))
+
+from pogadane.config_loader import ConfigManager  # noqa: E402
+from pogadane.constants import TRANSCRIPTION_PROFILES, TUNING_SETTINGS_KEY  # noqa: E402
+from pogadane.text_utils import normalize_for_wer, word_error_rate  # noqa: E402
+from pogadane.transcription_providers import (  # noqa: E402
+    FasterWhisperLibraryProvider,
+    get_transcription_profile,
+)
+
+AUDIO_EXTENSIONS = {".mp3", ".wav", ".m4a", ".flac", ".ogg", ".opus", ".webm", ".mp4"}
+
+
+def find_corpus(corpus_dir: Path):
+    """Return (audio_path, reference_text) pairs for files that have a reference."""
+    pairs = []
+    for audio_path in sorted(corpus_dir.iterdir()):
+        if audio_path.suffix.lower() not in AUDIO_EXTENSIONS:
+            continue
+        reference = audio_path.with_suffix(".txt")
+        if reference.is_file():
+            pairs.append((audio_path, reference.read_text(encoding="utf-8")))
+        else:
+            print(f"⚠️ Skipping {audio_path.name}: no reference {reference.name}")
+    return pairs
+
+
+def audio_duration(audio_path: Path) -> float:
+    """Duration of an audio file in seconds (decoded with faster-whisper)."""
+    from faster_whisper import decode_audio
+    return len(decode_audio(str(audio_path))) / 16000
+
+
+def benchmark_profile(name, pairs, durations, args, work_dir: Path):
+    """Transcribe the corpus with one profile and return (rtf, wer, model)."""
+    config = ConfigManager()
+    profile = get_transcription_profile(name)
+    model = profile["model"] or args.model or config.get("WHISPER_MODEL")
+
+    provider = FasterWhisperLibraryProvider(
+        device=args.device,
+        compute_type=args.compute_type,
+        tuning=config.get(TUNING_SETTINGS_KEY, None),
+        profile=name,
+    )
+
+    if not args.no_warmup:
+        # Model loading is not part of the measured decoding time
+        provider.transcribe(pairs[0][0], work_dir, "warmup", args.language, model)
+
+    total_seconds = 0.0
+    total_errors = 0.0
+    total_words = 0
+    for audio_path, reference in pairs:
+        start = time.perf_counter()
+        output = provider.transcribe(audio_path, work_dir, audio_path.stem, args.language, model)
+        total_seconds += time.perf_counter() - start
+
+        hypothesis = output.read_text(encoding="utf-8") if output else ""
+        words = len(normalize_for_wer(reference))
+        total_errors += word_error_rate(reference, hypothesis) * words
+        total_words += words
+
+    rtf = total_seconds / sum(durations)
+    wer = total_errors / total_words if total_words else 0.0
+    return rtf, wer, model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark transcription profiles")
+    parser.add_argument("corpus", type=Path, help="Directory with audio files and .txt references")
+    parser.add_argument("--profiles", nargs="+", default=list(TRANSCRIPTION_PROFILES),
+                        choices=list(TRANSCRIPTION_PROFILES))
+    parser.add_argument("--model", help="Model for profiles without a pinned model")
+    parser.add_argument("--language", default="Polish")
+    parser.add_argument("--device", default="auto")
+    parser.add_argument("--compute-type", default="auto")
+    parser.add_argument("--no-warmup", action="store_true",
+                        help="Include model loading in the measured time")
+    args = parser.parse_args()
+
+    pairs = find_corpus(args.corpus)
+    if not pairs:
+        print(f"❌ No audio files with references found in {args.corpus}")
+        return 1
+
+    durations = [audio_duration(audio_path) for audio_path, _ in pairs]
+    print(f"📂 Corpus: {len(pairs)} files, {sum(durations) / 60:.1f} min of audio\n")
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.profiles:
+            print(f"⏱️ Profile '{name}'...")
+            rows.append((name, *benchmark_profile(name, pairs, durations, args, Path(tmp))))
+
+    print("\n| Profile | Model | RTF | WER |")
+    print("|---|---|---|---|")
+    for name, rtf, wer, model in rows:
+        print(f"| {name} | {model} | {rtf:.3f} | {wer:.1%} |")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Benchmarks GUI startup: how long until the main window is interactive.
+
+Two modes:
+
+    headless (default)
+        Builds PogadaneApp on a Flet page connected to an in-process
+        connection that serializes every command like the real client
+        connection would. Reports import time, UI construction time, the
+        number of controls sent for the first frame and their size, and the
+        same numbers for opening the settings dialog twice (first build and
+        cached reopen). Useful for comparing changes on any machine.
+
+    --window
+        Starts the real desktop app and measures the time from process start
+        until the client has processed the first frame: after the UI is
+        built, a round-trip call to the client is made, which is answered
+        only after all earlier commands were applied. The window closes
+        itself afterwards. Run it on the target desktop (e.g. VDI).
+
+Run from project root:
+    python _dev/benchmark_startup.py
+    python _dev/benchmark_startup.py --repeat 5
+    python _dev/benchmark_startup.py --window
+"""
+
+import time
+
+PROCESS_START = time.perf_counter()
+
+import sys  # noqa: E402
+import json  # noqa: E402
+import asyncio  # noqa: E402
+import argparse  # noqa: E402
+import threading  # noqa: E402
+import statistics  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+# Make the pogadane package importable when run from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent / "_app" / "src"))
+
+
+def load_app():
+    """Import the GUI module; returns (flet, gui_flet module, seconds)."""
+    start = time.perf_counter()
+    import flet as ft
+    from pogadane import gui_flet
+    return ft, gui_flet, time.perf_counter() - start
+
+
+def make_measuring_connection():
+    """Create a Flet connection that serializes commands and counts controls."""
+    from flet.core.connection import Connection
+    from flet.core.protocol import (
+        CommandEncoder,
+        PageCommandResponsePayload,
+        PageCommandsBatchResponsePayload,
+    )
+
+    class MeasuringConnection(Connection):
+        """In-process client stand-in: assigns control ids, records payload size."""
+
+        def __init__(self):
+            super().__init__()
+            self.controls_sent = 0
+            self.bytes_sent = 0
+            self._next_id = 1
+
+        def reset(self):
+            self.controls_sent = 0
+            self.bytes_sent = 0
+
+        def send_command(self, session_id, command):
+            self.bytes_sent += len(json.dumps(command, cls=CommandEncoder))
+            return PageCommandResponsePayload(result="", error="")
+
+        def send_commands(self, session_id, commands):
+            self.bytes_sent += len(json.dumps(commands, cls=CommandEncoder))
+            results = []
+            for command in commands:
+                if command.name == "add":
+                    ids = [f"_{self._next_id + i}" for i in range(len(command.commands))]
+                    self._next_id += len(ids)
+                    self.controls_sent += len(ids)
+                    results.append(" ".join(ids))
+            return PageCommandsBatchResponsePayload(results=results, error="")
+
+    return MeasuringConnection()
+
+
+def run_headless(repeat: int):
+    """Measure UI construction and first-frame payload without a window."""
+    ft, gui_flet, import_seconds = load_app()
+    print(f"Import pogadane.gui_flet: {import_seconds * 1000:.0f} ms")
+
+    rows = []
+    for _ in range(repeat):
+        conn = make_measuring_connection()
+        # The page's event loop runs in its own thread, as in the real app
+        loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+        loop_thread.start()
+        page = ft.Page(conn, "benchmark", loop=loop)
+
+        start = time.perf_counter()
+        app = gui_flet.PogadaneApp(page)
+        build_seconds = time.perf_counter() - start
+        first_frame = (conn.controls_sent, conn.bytes_sent)
+
+        dialog_times = []
+        for _ in range(2):
+            conn.reset()
+            start = time.perf_counter()
+            app.open_settings_dialog(None)
+            dialog_times.append((time.perf_counter() - start, conn.controls_sent, conn.bytes_sent))
+            app.close_dialog(app.settings_dialog)
+
+        rows.append((build_seconds, first_frame, dialog_times))
+        if app.watchdog:
+            app.watchdog.stop()
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+
+    def ms(values):
+        return f"{statistics.median(values) * 1000:.1f} ms"
+
+    first_frame = rows[-1][1]
+    print(f"UI construction (median of {repeat}): {ms([r[0] for r in rows])}")
+    print(f"First frame: {first_frame[0]} controls, {first_frame[1] / 1024:.1f} KiB")
+    for index, label in enumerate(("Settings dialog (first open)", "Settings dialog (reopen)")):
+        seconds = [r[2][index][0] for r in rows]
+        _, controls, size = rows[-1][2][index]
+        print(f"{label}: {ms(seconds)}, {controls} controls, {size / 1024:.1f} KiB")
+
+
+def run_window():
+    """Measure time to interactive of the real desktop window."""
+    ft, gui_flet, import_seconds = load_app()
+
+    def main(page):
+        built_at = time.perf_counter()
+        gui_flet.PogadaneApp(page)
+        ui_ready = time.perf_counter()
+        # Answered by the client after it has applied the first frame
+        page.get_clipboard()
+        interactive = time.perf_counter()
+
+        print(f"Import pogadane.gui_flet: {import_seconds * 1000:.0f} ms")
+        print(f"Window connected after: {(built_at - PROCESS_START) * 1000:.0f} ms")
+        print(f"UI construction: {(ui_ready - built_at) * 1000:.0f} ms")
+        print(f"First frame applied by client: {(interactive - ui_ready) * 1000:.0f} ms")
+        print(f"Time to interactive: {(interactive - PROCESS_START) * 1000:.0f} ms")
+        page.window.close()
+
+    ft.app(target=main)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Pogadane GUI startup")
+    parser.add_argument("--window", action="store_true", help="measure the real desktop window")
+    parser.add_argument("--repeat", type=int, default=3, help="headless repetitions (default: 3)")
+    args = parser.parse_args()
+
+    if args.window:
+        run_window()
+    else:
+        run_headless(max(args.repeat, 1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for archive module.
+Tests writing results and segments to Parquet, incremental archiving and
+restoring the result store from an archive.
+"""
+import pytest
+from pogadane.metrics import JobMetrics
+from pogadane.result_store import ResultStore
+from pogadane.segments import SegmentStore
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+from pogadane.archive import (  # noqa: E402
+    archive_store, import_archive, last_archived, open_dataset, part_files, source_id,
+)
+
+
+@pytest.fixture
+def store(temp_dir):
+    """Result store with a segmented, a plain text and a failed result."""
+    result_store = ResultStore(temp_dir / "pogadane.db")
+    segments = SegmentStore()
+    segments.append(0.0, 2.5, " Dzień dobry.", logprob=-0.2)
+    segments.append(2.5, 4.0, " Budżet.")
+    metrics = JobMetrics(source="a.mp3", stage_seconds={"transcribing": 2.0}, audio_seconds=4.0)
+    result_store.add("a.mp3", segments, "Spotkanie", job_id="1", metrics=metrics,
+                     provenance={"transcription_model": "turbo", "profile": "fast"}, created_at=100.0)
+    result_store.add("b.mp3", "zwykły tekst", "", created_at=200.0)
+    result_store.add("c.mp3", "[0.00s -> 1.00s] częściowy", "", status="error", created_at=300.0)
+    yield result_store
+    result_store.close()
+
+
+class TestArchive:
+    """Test suite for the Parquet archive."""
+
+    def test_tables(self, store, temp_dir):
+        """Test the results and segments tables and their compression."""
+        assert archive_store(store, temp_dir / "archiwum") == 3
+        results = open_dataset(temp_dir / "archiwum", "results").to_table().to_pylist()
+        segments = open_dataset(temp_dir / "archiwum", "segments").to_table().to_pylist()
+
+        assert [row["source"] for row in results] == ["a.mp3", "b.mp3", "c.mp3"]
+        assert results[0]["transcription"] is None and results[0]["segments"] == 2
+        assert results[0]["transcription_model"] == "turbo"
+        assert results[0]["processing_seconds"] == 2.0
+        assert results[1]["transcription"] == "zwykły tekst"
+        assert segments[0] == {"source_id": source_id("a.mp3"), "segment": 0, "start": 0.0, "end": 2.5,
+                               "text": " Dzień dobry.", "logprob": pytest.approx(-0.2)}
+        assert segments[1]["logprob"] is None
+        metadata = pq.ParquetFile(part_files(temp_dir / "archiwum", "segments")[0]).metadata
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    def test_incremental(self, store, temp_dir):
+        """Test that later runs only add results stored after the last archived one."""
+        folder = temp_dir / "archiwum"
+        archive_store(store, folder)
+        assert last_archived(folder) == 300.0
+        assert archive_store(store, folder) == 0
+        assert len(part_files(folder, "results")) == 1
+
+        store.add("b.mp3", "nowa wersja", "", created_at=400.0)
+        assert archive_store(store, folder) == 1
+        assert len(part_files(folder, "results")) == 2
+        assert archive_store(store, folder, full=True) == 3
+
+    def test_row_groups(self, store, temp_dir):
+        """Test that segments are written in row groups of the given size."""
+        archive_store(store, temp_dir / "archiwum", row_group_rows=1)
+        metadata = pq.ParquetFile(part_files(temp_dir / "archiwum", "segments")[0]).metadata
+        assert metadata.num_row_groups == 2
+
+    def test_import_restores_store(self, store, temp_dir):
+        """Test that an imported archive equals the original store."""
+        folder = temp_dir / "archiwum"
+        archive_store(store, folder, row_group_rows=1)
+        copy = ResultStore(temp_dir / "kopia.db")
+        assert import_archive(folder, copy) == 3
+        for source in ("a.mp3", "b.mp3", "c.mp3"):
+            assert copy.get(source) == store.get(source)
+        assert copy.get("a.mp3")["transcription"].logprob(0) == pytest.approx(-0.2)
+        assert copy.search("budżet")[0].source == "a.mp3"
+        copy.close()
+
+    def test_import_uses_newest_version(self, store, temp_dir):
+        """Test that a re-archived source is restored from its newest row."""
+        folder = temp_dir / "archiwum"
+        archive_store(store, folder)
+        store.add("a.mp3", "[0.00s -> 1.00s] poprawiony", "Nowe", created_at=500.0)
+        archive_store(store, folder)
+        copy = ResultStore(temp_dir / "kopia.db")
+        import_archive(folder, copy)
+        assert str(copy.get("a.mp3")["transcription"]) == "[0.00s -> 1.00s] poprawiony"
+        copy.close()
+
+    def test_import_keeps_existing(self, store, temp_dir):
+        """Test that results already in the store are kept unless replaced."""
+        folder = temp_dir / "archiwum"
+        archive_store(store, folder)
+        store.add("b.mp3", "lokalna zmiana", "", created_at=600.0)
+        assert import_archive(folder, store) == 0
+        assert store.get("b.mp3")["transcription"] == "lokalna zmiana"
+        assert import_archive(folder, store, replace=True) == 3
+        assert store.get("b.mp3")["transcription"] == "zwykły tekst"
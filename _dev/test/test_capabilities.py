@@ -0,0 +1,155 @@
+"""
+Unit tests for capabilities module.
+Tests probing of Python packages and executables, caching with TTL,
+invalidation on environment changes and concurrent probing.
+"""
+import sys
+import threading
+import time
+from pogadane import capabilities
+from pogadane.capabilities import (
+    CapabilityRegistry,
+    probe_executable,
+    probe_python_package,
+)
+
+
+class CountingProbe:
+    """Probe test double counting its calls."""
+
+    def __init__(self, result=(True, "1.0"), delay=0.0):
+        self.result = result
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return self.result
+
+
+class TestProbes:
+    """Test suite for the probe factories."""
+
+    def test_python_package_found_without_import(self):
+        """Test that an installed package is reported without importing it."""
+        sys.modules.pop("json.tool", None)
+        available, _ = probe_python_package("json.tool")()
+        assert available is True
+        assert "json.tool" not in sys.modules
+
+    def test_python_package_version(self):
+        """Test that the version comes from the distribution metadata."""
+        import pytest as pytest_module
+        assert probe_python_package("pytest")() == (True, pytest_module.__version__)
+
+    def test_python_package_missing(self):
+        """Test that a missing package is reported as unavailable."""
+        assert probe_python_package("pogadane_brak_pakietu")()[0] is False
+        assert probe_python_package("pogadane_brak.modul")()[0] is False
+
+    def test_executable(self):
+        """Test that an executable is run and its first output line kept."""
+        available, version = probe_executable([sys.executable, "--version"])()
+        assert available is True
+        assert version.startswith("Python")
+        assert probe_executable(["pogadane-brak-programu", "--version"])()[0] is False
+        assert probe_executable([sys.executable, "-c", "raise SystemExit(3)"])()[0] is False
+
+
+class TestCapabilityRegistry:
+    """Test suite for CapabilityRegistry."""
+
+    def test_results_are_cached(self):
+        """Test that a probe runs once until refreshed or invalidated."""
+        probe = CountingProbe()
+        registry = CapabilityRegistry({"lib": probe})
+        assert registry.is_available("lib")
+        assert registry.get("lib").version == "1.0"
+        assert probe.calls == 1
+        registry.get("lib", refresh=True)
+        registry.invalidate("lib")
+        registry.get("lib")
+        assert probe.calls == 3
+
+    def test_ttl_expires(self):
+        """Test that results older than the TTL are probed again."""
+        probe = CountingProbe()
+        registry = CapabilityRegistry({"lib": probe}, ttl=0.05)
+        registry.get("lib")
+        time.sleep(0.06)
+        registry.get("lib")
+        assert probe.calls == 2
+
+    def test_environment_change_invalidates(self, monkeypatch):
+        """Test that a changed site-packages mtime drops cached results."""
+        probe = CountingProbe()
+        registry = CapabilityRegistry({"lib": probe})
+        registry.get("lib")
+        monkeypatch.setattr(capabilities, "environment_key", lambda: ("inny interpreter",))
+        registry.get("lib")
+        registry.get("lib")
+        assert probe.calls == 2
+
+    def test_probe_all_runs_concurrently(self):
+        """Test that slow probes run in parallel and each only once."""
+        probes = {f"lib{i}": CountingProbe(delay=0.2) for i in range(4)}
+        registry = CapabilityRegistry(probes)
+        start = time.perf_counter()
+        results = registry.probe_all()
+        assert time.perf_counter() - start < 0.6
+        assert list(results) == ["lib0", "lib1", "lib2", "lib3"]
+        registry.probe_all()
+        assert all(probe.calls == 1 for probe in probes.values())
+
+    def test_concurrent_callers_share_probe(self):
+        """Test that callers asking during a probe wait for the same result."""
+        probe = CountingProbe(delay=0.1)
+        registry = CapabilityRegistry({"lib": probe})
+        threads = [threading.Thread(target=registry.get, args=("lib",)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert probe.calls == 1
+
+    def test_failing_and_unknown_probes(self):
+        """Test that a crashing probe and an unknown name are unavailable."""
+        def broken():
+            raise RuntimeError("boom")
+        registry = CapabilityRegistry({"broken": broken})
+        assert registry.get("broken").available is None
+        assert not registry.is_available("broken")
+        assert not registry.is_available("unknown")
+
+    def test_ensure_keeps_existing_probe(self):
+        """Test that ensure() does not replace a registered probe."""
+        probe = CountingProbe(result=(True, "stary"))
+        registry = CapabilityRegistry({"exe": probe})
+        registry.ensure("exe", CountingProbe(result=(False, "nowy")))
+        assert registry.get("exe").version == "stary"
+
+    def test_service_probes_have_short_ttl(self):
+        """Test that a stopped service is probed again and a running one briefly cached."""
+        binary = CountingProbe(result=(True, "ollama 0.5"))
+        server = CountingProbe(result=(False, "Nie działa"))
+        registry = CapabilityRegistry({"exe": binary, "server": server}, service_ttls={"server": 0.05})
+        assert not registry.is_available("server")
+        server.result = (True, "NAME")
+        assert registry.is_available("server")
+        registry.get("server")
+        assert server.calls == 2
+        time.sleep(0.06)
+        registry.get("server")
+        registry.get("exe")
+        registry.get("exe")
+        assert server.calls == 3
+        assert binary.calls == 1
+
+    def test_ollama_server_is_a_service_probe(self):
+        """Test that only the server probe of Ollama uses the short TTL."""
+        registry = CapabilityRegistry()
+        assert "ollama-server" in registry.service_ttls
+        assert "ollama" not in registry.service_ttls
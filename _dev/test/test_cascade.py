@@ -0,0 +1,133 @@
+"""
+Unit tests for cascade module.
+Tests selection of uncertain draft segments, range merging and the
+cascade flow of FasterWhisperLibraryProvider.
+"""
+import pytest
+from types import SimpleNamespace
+from pogadane.cascade import (
+    CascadeThresholds,
+    needs_redecode,
+    select_redecode_ranges,
+    ranges_to_clip_timestamps,
+    covered_fraction,
+    merge_cascade_segments,
+)
+from pogadane.transcription_providers import FasterWhisperLibraryProvider
+
+
+def seg(start, end, text="tekst", avg_logprob=-0.2, no_speech_prob=0.1, compression_ratio=1.3):
+    """Create a segment-like object."""
+    return SimpleNamespace(
+        start=start, end=end, text=text, avg_logprob=avg_logprob,
+        no_speech_prob=no_speech_prob, compression_ratio=compression_ratio,
+    )
+
+
+class TestNeedsRedecode:
+    """Test suite for needs_redecode function."""
+
+    def test_confident_segment_is_kept(self):
+        """Test that a confident segment is not re-decoded."""
+        assert not needs_redecode(seg(0, 1), CascadeThresholds())
+
+    def test_low_logprob(self):
+        """Test that low average log-probability triggers re-decoding."""
+        assert needs_redecode(seg(0, 1, avg_logprob=-1.2), CascadeThresholds())
+
+    def test_high_compression_ratio(self):
+        """Test that repetitive text triggers re-decoding."""
+        assert needs_redecode(seg(0, 1, compression_ratio=2.6), CascadeThresholds())
+
+    def test_text_in_silence(self):
+        """Test that text with high no_speech_prob triggers re-decoding."""
+        assert needs_redecode(seg(0, 1, no_speech_prob=0.8), CascadeThresholds())
+        assert not needs_redecode(seg(0, 1, text=" ", no_speech_prob=0.8), CascadeThresholds())
+
+
+class TestRanges:
+    """Test suite for range selection and merging."""
+
+    def test_adjacent_flagged_segments_are_merged(self):
+        """Test that nearby uncertain segments form one padded range."""
+        segments = [
+            seg(0, 2),
+            seg(2, 4, avg_logprob=-1.5),
+            seg(4.5, 6, avg_logprob=-1.5),
+            seg(6, 10),
+            seg(10, 12, compression_ratio=3.0),
+        ]
+        ranges = select_redecode_ranges(segments, duration=12.0)
+        assert ranges == [(1.75, 6.25), (9.75, 12.0)]
+        assert ranges_to_clip_timestamps(ranges) == [1.75, 6.25, 9.75, 12.0]
+
+    def test_no_flagged_segments(self):
+        """Test that a confident draft needs no large model."""
+        ranges = select_redecode_ranges([seg(0, 5), seg(5, 10)], duration=10.0)
+        assert ranges == []
+        assert covered_fraction(ranges, 10.0) == 0.0
+
+    def test_covered_fraction(self):
+        """Test fraction of audio covered by ranges."""
+        assert covered_fraction([(0, 2.5), (5, 7.5)], 10.0) == pytest.approx(0.5)
+        assert covered_fraction([(0, 1)], 0.0) == 0.0
+
+    def test_merge_replaces_only_ranges(self):
+        """Test that refined segments replace draft segments inside ranges."""
+        draft = [seg(0, 2, "a"), seg(2, 4, "zle"), seg(4, 6, "c")]
+        refined = [seg(1.9, 4.1, "dobrze"), seg(4.2, 6, "poza zakresem")]
+        merged = merge_cascade_segments(draft, refined, [(1.75, 4.25)])
+        assert [s.text for s in merged] == ["a", "dobrze", "c"]
+
+
+class FakeWhisperModel:
+    """Test double returning fixed segments and recording calls."""
+
+    def __init__(self, segments, duration=6.0):
+        self.segments = segments
+        self.duration = duration
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append(kwargs)
+        info = SimpleNamespace(language="pl", language_probability=0.99, duration=self.duration)
+        return iter(self.segments), info
+
+
+class TestProviderCascade:
+    """Test suite for cascade mode in FasterWhisperLibraryProvider."""
+
+    def test_cascade_redecodes_uncertain_range(self, temp_dir):
+        """Test the draft/refine flow, merged output and reported fraction."""
+        draft = FakeWhisperModel([seg(0, 2, " pewne"), seg(2, 4, " niepewne", avg_logprob=-2.0),
+                                  seg(4, 6, " pewne")])
+        large = FakeWhisperModel([seg(1.8, 4.2, " poprawione")])
+
+        provider = FasterWhisperLibraryProvider(device="cpu", cascade_draft_model="tiny")
+        provider._faster_whisper = SimpleNamespace(decode_audio=lambda path: [0.0] * 16000 * 6)
+        provider._models = {"tiny": (draft, None, 0), "large-v3": (large, None, 0)}
+
+        audio = temp_dir / "audio.wav"
+        audio.write_bytes(b"RIFF")
+        output = provider.transcribe(audio, temp_dir, "nagranie", "Polish", "large-v3")
+
+        text = output.read_text(encoding="utf-8")
+        assert "poprawione" in text and "niepewne" not in text
+        assert large.calls[0]["clip_timestamps"] == [1.75, 4.25]
+        assert large.calls[0]["condition_on_previous_text"] is False
+        assert provider.last_run_info["cascade"] is True
+        assert provider.last_run_info["large_model_fraction"] == pytest.approx(2.5 / 6.0)
+
+    def test_cascade_skipped_for_same_model(self, temp_dir):
+        """Test that cascade mode is not used when draft and main model match."""
+        model = FakeWhisperModel([seg(0, 2, " tekst", avg_logprob=-2.0)])
+        provider = FasterWhisperLibraryProvider(device="cpu", cascade_draft_model="small")
+        provider._faster_whisper = SimpleNamespace()
+        provider._models = {"small": (model, None, 0)}
+
+        audio = temp_dir / "audio.wav"
+        audio.write_bytes(b"RIFF")
+        provider.transcribe(audio, temp_dir, "nagranie", "Polish", "small")
+
+        assert len(model.calls) == 1
+        assert "cascade" not in provider.last_run_info
@@ -0,0 +1,87 @@
+"""
+Unit tests for ConsoleBuffer class.
+Tests the bounded ring of console lines, disk spill and pending-line
+draining used for batched GUI updates.
+"""
+from pogadane.gui_utils.console_buffer import ConsoleBuffer
+
+
+class TestConsoleBuffer:
+    """Test suite for ConsoleBuffer."""
+
+    def test_append_splits_lines(self):
+        """Test that messages are stored as lines without a trailing empty line."""
+        buffer = ConsoleBuffer()
+        assert buffer.append("pierwsza\n") == 1
+        assert buffer.append("druga\ntrzecia\n") == 2
+        assert buffer.lines() == ["pierwsza", "druga", "trzecia"]
+        assert buffer.append("\n❌ błąd\n") == 2
+        assert buffer.lines()[-2:] == ["", "❌ błąd"]
+
+    def test_ring_is_bounded(self):
+        """Test that only max_lines are kept in memory."""
+        buffer = ConsoleBuffer(max_lines=3)
+        for i in range(10):
+            buffer.append(f"linia {i}\n")
+        assert buffer.lines() == ["linia 7", "linia 8", "linia 9"]
+        assert buffer.total_lines == 10
+        assert buffer.spilled_lines == 7
+        buffer.close()
+
+    def test_drain_reports_new_and_removed_lines(self):
+        """Test that a flush adds new lines and removes evicted shown lines."""
+        buffer = ConsoleBuffer(max_lines=4)
+        displayed = []
+
+        def flush():
+            new_lines, removed = buffer.drain()
+            del displayed[:removed]
+            displayed.extend(new_lines)
+
+        for i in range(3):
+            buffer.append(f"a{i}\n")
+        flush()
+        assert displayed == ["a0", "a1", "a2"]
+
+        for i in range(3):
+            buffer.append(f"b{i}\n")
+        flush()
+        assert displayed == buffer.lines() == ["a2", "b0", "b1", "b2"]
+
+        # More new lines than the ring holds between two flushes
+        for i in range(10):
+            buffer.append(f"c{i}\n")
+        flush()
+        assert displayed == buffer.lines() == ["c6", "c7", "c8", "c9"]
+        assert not buffer.has_pending
+        buffer.close()
+
+    def test_save_includes_spilled_lines(self, temp_dir):
+        """Test that the saved log contains every line in order."""
+        buffer = ConsoleBuffer(max_lines=2, spill_dir=temp_dir)
+        for i in range(5):
+            buffer.append(f"linia {i}\n")
+        path = temp_dir / "log.txt"
+        buffer.save(path)
+        assert path.read_text(encoding="utf-8").splitlines() == [f"linia {i}" for i in range(5)]
+        buffer.close()
+
+    def test_clear_removes_spill_file(self, temp_dir):
+        """Test that clearing empties the buffer and deletes the spill file."""
+        buffer = ConsoleBuffer(max_lines=1, spill_dir=temp_dir)
+        buffer.append("a\nb\nc\n")
+        assert list(temp_dir.glob("pogadane_console_*.log"))
+        buffer.clear()
+        assert len(buffer) == 0
+        assert buffer.total_lines == 0
+        assert not list(temp_dir.glob("pogadane_console_*.log"))
+
+    def test_without_spill_keeps_only_tail(self, temp_dir):
+        """Test that evicted lines are dropped when spilling is off."""
+        buffer = ConsoleBuffer(max_lines=2, spill_dir=temp_dir, spill=False)
+        buffer.append("a\nb\nc\n")
+        assert buffer.lines() == ["b", "c"]
+        assert not list(temp_dir.glob("pogadane_console_*.log"))
+        path = temp_dir / "log.txt"
+        buffer.save(path)
+        assert path.read_text(encoding="utf-8").splitlines() == ["b", "c"]
@@ -13,6 +13,8 @@ from pogadane.constants import (
     FILE_STATUS_PROCESSING,
     FILE_STATUS_COMPLETED,
     FILE_STATUS_ERROR,
+    TRANSCRIPTION_PROFILES,
+    DEFAULT_TRANSCRIPTION_PROFILE,
 )
 
 
@@ -129,5 +131,39 @@ class TestConstants:
                 f"Default template '{template_name}' not found in templates"
 
 
+
+class TestTranscriptionProfiles:
+    """Test suite for transcription speed profiles."""
+
+    def test_profiles_defined(self):
+        """Test that fast, balanced and accurate profiles exist."""
+        assert set(TRANSCRIPTION_PROFILES) == {"fast", "balanced", "accurate"}
+        assert DEFAULT_TRANSCRIPTION_PROFILE in TRANSCRIPTION_PROFILES
+        assert DEFAULT_CONFIG['TRANSCRIPTION_PROFILE'] in TRANSCRIPTION_PROFILES
+
+    def test_profiles_have_decode_options(self):
+        """Test that every profile sets all decoding knobs."""
+        from pogadane.transcription_providers import PROFILE_DECODE_KEYS
+        for name, profile in TRANSCRIPTION_PROFILES.items():
+            for key in PROFILE_DECODE_KEYS:
+                assert key in profile, f"Profile '{name}' is missing '{key}'"
+            assert "model" in profile
+
+    def test_fast_profile_is_greedy_without_timestamps(self):
+        """Test that the fast profile uses greedy decoding without timestamps."""
+        fast = TRANSCRIPTION_PROFILES["fast"]
+        assert fast["beam_size"] == 1
+        assert fast["without_timestamps"] is True
+
+    def test_unknown_profile_falls_back_to_default(self):
+        """Test that unknown profile names resolve to the default profile."""
+        from pogadane.transcription_providers import get_transcription_profile, profile_decode_options
+        profile = get_transcription_profile("nonexistent")
+        assert profile["name"] == DEFAULT_TRANSCRIPTION_PROFILE
+        options = profile_decode_options(get_transcription_profile("balanced"))
+        assert isinstance(options["temperature"], list)
+        assert "model" not in options
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,124 @@
+"""
+Unit tests for events module.
+Tests typed job events and the coalescing EventBus used to deliver
+them to the GUI event loop.
+"""
+import asyncio
+import threading
+import pytest
+from pogadane.events import EventBus, EventKind, JobEvent
+from pogadane.backend import ProcessingStage, ProgressUpdate
+
+
+def progress(job_id, fraction, stage=ProcessingStage.TRANSCRIBING):
+    """Create a PROGRESS event."""
+    return JobEvent.progress(job_id, ProgressUpdate(stage=stage, message="...", progress=fraction))
+
+
+class RecordingLoop:
+    """Test double for page.run_task that records scheduled deliveries."""
+
+    def __init__(self):
+        self.scheduled = 0
+
+    def schedule(self):
+        self.scheduled += 1
+
+
+@pytest.fixture
+def bus():
+    """EventBus with a recording scheduler and handler."""
+    loop = RecordingLoop()
+    delivered = []
+    bus = EventBus(schedule=loop.schedule, handler=delivered.extend, min_interval=0.0)
+    bus.loop = loop
+    bus.delivered = delivered
+    return bus
+
+
+class TestJobEvent:
+    """Test suite for JobEvent."""
+
+    def test_from_progress_update(self):
+        """Test conversion of backend progress updates."""
+        update = ProgressUpdate(
+            stage=ProcessingStage.SUMMARIZING, message="Generating summary...",
+            progress=0.7, details={"transcription_length": 1200}
+        )
+        event = JobEvent.progress("job-1", update)
+        assert event.kind == EventKind.PROGRESS
+        assert event.job_id == "job-1"
+        assert event.stage == ProcessingStage.SUMMARIZING
+        assert event.fraction == 0.7
+        assert event.metrics == {"transcription_length": 1200}
+
+
+class TestEventBus:
+    """Test suite for EventBus."""
+
+    def test_schedules_once_until_drained(self, bus):
+        """Test that only the first event after a delivery schedules one."""
+        for _ in range(50):
+            bus.publish(JobEvent.log("linia\n"))
+        assert bus.loop.scheduled == 1
+        assert len(bus.drain()) == 50
+        bus.publish(JobEvent.log("kolejna\n"))
+        assert bus.loop.scheduled == 2
+
+    def test_progress_is_coalesced_per_job(self, bus):
+        """Test that undelivered progress events of a job are replaced."""
+        bus.publish(progress("a", 0.1))
+        bus.publish(JobEvent.log("log a\n", "a"))
+        bus.publish(progress("b", 0.5))
+        bus.publish(progress("a", 0.3))
+        bus.publish(progress("a", 0.6))
+        events = bus.drain()
+        assert [(e.kind, e.job_id) for e in events] == [
+            (EventKind.PROGRESS, "a"), (EventKind.LOG, "a"), (EventKind.PROGRESS, "b"),
+        ]
+        assert events[0].fraction == 0.6
+
+    def test_status_keeps_progress_order(self, bus):
+        """Test that progress after a status change is not moved before it."""
+        bus.publish(progress("a", 0.9))
+        bus.publish(JobEvent(EventKind.STATUS, job_id="a", status="done"))
+        bus.publish(progress("a", 0.0))
+        events = bus.drain()
+        assert [e.kind for e in events] == [EventKind.PROGRESS, EventKind.STATUS, EventKind.PROGRESS]
+        assert [e.fraction for e in events if e.kind == EventKind.PROGRESS] == [0.9, 0.0]
+
+    def test_segments_are_not_coalesced(self, bus):
+        """Test that segments are all delivered and do not pin progress order."""
+        bus.publish(progress("a", 0.3))
+        for i in range(3):
+            bus.publish(JobEvent.segment("a", "a.mp3", i * 2.0, i * 2.0 + 2, f"zdanie {i}"))
+        bus.publish(progress("a", 0.4))
+        events = bus.drain()
+        assert [e.kind for e in events] == [EventKind.PROGRESS] + [EventKind.SEGMENT] * 3
+        assert events[0].fraction == 0.4
+        assert [e.payload["text"] for e in events[1:]] == ["zdanie 0", "zdanie 1", "zdanie 2"]
+
+    def test_deliver_passes_events_to_handler(self, bus):
+        """Test that deliver() hands all pending events to the handler."""
+        bus.publish(JobEvent.log("a\n"))
+        bus.publish(JobEvent(EventKind.FINISHED))
+        asyncio.run(bus.deliver())
+        assert [e.kind for e in bus.delivered] == [EventKind.LOG, EventKind.FINISHED]
+        assert bus.drain() == []
+
+    def test_publish_from_threads(self, bus):
+        """Test that events published concurrently are all delivered."""
+        def worker(job_id):
+            for i in range(200):
+                bus.publish(JobEvent.log(f"{job_id} {i}\n", job_id))
+                bus.publish(progress(job_id, i / 200))
+
+        threads = [threading.Thread(target=worker, args=(f"job-{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        events = bus.drain()
+        assert sum(e.kind == EventKind.LOG for e in events) == 800
+        assert sum(e.kind == EventKind.PROGRESS for e in events) == 4
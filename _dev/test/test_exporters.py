@@ -0,0 +1,100 @@
+"""
+Unit tests for exporters module.
+Tests the streamed TXT, Markdown, JSONL and subtitle exports, progress
+reporting and cancellation.
+"""
+import json
+import threading
+import pytest
+from pogadane.exporters import export_results, format_subtitle_time
+from pogadane.gui_utils import ResultsManager
+from pogadane.segments import SegmentStore
+
+
+@pytest.fixture
+def results(temp_dir):
+    """Results of two recordings with timestamps and one without."""
+    rm = ResultsManager(cache_size=1, spill_dir=temp_dir)
+    segments = SegmentStore()
+    segments.append(0.0, 2.5, " Dzień dobry.")
+    segments.append(3661.2, 3662.0, " Do widzenia.")
+    rm.add_result("/nagrania/spotkanie.mp3", segments, "Krótkie spotkanie")
+    rm.add_result("/inne/spotkanie.mp3", "[0.00s -> 1.00s] Drugie", "")
+    rm.add_result("https://youtu.be/abcdefghijk", "Tekst bez znaczników", "Film")
+    return rm
+
+
+class TestExporters:
+    """Test suite for export_results."""
+
+    def test_subtitle_time(self):
+        """Test SRT and WebVTT timestamps."""
+        assert format_subtitle_time(3661.2) == "01:01:01,200"
+        assert format_subtitle_time(59.9996, ".") == "00:01:00.000"
+
+    def test_srt(self, results, temp_dir):
+        """Test one SRT file per recording with unique names; text results are skipped."""
+        stats = export_results(results.iter_results(), "srt", temp_dir / "napisy")
+        assert (stats.exported, stats.skipped, stats.files) == (2, 1, 2)
+        first = (temp_dir / "napisy" / "spotkanie.srt").read_text(encoding="utf-8")
+        assert first == (
+            "1\n00:00:00,000 --> 00:00:02,500\nDzień dobry.\n\n"
+            "2\n01:01:01,200 --> 01:01:02,000\nDo widzenia.\n\n"
+        )
+        assert (temp_dir / "napisy" / "spotkanie_2.srt").exists()
+
+    def test_vtt(self, results, temp_dir):
+        """Test the WebVTT header and cue timestamps."""
+        export_results(results.iter_results(["/inne/spotkanie.mp3"]), "vtt", temp_dir)
+        assert (temp_dir / "spotkanie.vtt").read_text(encoding="utf-8") == (
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nDrugie\n\n"
+        )
+
+    def test_jsonl(self, results, temp_dir):
+        """Test one JSON object per result with segments when available."""
+        stats = export_results(results.iter_results(), "jsonl", temp_dir / "wyniki.jsonl")
+        records = [json.loads(line) for line in
+                   (temp_dir / "wyniki.jsonl").read_text(encoding="utf-8").splitlines()]
+        assert stats.exported == 3
+        assert records[0]["segments"][1] == {"start": 3661.2, "end": 3662.0, "text": " Do widzenia."}
+        assert records[0]["transcription"] == "Dzień dobry. Do widzenia."
+        assert records[2] == {"source": "https://youtu.be/abcdefghijk", "summary": "Film",
+                              "transcription": "Tekst bez znaczników", "segments": None}
+
+    def test_txt_matches_results_manager(self, results, temp_dir):
+        """Test that the TXT export is the ResultsManager text export."""
+        export_results(results.iter_results(), "txt", temp_dir / "wyniki.txt")
+        assert (temp_dir / "wyniki.txt").read_text(encoding="utf-8") == results.export_all_results() + "\n"
+
+    def test_markdown(self, results, temp_dir):
+        """Test Markdown sections with timed transcript lines."""
+        export_results(results.iter_results(), "md", temp_dir / "wyniki.md")
+        text = (temp_dir / "wyniki.md").read_text(encoding="utf-8")
+        assert text.startswith("# Wyniki Pogadane\n\n## 1. /nagrania/spotkanie.mp3\n")
+        assert "- **1:01:01** Do widzenia." in text
+        assert "_Brak podsumowania._" in text
+
+    def test_progress_and_cancel(self, results, temp_dir):
+        """Test progress callbacks and stopping after the current result."""
+        cancel = threading.Event()
+        calls = []
+
+        def progress(done, total):
+            calls.append((done, total))
+            cancel.set()
+
+        stats = export_results(results.iter_results(), "jsonl", temp_dir / "wyniki.jsonl",
+                               total=3, progress=progress, cancel=cancel)
+        assert calls == [(1, 3)]
+        assert stats.cancelled and stats.exported == 1
+
+    def test_export_does_not_fill_cache(self, results, temp_dir):
+        """Test that exporting reads results without replacing the cached ones."""
+        cached = list(results._cache)
+        export_results(results.iter_results(), "txt", temp_dir / "wyniki.txt")
+        assert list(results._cache) == cached
+
+    def test_unknown_format(self, results, temp_dir):
+        """Test that an unknown format is rejected."""
+        with pytest.raises(ValueError):
+            export_results(results.iter_results(), "docx", temp_dir / "wyniki.docx")
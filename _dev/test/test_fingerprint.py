@@ -0,0 +1,228 @@
+"""
+Unit tests for fingerprint module.
+Tests audio fingerprints of synthetic speech-like signals: matching
+re-encoded and shifted copies, rejecting other recordings, the on-disk
+index and the reuse of transcripts by the backend.
+"""
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+import pytest
+from pogadane.segments import SegmentStore
+
+np = pytest.importorskip("numpy")
+from pogadane.fingerprint import AudioFingerprint, FingerprintIndex, iter_audio_blocks, similarity  # noqa: E402
+
+SAMPLE_RATE = 8000
+
+
+def speech(seed, seconds=40.0):
+    """Syllables of harmonic tones with random pitch, loudness and pauses."""
+    rng = np.random.default_rng(seed)
+    samples = np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+    position = 0.0
+    while position < seconds:
+        length = rng.uniform(0.1, 0.4)
+        pitch = rng.uniform(100, 250)
+        start, end = int(position * SAMPLE_RATE), int(min(position + length, seconds) * SAMPLE_RATE)
+        t = np.arange(end - start) / SAMPLE_RATE
+        tone = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 8))
+        samples[start:end] += 0.2 * rng.uniform(0.2, 1.0) * np.sin(np.pi * t / length) * tone
+        position += length + (rng.uniform(0.05, 0.6) if rng.random() < 0.3 else 0.02)
+    return samples
+
+
+def reencode(samples, delay):
+    """Copy as another encoder would produce it: filtered, quieter, noisy and delayed."""
+    rng = np.random.default_rng(0)
+    copy = np.convolve(samples, np.ones(3) / 3, mode="same") * 0.6
+    copy = np.concatenate([np.zeros(int(delay * SAMPLE_RATE)), copy])
+    return (copy + rng.normal(0, 0.003, len(copy))).astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def meeting():
+    """Samples and fingerprint of a 40-second recording."""
+    samples = speech(1)
+    return samples, AudioFingerprint.from_samples(samples)
+
+
+class TestAudioFingerprint:
+    """Test suite for AudioFingerprint and similarity."""
+
+    def test_streamed_blocks_match_whole_array(self, meeting):
+        """Test that decoding in blocks gives the same fingerprint."""
+        samples, fingerprint = meeting
+        streamed = AudioFingerprint.from_samples(np.array_split(samples, 137))
+        assert streamed.duration == fingerprint.duration == 40.0
+        assert np.allclose(streamed.energy, fingerprint.energy)
+        assert np.allclose(streamed.chroma, fingerprint.chroma, atol=1e-5)
+
+    @pytest.mark.parametrize("delay", [0.0, 0.03, 0.35, 2.5])
+    def test_reencoded_copy_matches(self, meeting, delay):
+        """Test that a filtered, noisy copy shifted by encoder padding scores high."""
+        samples, fingerprint = meeting
+        assert similarity(fingerprint, AudioFingerprint.from_samples(reencode(samples, delay))) > 0.9
+
+    def test_other_recordings_do_not_match(self, meeting):
+        """Test that different recordings and silence score low."""
+        _, fingerprint = meeting
+        for seed in (2, 3, 4):
+            assert similarity(fingerprint, AudioFingerprint.from_samples(speech(seed))) < 0.3
+        assert similarity(fingerprint, AudioFingerprint.from_samples(np.zeros(40 * SAMPLE_RATE))) == 0.0
+
+    def test_partial_copy_scores_by_coverage(self, meeting):
+        """Test that the first half of a recording is not taken for the whole."""
+        samples, fingerprint = meeting
+        half = AudioFingerprint.from_samples(samples[:len(samples) // 2])
+        assert similarity(fingerprint, half) == pytest.approx(0.5, abs=0.02)
+
+    def test_blobs_round_trip(self, meeting):
+        """Test that stored fingerprints compare like the computed ones."""
+        samples, fingerprint = meeting
+        stored = AudioFingerprint.from_blobs(fingerprint.duration, *fingerprint.to_blobs())
+        copy = AudioFingerprint.from_samples(reencode(samples, 0.35))
+        assert similarity(stored, copy) == pytest.approx(similarity(fingerprint, copy), abs=0.01)
+
+
+class InvalidDataError(Exception):
+    """Stand-in for av.error.InvalidDataError."""
+
+
+class FakePacket:
+    """Packet decoding to one frame of samples, or failing like a damaged one."""
+
+    def __init__(self, samples):
+        self.samples = samples
+
+    def decode(self):
+        if self.samples is None:
+            raise InvalidDataError("damaged packet")
+        return [self.samples]
+
+
+class FakeResampler:
+    """Resampler passing s16 samples through and holding the last frame until flushed."""
+
+    def __init__(self, **kwargs):
+        self.held = None
+
+    def resample(self, frame):
+        out = [] if self.held is None else [self.held]
+        self.held = None if frame is None else SimpleNamespace(to_ndarray=lambda: frame.reshape(1, -1))
+        return out
+
+
+def fake_av(packets):
+    """Module standing in for PyAV, demuxing the given packets."""
+    container = SimpleNamespace(
+        streams=SimpleNamespace(audio=["stream"]),
+        demux=lambda stream: iter(packets),
+    )
+
+    class Container:
+        def __enter__(self):
+            return container
+
+        def __exit__(self, *exc):
+            return False
+
+    return SimpleNamespace(
+        open=lambda path, **kwargs: Container(),
+        audio=SimpleNamespace(resampler=SimpleNamespace(AudioResampler=FakeResampler)),
+        error=SimpleNamespace(InvalidDataError=InvalidDataError),
+    )
+
+
+class TestIterAudioBlocks:
+    """Test suite for iter_audio_blocks."""
+
+    def test_damaged_packets_are_skipped(self, monkeypatch):
+        """Test that decoding continues after a packet that fails to decode."""
+        blocks = [np.full(4, value, dtype=np.int16) for value in (1000, 2000, 3000)]
+        packets = [FakePacket(blocks[0]), FakePacket(None), FakePacket(blocks[1]), FakePacket(blocks[2])]
+        monkeypatch.setitem(sys.modules, "av", fake_av(packets))
+        decoded = list(iter_audio_blocks("nagranie.mp3"))
+        assert [block[0] * 32768 for block in decoded] == [1000, 2000, 3000]
+        assert all(block.dtype == np.float32 for block in decoded)
+
+
+class TestFingerprintIndex:
+    """Test suite for FingerprintIndex."""
+
+    def test_find_returns_transcript(self, meeting, temp_dir):
+        """Test that a copy finds the stored recording and its transcript."""
+        samples, fingerprint = meeting
+        segments = SegmentStore()
+        segments.append(0.0, 5.0, " Dzień dobry.")
+        index = FingerprintIndex(temp_dir / "fingerprints.db")
+        index.add("spotkanie.mp4", fingerprint, segments)
+        index.add("inne.mp3", AudioFingerprint.from_samples(speech(2)), "Inny tekst")
+
+        match = index.find(AudioFingerprint.from_samples(reencode(samples, 0.35)), threshold=0.85)
+        assert match.source == "spotkanie.mp4"
+        assert match.score > 0.9
+        assert match.transcription == segments
+        assert index.find(fingerprint, exclude="spotkanie.mp4") is None
+        index.close()
+
+    def test_duration_preselects_candidates(self, meeting, temp_dir):
+        """Test that recordings of very different length are not compared."""
+        samples, fingerprint = meeting
+        index = FingerprintIndex(temp_dir / "fingerprints.db")
+        index.add("spotkanie.mp4", fingerprint, "Tekst")
+        longer = AudioFingerprint.from_samples(np.concatenate([samples, speech(5, 30.0)]))
+        with patch("pogadane.fingerprint.similarity") as compare:
+            assert index.find(longer) is None
+        compare.assert_not_called()
+        assert "spotkanie.mp4" in index and len(index) == 1
+        assert index.has_candidates(40.5)
+        assert not index.has_candidates(70.0)
+        assert not index.has_candidates(40.0, exclude="spotkanie.mp4")
+        assert index.remove("spotkanie.mp4")
+        assert not index.remove("spotkanie.mp4")
+        index.close()
+
+
+class TestBackendReuse:
+    """Test suite for reusing transcripts of duplicates in PogadaneBackend.process_file."""
+
+    def run(self, backend, source, fingerprint, duration=None, **kwargs):
+        """Process a source with transcription, summary and file handling stubbed."""
+        with patch("pogadane.fingerprint.fingerprint_file", return_value=fingerprint), \
+                patch("pogadane.short_clips.probe_audio_duration", return_value=duration), \
+                patch.object(backend, "_copy_to_temp", return_value=source), \
+                patch.object(backend, "_transcribe_audio", return_value="[0.00s -> 5.00s]  Nowa.") as transcribe, \
+                patch.object(backend, "_summarize_text", return_value="Streszczenie"), \
+                patch.object(backend, "_cleanup_temp_files"):
+            transcription, _ = backend.process_file(source, **kwargs)
+        return transcription, transcribe.called
+
+    def test_duplicate_reuses_transcript(self, meeting, temp_dir):
+        """Test that a re-uploaded recording is not transcribed again unless overridden."""
+        from pogadane.backend import PogadaneBackend
+        samples, fingerprint = meeting
+        backend = PogadaneBackend()
+        backend.fingerprint_index = FingerprintIndex(temp_dir / "fingerprints.db")
+        copy = AudioFingerprint.from_samples(reencode(samples, 0.35))
+
+        assert self.run(backend, "spotkanie.mp4", fingerprint, 40.0) == ("[0.00s -> 5.00s]  Nowa.", True)
+        assert self.run(backend, "spotkanie.mp3", copy, 40.35) == ("[0.00s -> 5.00s]  Nowa.", False)
+        assert backend.last_transcription_info["duplicate_of"] == "spotkanie.mp4"
+        assert backend.last_segments.plain_text() == "Nowa."
+        assert self.run(backend, "spotkanie.mp3", copy, reuse_duplicates=False)[1]
+        backend.fingerprint_index.close()
+
+    def test_no_decode_before_transcription_without_candidates(self, meeting, temp_dir):
+        """Test that a recording of a new length is looked up by its header only and still indexed."""
+        from pogadane.backend import PogadaneBackend
+        _, fingerprint = meeting
+        backend = PogadaneBackend()
+        backend.fingerprint_index = FingerprintIndex(temp_dir / "fingerprints.db")
+        backend.fingerprint_index.add("krótkie.mp3", AudioFingerprint.from_samples(speech(2, 10.0)), "Tekst")
+
+        with patch.object(backend.fingerprint_index, "find") as find:
+            assert self.run(backend, "spotkanie.mp4", fingerprint, duration=40.0)[1]
+        find.assert_not_called()
+        assert "spotkanie.mp4" in backend.fingerprint_index
+        backend.fingerprint_index.close()
@@ -0,0 +1,204 @@
+"""
+Unit tests for the hardware module.
+Tests hardware probing, calibration candidates, tuning persistence and lookup.
+"""
+import json
+import pytest
+from types import SimpleNamespace
+from pogadane.hardware import (
+    HardwareInfo,
+    CalibrationResult,
+    probe_hardware,
+    candidate_configs,
+    build_tuning_entry,
+    lookup_tuning,
+    save_tuning,
+    _time_transcription,
+    _window_timestamps,
+)
+from pogadane.config_loader import ConfigManager
+from pogadane.transcription_providers import FasterWhisperLibraryProvider
+
+
+@pytest.fixture
+def hardware():
+    """Fixed hardware description independent of the test machine."""
+    return HardwareInfo(
+        cpu_model="Test CPU",
+        logical_cores=8,
+        physical_cores=4,
+        ram_bytes=16 * 1024 ** 3,
+        cpu_flags=frozenset({"avx2", "avx512f", "avx512_vnni"}),
+    )
+
+
+class TestHardwareInfo:
+    """Test suite for hardware probing."""
+
+    def test_probe_returns_sane_values(self):
+        """Test probing the current machine returns plausible values."""
+        info = probe_hardware()
+        assert info.logical_cores >= 1
+        assert 1 <= info.physical_cores <= info.logical_cores
+        assert info.ram_bytes >= 0
+        assert info.cuda_devices >= 0
+
+    def test_feature_flags(self, hardware):
+        """Test instruction set helpers."""
+        assert hardware.has_avx2
+        assert hardware.has_avx512
+        assert hardware.has_vnni
+        assert hardware.ram_gb == pytest.approx(16.0)
+
+    def test_fingerprint_is_stable(self, hardware):
+        """Test fingerprint depends only on hardware identity."""
+        same = HardwareInfo("Test CPU", 8, 4, 1, frozenset())
+        other = HardwareInfo("Other CPU", 8, 4, 16 * 1024 ** 3, frozenset())
+        assert hardware.fingerprint() == same.fingerprint()
+        assert hardware.fingerprint() != other.fingerprint()
+
+    def test_summary_mentions_cores(self, hardware):
+        """Test summary line is human-readable."""
+        summary = hardware.summary()
+        assert "4 cores / 8 threads" in summary
+        assert "AVX2" in summary
+
+
+class TestCandidateConfigs:
+    """Test suite for calibration candidate generation."""
+
+    def test_cpu_thread_options(self, hardware):
+        """Test CPU candidates cover half, physical and logical core counts."""
+        configs = candidate_configs(hardware, "cpu", compute_types=("int8",), batch_sizes=(0,))
+        assert [threads for _, threads, _ in configs] == [2, 4, 8]
+
+    def test_cuda_ignores_threads(self, hardware):
+        """Test CUDA candidates do not vary CPU threads."""
+        configs = candidate_configs(hardware, "cuda", compute_types=("float16",), batch_sizes=(0, 8))
+        assert configs == [("float16", 0, 0), ("float16", 0, 8)]
+
+    def test_low_ram_limits_batch_size(self):
+        """Test large batch sizes are skipped on machines with little RAM."""
+        small = HardwareInfo("Small CPU", 2, 2, 4 * 1024 ** 3, frozenset())
+        configs = candidate_configs(small, "cpu", compute_types=("int8",), batch_sizes=(0, 4, 8))
+        assert {batch for _, _, batch in configs} == {0, 4}
+
+    def test_window_timestamps(self):
+        """Test clip windows cover the whole duration in 30 s chunks."""
+        windows = _window_timestamps(65.0)
+        assert windows == [
+            {"start": 0.0, "end": 30.0},
+            {"start": 30.0, "end": 60.0},
+            {"start": 60.0, "end": 65.0},
+        ]
+
+    def test_batched_timing_uses_installed_units(self):
+        """Test that faster-whisper 1.1 gets calibration windows as sample indices."""
+        np = pytest.importorskip("numpy")
+        calls = []
+
+        class Pipeline:
+            def __init__(self, model):
+                pass
+
+            def transcribe(self, audio, **kwargs):
+                calls.append(kwargs)
+                return iter(()), None
+
+        module = SimpleNamespace(__version__="1.1.1", BatchedInferencePipeline=Pipeline)
+        _time_transcription(object(), np.zeros(16000 * 40, dtype=np.float32), 4, "pl", module)
+        assert calls[0]["clip_timestamps"] == [{"start": 0, "end": 480000}, {"start": 480000, "end": 640000}]
+        assert calls[0]["vad_filter"] is False
+
+
+class TestSyntheticClip:
+    """Test suite for the synthetic calibration clip."""
+
+    def test_clip_shape_and_range(self):
+        """Test clip is float32 16 kHz audio within [-1, 1]."""
+        np = pytest.importorskip("numpy")
+        from pogadane.hardware import synthetic_clip
+        clip = synthetic_clip(2.0)
+        assert clip.dtype == np.float32
+        assert clip.shape == (32000,)
+        assert float(np.abs(clip).max()) <= 1.0
+
+    def test_clip_is_deterministic(self):
+        """Test repeated calls produce identical audio."""
+        np = pytest.importorskip("numpy")
+        from pogadane.hardware import synthetic_clip
+        assert np.array_equal(synthetic_clip(1.0), synthetic_clip(1.0))
+
+
+class TestTuningPersistence:
+    """Test suite for storing and looking up calibration results."""
+
+    def test_lookup_matches_device_and_hardware(self, hardware):
+        """Test lookup only returns entries for this device and machine."""
+        best = CalibrationResult("turbo", "cpu", "int8_float32", 4, 8, seconds=3.0, rtf=0.05)
+        tuning = {"turbo": build_tuning_entry(best, hardware)}
+
+        entry = lookup_tuning(tuning, "turbo", "cpu", hardware)
+        assert entry["compute_type"] == "int8_float32"
+        assert entry["cpu_threads"] == 4
+        assert entry["batch_size"] == 8
+
+        assert lookup_tuning(tuning, "turbo", "cuda", hardware) is None
+        assert lookup_tuning(tuning, "small", "cpu", hardware) is None
+        other = HardwareInfo("Other CPU", 8, 4, 0, frozenset())
+        assert lookup_tuning(tuning, "turbo", "cpu", other) is None
+
+    def test_lookup_handles_missing_tuning(self):
+        """Test lookup tolerates missing or malformed settings."""
+        assert lookup_tuning(None, "turbo", "cpu") is None
+        assert lookup_tuning("invalid", "turbo", "cpu") is None
+        assert lookup_tuning({"turbo": "invalid"}, "turbo", "cpu") is None
+
+    def test_save_tuning_preserves_other_settings(self, temp_dir):
+        """Test saving tuning keeps existing settings.json keys."""
+        config_file = temp_dir / "config.py"
+        config_file.write_text("WHISPER_MODEL = 'turbo'\n", encoding='utf-8')
+        settings_file = temp_dir / "settings.json"
+        settings_file.write_text(json.dumps({"THEME_MODE": "dark"}), encoding='utf-8')
+
+        manager = ConfigManager()
+        manager.initialize(config_file)
+        best = CalibrationResult("turbo", "cpu", "int8", 4, 0, seconds=5.0, rtf=0.1)
+        save_tuning("turbo", best, manager)
+
+        saved = json.loads(settings_file.read_text(encoding='utf-8'))
+        assert saved["THEME_MODE"] == "dark"
+        assert saved["FASTER_WHISPER_TUNING"]["turbo"]["compute_type"] == "int8"
+        assert manager.get("FASTER_WHISPER_TUNING")["turbo"]["cpu_threads"] == 4
+
+        # Saving the theme afterwards must not drop the tuning
+        manager.config.THEME_MODE = "light"
+        manager.save_config_to_file()
+        saved = json.loads(settings_file.read_text(encoding='utf-8'))
+        assert saved["THEME_MODE"] == "light"
+        assert "turbo" in saved["FASTER_WHISPER_TUNING"]
+
+
+class TestProviderTuning:
+    """Test suite for calibrated settings in FasterWhisperLibraryProvider."""
+
+    def _tuning(self, compute_type="int8_float32", threads=6, batch=8):
+        best = CalibrationResult("turbo", "cpu", compute_type, threads, batch)
+        return {"turbo": build_tuning_entry(best)}
+
+    def test_auto_uses_tuning(self):
+        """Test compute_type 'auto' picks up the calibrated configuration."""
+        provider = FasterWhisperLibraryProvider(device="cpu", tuning=self._tuning())
+        assert provider._resolve_runtime("turbo") == ("cpu", "int8_float32", 6, 8)
+
+    def test_auto_without_tuning_uses_defaults(self):
+        """Test compute_type 'auto' falls back to int8 on CPU."""
+        provider = FasterWhisperLibraryProvider(device="cpu")
+        assert provider._resolve_runtime("turbo") == ("cpu", "int8", 0, 0)
+
+    def test_explicit_settings_override_tuning(self):
+        """Test explicit compute type disables calibrated settings."""
+        provider = FasterWhisperLibraryProvider(
+            device="cpu", compute_type="float32", batch_size=2, tuning=self._tuning()
+        )
+        assert provider._resolve_runtime("turbo") == ("cpu", "float32", 0, 2)
@@ -6,10 +6,13 @@ and LLMProviderFactory.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pogadane.llm_providers import (
+    LlamaCppProvider,
     LLMProvider,
     OllamaProvider,
     GoogleGeminiProvider,
     LLMProviderFactory,
+    parse_go_duration,
+    parse_ollama_stats,
 )
 
 
@@ -129,6 +132,37 @@ class TestOllamaProvider:
         assert result is None or "error" in result.lower()
 
 
+class TestOllamaStats:
+    """Test suite for reading ``ollama run --verbose`` statistics."""
+
+    def test_parse_go_duration(self):
+        """Test Go duration strings as printed by Ollama."""
+        assert parse_go_duration("102.5ms") == pytest.approx(0.1025)
+        assert parse_go_duration("1m2.5s") == 62.5
+        assert parse_go_duration("850µs") == pytest.approx(0.00085)
+        assert parse_go_duration("12 token(s)") is None
+
+    def test_parse_stats(self):
+        """Test that token counts and durations are read from stderr."""
+        stderr = (
+            "total duration:       6.1s\n"
+            "load duration:        5.1ms\n"
+            "prompt eval count:    26 token(s)\n"
+            "prompt eval duration: 200ms\n"
+            "prompt eval rate:     130.00 tokens/s\n"
+            "eval count:           290 token(s)\n"
+            "eval duration:        5.8s\n"
+            "eval rate:            50.00 tokens/s\n"
+        )
+        assert parse_ollama_stats(stderr) == {
+            "prompt_tokens": 26,
+            "prompt_eval_seconds": pytest.approx(0.2),
+            "completion_tokens": 290,
+            "generation_seconds": 5.8,
+        }
+        assert parse_ollama_stats("spinner\nError: model not found") == {}
+
+
 class TestGoogleGeminiProvider:
     """Test suite for GoogleGeminiProvider."""
 
@@ -232,6 +266,21 @@ class TestLLMProviderFactory:
         assert isinstance(provider, GoogleGeminiProvider)
         assert provider.api_key == 'test_api_key'
 
+    def test_create_gguf_provider_with_context_size(self):
+        """Test that the GGUF context size comes from the config."""
+        mock_config = Mock()
+        mock_config.get.side_effect = lambda key, default=None: {
+            'SUMMARY_PROVIDER': 'gguf',
+            'GGUF_MODEL_PATH': 'model.gguf',
+            'GGUF_CONTEXT_SIZE': 16384,
+            'DEBUG_MODE': False
+        }.get(key, default)
+        
+        provider = LLMProviderFactory.create_provider(mock_config)
+        
+        assert isinstance(provider, LlamaCppProvider)
+        assert provider.n_ctx == 16384
+
     def test_create_provider_defaults_to_ollama(self):
         """Test that factory defaults to Ollama for unknown provider."""
         mock_config = Mock()
@@ -304,5 +353,111 @@ class TestProviderIntegration:
             assert 'source_name' in params
 
 
+class FakeLlama:
+    """Stand-in for llama_cpp.Llama: one token per character, prefix reuse and saved states."""
+    
+    def __init__(self):
+        self.input_ids = []
+        self.n_tokens = 0
+        self.evaluated = 0
+        self.answers = 0
+    
+    def tokenize(self, text, add_bos=True, special=False):
+        return ([1] if add_bos else []) + [ord(c) for c in text.decode("utf-8")]
+    
+    def detokenize(self, tokens):
+        return "".join(chr(t) for t in tokens if t != 1).encode("utf-8")
+    
+    def __call__(self, tokens, max_tokens, stream, **kwargs):
+        reused = 0
+        for old, new in zip(self.input_ids[:self.n_tokens], tokens[:-1]):
+            if old != new:
+                break
+            reused += 1
+        self.evaluated = len(tokens) - reused
+        self.answers += 1
+        answer = f" Odpowiedź {self.answers}"
+        self.input_ids = list(tokens) + [ord(c) for c in answer]
+        self.n_tokens = len(self.input_ids)
+        for char in answer:
+            yield {"choices": [{"text": char}]}
+    
+    def save_state(self):
+        return Mock(ids=list(self.input_ids), llama_state_size=1000)
+    
+    def load_state(self, state):
+        self.input_ids = list(state.ids)
+        self.n_tokens = len(self.input_ids)
+
+
+@pytest.fixture
+def qa_provider():
+    """GGUF provider with a fake model loaded."""
+    provider = LlamaCppProvider(model_path="gemma-3-4b-it-Q4_K_M.gguf", n_ctx=4096)
+    provider._llm = FakeLlama()
+    return provider
+
+
+class TestLlamaCppQA:
+    """Test suite for multi-turn questions about a transcript (LlamaCppProvider.ask)."""
+    
+    def test_follow_up_reuses_transcript(self, qa_provider):
+        """Test that a follow-up question evaluates only the new tokens."""
+        transcript = "Ustalono budżet marketingu na 20 tysięcy. " * 20
+        assert qa_provider.ask("a.mp3", "Jaki jest budżet?", transcript) == "Odpowiedź 1"
+        first = qa_provider.last_run_info
+        assert first["cached_tokens"] == 0
+        assert first["transcript_truncated"] is False
+        
+        assert qa_provider.ask("a.mp3", "A kto go zatwierdził?") == "Odpowiedź 2"
+        second = qa_provider.last_run_info
+        assert second["cached_tokens"] > len(transcript)
+        assert second["prompt_tokens"] == qa_provider._llm.evaluated
+        assert second["prompt_tokens"] < 150
+        assert qa_provider.session_turns("a.mp3") == [("Jaki jest budżet?", "Odpowiedź 1"),
+                                                      ("A kto go zatwierdził?", "Odpowiedź 2")]
+    
+    def test_switching_sessions_loads_saved_state(self, qa_provider):
+        """Test that returning to a session restores its evaluated transcript."""
+        qa_provider.ask("a.mp3", "Pytanie?", "Pierwsze nagranie. " * 30)
+        qa_provider.ask("b.mp3", "Pytanie?", "Drugie nagranie. " * 30)
+        qa_provider.ask("a.mp3", "Kolejne pytanie?")
+        assert qa_provider.last_run_info["prompt_tokens"] < 150
+    
+    def test_states_evicted_least_recently_used_first(self, qa_provider):
+        """Test that saved states above the memory budget are dropped, oldest first."""
+        qa_provider.qa_state_budget = 2000
+        for source in ("a.mp3", "b.mp3", "c.mp3"):
+            qa_provider.ask(source, "Pytanie?", f"Nagranie {source}. " * 20)
+        assert qa_provider.qa_state_bytes == 2000
+        assert qa_provider._sessions["a.mp3"].state is None
+        assert qa_provider._sessions["b.mp3"].state is not None
+        
+        # An evicted session continues after evaluating its transcript again
+        assert qa_provider.ask("a.mp3", "Jeszcze jedno?") == "Odpowiedź 4"
+        assert qa_provider.last_run_info["prompt_tokens"] > 20 * len("Nagranie a.mp3. ")
+        assert len(qa_provider.session_turns("a.mp3")) == 2
+    
+    def test_unknown_session_needs_transcript(self, qa_provider):
+        """Test that a new session without a transcript is rejected."""
+        with pytest.raises(ValueError):
+            qa_provider.ask("nowy.mp3", "Pytanie?")
+        qa_provider.ask("nowy.mp3", "Pytanie?", "Tekst.")
+        assert qa_provider.close_session("nowy.mp3")
+        assert not qa_provider.close_session("nowy.mp3")
+    
+    def test_long_transcript_and_old_turns_fit_context(self, qa_provider):
+        """Test that the transcript is cut and the oldest turns are dropped to fit the context."""
+        qa_provider.n_ctx = 1600
+        qa_provider.ask("a.mp3", "Pytanie 1?", "słowo " * 1000, max_tokens=200)
+        assert len(qa_provider._sessions["a.mp3"].context) < 1000
+        assert qa_provider.last_run_info["transcript_truncated"] is True
+        for number in range(2, 20):
+            qa_provider.ask("a.mp3", f"Pytanie {number} " + "x" * 30, max_tokens=200)
+        turns = qa_provider.session_turns("a.mp3")
+        assert 0 < len(turns) < 18
+        assert turns[-1][0].startswith("Pytanie 19")
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
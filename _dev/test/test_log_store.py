@@ -0,0 +1,111 @@
+"""
+Unit tests for log_store module.
+Tests the rotating on-disk log: both output formats, rotation, copying the
+text log from a mark, and records fed by ProgressCallback.
+"""
+import json
+from pogadane.log_store import LogStore, _RotatingFile
+from pogadane.backend import ProcessingStage, ProgressCallback
+
+
+class TestLogStore:
+    """Test suite for LogStore."""
+
+    def test_writes_text_and_jsonl(self, temp_dir):
+        """Test that a record is written in both formats."""
+        store = LogStore(temp_dir)
+        store.write("Transkrypcja\ndruga linia", stage="transcribing", source="a.mp3", job_id=None)
+        store.flush()
+        text = store.text_path.read_text(encoding="utf-8").splitlines()
+        assert len(text) == 2
+        assert text[0].endswith("INFO    [transcribing] Transkrypcja")
+        assert text[1].endswith("[transcribing] druga linia")
+        record = json.loads(store.jsonl_path.read_text(encoding="utf-8"))
+        assert record["message"] == "Transkrypcja\ndruga linia"
+        assert record["source"] == "a.mp3"
+        assert "job_id" not in record  # None fields are left out
+        store.close()
+
+    def test_appends_to_existing_log(self, temp_dir):
+        """Test that reopening keeps earlier records."""
+        for message in ("pierwszy", "drugi"):
+            store = LogStore(temp_dir)
+            store.write(message)
+            store.close()
+        assert len(store.text_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_rotation_keeps_bounded_files(self, temp_dir):
+        """Test that files are rotated by size and old ones removed."""
+        store = LogStore(temp_dir, max_bytes=200, backups=2)
+        for i in range(50):
+            store.write(f"komunikat numer {i:03d}")
+        store.close()
+        names = sorted(path.name for path in temp_dir.iterdir())
+        assert names == ["pogadane.jsonl", "pogadane.jsonl.1", "pogadane.jsonl.2",
+                         "pogadane.log", "pogadane.log.1", "pogadane.log.2"]
+        assert all(path.stat().st_size < 300 for path in temp_dir.iterdir())
+
+    def test_size_is_counted_without_flushing(self, temp_dir):
+        """Test that records stay buffered until flushed and the counted size matches the file."""
+        path = temp_dir / "pogadane.log"
+        path.write_bytes(b"stary wpis\n")
+        log = _RotatingFile(path, max_bytes=10_000, backups=1)
+        for i in range(20):
+            log.write(f"zażółć gęślą jaźń {i}\n")
+        assert path.stat().st_size == 11
+        log.flush()
+        assert log.tell() == path.stat().st_size
+        assert log.rotations == 0
+        log.close()
+
+    def test_copy_text_since_mark(self, temp_dir):
+        """Test that saving copies only records after the mark, across rotations."""
+        store = LogStore(temp_dir, max_bytes=400, backups=10)
+        store.write("poprzednia sesja")
+        mark = store.mark()
+        for i in range(20):
+            store.write(f"linia {i:02d}")
+        destination = temp_dir / "zapis.txt"
+        store.copy_text(destination, since=mark)
+        lines = destination.read_text(encoding="utf-8").splitlines()
+        assert [line[line.index("linia"):] for line in lines] == [f"linia {i:02d}" for i in range(20)]
+        store.copy_text(destination)
+        assert "poprzednia sesja" in destination.read_text(encoding="utf-8")
+        store.close()
+
+    def test_mark_older_than_kept_files(self, temp_dir):
+        """Test that a mark in a deleted file copies everything still kept."""
+        store = LogStore(temp_dir, max_bytes=100, backups=1)
+        mark = store.mark()
+        for i in range(30):
+            store.write(f"linia {i:02d}")
+        destination = temp_dir / "zapis.txt"
+        assert store.copy_text(destination, since=mark) > 0
+        assert destination.read_text(encoding="utf-8").splitlines()[-1].endswith("linia 29")
+        store.close()
+
+    def test_write_after_close_is_ignored(self, temp_dir):
+        """Test that a closed store drops records instead of failing."""
+        store = LogStore(temp_dir)
+        store.close()
+        store.write("za późno")
+        assert store.flush()
+        assert store.text_path.read_text(encoding="utf-8") == ""
+
+
+class TestProgressCallbackLogging:
+    """Test suite for ProgressCallback feeding a LogStore."""
+
+    def test_updates_and_messages_are_recorded(self, temp_dir):
+        """Test that updates carry source, stage and progress."""
+        store = LogStore(temp_dir)
+        progress = ProgressCallback(log_store=store, source="wyklad.mp3")
+        progress.update(ProcessingStage.TRANSCRIBING, "Transkrypcja", 0.5)
+        progress.log("Ostrzeżenie", level="warning")
+        store.close()
+        records = [json.loads(line) for line in store.jsonl_path.read_text(encoding="utf-8").splitlines()]
+        assert [(r["message"], r["level"], r["stage"], r["progress"]) for r in records] == [
+            ("Transkrypcja", "info", ProcessingStage.TRANSCRIBING.value, 0.5),
+            ("Ostrzeżenie", "warning", ProcessingStage.TRANSCRIBING.value, 0.5),
+        ]
+        assert all(r["source"] == "wyklad.mp3" for r in records)
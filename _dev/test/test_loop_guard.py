@@ -0,0 +1,271 @@
+"""
+Unit tests for loop_guard module.
+Tests online detection of repetition loops and the abort/resume flow
+of FasterWhisperLibraryProvider, and segments reported while decoding.
+"""
+import pytest
+from types import SimpleNamespace
+from pogadane.loop_guard import (
+    RepetitionGuard,
+    normalize_words,
+    resume_point,
+    regions_after,
+)
+from pogadane.transcription_providers import FasterWhisperLibraryProvider
+
+
+def seg(start, end, text):
+    """Create a segment-like object."""
+    return SimpleNamespace(start=start, end=end, text=text)
+
+
+def feed_all(guard, segments):
+    """Feed segments until the first loop event."""
+    for segment in segments:
+        event = guard.feed(segment)
+        if event:
+            return event
+    return None
+
+
+class TestRepetitionGuard:
+    """Test suite for RepetitionGuard."""
+
+    def test_normal_speech_is_not_a_loop(self):
+        """Test that ordinary varied text passes."""
+        sentences = [
+            " Dzień dobry, zaczynamy spotkanie zespołu.",
+            " Pierwszy punkt to harmonogram wdrożenia.",
+            " Termin przesunął się o tydzień.",
+            " Dziękuję, przechodzimy dalej.",
+            " Drugi punkt to budżet na przyszły kwartał.",
+            " Proszę o uwagi do końca tygodnia.",
+        ]
+        segments = [seg(i * 3.0, i * 3.0 + 3.0, text) for i, text in enumerate(sentences)]
+        assert feed_all(RepetitionGuard(), segments) is None
+
+    def test_identical_segments(self):
+        """Test that repeated identical segments form a loop and the first is kept."""
+        segments = [seg(0, 4, " Omawiamy projekt.")] + [
+            seg(4 + i * 2, 6 + i * 2, " Dziękuję za uwagę.") for i in range(5)
+        ]
+        event = feed_all(RepetitionGuard(), segments)
+        assert event is not None
+        assert event.cut_at == 6
+        assert event.loop_end == 10
+        assert event.phrase == "dziękuję za uwagę"
+        assert event.repeats == 3
+
+    def test_repeated_short_phrases_are_speech(self):
+        """Test that "Tak." answered several times is not cut as a loop."""
+        segments = [seg(i * 1.5, i * 1.5 + 1.0, " Tak.") for i in range(10)]
+        assert feed_all(RepetitionGuard(), segments) is None
+        segments = [seg(i, i + 1.0, " Dobrze.") for i in range(5)]
+        assert feed_all(RepetitionGuard(), segments) is None
+
+    def test_long_run_of_short_phrase_without_pauses(self):
+        """Test that a short phrase looping back to back is still caught."""
+        segments = [seg(i * 2.0, i * 2.0 + 2.0, " Dziękuję.") for i in range(12)]
+        event = feed_all(RepetitionGuard(), segments)
+        assert event is not None
+        assert event.repeats == 8
+        assert event.cut_at == 2.0
+
+    def test_configurable_repeats(self):
+        """Test the number of repeats and the short phrase length."""
+        segments = [seg(i * 2.0, i * 2.0 + 2.0, " Dziękuję za uwagę.") for i in range(4)]
+        assert feed_all(RepetitionGuard(max_segment_repeats=5), segments) is None
+        short = [seg(i * 1.5, i * 1.5 + 1.0, " Tak.") for i in range(3)]
+        assert feed_all(RepetitionGuard(min_repeat_words=1), short).repeats == 3
+
+    def test_punctuation_and_case_are_ignored(self):
+        """Test normalization of segment text."""
+        assert normalize_words(" Dziękuję, za UWAGĘ!") == ("dziękuję", "za", "uwagę")
+
+    def test_ngram_loop_across_varying_segments(self):
+        """Test that a dominating n-gram is detected even if segments differ."""
+        texts = [" Tak, to jest to.", " to jest to, to jest to", " no to jest to to jest to",
+                 " to jest to to jest to to jest to", " i to jest to to jest to"]
+        segments = [seg(i * 2.0, i * 2.0 + 2.0, text) for i, text in enumerate(texts)]
+        event = feed_all(RepetitionGuard(), segments)
+        assert event is not None
+        assert event.phrase in ("to jest to", "jest to to")
+        assert event.cut_at > 0.0
+
+    def test_cut_point(self):
+        """Test which seen segments a later loop could still drop."""
+        guard = RepetitionGuard()
+        assert guard.cut_point() is None
+        guard.feed(seg(0, 3, " Omawiamy projekt na ten rok."))
+        guard.feed(seg(3, 5, " Dziękuję za uwagę."))
+        assert guard.cut_point() is None
+        guard.feed(seg(5, 7, " Dziękuję za uwagę."))
+        assert guard.cut_point() == 5
+        guard.feed(seg(7, 9, " Następny punkt."))
+        assert guard.cut_point() is None
+
+    def test_empty_segments_are_ignored(self):
+        """Test that segments without words do not count as repeats."""
+        segments = [seg(i, i + 1, " ...") for i in range(5)]
+        assert feed_all(RepetitionGuard(), segments) is None
+
+
+class TestResume:
+    """Test suite for resume_point and regions_after."""
+
+    def test_next_speech_region(self):
+        """Test skipping silence to the next speech region."""
+        regions = [(0.0, 10.0), (40.0, 55.0), (70.0, 80.0)]
+        assert resume_point(regions, 20.0, 100.0) == 40.0
+        assert resume_point(regions, 45.0, 100.0) == 45.0
+        assert resume_point(regions, 85.0, 100.0) == 100.0
+        assert resume_point(None, 20.0, 100.0) == 20.0
+
+    def test_regions_after(self):
+        """Test clip timestamps of the remaining speech."""
+        regions = [(0.0, 10.0), (40.0, 55.0), (70.0, 80.0)]
+        assert regions_after(regions, 45.0) == [45.0, 55.0, 70.0, 80.0]
+
+
+class FakeWhisperModel:
+    """Test double yielding scripted segment lists per call."""
+
+    def __init__(self, passes):
+        self.passes = passes
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append(kwargs)
+        segments = self.passes[len(self.calls) - 1]
+        return iter(segments), SimpleNamespace(language="pl", language_probability=0.99, duration=100.0)
+
+
+class TestProviderLoopGuard:
+    """Test suite for loop aborts in FasterWhisperLibraryProvider.transcribe."""
+
+    def test_loop_is_cut_and_decoding_resumes(self, temp_dir):
+        """Test that the loop is dropped and decoding resumes at the next speech."""
+        looping = [seg(0, 5, " Początek nagrania.")] + [
+            seg(5 + i * 2, 7 + i * 2, " Dziękuję za uwagę.") for i in range(50)
+        ]
+        model = FakeWhisperModel([looping, [seg(60, 65, " Dalsza część.")]])
+        fake_vad = SimpleNamespace(get_speech_timestamps=lambda audio: [
+            {"start": 0, "end": 7 * 16000}, {"start": 60 * 16000, "end": 70 * 16000},
+        ])
+        provider = FasterWhisperLibraryProvider(device="cpu")
+        provider._faster_whisper = SimpleNamespace(
+            decode_audio=lambda path: [0.0] * 16, vad=fake_vad
+        )
+        provider._models = {"small": (model, None, 0)}
+
+        audio = temp_dir / "audio.wav"
+        audio.write_bytes(b"RIFF")
+        output = provider.transcribe(audio, temp_dir, "nagranie", "Polish", "small")
+
+        text = output.read_text(encoding="utf-8")
+        assert text.count("Dziękuję za uwagę") == 1
+        assert "Dalsza część" in text
+        assert model.calls[1]["clip_timestamps"] == [60.0, 100.0]
+        assert model.calls[1]["condition_on_previous_text"] is False
+        assert provider.last_run_info["loop_aborts"] == 1
+        assert provider.last_run_info["loop_seconds_skipped"] == pytest.approx(49.0)
+        assert provider.last_run_info["loop_seconds_removed"] == pytest.approx(4.0)
+
+    def test_guard_disabled(self, temp_dir):
+        """Test that loops are kept when the guard is turned off."""
+        looping = [seg(i * 2, i * 2 + 2, " Dziękuję.") for i in range(5)]
+        model = FakeWhisperModel([looping])
+        provider = FasterWhisperLibraryProvider(device="cpu", loop_guard=False)
+        provider._faster_whisper = SimpleNamespace()
+        provider._models = {"small": (model, None, 0)}
+
+        audio = temp_dir / "audio.wav"
+        audio.write_bytes(b"RIFF")
+        output = provider.transcribe(audio, temp_dir, "nagranie", "Polish", "small")
+
+        assert output.read_text(encoding="utf-8").count("Dziękuję") == 5
+        assert "loop_aborts" not in provider.last_run_info
+
+
+class TestProviderSegmentCallback:
+    """Test suite for on_segment in FasterWhisperLibraryProvider.transcribe."""
+
+    def test_segments_reported_while_decoding(self, temp_dir):
+        """Test that each segment is reported before the next one is decoded."""
+        events = []
+
+        def decoding():
+            for i in range(3):
+                events.append(f"decode {i}")
+                yield seg(i * 2, i * 2 + 2, f" Zdanie {i}.")
+
+        model = FakeWhisperModel([decoding()])
+        provider = FasterWhisperLibraryProvider(device="cpu", loop_guard=False)
+        provider._faster_whisper = SimpleNamespace()
+        provider._models = {"small": (model, None, 0)}
+        provider.on_segment = lambda start, end, text: events.append(f"segment {start:.0f} {text.strip()}")
+
+        audio = temp_dir / "audio.wav"
+        audio.write_bytes(b"RIFF")
+        provider.transcribe(audio, temp_dir, "nagranie", "Polish", "small")
+
+        assert events == [
+            "decode 0", "segment 0 Zdanie 0.",
+            "decode 1", "segment 2 Zdanie 1.",
+            "decode 2", "segment 4 Zdanie 2.",
+        ]
+        assert len(provider.last_segments) == 3
+
+    def test_segments_reported_while_decoding_with_loop_guard(self, temp_dir):
+        """Test that the loop guard reports final segments during decoding and never a dropped one."""
+        events = []
+        texts = [" Zaczynamy spotkanie.", " Pierwszy punkt to budżet.", " Drugi punkt to termin."]
+
+        def decoding():
+            for i, text in enumerate(texts):
+                events.append(f"decode {i}")
+                yield seg(i * 2, i * 2 + 2, text)
+            for i in range(3, 8):
+                events.append(f"decode {i}")
+                yield seg(i * 2, i * 2 + 2, " Dziękuję za uwagę.")
+
+        model = FakeWhisperModel([decoding(), [seg(60, 62, " Dalsza część.")]])
+        provider = FasterWhisperLibraryProvider(device="cpu", loop_guard=True)
+        provider._faster_whisper = SimpleNamespace(
+            decode_audio=lambda path: [0.0] * 16,
+            vad=SimpleNamespace(get_speech_timestamps=lambda audio: [{"start": 60 * 16000, "end": 62 * 16000}]),
+        )
+        provider._models = {"small": (model, None, 0)}
+        provider.on_segment = lambda start, end, text: events.append(f"segment {start:.0f} {text.strip()}")
+
+        audio = temp_dir / "audio.wav"
+        audio.write_bytes(b"RIFF")
+        provider.transcribe(audio, temp_dir, "nagranie", "Polish", "small")
+
+        assert events[:6] == [
+            "decode 0", "segment 0 Zaczynamy spotkanie.",
+            "decode 1", "segment 2 Pierwszy punkt to budżet.",
+            "decode 2", "segment 4 Drugi punkt to termin.",
+        ]
+        reported = [event for event in events if event.startswith("segment")]
+        assert reported == [
+            "segment 0 Zaczynamy spotkanie.", "segment 2 Pierwszy punkt to budżet.",
+            "segment 4 Drugi punkt to termin.", "segment 6 Dziękuję za uwagę.", "segment 60 Dalsza część.",
+        ]
+        assert provider.last_run_info["loop_aborts"] == 1
+
+    def test_callback_error_does_not_stop_transcription(self, temp_dir):
+        """Test that a failing callback does not lose segments."""
+        model = FakeWhisperModel([[seg(0, 2, " Jeden."), seg(2, 4, " Dwa.")]])
+        provider = FasterWhisperLibraryProvider(device="cpu", loop_guard=False)
+        provider._faster_whisper = SimpleNamespace()
+        provider._models = {"small": (model, None, 0)}
+
+        def broken(start, end, text):
+            raise RuntimeError("boom")
+        provider.on_segment = broken
+
+        audio = temp_dir / "audio.wav"
+        audio.write_bytes(b"RIFF")
+        output = provider.transcribe(audio, temp_dir, "nagranie", "Polish", "small")
+        assert "Dwa." in output.read_text(encoding="utf-8")
@@ -0,0 +1,125 @@
+"""
+Unit tests for media_import module.
+Tests streaming folder scans, chunking, partial-content deduplication
+and reading URL lists for bulk queue import.
+"""
+import os
+import pytest
+from pogadane.media_import import (
+    ContentDeduper,
+    iter_chunks,
+    iter_media_files,
+    partial_hash,
+    read_source_list,
+)
+
+
+@pytest.fixture
+def media_tree(temp_dir):
+    """Folder with audio/video files in subfolders and some other files."""
+    (temp_dir / "b" / "deep").mkdir(parents=True)
+    (temp_dir / "a").mkdir()
+    (temp_dir / "wyklad.MP3").write_bytes(b"1" * 100)
+    (temp_dir / "notatki.txt").write_text("x")
+    (temp_dir / "a" / "film.mp4").write_bytes(b"2" * 200)
+    (temp_dir / "b" / "rozmowa.wav").write_bytes(b"3" * 300)
+    (temp_dir / "b" / "deep" / "kopia.m4a").write_bytes(b"1" * 100)
+    return temp_dir
+
+
+class TestIterMediaFiles:
+    """Test suite for iter_media_files."""
+
+    def test_recursive_scan(self, media_tree):
+        """Test that media files are found recursively in name order."""
+        names = [os.path.relpath(f.path, media_tree) for f in iter_media_files(media_tree)]
+        assert names == [
+            "wyklad.MP3",
+            os.path.join("a", "film.mp4"),
+            os.path.join("b", "rozmowa.wav"),
+            os.path.join("b", "deep", "kopia.m4a"),
+        ]
+
+    def test_captures_size_and_mtime(self, media_tree):
+        """Test that size and modification time come from the scan."""
+        found = {os.path.basename(f.path): f for f in iter_media_files(media_tree)}
+        assert found["rozmowa.wav"].size == 300
+        assert found["rozmowa.wav"].mtime == pytest.approx(os.path.getmtime(media_tree / "b" / "rozmowa.wav"))
+
+    def test_non_recursive_and_extension_filter(self, media_tree):
+        """Test scanning only the top folder and custom extensions."""
+        assert [os.path.basename(f.path) for f in iter_media_files(media_tree, recursive=False)] == ["wyklad.MP3"]
+        assert [os.path.basename(f.path) for f in iter_media_files(media_tree, extensions=[".txt"])] == ["notatki.txt"]
+
+    def test_missing_folder(self, temp_dir):
+        """Test that an unreadable folder yields nothing."""
+        assert list(iter_media_files(temp_dir / "brak")) == []
+
+
+class TestIterChunks:
+    """Test suite for iter_chunks."""
+
+    def test_chunks(self):
+        """Test that streams are split into bounded chunks."""
+        assert list(iter_chunks(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert list(iter_chunks([], 3)) == []
+
+
+class TestContentDeduper:
+    """Test suite for ContentDeduper and partial_hash."""
+
+    def test_skips_same_content(self, media_tree):
+        """Test that a copy under another name is reported once."""
+        deduper = ContentDeduper()
+        kept = [os.path.basename(f.path) for f in deduper.filter(iter_media_files(media_tree))]
+        assert kept == ["wyklad.MP3", "film.mp4", "rozmowa.wav"]
+        assert deduper.duplicates == 1
+
+    def test_same_size_different_content(self, temp_dir):
+        """Test that equal sizes alone are not duplicates."""
+        (temp_dir / "x.mp3").write_bytes(b"a" * 50)
+        (temp_dir / "y.mp3").write_bytes(b"b" * 50)
+        deduper = ContentDeduper()
+        assert len(list(deduper.filter(iter_media_files(temp_dir)))) == 2
+        assert deduper.duplicates == 0
+
+    def test_partial_hash_samples_large_files(self, temp_dir):
+        """Test that large files are hashed from sampled blocks."""
+        first = temp_dir / "first.bin"
+        second = temp_dir / "second.bin"
+        data = bytearray(os.urandom(4096))
+        first.write_bytes(bytes(data))
+        # Differs only outside the sampled start/middle/end blocks
+        data[600] ^= 0xFF
+        second.write_bytes(bytes(data))
+        assert partial_hash(first, block=256) == partial_hash(second, block=256)
+        assert partial_hash(first, block=2048) != partial_hash(second, block=2048)
+
+
+class TestReadSourceList:
+    """Test suite for read_source_list."""
+
+    def test_txt_list(self, temp_dir):
+        """Test one source per line with comments and blank lines."""
+        path = temp_dir / "lista.txt"
+        path.write_text("# wykłady\nhttps://youtu.be/a\n\n  https://youtu.be/b  \n", encoding="utf-8")
+        assert [s["url"] for s in read_source_list(path)] == ["https://youtu.be/a", "https://youtu.be/b"]
+
+    def test_csv_with_header(self, temp_dir):
+        """Test CSV columns named in a header row."""
+        path = temp_dir / "lista.csv"
+        path.write_text(
+            "url;start_time;end_time;profile\nhttps://youtu.be/a;1:00;2:30;fast\nhttps://youtu.be/b;;;\n",
+            encoding="utf-8",
+        )
+        sources = read_source_list(path)
+        assert sources[0] == {"url": "https://youtu.be/a", "start_time": "1:00", "end_time": "2:30", "profile": "fast"}
+        assert sources[1] == {"url": "https://youtu.be/b", "start_time": None, "end_time": None, "profile": None}
+
+    def test_csv_without_header(self, temp_dir):
+        """Test CSV values by position."""
+        path = temp_dir / "lista.csv"
+        path.write_text("https://youtu.be/a,0:10\nhttps://youtu.be/b,0:20\n", encoding="utf-8")
+        assert [(s["url"], s["start_time"]) for s in read_source_list(path)] == [
+            ("https://youtu.be/a", "0:10"), ("https://youtu.be/b", "0:20"),
+        ]
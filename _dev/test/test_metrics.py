@@ -0,0 +1,147 @@
+"""
+Unit tests for metrics module.
+Tests derived job metrics, the persisted metrics history with its CSV
+export, and the stage timing of ProgressCallback.
+"""
+import csv
+import time
+from pogadane.metrics import CSV_COLUMNS, JobMetrics, MetricsHistory, peak_rss_bytes
+from pogadane.backend import ProcessingStage, ProgressCallback
+
+
+def make_job(index=0, **overrides):
+    """Metrics of a completed job with transcription and summary numbers."""
+    values = dict(
+        source=f"nagranie{index}.mp3",
+        job_id=f"job{index}",
+        stage_seconds={"copying": 1.0, "transcribing": 30.0, "summarizing": 9.0},
+        audio_seconds=120.0,
+        queue_wait_seconds=float(index),
+        prompt_tokens=800,
+        completion_tokens=200,
+        prompt_eval_seconds=2.0,
+        generation_seconds=5.0,
+        peak_rss_bytes=512 * 1024 * 1024,
+        cache_hits=1,
+        cache_misses=1,
+    )
+    values.update(overrides)
+    return JobMetrics(**values)
+
+
+class TestJobMetrics:
+    """Test suite for JobMetrics."""
+
+    def test_derived_values(self):
+        """Test real-time factor, token rates and cache hit rate."""
+        job = make_job()
+        assert job.total_seconds == 40.0
+        assert job.real_time_factor == 0.25
+        assert job.prompt_tokens_per_second == 400.0
+        assert job.generation_tokens_per_second == 40.0
+        assert job.cache_hit_rate == 0.5
+
+    def test_missing_values(self):
+        """Test that derived values are None without the underlying numbers."""
+        job = JobMetrics(source="a.mp3")
+        assert job.total_seconds == 0
+        assert job.real_time_factor is None
+        assert job.generation_tokens_per_second is None
+        assert job.cache_hit_rate is None
+
+    def test_dict_round_trip(self):
+        """Test that to_dict/from_dict keep all fields and ignore unknown keys."""
+        job = make_job()
+        data = job.to_dict()
+        data["nieznane_pole"] = 1
+        assert JobMetrics.from_dict(data) == job
+
+    def test_peak_rss(self):
+        """Test that the peak memory of the process is reported."""
+        assert peak_rss_bytes() > 1024 * 1024
+
+
+class TestMetricsHistory:
+    """Test suite for MetricsHistory."""
+
+    def test_series_skips_missing_values(self):
+        """Test that series() returns the values of jobs that have them."""
+        history = MetricsHistory()
+        history.append(make_job(0))
+        history.append(JobMetrics(source="blad.mp3", status="error"))
+        history.append(make_job(2, audio_seconds=60.0))
+        assert history.series("real_time_factor") == [0.25, 0.5]
+        assert history.series("queue_wait_seconds", last=2) == [2.0]
+
+    def test_summary(self):
+        """Test averages, the highest peak memory and the error count."""
+        history = MetricsHistory()
+        history.append(make_job(0))
+        history.append(make_job(1, peak_rss_bytes=2 ** 31, cache_hits=0))
+        history.append(JobMetrics(source="blad.mp3", status="error"))
+        summary = history.summary()
+        assert summary["jobs"] == 3
+        assert summary["errors"] == 1
+        assert summary["queue_wait_seconds"] == 0.5
+        assert summary["peak_rss_bytes"] == 2 ** 31
+        assert summary["cache_hit_rate"] == 1 / 3
+        assert MetricsHistory().summary()["real_time_factor"] is None
+
+    def test_persisted_and_bounded(self, temp_dir):
+        """Test that jobs are appended to the file and reloaded up to max_jobs."""
+        path = temp_dir / "metrics.jsonl"
+        history = MetricsHistory(path, max_jobs=3)
+        for i in range(5):
+            history.append(make_job(i))
+        assert [job.job_id for job in history.jobs()] == ["job2", "job3", "job4"]
+
+        reloaded = MetricsHistory(path, max_jobs=3)
+        assert reloaded.load() == 3
+        assert reloaded.jobs() == history.jobs()
+
+    def test_load_compacts_large_file(self, temp_dir):
+        """Test that a file much longer than max_jobs is rewritten."""
+        path = temp_dir / "metrics.jsonl"
+        history = MetricsHistory(path, max_jobs=2)
+        for i in range(9):
+            history.append(make_job(i))
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write("uszkodzona linia\n")
+        assert MetricsHistory(path, max_jobs=2).load() == 1
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_to_csv(self, temp_dir):
+        """Test the CSV export with stage times and derived columns."""
+        history = MetricsHistory()
+        history.append(make_job(0))
+        history.append(JobMetrics(source="blad.mp3", status="error"))
+        assert history.to_csv(temp_dir / "metrics.csv") == 2
+        with open(temp_dir / "metrics.csv", newline="", encoding="utf-8") as handle:
+            rows = list(csv.DictReader(handle))
+        assert list(rows[0]) == CSV_COLUMNS
+        assert rows[0]["transcribing_seconds"] == "30.0"
+        assert rows[0]["real_time_factor"] == "0.25"
+        assert rows[0]["peak_rss_mb"] == "512.0"
+        assert rows[1]["status"] == "error"
+        assert rows[1]["real_time_factor"] == ""
+
+
+class TestProgressCallbackStages:
+    """Test suite for stage timing in ProgressCallback."""
+
+    def test_stage_seconds(self):
+        """Test that time is attributed to the stage that was active."""
+        progress = ProgressCallback()
+        progress.update(ProcessingStage.TRANSCRIBING, "Transkrypcja", 0.3)
+        time.sleep(0.05)
+        progress.log("komunikat")  # does not change the stage
+        progress.update(ProcessingStage.TRANSCRIBING, "Nadal transkrypcja", 0.5)
+        time.sleep(0.05)
+        progress.update(ProcessingStage.SUMMARIZING, "Podsumowanie", 0.7)
+        progress.update(ProcessingStage.COMPLETED, "Gotowe", 1.0)
+        time.sleep(0.02)
+        progress.update(ProcessingStage.COMPLETED, "Gotowe", 1.0)
+
+        assert set(progress.stage_seconds) == {"initializing", "transcribing", "summarizing"}
+        assert progress.stage_seconds["transcribing"] >= 0.1
+        assert progress.stage_seconds["summarizing"] < 0.05
@@ -0,0 +1,135 @@
+"""
+Unit tests for model_store module.
+Tests importing CTranslate2 model directories, manifest verification
+and loading stored models without Hub resolution.
+"""
+import os
+import pytest
+from types import SimpleNamespace
+from pogadane import model_store
+from pogadane.model_store import (
+    import_model,
+    list_models,
+    find_model,
+    verify_model,
+    read_manifest,
+    resolve_model_path,
+    model_dir_name,
+)
+from pogadane.transcription_providers import FasterWhisperLibraryProvider
+
+
+@pytest.fixture
+def converted_model(temp_dir):
+    """Directory that looks like a converted CTranslate2 Whisper model."""
+    source = temp_dir / "converted"
+    source.mkdir()
+    (source / "model.bin").write_bytes(b"\x00\x01" * 512)
+    (source / "config.json").write_text('{"alignment_heads": []}', encoding="utf-8")
+    (source / "tokenizer.json").write_text("{}", encoding="utf-8")
+    return source
+
+
+@pytest.fixture
+def store_root(temp_dir, monkeypatch):
+    """Temporary store used as the default store directory."""
+    root = temp_dir / "store"
+    monkeypatch.setattr(model_store, "WHISPER_STORE_DIR", root)
+    return root
+
+
+class TestModelStore:
+    """Test suite for importing, listing and verifying models."""
+
+    def test_import_writes_manifest(self, converted_model, store_root):
+        """Test that an imported model gets a manifest with checksums."""
+        model = import_model(converted_model, "small", "int8")
+        assert model.path == store_root / "small-int8"
+        manifest = read_manifest(model.path)
+        assert manifest["name"] == "small"
+        assert manifest["quantization"] == "int8"
+        assert set(manifest["files"]) == {"model.bin", "config.json", "tokenizer.json"}
+        assert len(manifest["files"]["model.bin"]["sha256"]) == 64
+        assert [m.name for m in list_models()] == ["small"]
+
+    def test_import_rejects_incomplete_directory(self, temp_dir, store_root):
+        """Test that directories without model.bin are rejected."""
+        (temp_dir / "empty").mkdir()
+        with pytest.raises(ValueError):
+            import_model(temp_dir / "empty", "small")
+        assert list_models() == []
+
+    def test_verify_detects_modified_file(self, converted_model, store_root):
+        """Test that changed content fails verification once stamps change."""
+        model = import_model(converted_model, "small")
+        assert verify_model(model.path)
+
+        model_bin = model.path / "model.bin"
+        model_bin.write_bytes(b"\xff\x01" * 512)
+        stat = model_bin.stat()
+        os.utime(model_bin, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert not verify_model(model.path)
+
+    def test_verify_detects_missing_file(self, converted_model, store_root):
+        """Test that a missing file fails verification."""
+        model = import_model(converted_model, "small")
+        (model.path / "tokenizer.json").unlink()
+        assert not verify_model(model.path)
+        assert resolve_model_path("small") is None
+
+    def test_find_prefers_matching_quantization(self, converted_model, store_root):
+        """Test selection between stored variants of one model."""
+        import_model(converted_model, "small")
+        import_model(converted_model, "small", "int8")
+        assert find_model("small", "int8").quantization == "int8"
+        assert find_model("small", "float16").quantization is None
+        assert find_model("medium") is None
+
+    def test_model_dir_name(self):
+        """Test directory naming for names and Hub ids."""
+        assert model_dir_name("turbo") == "turbo"
+        assert model_dir_name("turbo", "int8") == "turbo-int8"
+        assert model_dir_name("Systran/faster-whisper-small") == "Systran--faster-whisper-small"
+
+
+class FakeFasterWhisper:
+    """Test double for the faster_whisper module recording model loads."""
+
+    def __init__(self):
+        self.loads = []
+
+    def WhisperModel(self, model, **kwargs):
+        self.loads.append((model, kwargs))
+        return SimpleNamespace()
+
+
+class TestProviderModelStore:
+    """Test suite for loading stored models in FasterWhisperLibraryProvider."""
+
+    def test_stored_model_is_loaded_from_disk(self, converted_model, store_root):
+        """Test that a stored model path is used with local_files_only."""
+        import_model(converted_model, "small", "int8")
+        fake = FakeFasterWhisper()
+        provider = FasterWhisperLibraryProvider(device="cpu", compute_type="int8")
+        provider._faster_whisper = fake
+
+        provider._load_model("small")
+
+        path, kwargs = fake.loads[0]
+        assert path == str(store_root / "small-int8")
+        assert kwargs["local_files_only"] is True
+        assert provider.last_run_info["model_sources"] == {"small": "store"}
+        assert provider.last_run_info["model_load_seconds"] >= 0.0
+
+    def test_fallback_to_hub_name(self, store_root):
+        """Test that models missing from the store are resolved by name."""
+        fake = FakeFasterWhisper()
+        provider = FasterWhisperLibraryProvider(device="cpu", compute_type="int8", offline=True)
+        provider._faster_whisper = fake
+
+        provider._load_model("tiny")
+
+        path, kwargs = fake.loads[0]
+        assert path == "tiny"
+        assert kwargs["local_files_only"] is True
+        assert provider.last_run_info["model_sources"] == {"tiny": "cache"}
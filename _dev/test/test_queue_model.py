@@ -0,0 +1,91 @@
+"""
+Unit tests for QueueModel class.
+Tests the processing queue model used by the virtualized GUI queue:
+deduplication, lookup by id and value, status changes and slicing.
+"""
+import time
+import pytest
+from pogadane.gui_utils.queue_model import QueueModel, make_display_name
+from pogadane.constants import FILE_STATUS_PENDING, FILE_STATUS_PROCESSING, FILE_STATUS_COMPLETED
+
+
+class TestQueueModel:
+    """Test suite for QueueModel."""
+
+    def test_add_skips_duplicates_and_blanks(self):
+        """Test that values are queued once and blank values are ignored."""
+        model = QueueModel()
+        added = model.add_many(["/audio/a.mp3", " /audio/b.mp3 ", "", "/audio/a.mp3"], profile="fast")
+        assert [entry.value for entry in added] == ["/audio/a.mp3", "/audio/b.mp3"]
+        assert len(model) == 2
+        assert "/audio/b.mp3" in model
+        assert model.add("/audio/b.mp3") is None
+        assert all(entry.profile == "fast" and entry.status == FILE_STATUS_PENDING for entry in model)
+
+    def test_lookup_by_id_and_value(self):
+        """Test that entries are found by id and by value."""
+        model = QueueModel()
+        entry = model.add("https://youtu.be/x", start_time="1:00", end_time="2:00")
+        assert model.get(entry.id) is entry
+        assert model.find("https://youtu.be/x") is entry
+        assert entry.is_url
+        assert entry.display_name == "https://youtu.be/x [1:00 - 2:00]"
+
+    def test_remove_keeps_order(self):
+        """Test that removal keeps the order of the remaining entries."""
+        model = QueueModel()
+        model.add_many([f"/audio/{i}.mp3" for i in range(5)])
+        removed = model.remove("/audio/2.mp3")
+        assert removed is not None
+        assert model.remove("/audio/2.mp3") is None
+        assert model.get(removed.id) is None
+        assert [entry.display_name for entry in model] == ["0.mp3", "1.mp3", "3.mp3", "4.mp3"]
+        assert model.index_of(model.find("/audio/3.mp3").id) == 2
+        assert model.index_of(removed.id) == -1
+
+    def test_set_status_reports_changes(self):
+        """Test that only real status changes are reported."""
+        model = QueueModel()
+        entry = model.add("/audio/a.mp3")
+        version = model.version
+        assert model.set_status(entry.id, FILE_STATUS_PROCESSING)
+        assert not model.set_status(entry.id, FILE_STATUS_PROCESSING)
+        assert not model.set_status(12345, FILE_STATUS_COMPLETED)
+        assert model.version == version  # status does not change order or content
+        model.reset_statuses()
+        assert entry.status == FILE_STATUS_PENDING
+
+    def test_slice(self):
+        """Test that slices return the entries shown by the visible rows."""
+        model = QueueModel()
+        model.add_many([f"/audio/{i}.mp3" for i in range(10)])
+        assert [entry.display_name for entry in model.slice(8, 20)] == ["8.mp3", "9.mp3"]
+        assert [entry.display_name for entry in model.slice(-3, 1)] == ["0.mp3"]
+
+    def test_large_import_is_fast(self):
+        """Test that 20 000 files are queued and looked up well under a second."""
+        model = QueueModel()
+        paths = [f"/nagrania/wyklad_{i:05d}.mp3" for i in range(20000)]
+        start = time.perf_counter()
+        assert len(model.add_many(paths)) == 20000
+        assert model.add_many(paths) == []
+        for path in paths[::100]:
+            model.set_status(model.find(path).id, FILE_STATUS_COMPLETED)
+        assert time.perf_counter() - start < 1.0
+        assert model.find(paths[19999]).display_name == "wyklad_19999.mp3"
+
+
+class TestMakeDisplayName:
+    """Test suite for make_display_name."""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("/audio/nagranie.mp3", "nagranie.mp3"),
+        ("https://youtu.be/x", "https://youtu.be/x"),
+    ])
+    def test_display_name(self, value, expected):
+        """Test the names shown for paths and URLs."""
+        assert make_display_name(value) == expected
+
+    def test_url_with_open_range(self):
+        """Test that an open time range is shown with defaults."""
+        assert make_display_name("https://youtu.be/x", end_time="5:00") == "https://youtu.be/x [0:00 - 5:00]"
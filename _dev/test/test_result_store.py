@@ -0,0 +1,121 @@
+"""
+Unit tests for result_store module.
+Tests persisting results with their provenance, full-text search with
+filters and the index kept in sync when results are replaced or removed.
+"""
+import sqlite3
+import pytest
+from pogadane.metrics import JobMetrics
+from pogadane.result_store import ResultStore, fts_query
+from pogadane.segments import SegmentStore
+
+
+@pytest.fixture
+def store(temp_dir):
+    """Result store in a temporary folder."""
+    result_store = ResultStore(temp_dir / "wyniki" / "pogadane.db")
+    yield result_store
+    result_store.close()
+
+
+def make_segments(*texts):
+    """Segment store with one two-second segment per text."""
+    segments = SegmentStore()
+    for i, text in enumerate(texts):
+        segments.append(i * 2.0, i * 2.0 + 2.0, text)
+    return segments
+
+
+class TestResultStore:
+    """Test suite for ResultStore."""
+
+    def test_wal_mode(self, store):
+        """Test that the database is opened in WAL mode."""
+        assert store.path.exists()
+        with sqlite3.connect(str(store.path)) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_round_trip_with_provenance(self, store):
+        """Test that segments, summary, provenance and metrics are restored."""
+        segments = make_segments("Dzień dobry.", "Omawiamy budżet.")
+        metrics = JobMetrics(source="a.mp3", stage_seconds={"transcribing": 3.0}, audio_seconds=4.0)
+        provenance = {"transcription_model": "turbo", "profile": "fast", "summary_model": "gemma3:4b"}
+        store.add("a.mp3", segments, "Streszczenie", job_id="7", provenance=provenance, metrics=metrics)
+
+        result = store.get("a.mp3")
+        assert result["transcription"] == segments
+        assert result["summary"] == "Streszczenie"
+        assert result["provenance"] == provenance
+        assert result["metrics"] == metrics
+        assert result["processing_seconds"] == 3.0
+        assert result["job_id"] == "7"
+        assert store.get("brak.mp3") is None
+
+    def test_text_transcriptions(self, store):
+        """Test that segment-format text is compacted and plain text kept as is."""
+        store.add("a.mp3", "[0.00s -> 1.00s] raz\n[1.00s -> 2.00s] dwa")
+        store.add("b.mp3", "zwykły tekst")
+        assert isinstance(store.get("a.mp3")["transcription"], SegmentStore)
+        assert store.get("b.mp3")["transcription"] == "zwykły tekst"
+
+    def test_persisted_across_connections(self, temp_dir):
+        """Test that results are kept after the store is closed."""
+        first = ResultStore(temp_dir / "pogadane.db")
+        first.add("a.mp3", "tekst", "podsumowanie")
+        first.close()
+        second = ResultStore(temp_dir / "pogadane.db")
+        assert len(second) == 1
+        assert second.search("podsumowanie")[0].source == "a.mp3"
+        second.close()
+
+    def test_search(self, store):
+        """Test ranked search in transcripts, summaries and source names."""
+        store.add("spotkanie.mp3", make_segments("Rozmawiamy o budżecie", "i o planach"), "")
+        store.add("wyklad.mp3", "Budżet budżet budżet", "Wykład o budżecie")
+        store.add("inne.mp3", "nic ciekawego", "Podsumowanie")
+
+        assert [hit.source for hit in store.search("budżet")] == ["wyklad.mp3"]
+        assert {hit.source for hit in store.search("budże")} == {"spotkanie.mp3", "wyklad.mp3"}
+        assert store.search("o planach")[0].snippet == "Rozmawiamy [o] budżecie i [o] [planach]"
+        assert store.search("wyklad")[0].source == "wyklad.mp3"
+        assert store.search("   ") == []
+
+    def test_search_ignores_diacritics_and_syntax(self, store):
+        """Test that diacritics and FTS operators in user input do not matter."""
+        store.add("a.mp3", "Zażółć gęślą jaźń", "")
+        assert store.search("gesla")[0].source == "a.mp3"
+        assert store.search('gęślą" OR (') == []
+        with pytest.raises(ValueError):
+            store.search('"niedomknięty', raw=True)
+        assert store.search("gesla OR nic", raw=True)[0].source == "a.mp3"
+
+    def test_filters(self, store):
+        """Test metadata filters in filter() and search()."""
+        store.add("a.mp3", "wspólne słowo", "", provenance={"profile": "fast", "transcription_model": "small"})
+        store.add("b.mp3", "wspólne słowo", "", provenance={"profile": "accurate", "transcription_model": "large-v3"})
+        store.add("c_d.mp3", "inne", "", status="error")
+
+        assert [row["source"] for row in store.filter(profile="fast")] == ["a.mp3"]
+        assert [row["source"] for row in store.filter(status="error")] == ["c_d.mp3"]
+        assert [row["source"] for row in store.filter(source="_")] == ["c_d.mp3"]
+        assert [hit.source for hit in store.search("słowo", transcription_model="large-v3")] == ["b.mp3"]
+        assert store.filter(since=0, until=1) == []
+        assert len(store.filter(limit=2)) == 2
+        with pytest.raises(ValueError):
+            store.filter(nieznany="x")
+
+    def test_replace_and_delete_update_index(self, store):
+        """Test that the index follows replaced and deleted results."""
+        store.add("a.mp3", "stara wersja", "")
+        store.add("a.mp3", "nowa wersja", "")
+        assert len(store) == 1
+        assert store.search("stara") == []
+        assert store.search("nowa")[0].source == "a.mp3"
+        assert store.delete("a.mp3")
+        assert store.search("nowa") == []
+        assert not store.delete("a.mp3")
+
+    def test_fts_query(self):
+        """Test quoting of user input with a prefix match on the last word."""
+        assert fts_query('ala "ma" kota') == '"ala" """ma""" "kota"*'
+        assert fts_query("") == ""
@@ -4,6 +4,7 @@ Tests ResultsManager class for results storage and display.
 """
 import pytest
 from pogadane.gui_utils.results_manager import ResultsManager
+from pogadane.segments import SegmentStore
 
 
 class TestResultsManager:
@@ -112,6 +113,16 @@ class TestResultsManager:
             sources = list(rm.results.keys())
             assert len(sources) == 2
 
+    def test_find_sources(self):
+        """Test filtering sources by name (case-insensitive)."""
+        rm = ResultsManager()
+        rm.add_result("/nagrania/Wykład_1.mp3", "Trans 1", "Summary 1")
+        rm.add_result("/nagrania/rozmowa.mp3", "Trans 2", "Summary 2")
+        rm.add_result("https://youtu.be/wykład", "Trans 3", "Summary 3")
+        assert rm.find_sources("WYKŁAD") == ["/nagrania/Wykład_1.mp3", "https://youtu.be/wykład"]
+        assert rm.find_sources("  ") == rm.get_all_sources()
+        assert rm.find_sources("brak") == []
+
     def test_clear_results(self):
         """Test clearing all results."""
         rm = ResultsManager()
@@ -211,6 +222,101 @@ class TestResultsManager:
         assert len(rm.results) == 2
 
 
+class TestResultsManagerSpill:
+    """Test suite for the disk-backed result bodies of ResultsManager."""
+
+    def test_bodies_spilled_and_cached(self, temp_dir):
+        """Test that only cache_size bodies stay in memory and others are read back."""
+        rm = ResultsManager(cache_size=2, spill_dir=temp_dir)
+        segments = SegmentStore()
+        segments.append(0.0, 1.5, "Pierwsze zdanie")
+        rm.add_result("a.mp3", segments, "Streszczenie A")
+        for name in ("b.mp3", "c.mp3", "d.mp3"):
+            rm.add_result(name, f"Tekst {name} żółć", f"Streszczenie {name}")
+
+        assert list(rm._cache) == ["c.mp3", "d.mp3"]
+        assert rm.get_segments("a.mp3") == segments
+        assert rm.get_result("b.mp3") == {"transcription": "Tekst b.mp3 żółć", "summary": "Streszczenie b.mp3"}
+        assert list(rm._cache) == ["a.mp3", "b.mp3"]
+        assert rm.results_data["a.mp3"] == {
+            "status": "completed", "transcription_bytes": len(segments.to_bytes()),
+            "summary_chars": 14, "segments": 1,
+        }
+        assert len(list(temp_dir.glob("pogadane_results_*"))) == 1
+
+    def test_overwrite_keeps_order(self, temp_dir):
+        """Test that a replaced result keeps its position and returns the new bodies."""
+        rm = ResultsManager(cache_size=0, spill_dir=temp_dir)
+        rm.add_result("a.mp3", "stary", "stare")
+        rm.add_result("b.mp3", "inny", "")
+        rm.add_result("a.mp3", "nowy", "nowe")
+        assert rm.get_all_sources() == ["a.mp3", "b.mp3"]
+        assert rm.get_transcription("a.mp3") == "nowy"
+        assert rm.get_summary("a.mp3") == "nowe"
+
+    def test_replaced_result_reuses_its_record(self, temp_dir):
+        """Test that a replacement that fits is written over the old record."""
+        rm = ResultsManager(cache_size=0, spill_dir=temp_dir)
+        rm.add_result("a.mp3", "długa transkrypcja", "streszczenie")
+        rm.add_result("b.mp3", "inny", "")
+        rm.add_result("a.mp3", "krótsza", "nowe")
+        assert rm._locations["a.mp3"].offset == 0
+        assert rm.get_result("a.mp3") == {"transcription": "krótsza", "summary": "nowe"}
+        assert rm.get_transcription("b.mp3") == "inny"
+        rm.add_result("a.mp3", "długa transkrypcja!", "streszczenie")
+        assert rm.get_result("a.mp3") == {"transcription": "długa transkrypcja!", "summary": "streszczenie"}
+
+    def test_spill_file_compacted(self, temp_dir):
+        """Test that space of replaced results is reclaimed past the threshold."""
+        rm = ResultsManager(cache_size=0, spill_dir=temp_dir, compact_bytes=1000)
+        rm.add_result("stały.mp3", "x" * 300, "")
+        for i in range(20):
+            rm.add_result("live.mp3", "tekst " * (i + 10), f"wersja {i}")
+        assert rm._dead_bytes < 1000
+        assert max(location.offset for location in rm._locations.values()) < 1000 + 300
+        assert rm.get_transcription("stały.mp3") == "x" * 300
+        assert rm.get_result("live.mp3") == {"transcription": "tekst " * 29, "summary": "wersja 19"}
+        assert len(list(temp_dir.glob("pogadane_results_*"))) == 1
+
+    def test_pinned_result_grows(self, temp_dir):
+        """Test that a pinned transcript is read live and stored when unpinned."""
+        rm = ResultsManager(cache_size=0, spill_dir=temp_dir)
+        live = SegmentStore()
+        rm.add_result("a.mp3", live, "", status="live", pinned=True)
+        live.append(0.0, 1.0, "nowy segment")
+        assert rm.get_segments("a.mp3") is live
+        rm.unpin("a.mp3", status="error")
+        live.append(1.0, 2.0, "po zakończeniu")
+        assert len(rm.get_segments("a.mp3")) == 1
+        assert rm.results_data["a.mp3"]["status"] == "error"
+
+    def test_without_spill(self):
+        """Test that spill=False keeps all bodies in memory."""
+        rm = ResultsManager(cache_size=0, spill=False)
+        rm.add_result("a.mp3", "tekst", "streszczenie")
+        assert rm._spill_path is None
+        assert rm.get_result("a.mp3") == {"transcription": "tekst", "summary": "streszczenie"}
+
+    def test_clear_deletes_spill_file(self, temp_dir):
+        """Test that clear_all removes the results and the spill file."""
+        rm = ResultsManager(spill_dir=temp_dir)
+        rm.add_result("a.mp3", "tekst", "streszczenie")
+        rm.clear_all()
+        assert not rm.has_results()
+        assert rm.get_result("a.mp3") is None
+        assert list(temp_dir.glob("pogadane_results_*")) == []
+
+    def test_export_to_file(self, temp_dir):
+        """Test that the streamed export matches export_all_results."""
+        rm = ResultsManager(cache_size=1, spill_dir=temp_dir)
+        rm.add_result("a.mp3", "[0.00s -> 1.00s] raz", "Streszczenie A")
+        rm.add_result("b.mp3", "zwykły tekst", "")
+        rm.export_to_file(temp_dir / "eksport.txt")
+        exported = (temp_dir / "eksport.txt").read_text(encoding="utf-8")
+        assert exported == rm.export_all_results() + "\n"
+        assert "WYNIK #2: b.mp3" in exported
+
+
 class TestResultsManagerIntegration:
     """Integration tests for ResultsManager."""
 
@@ -0,0 +1,211 @@
+"""
+Unit tests for segments module.
+Tests the array-backed SegmentStore: rendering, time lookup,
+word timestamps, serialization and memory footprint.
+"""
+import sys
+import pytest
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import List
+from pogadane.segments import SegmentStore, Segment, Word
+from pogadane.gui_utils.results_manager import ResultsManager
+
+
+def seg(start, end, text, words=None):
+    """Create a segment-like object."""
+    return SimpleNamespace(start=start, end=end, text=text, words=words)
+
+
+@pytest.fixture
+def store():
+    """Store with three segments."""
+    return SegmentStore.from_segments([
+        seg(0.0, 2.5, " Dzień dobry."),
+        seg(2.5, 5.0, " Zaczynamy spotkanie."),
+        seg(7.0, 9.25, " Pierwszy punkt."),
+    ])
+
+
+class TestSegmentStore:
+    """Test suite for SegmentStore."""
+
+    def test_rendering_matches_transcript_format(self, store):
+        """Test that lines are rendered in the provider's transcript format."""
+        assert store.line(0) == "[0.00s -> 2.50s]  Dzień dobry."
+        assert store.to_text().split("\n")[2] == "[7.00s -> 9.25s]  Pierwszy punkt."
+        assert str(store) == store.to_text()
+        assert store.plain_text() == "Dzień dobry. Zaczynamy spotkanie. Pierwszy punkt."
+
+    def test_item_access(self, store):
+        """Test indexing, iteration and length."""
+        assert len(store) == 3
+        assert store[1] == Segment(2.5, 5.0, " Zaczynamy spotkanie.")
+        assert store[-1].text == " Pierwszy punkt."
+        assert [s.start for s in store] == [0.0, 2.5, 7.0]
+        with pytest.raises(IndexError):
+            store[3]
+
+    def test_index_at(self, store):
+        """Test binary-search time lookup."""
+        assert store.index_at(0.0) == 0
+        assert store.index_at(3.0) == 1
+        assert store.index_at(6.0) == 1
+        assert store.index_at(100.0) == 2
+        assert SegmentStore().index_at(1.0) == -1
+
+    def test_range_between(self, store):
+        """Test selecting segments overlapping a time window."""
+        assert store.range_between(1.0, 3.0) == (0, 2)
+        assert store.range_between(5.5, 6.5) == (2, 2)
+        assert store.to_text(*store.range_between(6.0, 10.0)) == "[7.00s -> 9.25s]  Pierwszy punkt."
+
+    def test_times_render_like_float64_lines(self):
+        """Test that float32 storage does not change rendered timestamps."""
+        times = [2.345, 10799.995, 3601.125, 0.015]
+        store = SegmentStore()
+        for t in times:
+            store.append(t, t + 1.0, "x")
+        for index, t in enumerate(times):
+            assert store.line(index).startswith(f"[{t:.2f}s -> {t + 1.0:.2f}s]")
+
+    def test_words(self):
+        """Test optional word timestamps."""
+        words = [SimpleNamespace(start=0.0, end=0.4, word=" Ala"), (0.4, 0.9, " ma")]
+        store = SegmentStore.from_segments([seg(0.0, 0.9, " Ala ma", words), seg(1.0, 2.0, " kota")])
+        assert store.has_words
+        assert store.words(0) == [Word(0.0, 0.4, " Ala"), Word(0.4, 0.9, " ma")]
+        assert store.words(1) == []
+
+    def test_logprobs(self, store):
+        """Test optional log-probabilities, kept through serialization."""
+        assert not store.has_logprobs and store.logprob(0) is None
+        store.extend([SimpleNamespace(start=10.0, end=11.0, text=" Koniec.", words=None, avg_logprob=-0.25)])
+        assert store.has_logprobs
+        assert store.logprob(2) is None
+        assert store.logprob(3) == -0.25
+        loaded = SegmentStore.from_bytes(store.to_bytes())
+        assert loaded == store
+        assert loaded.logprob(3) == -0.25
+
+    def test_from_columns(self, store):
+        """Test that a store built from columns equals one built segment by segment."""
+        columns = ([s.start for s in store], [s.end for s in store], [s.text for s in store])
+        assert SegmentStore.from_columns(*columns) == store
+        with_logprobs = SegmentStore.from_columns(*columns, logprobs=[None, -1.0, None])
+        assert with_logprobs.logprob(1) == -1.0 and with_logprobs.logprob(2) is None
+        with pytest.raises(ValueError):
+            SegmentStore.from_columns([0.0], [], ["a"])
+
+
+class TestSegmentStoreText:
+    """Test suite for parsing transcripts and serialization."""
+
+    def test_from_text_round_trip(self, store):
+        """Test that rendered text parses back to an equal store."""
+        assert SegmentStore.from_text(store.to_text()) == store
+
+    def test_from_text_rejects_other_formats(self):
+        """Test that plain text is not treated as segments."""
+        assert SegmentStore.from_text("Zwykły tekst bez znaczników czasu") is None
+        assert SegmentStore.from_text("[0.00s -> 1.00s] a\nbez czasu") is None
+        assert SegmentStore.from_text("") is None
+
+    def test_save_and_load(self, store, temp_dir):
+        """Test binary persistence including words."""
+        store.append(10.0, 11.0, " słowo", [(10.0, 11.0, " słowo")])
+        path = temp_dir / "segments.bin"
+        store.save(path)
+        loaded = SegmentStore.load(path)
+        assert loaded == store
+        assert loaded.words(3) == [Word(10.0, 11.0, " słowo")]
+        assert path.stat().st_size < len(store.to_text().encode("utf-8")) + 100
+
+    def test_from_bytes_rejects_garbage(self):
+        """Test that invalid data raises ValueError."""
+        with pytest.raises(ValueError):
+            SegmentStore.from_bytes(b"not a store")
+
+
+@dataclass
+class WhisperSegment:
+    """Mirror of faster-whisper's Segment dataclass."""
+    id: int
+    seek: int
+    start: float
+    end: float
+    text: str
+    tokens: List[int]
+    avg_logprob: float
+    compression_ratio: float
+    no_speech_prob: float
+    words: list = field(default_factory=list)
+    temperature: float = 0.0
+
+
+@dataclass
+class WhisperWord:
+    """Mirror of faster-whisper's Word dataclass."""
+    start: float
+    end: float
+    word: str
+    probability: float
+
+
+def deep_size(obj, seen=None):
+    """Approximate deep size of an object graph in bytes."""
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (list, tuple)):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += deep_size(obj.__dict__, seen)
+    elif isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    return size
+
+
+class TestMemoryFootprint:
+    """Test suite comparing memory use with per-segment Python objects."""
+
+    def test_three_hour_transcript(self):
+        """Test that a 3-hour transcript is an order of magnitude smaller."""
+        words_text = ["żółw", "spotkanie", "projekt", "wdrożenie", "termin", "zespół"]
+        segments = []
+        lines = []
+        t = 0.0
+        for i in range(2700):  # ~4 s per segment over 3 hours
+            words = [
+                WhisperWord(t + k * 0.3, t + k * 0.3 + 0.28, f" {words_text[(i + k) % 6]}", 0.9)
+                for k in range(12)
+            ]
+            text = "".join(w.word for w in words)
+            segments.append(WhisperSegment(i, i * 400, t, t + 4.0, text, list(range(50000, 50030)),
+                                           -0.2, 1.4, 0.01, words))
+            lines.append(f"[{t:.2f}s -> {t + 4.0:.2f}s] {text}")
+            t += 4.0
+
+        objects_size = deep_size(segments) + deep_size(lines)
+        store = SegmentStore.from_segments(segments)
+
+        assert len(store) == 2700
+        assert store.to_text() == "\n".join(lines)
+        assert store.nbytes * 10 < objects_size
+
+    def test_results_manager_keeps_store(self, store):
+        """Test that ResultsManager stores segment transcripts compactly."""
+        rm = ResultsManager()
+        rm.add_result("a.mp3", store.to_text(), "Streszczenie")
+        rm.add_result("b.mp3", "Zwykły tekst", "Streszczenie")
+        rm.add_result("c.mp3", store, "Streszczenie")
+
+        assert rm.get_segments("a.mp3") == store
+        assert rm.get_result("a.mp3")["transcription"] == store.to_text()
+        assert rm.get_segments("b.mp3") is None
+        assert rm.get_result("b.mp3")["transcription"] == "Zwykły tekst"
+        assert rm.get_result("c.mp3")["transcription"] == store.to_text()
+        assert list(rm.iter_transcription_lines("c.mp3"))[0] == store.line(0)
+        assert store.to_text() in rm.export_all_results()
@@ -0,0 +1,121 @@
+"""
+Unit tests for semantic_index module.
+Tests chunking transcripts, searching by similarity, incremental add and
+remove and the index files kept on disk. A bag-of-words embedder stands in
+for the sentence-transformers model.
+"""
+import zlib
+import pytest
+from pogadane.segments import SegmentStore
+
+np = pytest.importorskip("numpy")
+from pogadane.semantic_index import SemanticIndex, chunk_transcription  # noqa: E402
+
+DIM = 64
+
+
+def embed(texts):
+    """Vectors counting word stems (first four letters), hashed into DIM buckets."""
+    vectors = np.zeros((len(texts), DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for word in text.lower().split():
+            stem = word.strip(".,?!")[:4]
+            if len(stem) > 2:
+                vectors[row, zlib.crc32(stem.encode("utf-8")) % DIM] += 1.0
+    return vectors
+
+
+def make_segments(*texts):
+    """Segment store with one ten-second segment per text."""
+    segments = SegmentStore()
+    for i, text in enumerate(texts):
+        segments.append(i * 10.0, i * 10.0 + 10.0, " " + text)
+    return segments
+
+
+@pytest.fixture
+def index(temp_dir):
+    """Index with two meetings, chunked one segment at a time."""
+    semantic = SemanticIndex(temp_dir / "semantic", "test-model", embedder=embed, max_chars=10)
+    semantic.add("zarzad.mp3", make_segments("Dzień dobry wszystkim.", "Budżet marketingu rośnie.",
+                                             "Wakacje zaczynają się w lipcu."))
+    semantic.add("zespol.mp3", make_segments("Sprint kończy się w piątek.", "Budżetu nie przekraczamy."))
+    return semantic
+
+
+class TestChunking:
+    """Test suite for chunk_transcription."""
+
+    def test_segments_grouped_by_length(self):
+        """Test that consecutive segments form chunks with their time range."""
+        chunks = chunk_transcription(make_segments("raz dwa", "trzy", "cztery pięć sześć"), max_chars=12)
+        assert [(c.start, c.end, c.text) for c in chunks] == [
+            (0.0, 20.0, "raz dwa trzy"), (20.0, 30.0, "cztery pięć sześć"),
+        ]
+
+    def test_plain_text(self):
+        """Test that text without timestamps is split by words."""
+        chunks = chunk_transcription("jeden dwa trzy cztery", max_chars=9)
+        assert [c.text for c in chunks] == ["jeden dwa", "trzy", "cztery"]
+        assert chunks[0].start is None
+        assert chunk_transcription("") == []
+
+
+class TestSemanticIndex:
+    """Test suite for SemanticIndex."""
+
+    def test_search(self, index):
+        """Test that the closest fragment is found with its time."""
+        hit = index.search("jaki mamy budżet marketingu", limit=1)[0]
+        assert (hit.source, hit.start, hit.text) == ("zarzad.mp3", 10.0, "Budżet marketingu rośnie.")
+        assert hit.score > 0.5
+
+    def test_no_hits_requested(self, index):
+        """Test that a limit of zero or less returns no hits."""
+        assert index.search("budżet", limit=0) == []
+        assert index.search("budżet", limit=-1) == []
+
+    def test_per_source(self, index):
+        """Test limiting hits per recording."""
+        hits = index.search("budżet wakacje sprint", limit=10, per_source=1)
+        assert sorted(hit.source for hit in hits) == ["zarzad.mp3", "zespol.mp3"]
+
+    def test_replace_and_remove(self, index):
+        """Test that replaced and removed results are no longer found."""
+        index.add("zarzad.mp3", make_segments("Tylko o pogodzie."))
+        assert len(index) == 3
+        assert all(hit.source != "zarzad.mp3" or hit.text == "Tylko o pogodzie."
+                   for hit in index.search("budżet marketingu", limit=10))
+        assert index.remove("zespol.mp3")
+        assert not index.remove("zespol.mp3")
+        assert index.sources == ["zarzad.mp3"]
+
+    def test_persisted_as_float16(self, index, temp_dir):
+        """Test that vectors are appended as float16 rows and reloaded with the chunks."""
+        index.remove("zespol.mp3")
+        assert (temp_dir / "semantic" / "vectors.f16").stat().st_size == 5 * DIM * 2
+        reopened = SemanticIndex(temp_dir / "semantic", "test-model", embedder=embed)
+        assert len(reopened) == 3 and "zespol.mp3" not in reopened
+        assert reopened.search("wakacje w lipcu", limit=1)[0].start == 20.0
+
+    def test_other_model_discards_index(self, index, temp_dir):
+        """Test that vectors of a different model are not mixed with new ones."""
+        other = SemanticIndex(temp_dir / "semantic", "inny-model", embedder=embed)
+        assert len(other) == 0
+
+    def test_recovers_from_cut_off_write(self, index, temp_dir):
+        """Test that a record without its vectors (crash while adding) is dropped."""
+        vectors = temp_dir / "semantic" / "vectors.f16"
+        vectors.write_bytes(vectors.read_bytes()[:-DIM * 2])
+        reopened = SemanticIndex(temp_dir / "semantic", "test-model", embedder=embed)
+        assert reopened.sources == ["zarzad.mp3"]
+        assert vectors.stat().st_size == 3 * DIM * 2
+
+    def test_compaction(self, temp_dir):
+        """Test that files are rewritten when removed rows outnumber live ones."""
+        semantic = SemanticIndex(temp_dir / "semantic", "test-model", embedder=embed, max_chars=1)
+        semantic.add("duzy.mp3", make_segments(*["słowo"] * 1100))
+        semantic.add("maly.mp3", make_segments("budżet"))
+        semantic.remove("duzy.mp3")
+        assert (temp_dir / "semantic" / "vectors.f16").stat().st_size == DIM * 2
+        assert semantic.search("budżet", limit=1)[0].source == "maly.mp3"
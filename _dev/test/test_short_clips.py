@@ -0,0 +1,234 @@
+"""
+Unit tests for short_clips module.
+Tests packing of short files into shared timelines and routing of
+segments back to their source files.
+"""
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+from pogadane.short_clips import (
+    clip_timestamps_for,
+    split_windows,
+    pack_clips,
+    pack_waveforms,
+    route_segments,
+)
+from pogadane.transcription_providers import FasterWhisperLibraryProvider
+
+
+def seg(start, end, text):
+    """Create a segment-like object."""
+    return SimpleNamespace(start=start, end=end, text=text)
+
+
+class TestPackClips:
+    """Test suite for pack_clips and split_windows."""
+
+    def test_split_windows(self):
+        """Test splitting at the 30 second window limit."""
+        assert split_windows(12.5) == [(0.0, 12.5)]
+        assert split_windows(45.0) == [(0.0, 30.0), (30.0, 45.0)]
+
+    def test_offsets_start_on_whole_seconds(self):
+        """Test that each file starts at a whole second after the previous one."""
+        groups = pack_clips([12.5, 8.0, 20.2])
+        assert len(groups) == 1
+        group = groups[0]
+        assert group.offsets == [0.0, 13.0, 21.0]
+        assert group.windows == [
+            {"start": 0.0, "end": 12.5},
+            {"start": 13.0, "end": 21.0},
+            {"start": 21.0, "end": 41.2},
+        ]
+        assert group.total_seconds == 42.0
+
+    def test_group_size_limit(self):
+        """Test that groups are split when the timeline would be too long."""
+        groups = pack_clips([25.0] * 5, group_seconds=60.0)
+        assert [group.indices for group in groups] == [[0, 1], [2, 3], [4]]
+
+    def test_empty_files_are_skipped(self):
+        """Test that files without audio are not packed."""
+        groups = pack_clips([0.0, 5.0])
+        assert groups[0].indices == [1]
+
+
+class TestRouteSegments:
+    """Test suite for route_segments function."""
+
+    def test_segments_return_to_source_files(self):
+        """Test that segments are re-based onto their file timelines."""
+        group = pack_clips([12.5, 8.0])[0]
+        segments = [seg(0.0, 5.0, "a"), seg(5.0, 12.5, "b"), seg(13.0, 20.999, "c")]
+        routed = route_segments(segments, group)
+        assert [(s.start, s.end, s.text) for s in routed[0]] == [(0.0, 5.0, "a"), (5.0, 12.5, "b")]
+        assert [(s.start, s.end, s.text) for s in routed[1]] == [(0.0, 7.999, "c")]
+
+    def test_files_without_segments(self):
+        """Test that silent files get an empty segment list."""
+        group = pack_clips([3.0, 3.0])[0]
+        routed = route_segments([seg(0.0, 2.0, "a")], group)
+        assert routed[1] == []
+
+    def test_concatenate_group(self):
+        """Test that waveforms are placed at their offsets."""
+        np = pytest.importorskip("numpy")
+        from pogadane.short_clips import concatenate_group
+        group = pack_clips([0.5, 1.0])[0]
+        waveforms = {0: np.ones(8000, dtype=np.float32), 1: np.full(16000, 2.0, dtype=np.float32)}
+        audio = concatenate_group(group, waveforms)
+        assert audio.shape == (32000,)
+        assert audio[:8000].min() == 1.0
+        assert audio[8000:16000].max() == 0.0
+        assert audio[16000:].min() == 2.0
+
+    def test_waveform_longer_than_slot_is_rejected(self):
+        """Test that a file decoding longer than its packed slot is not cut silently."""
+        np = pytest.importorskip("numpy")
+        from pogadane.short_clips import concatenate_group
+        group = pack_clips([0.5, 1.0])[0]
+        waveforms = {0: np.ones(20000, dtype=np.float32), 1: np.ones(16000, dtype=np.float32)}
+        with pytest.raises(ValueError):
+            concatenate_group(group, waveforms)
+
+    def test_pack_waveforms_uses_decoded_length(self):
+        """Test that slots follow the decoded audio and groups are yielded as they fill."""
+        np = pytest.importorskip("numpy")
+        waveforms = [(0, np.ones(40000, dtype=np.float32)), (1, np.zeros(0, dtype=np.float32)),
+                     (2, np.ones(16000, dtype=np.float32)), (3, np.ones(16000, dtype=np.float32))]
+        groups = list(pack_waveforms(waveforms, group_seconds=4.0))
+        assert [group.indices for group, _ in groups] == [[0, 2], [3]]
+        first, first_waveforms = groups[0]
+        assert first.offsets == [0.0, 3.0]
+        assert first.windows == [{"start": 0.0, "end": 2.5}, {"start": 3.0, "end": 4.0}]
+        assert sorted(first_waveforms) == [0, 2]
+
+
+class FakeBatchedPipeline:
+    """Test double returning one segment per clip window."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append(kwargs)
+        segments = [
+            seg(window["start"], window["end"], f" okno {i}")
+            for i, window in enumerate(kwargs["clip_timestamps"])
+        ]
+        return iter(segments), SimpleNamespace(duration=len(audio) / 16000)
+
+
+class TestProviderShortClips:
+    """Test suite for FasterWhisperLibraryProvider.transcribe_short_clips."""
+
+    def test_one_shared_call_for_many_files(self):
+        """Test that short files share one inference call and get their own text."""
+        np = pytest.importorskip("numpy")
+        durations = {"a.wav": 2.0, "b.wav": 3.5, "c.wav": 1.0}
+        pipeline = FakeBatchedPipeline()
+
+        provider = FasterWhisperLibraryProvider(device="cpu")
+        provider._faster_whisper = SimpleNamespace(
+            decode_audio=lambda path: np.zeros(int(durations[Path(path).name] * 16000), dtype=np.float32)
+        )
+        provider._models = {"turbo": (object(), pipeline, 8)}
+
+        paths = [Path(name) for name in durations]
+        results = provider.transcribe_short_clips(paths, list(durations.values()), model="turbo")
+
+        assert len(pipeline.calls) == 1
+        assert pipeline.calls[0]["batch_size"] == 8
+        assert results[Path("a.wav")] == "[0.00s -> 2.00s]  okno 0"
+        assert results[Path("b.wav")] == "[0.00s -> 3.50s]  okno 1"
+        assert results[Path("c.wav")] == "[0.00s -> 1.00s]  okno 2"
+        assert provider.last_run_info["short_clip_groups"] == 1
+        # Windows are decoded as given and independently of each other
+        assert pipeline.calls[0]["vad_filter"] is False
+        assert pipeline.calls[0]["condition_on_previous_text"] is False
+
+    def test_file_longer_than_its_header(self):
+        """Test that a file decoding longer than its header duration is transcribed whole."""
+        np = pytest.importorskip("numpy")
+        lengths = {"a.wav": 3.0, "b.wav": 1.0}
+        pipeline = FakeBatchedPipeline()
+        provider = FasterWhisperLibraryProvider(device="cpu")
+        provider._faster_whisper = SimpleNamespace(
+            decode_audio=lambda path: np.zeros(int(lengths[Path(path).name] * 16000), dtype=np.float32)
+        )
+        provider._models = {"turbo": (object(), pipeline, 8)}
+        results = provider.transcribe_short_clips([Path("a.wav"), Path("b.wav")], [1.0, 1.0], model="turbo")
+        assert results[Path("a.wav")] == "[0.00s -> 3.00s]  okno 0"
+        assert results[Path("b.wav")] == "[0.00s -> 1.00s]  okno 1"
+
+    def test_failures_cost_only_their_group(self):
+        """Test that a file that cannot be decoded and a failing group do not stop other groups."""
+        np = pytest.importorskip("numpy")
+
+        def decode(path):
+            if path == "zepsuty.wav":
+                raise RuntimeError("Invalid data")
+            # Long enough for one file per group
+            return np.zeros(400 * 16000, dtype=np.float32)
+
+        class FailingOnce(FakeBatchedPipeline):
+            def transcribe(self, audio, **kwargs):
+                if not self.calls:
+                    self.calls.append(kwargs)
+                    raise RuntimeError("out of memory")
+                return super().transcribe(audio, **kwargs)
+
+        pipeline = FailingOnce()
+        provider = FasterWhisperLibraryProvider(device="cpu")
+        provider._faster_whisper = SimpleNamespace(decode_audio=decode)
+        provider._models = {"turbo": (object(), pipeline, 8)}
+        paths = [Path("a.wav"), Path("zepsuty.wav"), Path("b.wav"), Path("c.wav")]
+        results = provider.transcribe_short_clips(paths, [400.0] * 4, model="turbo")
+
+        assert list(results) == [Path("b.wav"), Path("c.wav")]
+        assert provider.last_run_info["short_clip_groups"] == 3
+        assert sorted(provider.last_run_info["short_clip_failed"]) == ["a.wav", "zepsuty.wav"]
+
+    def test_windows_in_samples_for_older_faster_whisper(self):
+        """Test that faster-whisper 1.1 gets clip_timestamps as sample indices."""
+        np = pytest.importorskip("numpy")
+        pipeline = FakeBatchedPipeline()
+        provider = FasterWhisperLibraryProvider(device="cpu")
+        provider._faster_whisper = SimpleNamespace(
+            __version__="1.1.1",
+            decode_audio=lambda path: np.zeros(32000 if path == "a.wav" else 24000, dtype=np.float32),
+        )
+        provider._models = {"turbo": (object(), pipeline, 8)}
+        provider.transcribe_short_clips([Path("a.wav"), Path("b.wav")], [2.0, 1.5], model="turbo")
+        assert pipeline.calls[0]["clip_timestamps"] == [{"start": 0, "end": 32000}, {"start": 32000, "end": 56000}]
+
+
+class TestClipTimestampUnits:
+    """Test suite for clip_timestamps_for."""
+
+    def test_units_follow_installed_version(self):
+        """Test seconds for faster-whisper 1.2+ and samples for 1.1.x."""
+        windows = [{"start": 0.0, "end": 30.0}, {"start": 30.0, "end": 42.5}]
+        assert clip_timestamps_for(windows, SimpleNamespace(__version__="1.2.0")) == windows
+        assert clip_timestamps_for(windows, SimpleNamespace(__version__="1.10.1")) == windows
+        assert clip_timestamps_for(windows, SimpleNamespace(__version__="1.1.1")) == [
+            {"start": 0, "end": 480000}, {"start": 480000, "end": 680000},
+        ]
+        # Unknown versions are treated as current
+        assert clip_timestamps_for(windows, SimpleNamespace()) == windows
+
+
+class TestBatchedJobMetrics:
+    """Test suite for metrics of jobs transcribed in a shared batch."""
+
+    def test_audio_duration_from_clip_length(self):
+        """Test that a pre-transcribed job reports the length of its clip."""
+        from pogadane.backend import PogadaneBackend
+        backend = PogadaneBackend()
+        backend._pretranscribed = {"a.wav": "[0.00s -> 2.00s]  okno"}
+        backend._pretranscribed_info = {"a.wav": {"audio_duration": 2.0, "short_clip_batched": True}}
+        with patch.object(backend, "_summarize_text", return_value="Streszczenie"):
+            transcription, _ = backend.process_file("a.wav")
+        assert transcription == "[0.00s -> 2.00s]  okno"
+        assert backend.last_job_metrics.audio_seconds == 2.0
@@ -8,6 +8,9 @@ from pogadane.text_utils import (
     strip_ansi,
     is_valid_url,
     extract_transcription_and_summary,
+    parse_timestamp,
+    format_timestamp,
+    word_error_rate,
 )
 
 
@@ -84,6 +87,43 @@ class TestIsValidUrl:
         assert not is_valid_url("Hello World")
 
 
+class TestParseTimestamp:
+    """Test suite for parse_timestamp function."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("95", 95.0),
+        ("1:35", 95.0),
+        ("01:02:03", 3723.0),
+        (" 12.5 ", 12.5),
+        ("0:07.25", 7.25),
+    ])
+    def test_valid_times(self, text, expected):
+        """Test seconds, mm:ss and hh:mm:ss."""
+        assert parse_timestamp(text) == expected
+
+    @pytest.mark.parametrize("text", ["", "abc", "1:75", "1:2:3:4", "-5", ":30", None])
+    def test_invalid_times(self, text):
+        """Test that invalid input returns None."""
+        assert parse_timestamp(text) is None
+
+
+class TestFormatTimestamp:
+    """Test suite for format_timestamp function."""
+
+    @pytest.mark.parametrize("seconds,expected", [
+        (0, "0:00"),
+        (95.7, "1:35"),
+        (3723, "1:02:03"),
+    ])
+    def test_format(self, seconds, expected):
+        """Test mm:ss below one hour and h:mm:ss above."""
+        assert format_timestamp(seconds) == expected
+
+    def test_round_trip(self):
+        """Test that formatted times parse back."""
+        assert parse_timestamp(format_timestamp(3723)) == 3723
+
+
 class TestExtractTranscriptionAndSummary:
     """Test suite for extract_transcription_and_summary function."""
 
@@ -201,3 +241,27 @@ Lowercase markers (should not match)
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
+
+
+class TestWordErrorRate:
+    """Test suite for word_error_rate function."""
+
+    def test_identical_text(self):
+        """Test identical transcripts have zero error rate."""
+        assert word_error_rate("ala ma kota", "ala ma kota") == 0.0
+
+    def test_ignores_case_punctuation_and_timestamps(self):
+        """Test normalization of segment timestamps, case and punctuation."""
+        hypothesis = "[0.00s -> 1.50s] Ala ma kota.\n[1.50s -> 2.00s] Kot ma Alę!"
+        assert word_error_rate("ala ma kota kot ma alę", hypothesis) == 0.0
+
+    def test_substitution_deletion_insertion(self):
+        """Test each edit counts as one error relative to reference length."""
+        assert word_error_rate("ala ma kota", "ala ma psa") == pytest.approx(1 / 3)
+        assert word_error_rate("ala ma kota", "ala kota") == pytest.approx(1 / 3)
+        assert word_error_rate("ala ma kota", "ala ma kota i psa") == pytest.approx(2 / 3)
+
+    def test_empty_reference(self):
+        """Test empty reference handling."""
+        assert word_error_rate("", "") == 0.0
+        assert word_error_rate("", "coś") == 1.0
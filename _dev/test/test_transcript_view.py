@@ -0,0 +1,89 @@
+"""
+Unit tests for TranscriptPager class.
+Tests paging of transcript lines, jumping to a time and the search index
+used by the results viewer.
+"""
+import pytest
+from pogadane.gui_utils.transcript_view import TranscriptPager
+from pogadane.segments import SegmentStore
+
+
+@pytest.fixture
+def long_store():
+    """Transcript of 1000 two-second segments."""
+    store = SegmentStore()
+    for i in range(1000):
+        store.append(i * 2.0, i * 2.0 + 1.5, f"Zdanie {i} o Budżecie" if i % 250 == 3 else f"Zdanie {i}")
+    return store
+
+
+class TestTranscriptPager:
+    """Test suite for TranscriptPager."""
+
+    def test_pages_of_segments(self, long_store):
+        """Test that only the lines of the requested page are rendered."""
+        pager = TranscriptPager(long_store, page_size=100)
+        assert len(pager) == 1000
+        assert pager.page_count == 10
+        assert pager.page_range(3) == (300, 400)
+        lines = pager.page_lines(9)
+        assert len(lines) == 100
+        assert lines[-1] == "[1998.00s -> 1999.50s] Zdanie 999"
+        assert pager.page_range(42) == (900, 1000)  # clamped to the last page
+
+    def test_plain_text(self):
+        """Test transcripts that are not in segment format."""
+        pager = TranscriptPager("pierwsza\ndruga\ntrzecia", page_size=2)
+        assert pager.page_count == 2
+        assert pager.page_lines(1) == ["trzecia"]
+        assert not pager.has_timestamps
+        assert pager.line_at_time(10.0) is None
+
+    def test_empty_transcript(self):
+        """Test that an empty transcript has one empty page."""
+        pager = TranscriptPager("")
+        assert len(pager) == 0
+        assert pager.page_count == 1
+        assert pager.page_lines(0) == []
+        assert pager.search("x") == []
+
+    def test_line_at_time(self, long_store):
+        """Test jumping to the segment playing at a given time."""
+        pager = TranscriptPager(long_store, page_size=100)
+        line = pager.line_at_time(601.0)
+        assert line == 300
+        assert pager.page_of(line) == 3
+
+    def test_search(self, long_store):
+        """Test case-insensitive search returning line indices."""
+        pager = TranscriptPager(long_store, page_size=100)
+        assert pager.search("budżECIE") == [3, 253, 503, 753]
+        assert pager.search("zdanie 99") == [99] + list(range(990, 1000))
+        assert pager.search("   ") == []
+
+    def test_search_reports_each_line_once(self):
+        """Test that several hits in one line give one match."""
+        pager = TranscriptPager("ala ma ala\nnic\nala")
+        assert pager.search("ala") == [0, 2]
+
+    def test_growing_store(self):
+        """Test paging and search of a transcript that is still being decoded."""
+        store = SegmentStore()
+        pager = TranscriptPager(store, page_size=2)
+        assert pager.search("nowe") == []
+        for i in range(3):
+            store.append(i, i + 1, f"nowe zdanie {i}")
+        assert pager.page_count == 2
+        assert pager.page_lines(1) == ["[2.00s -> 3.00s] nowe zdanie 2"]
+        assert pager.search("nowe") == [0, 1, 2]
+        store.append(3, 4, "ostatnie NOWE")
+        assert pager.search("nowe") == [0, 1, 2, 3]
+
+    def test_from_results(self, long_store):
+        """Test creating a pager from a ResultsManager entry."""
+        from pogadane.gui_utils import ResultsManager
+        results = ResultsManager()
+        results.add_result("a.mp3", long_store, "")
+        results.add_result("b.mp3", "zwykły tekst", "")
+        assert TranscriptPager.from_results(results, "a.mp3").has_timestamps
+        assert TranscriptPager.from_results(results, "b.mp3").page_lines(0) == ["zwykły tekst"]
@@ -0,0 +1,55 @@
+"""
+Unit tests for UiWatchdog class.
+Tests detection of handlers that block the GUI event loop and the
+reported location of the blocking code.
+"""
+import asyncio
+import time
+from pogadane.gui_utils.ui_watchdog import UiWatchdog
+
+
+def blocking_handler():
+    """Stand-in for a handler doing blocking work on the event loop."""
+    time.sleep(0.2)
+
+
+async def run_with_watchdog(watchdog, work):
+    """Run the watchdog next to ``work`` and stop it afterwards."""
+    heartbeat = asyncio.ensure_future(watchdog.run())
+    await asyncio.sleep(0.05)
+    await work()
+    # Give the watcher time to see the loop responding again
+    await asyncio.sleep(0.1)
+    watchdog.stop()
+    await heartbeat
+
+
+class TestUiWatchdog:
+    """Test suite for UiWatchdog."""
+
+    def test_reports_blocking_handler(self):
+        """Test that a blocking call is recorded with its duration and location."""
+        watchdog = UiWatchdog(threshold=0.05, interval=0.01)
+
+        async def work():
+            blocking_handler()
+
+        asyncio.run(run_with_watchdog(watchdog, work))
+        assert len(watchdog.stalls) == 1
+        stall = watchdog.stalls[0]
+        assert stall.duration >= 0.1
+        assert "blocking_handler" in stall.location or "blocking_handler" in stall.stack
+
+    def test_ignores_awaiting_handler(self):
+        """Test that awaiting (non-blocking) handlers are not reported."""
+        watchdog = UiWatchdog(threshold=0.05, interval=0.01)
+
+        async def work():
+            await asyncio.sleep(0.2)
+
+        asyncio.run(run_with_watchdog(watchdog, work))
+        assert len(watchdog.stalls) == 0
+
+    def test_default_interval(self):
+        """Test that the heartbeat runs twice per threshold by default."""
+        assert UiWatchdog(threshold=0.1).interval == 0.05